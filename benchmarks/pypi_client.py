@@ -0,0 +1,63 @@
+"""
+Requests-per-second of PyPI lookups against a local stand-in server.
+
+Compares one urllib connection per request (the previous client) with the
+keep-alive PyPIClient, sequentially and with concurrent lookups.
+
+Run from the repository root:
+    PYTHONPATH=src python benchmarks/pypi_client.py [requests]
+"""
+
+import json
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+sys.path.insert(0, ".")
+
+from ginx.plugins.version_sync.pypi_utils import PyPIClient  # noqa: E402
+from tests.fixtures.pypi_server import FakePyPIServer  # noqa: E402
+
+
+def urlopen_lookup(base_url: str) -> Callable[[str], object]:
+    def lookup(name: str) -> object:
+        request = urllib.request.Request(f"{base_url}/{name}/json", headers={"User-Agent": "bench"})
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read().decode())
+
+    return lookup
+
+
+def measure(label: str, lookup: Callable[[str], object], names: List[str], concurrency: int) -> None:
+    start = time.perf_counter()
+    if concurrency == 1:
+        for name in names:
+            lookup(name)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(lookup, names))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} concurrency={concurrency:<3} {len(names) / elapsed:8.0f} req/s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    packages = {f"pkg{i}": ["1.0.0", "1.1.0"] for i in range(50)}
+    names = [f"pkg{i % 50}" for i in range(count)]
+
+    server = FakePyPIServer(packages).start()
+    base_url = f"{server.url}/pypi"
+    try:
+        for concurrency in (1, 8):
+            measure("urlopen (new connection each)", urlopen_lookup(base_url), names, concurrency)
+            client = PyPIClient(base_url=base_url)
+            measure("PyPIClient (keep-alive pool)", lambda name: client.get_package_info(name), names, concurrency)
+            client.pool.close()
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Pytest configuration and shared fixtures.
 """
 
 import shutil
+import sys
 import tempfile
 from pathlib import Path
 from typing import Any, Dict
@@ -10,6 +11,25 @@ from typing import Any, Dict
 import pytest
 import yaml
 
+from tests.fixtures.pypi_server import FakePyPIServer
+from tests.fixtures.simple_index import SimpleIndexServer, write_simple_project
+
+
+@pytest.fixture(autouse=True)
+def isolated_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the run history database of executed scripts out of the project."""
+    history_dir = tmp_path / "history"
+    monkeypatch.setenv("GINX_HISTORY_DIR", str(history_dir))
+    return history_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep cached PyPI metadata out of the user's cache directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("GINX_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
 
 @pytest.fixture
 def temp_dir():
@@ -97,3 +117,61 @@ def multi_config_dir(temp_dir: Path) -> Path:
             yaml.dump(config, f)
 
     return temp_dir
+
+
+@pytest.fixture
+def pypi_server():
+    """Local PyPI stand-in with a few packages."""
+    server = FakePyPIServer(
+        {
+            "requests": ["2.30.0", "2.31.0"],
+            "click": ["8.1.6", "8.1.7"],
+            "rich": ["13.6.0", "13.7.0"],
+            "typer": ["0.9.0"],
+        }
+    ).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def simple_index(tmp_path: Path):
+    """Directory-backed PEP 691 index with a few projects."""
+    root = tmp_path / "simple"
+    write_simple_project(
+        root,
+        "requests",
+        [
+            {"filename": "requests-2.30.0-py3-none-any.whl", "requires-python": ">=3.7"},
+            {"filename": "requests-2.31.0.tar.gz", "requires-python": ">=3.7"},
+            {"filename": "requests-2.31.0-py3-none-any.whl", "requires-python": ">=3.7"},
+            {"filename": "requests-2.32.0-py3-none-any.whl", "yanked": "Broken release"},
+            {"filename": "requests-3.0.0b1-py3-none-any.whl"},
+        ],
+    )
+    write_simple_project(
+        root,
+        "typing-extensions",
+        [{"filename": "typing_extensions-4.9.0-py3-none-any.whl"}],
+        versions=["4.9.0", "4.10.0"],
+    )
+    write_simple_project(root, "nightly", [{"filename": "nightly-1.0.dev3.tar.gz"}, {"filename": "nightly-1.0a1.tar.gz"}])
+    write_simple_project(root, "gone", [{"filename": "gone-1.0.tar.gz", "yanked": True}])
+
+    server = SimpleIndexServer(root).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def site_packages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """An isolated sys.path with a single, empty site-packages directory."""
+    from ginx.plugins.version_sync import dependency_index, package_utils
+
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    monkeypatch.setattr(sys, "path", [str(site)])
+    # Scans of the real environment must not be reused
+    monkeypatch.setattr(package_utils, "_distributions_cache", None)
+    monkeypatch.setattr(dependency_index, "_index_cache", None)
+    return site
@@ -10,19 +10,33 @@ __author__ = "Ginx Contributors"
 __email__ = "maverickweyunga@gmail.com"
 __description__ = "A command-line script runner powered by YAML configuration"
 
-from .config import create_sample_config, find_config_file, load_scripts
-from .utils import (
-    check_dependencies,
-    expand_variables,
-    extract_commands_from_shell_string,
-    find_requirements_files,
-    format_duration,
-    get_project_root,
-    parse_requirements_file,
-    run_command_with_streaming,
-    run_command_with_streaming_shell,
-    validate_command,
-)
+import importlib
+
+# Public helpers are imported lazily so that light entry points (such as the
+# daemon client) do not pay for importing Typer, Rich and PyYAML.
+_LAZY_EXPORTS = {
+    "create_sample_config": "config",
+    "find_config_file": "config",
+    "load_scripts": "config",
+    "check_dependencies": "utils",
+    "expand_variables": "utils",
+    "extract_commands_from_shell_string": "utils",
+    "find_requirements_files": "utils",
+    "format_duration": "utils",
+    "get_project_root": "utils",
+    "parse_requirements_file": "utils",
+    "run_command_with_streaming": "utils",
+    "run_command_with_streaming_shell": "utils",
+    "validate_command": "utils",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "__version__",
@@ -5,15 +5,19 @@ Ginx CLI module - Main application and command registration.
 from .app import app, initialize_app
 from .commands import (
     check_dependencies_command,
+    daemon_command,
     debug_plugins_command,
+    history_command,
     init_config_command,
     list_scripts_command,
     run_script_command,
     show_dependency_graph,
     validate_config_command,
     version_command,
+    watch_command,
+    worker_command,
 )
-from .registration import register_script_commands
+from .registration import refresh_script_commands, register_script_commands
 
 # Register built-in commands
 app.command("version", help="Show Ginx version.")(version_command)
@@ -24,6 +28,13 @@ app.command("graph", help="Check script dependencies.")(show_dependency_graph)
 app.command("debug-plugins", help="Debug plugin loading status.")(debug_plugins_command)
 app.command("init", help="Create a sample ginx.yaml configuration file.")(init_config_command)
 app.command("run", help="Run a script by name.")(run_script_command)
+app.command("watch", help="Re-run scripts when their input files change.")(watch_command)
+app.command("history", help="Show recorded script runs.")(history_command)
+app.command("daemon", help="Manage the resident Ginx daemon.")(daemon_command)
+app.command("worker", help="Run commands for remote executors.")(worker_command)
+
+# Register built-in and discovered plugins
+initialize_app()
 
 # Register dynamic script commands
 register_script_commands(app)
@@ -32,4 +43,5 @@ __all__ = [
     "app",
     "initialize_app",
     "register_script_commands",
+    "refresh_script_commands",
 ]
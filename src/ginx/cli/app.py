@@ -55,6 +55,9 @@ def main(ctx: typer.Context) -> None:
         ginx format              # Run the format script
         ginx build --verbose     # Run build script with verbose output
         ginx commit "fix: bug"   # Run commit script with extra args
+
+    Put --profile (or --profile=FILE) before the command to run ginx under
+    cProfile and write the stats to ginx.pstats (or FILE).
     """
     if ctx.invoked_subcommand is None:
         typer.echo(ctx.get_help())
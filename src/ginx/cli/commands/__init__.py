@@ -10,8 +10,12 @@ from .core import (
     validate_config_command,
     version_command,
 )
+from .daemon import daemon_command
+from .history import history_command
 from .init import init_config_command
 from .run import run_script_command
+from .watch import watch_command
+from .worker import worker_command
 
 __all__ = [
     "version_command",
@@ -22,4 +26,8 @@ __all__ = [
     "init_config_command",
     "run_script_command",
     "show_dependency_graph",
+    "watch_command",
+    "daemon_command",
+    "history_command",
+    "worker_command",
 ]
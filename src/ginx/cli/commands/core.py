@@ -2,17 +2,28 @@
 Core built-in commands: version, list, validate, deps.
 """
 
+import sqlite3
 import typing
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 
-from ginx.config import get_scripts, resolve_execution_order
+from ginx.config import (
+    estimate_makespan,
+    estimate_plan_durations,
+    find_critical_path,
+    get_plan_dependencies,
+    get_scripts,
+    get_setting,
+    resolve_execution_order,
+)
 from ginx.constants import COMMON_SHELL_RESERVED_COMMANDS
+from ginx.history import get_run_store
 from ginx.utils import (
     check_dependencies,
     extract_commands_from_shell_string,
     find_requirements_files,
+    format_duration,
     parse_requirements_file,
     validate_command,
 )
@@ -153,15 +164,59 @@ def check_dependencies_command() -> None:
         typer.echo()
 
 
-def show_dependency_graph(script_name: Optional[str] = typer.Argument(None, help="Script to analyze")) -> None:
+def _show_critical_path(scripts: Dict[str, Dict[str, Any]], script_name: str, jobs: int) -> None:
+    """Show the predicted critical path and makespan of a script's plan."""
+    plan = resolve_execution_order(scripts, script_name)
+
+    try:
+        known = get_run_store().get_median_durations(plan)
+    except sqlite3.Error:
+        known = {}
+
+    durations = estimate_plan_durations(plan, known)
+    dependencies = get_plan_dependencies(scripts, plan)
+    path = find_critical_path(plan, dependencies, durations)
+
+    typer.secho(f"Critical path for '{script_name}':", fg=typer.colors.BLUE, bold=True)
+    for i, name in enumerate(path, 1):
+        source = "median" if name in known else "no history"
+        typer.echo(f"  {i}. {name} - {format_duration(durations[name])} ({source})")
+
+    typer.echo()
+    typer.echo(f"Critical path length: {format_duration(sum(durations[name] for name in path))}")
+    typer.echo(f"Serial duration: {format_duration(sum(durations.values()))}")
+    typer.echo(f"Estimated makespan with {jobs} job(s): {format_duration(estimate_makespan(plan, dependencies, durations, jobs))}")
+
+    unseen = [name for name in plan if name not in known]
+    if unseen:
+        typer.echo()
+        typer.secho(
+            f"No recorded runs for {', '.join(unseen)}; assumed {format_duration(durations[unseen[0]])} each.",
+            fg=typer.colors.YELLOW,
+        )
+
+
+def show_dependency_graph(
+    script_name: Optional[str] = typer.Argument(None, help="Script to analyze"),
+    critical_path: bool = typer.Option(False, "--critical-path", help="Show the predicted critical path and duration"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=1, help="Parallel jobs assumed for the duration estimate"),
+) -> None:
     """Show dependency graph for all scripts or a specific script."""
     scripts = get_scripts()
 
+    if critical_path and not script_name:
+        typer.secho("--critical-path requires a script name.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
     if script_name:
         if script_name not in scripts:
             typer.secho(f"Script '{script_name}' not found.", fg=typer.colors.RED)
             raise typer.Exit(code=1)
 
+        if critical_path:
+            _show_critical_path(scripts, script_name, jobs if jobs is not None else int(get_setting("jobs")))
+            return
+
         execution_order = resolve_execution_order(scripts, script_name)
         typer.secho(f"Dependency chain for '{script_name}':", fg=typer.colors.BLUE, bold=True)
         for i, script in enumerate(execution_order):
@@ -174,13 +229,35 @@ def show_dependency_graph(script_name: Optional[str] = typer.Argument(None, help
                 typer.echo(f"  {name} → {', '.join(depends)}")
 
 
-def debug_plugins_command() -> None:
-    """Debug plugin loading and registration."""
+def debug_plugins_command(
+    timings: bool = typer.Option(False, "--timings", help="Show how long plugin loading and hook calls took"),
+    json_output: bool = typer.Option(False, "--json", help="Output timings in JSON format"),
+) -> None:
+    """
+    Debug plugin loading and registration.
+
+    \b
+    Loading phases (discovery, import, instantiation, initialize() and
+    add_commands()) are always timed. Hook calls are timed when
+    GINX_PLUGIN_TIMINGS is set to a file path; the timings of such runs
+    are written to that file as JSON on exit.
+
+    \b
+    Example:
+        ginx debug-plugins --timings
+        GINX_PLUGIN_TIMINGS=timings.json ginx build
+    """
+    import json
+
     from ginx.plugins import get_plugin_manager
 
+    plugin_manager = get_plugin_manager()
+    if json_output:
+        typer.echo(json.dumps(plugin_manager.timings.to_dict(), indent=2))
+        return
+
     typer.secho("Plugin Debug Information:", fg=typer.colors.BLUE, bold=True)
 
-    plugin_manager = get_plugin_manager()
     plugins = plugin_manager.list_plugins()
     typer.echo(f"Registered plugins: {len(plugins)}")
 
@@ -191,3 +268,23 @@ def debug_plugins_command() -> None:
 
     if not plugins:
         typer.secho("  No plugins registered", fg=typer.colors.YELLOW)
+
+    if timings:
+        _show_plugin_timings(plugin_manager.timings.rows())
+
+
+def _show_plugin_timings(rows: List[Dict[str, Any]]) -> None:
+    """Show plugin timings, slowest first."""
+    typer.echo()
+    typer.secho("Plugin Timings:", fg=typer.colors.BLUE, bold=True)
+    if not rows:
+        typer.secho("  Nothing was timed", fg=typer.colors.YELLOW)
+        return
+
+    width = max(len(row["subject"]) for row in rows)
+    typer.echo(f"  {'Subject':<{width}}  {'Phase':<20}  {'Calls':>5}  {'Total':>10}  {'Max':>10}")
+    for row in sorted(rows, key=lambda row: row["total"], reverse=True):
+        typer.echo(
+            f"  {row['subject']:<{width}}  {row['phase']:<20}  {row['calls']:>5}  "
+            f"{row['total'] * 1000:>7.2f} ms  {row['max'] * 1000:>7.2f} ms"
+        )
@@ -0,0 +1,126 @@
+"""
+Daemon command implementation.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import typer
+
+from ginx.daemon import ensure_socket_dir, find_project_root, get_socket_path
+from ginx.daemon.client import daemon_request
+from ginx.utils import format_duration
+
+
+def daemon_command(
+    action: str = typer.Argument("status", help="Action: start, stop, restart or status"),
+    foreground: bool = typer.Option(False, "--foreground", "-f", help="Run the daemon in the foreground"),
+) -> None:
+    """
+    Manage the resident Ginx daemon for the current project.
+
+    \b
+    While the daemon runs, 'ginx <script>' is forwarded to it over a Unix
+    socket and skips interpreter warm-up, plugin discovery and config parsing.
+    Set GINX_NO_DAEMON=1 to bypass it.
+
+    \b
+    Example:
+        ginx daemon start
+        ginx daemon status
+        ginx daemon stop
+    """
+    if not hasattr(os, "fork"):
+        typer.secho("The Ginx daemon requires a POSIX system.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    project_root = find_project_root()
+    if project_root is None:
+        typer.secho("No configuration file found.", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    if action == "status":
+        _show_status(project_root)
+    elif action == "start":
+        _start_daemon(project_root, foreground)
+    elif action == "stop":
+        _stop_daemon(project_root)
+    elif action == "restart":
+        _stop_daemon(project_root)
+        _start_daemon(project_root, foreground)
+    else:
+        typer.secho(f"Unknown action: {action}", fg=typer.colors.RED)
+        typer.echo("Valid actions: start, stop, restart, status")
+        raise typer.Exit(code=1)
+
+
+def _show_status(project_root: str) -> None:
+    status = daemon_request(project_root, "ping")
+    if status is None:
+        typer.secho("Daemon is not running.", fg=typer.colors.YELLOW)
+        return
+
+    typer.secho("Daemon is running:", fg=typer.colors.GREEN, bold=True)
+    typer.echo(f"  PID: {status['pid']}")
+    typer.echo(f"  Project: {status['project_root']}")
+    typer.echo(f"  Socket: {status['socket']}")
+    typer.echo(f"  Uptime: {format_duration(status['uptime'])}")
+    typer.echo(f"  Requests served: {status['requests_served']}")
+
+
+def _start_daemon(project_root: str, foreground: bool) -> None:
+    if daemon_request(project_root, "ping") is not None:
+        typer.secho("Daemon is already running.", fg=typer.colors.YELLOW)
+        return
+
+    try:
+        ensure_socket_dir()
+    except OSError as e:
+        typer.secho(f"✗ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    if foreground:
+        from ginx.daemon.server import main
+
+        typer.secho(f"Serving {project_root} (Ctrl+C to stop)", fg=typer.colors.BLUE)
+        try:
+            main([project_root])
+        except KeyboardInterrupt:
+            pass
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "ginx.daemon.server", project_root],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        status = daemon_request(project_root, "ping")
+        if status is not None:
+            typer.secho(f"✓ Daemon started (PID {status['pid']})", fg=typer.colors.GREEN)
+            return
+        time.sleep(0.05)
+
+    typer.secho("✗ Daemon did not start in time.", fg=typer.colors.RED)
+    raise typer.Exit(code=1)
+
+
+def _stop_daemon(project_root: str) -> None:
+    response = daemon_request(project_root, "stop")
+    if response is None:
+        typer.secho("Daemon is not running.", fg=typer.colors.YELLOW)
+        return
+
+    socket_path = get_socket_path(project_root)
+    deadline = time.time() + 5
+    while os.path.exists(socket_path) and time.time() < deadline:
+        time.sleep(0.05)
+
+    typer.secho("✓ Daemon stopped", fg=typer.colors.GREEN)
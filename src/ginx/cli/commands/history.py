@@ -0,0 +1,116 @@
+"""
+History command implementation.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import typer
+
+from ginx.history import get_run_store
+from ginx.utils import format_duration
+
+
+def _format_optional_duration(seconds: Optional[float]) -> str:
+    return format_duration(seconds) if seconds is not None else "-"
+
+
+def _format_timestamp(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def _show_runs(runs: List[Dict[str, Any]]) -> None:
+    if not runs:
+        typer.echo("No runs recorded.")
+        return
+
+    typer.secho("Recent runs:", fg=typer.colors.BLUE, bold=True)
+    typer.echo()
+
+    for run in runs:
+        succeeded = run["exit_code"] == 0
+        symbol = "✓" if succeeded else "✗"
+        color = typer.colors.GREEN if succeeded else typer.colors.RED
+        typer.secho(f"  {symbol} {run['script']}", fg=color, bold=True, nl=False)
+        typer.echo(
+            f"  {_format_timestamp(run['started_at'])}"
+            f"  wall {_format_optional_duration(run['wall_time'])}"
+            f"  cpu {_format_optional_duration(run['cpu_time'])}"
+            f"  exit {run['exit_code']}"
+            f"  plan {run['plan_id']} ({run['target']})"
+        )
+
+
+def _show_summary(summaries: List[Dict[str, Any]]) -> None:
+    if not summaries:
+        typer.echo("No runs recorded.")
+        return
+
+    typer.secho("Run statistics:", fg=typer.colors.BLUE, bold=True)
+    typer.echo()
+
+    for summary in summaries:
+        typer.secho(f"  {summary['script']}", fg=typer.colors.GREEN, bold=True)
+        typer.echo(f"    Runs: {summary['runs']} ({summary['failures']} failed)")
+        typer.echo(f"    Median wall time: {_format_optional_duration(summary['median_wall_time'])}")
+        typer.echo(f"    Max wall time: {_format_optional_duration(summary['max_wall_time'])}")
+        typer.echo(f"    Average CPU time: {_format_optional_duration(summary['avg_cpu_time'])}")
+        if summary["max_rss_kb"] is not None:
+            typer.echo(f"    Peak memory: {summary['max_rss_kb'] / 1024:.1f} MB")
+        typer.echo(f"    Last run: {_format_timestamp(summary['last_run'])}")
+        typer.echo()
+
+
+def history_command(
+    script_name: Optional[str] = typer.Argument(None, help="Only show runs of this script"),
+    limit: int = typer.Option(20, "--limit", "-n", help="Number of runs to show"),
+    failed: bool = typer.Option(False, "--failed", help="Only show failed runs"),
+    stats: bool = typer.Option(False, "--stats", help="Show aggregate statistics per script"),
+    json_output: bool = typer.Option(False, "--json", help="Output in JSON format"),
+    clear: bool = typer.Option(False, "--clear", help="Delete the recorded history"),
+    item_timings: bool = typer.Option(False, "--item-timings", help="Print the script's recorded shard item durations as a shard.timings file"),
+) -> None:
+    """
+    Show previously recorded script runs.
+
+    \b
+    Every executed script is recorded in .ginx/history.db next to the
+    configuration file (set GINX_HISTORY_DIR to store it elsewhere, or
+    'settings.history: false' to disable recording).
+
+    \b
+    Example:
+        ginx history
+        ginx history test --failed
+        ginx history --stats --json
+        ginx history test --item-timings > test-timings.json
+    """
+    store = get_run_store()
+
+    if item_timings:
+        if script_name is None:
+            typer.secho("--item-timings needs a script name.", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        durations = store.get_item_durations(script_name)
+        typer.echo(json.dumps({item: round(durations[item], 3) for item in sorted(durations)}, indent=2))
+        return
+
+    if clear:
+        store.clear()
+        typer.secho("✓ Run history cleared", fg=typer.colors.GREEN)
+        return
+
+    if stats:
+        summaries = store.summarize(script_name)
+        if json_output:
+            typer.echo(json.dumps(summaries, indent=2))
+        else:
+            _show_summary(summaries)
+        return
+
+    runs = store.query_runs(script_name, limit=limit, failed_only=failed)
+    if json_output:
+        typer.echo(json.dumps(runs, indent=2))
+    else:
+        _show_runs(runs)
@@ -2,6 +2,8 @@
 Run command implementation.
 """
 
+from typing import Optional
+
 import typer
 
 from ginx.cli.execution import execute_script_logic
@@ -18,6 +20,9 @@ def run_script_command(
     ),
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Show what would be executed without running"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose output"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=1, help="Run up to N independent scripts in parallel"),
+    shard: Optional[str] = typer.Option(None, "--shard", help="Only run shard K/N of the script's items"),
+    trace: Optional[str] = typer.Option(None, "--trace", help="Write a Chrome trace of the run to FILE (open it in Perfetto)"),
 ) -> None:
     """
     Run a script defined in the YAML file.
@@ -28,6 +33,9 @@ def run_script_command(
         ginx run deploy "staging"
         ginx run commit "fix: bug"
         ginx run test --stream --verbose
+        ginx run ci --jobs 4
+        ginx run test --shard 3/8
+        ginx run ci --jobs 4 --trace ci-trace.json
     """
     scripts = get_scripts()
     if script_name not in scripts:
@@ -38,4 +46,4 @@ def run_script_command(
         raise typer.Exit(code=1)
 
     script_config = scripts[script_name]
-    execute_script_logic(script_name, script_config, extra, streaming, dry_run, verbose)
+    execute_script_logic(script_name, script_config, extra, streaming, dry_run, verbose, jobs=jobs, shard=shard, trace=trace)
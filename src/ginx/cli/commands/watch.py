@@ -0,0 +1,202 @@
+"""
+Watch command implementation.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import typer
+
+from ginx.cli.execution import execute_plan
+from ginx.config import find_affected_scripts, find_config_file, get_script_inputs, get_scripts, resolve_execution_order
+from ginx.config.scripts import validate_dependencies
+from ginx.utils import create_file_watcher, get_watch_roots, terminate_running_commands, wait_for_changes
+from ginx.utils.watch import FileWatcher
+
+
+class WatchSession:
+    """Keeps the configuration and execution plan resident between runs."""
+
+    def __init__(self, script_names: List[str], streaming: bool, verbose: bool) -> None:
+        self.script_names = script_names
+        self.streaming = streaming
+        self.verbose = verbose
+
+        config_path = find_config_file()
+        self.config_path: Optional[str] = str(config_path.resolve()) if config_path else None
+        self.root = str(config_path.resolve().parent) if config_path else os.getcwd()
+
+        self.scripts: Dict[str, Dict[str, Any]] = {}
+        self.plan: List[str] = []
+
+        self._thread: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+        self._current_run: List[str] = []
+
+    def load(self, scripts: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
+        """
+        (Re)build the execution plan for the watched scripts.
+
+        Returns:
+            List of problems found (empty if the plan is usable)
+        """
+        if scripts is None:
+            scripts = get_scripts()
+
+        missing = [name for name in self.script_names if name not in scripts]
+        if missing:
+            return [f"Script '{name}' not found" for name in missing]
+
+        errors = validate_dependencies(scripts)
+        if errors:
+            return errors
+
+        plan: List[str] = []
+        for name in self.script_names:
+            for script in resolve_execution_order(scripts, name):
+                if script not in plan:
+                    plan.append(script)
+
+        self.scripts = scripts
+        self.plan = plan
+        return []
+
+    def watch_paths(self) -> List[str]:
+        """Get the files and directories that need to be watched."""
+        patterns: List[str] = []
+        for name in self.plan:
+            patterns.extend(get_script_inputs(self.scripts[name]))
+
+        paths = get_watch_roots(patterns, self.root) if patterns else [self.root]
+        if self.config_path and not any(self.config_path.startswith(path.rstrip(os.sep) + os.sep) for path in paths):
+            paths.append(self.config_path)
+        return paths
+
+    def relative_paths(self, changes: Set[str]) -> List[str]:
+        """Convert absolute changed paths into project-relative posix paths."""
+        return sorted(Path(os.path.relpath(path, self.root)).as_posix() for path in changes)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start_run(self, order: List[str]) -> None:
+        """Start executing scripts in a background thread."""
+        self._cancel.clear()
+        self._current_run = list(order)
+        self._thread = threading.Thread(target=self._run, args=(list(order),), daemon=True)
+        self._thread.start()
+
+    def cancel_run(self) -> List[str]:
+        """
+        Cancel the in-flight run, if any.
+
+        Returns:
+            Scripts that belonged to the cancelled run
+        """
+        if not self.is_running() or self._thread is None:
+            return []
+
+        self._cancel.set()
+        while self._thread.is_alive():
+            terminate_running_commands()
+            self._thread.join(0.1)
+
+        return self._current_run
+
+    def _run(self, order: List[str]) -> None:
+        try:
+            execute_plan(order, self.scripts, "", "", self.streaming, self.verbose, cancel_event=self._cancel)
+        except typer.Exit:
+            pass
+        except Exception as e:
+            typer.secho(f"✗ Error during run: {e}", fg=typer.colors.RED)
+
+        if not self._cancel.is_set():
+            typer.secho("\nWatching for changes... (Ctrl+C to stop)", fg=typer.colors.BLUE)
+
+
+def watch_command(
+    script_names: List[str] = typer.Argument(..., help="Scripts to re-run when their inputs change"),
+    debounce: int = typer.Option(200, "--debounce", help="Quiet period in milliseconds before re-running"),
+    poll: bool = typer.Option(False, "--poll", help="Use the polling watcher instead of inotify"),
+    interval: float = typer.Option(0.5, "--interval", help="Polling interval in seconds"),
+    initial: bool = typer.Option(True, "--initial/--no-initial", help="Run the scripts once before watching"),
+    streaming: bool = typer.Option(True, "--stream/--no-stream", help="Stream output in real-time"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show verbose output"),
+) -> None:
+    """
+    Re-run scripts whenever their declared inputs change.
+
+    \b
+    Scripts declare the files they depend on with 'inputs' glob patterns;
+    only scripts affected by a change (and the scripts depending on them)
+    are re-run. A change arriving mid-run cancels the in-flight run.
+
+    \b
+    Example:
+        ginx watch test
+        ginx watch lint test --debounce 500
+    """
+    session = WatchSession(script_names, streaming, verbose)
+
+    errors = session.load()
+    if errors:
+        for error in errors:
+            typer.secho(f"  ✗ {error}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    watcher: FileWatcher = create_file_watcher(session.watch_paths(), force_polling=poll, interval=interval)
+    typer.secho(
+        f"Watching {len(session.watch_paths())} path(s) for {', '.join(script_names)} using {type(watcher).__name__}",
+        fg=typer.colors.BLUE,
+        bold=True,
+    )
+
+    if initial:
+        session.start_run(session.plan)
+    else:
+        typer.secho("Watching for changes... (Ctrl+C to stop)", fg=typer.colors.BLUE)
+
+    try:
+        while True:
+            changes = wait_for_changes(watcher, debounce=debounce / 1000)
+            if not changes:
+                continue
+
+            if session.config_path in changes:
+                errors = session.load()
+                if errors:
+                    typer.secho("Configuration reload failed, keeping previous plan:", fg=typer.colors.RED)
+                    for error in errors:
+                        typer.secho(f"  ✗ {error}", fg=typer.colors.RED)
+                    continue
+
+                watcher.close()
+                watcher = create_file_watcher(session.watch_paths(), force_polling=poll, interval=interval)
+                affected = list(session.plan)
+                typer.secho("\n↻ Configuration changed, reloaded scripts", fg=typer.colors.CYAN)
+            else:
+                affected = find_affected_scripts(session.scripts, session.plan, session.relative_paths(changes))
+
+            if not affected:
+                continue
+
+            if session.is_running():
+                cancelled = session.cancel_run()
+                typer.secho("\n⚠ Change detected, cancelled in-flight run", fg=typer.colors.YELLOW)
+                affected = [name for name in session.plan if name in affected or name in cancelled]
+
+            typer.secho(
+                f"\n↻ {len(changes)} change(s) detected, re-running: {', '.join(affected)}",
+                fg=typer.colors.CYAN,
+                bold=True,
+            )
+            session.start_run(affected)
+
+    except KeyboardInterrupt:
+        session.cancel_run()
+        typer.secho("\nStopped watching.", fg=typer.colors.YELLOW)
+    finally:
+        watcher.close()
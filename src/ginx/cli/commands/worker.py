@@ -0,0 +1,48 @@
+"""
+Worker command implementation.
+"""
+
+import os
+
+import typer
+
+from ginx.executors.remote import TOKEN_ENV_VAR, WorkerServer
+
+
+def worker_command(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to listen on"),
+    port: int = typer.Option(7777, "--port", "-p", help="Port to listen on (0 picks a free port)"),
+    token: str = typer.Option("", "--token", help=f"Token clients must present (defaults to ${TOKEN_ENV_VAR})"),
+) -> None:
+    """
+    Run commands sent by remote executors.
+
+    \b
+    Anyone holding the token can run arbitrary commands as this user. The
+    token is never sent, but commands and output are not encrypted, so keep
+    the default host and reach the worker from other machines through an
+    SSH tunnel.
+
+    \b
+    Example:
+        GINX_WORKER_TOKEN=secret ginx worker --port 7777
+        ssh -N -L 7777:127.0.0.1:7777 buildbox   # on the client
+    """
+    token = token or os.environ.get(TOKEN_ENV_VAR, "")
+    if not token:
+        typer.secho(f"A token is required (--token or ${TOKEN_ENV_VAR}).", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    try:
+        server = WorkerServer(token, host, port)
+    except OSError as e:
+        typer.secho(f"✗ Cannot listen on {host}:{port}: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+    typer.secho(f"Worker listening on {server.address}", fg=typer.colors.GREEN)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
@@ -3,22 +3,74 @@ Core script execution logic.
 """
 
 import shlex
+import sqlite3
 import subprocess
+import threading
 import time
-from typing import Any, Dict
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import typer
 
-from ginx.config import get_scripts
+from ginx.config import (
+    compute_priorities,
+    estimate_plan_durations,
+    get_plan_dependencies,
+    get_scripts,
+    get_setting,
+)
+from ginx.config.scheduling import ReadyQueue
+from ginx.executors import LOCAL_EXECUTOR, ExecutorError, get_executor
+from ginx.history import RunStore, get_run_store
+from ginx.metrics import TextfileExporter, get_metrics_exporter
+from ginx.plugins import PluginManager, get_plugin_manager
+from ginx.plugins.events import (
+    CACHE_HIT,
+    OUTPUT_CHUNK,
+    PLAN_RESOLVED,
+    SCRIPT_FINISHED,
+    SCRIPT_QUEUED,
+    SCRIPT_STARTED,
+    OutputChunker,
+    get_event_bus,
+)
+from ginx.tracing import (
+    CACHE,
+    CHILD,
+    CHILD_CPU,
+    CONFIG,
+    HOOK,
+    PHASES,
+    PLAN,
+    SCRIPT,
+    VALIDATION,
+    get_overhead,
+    get_tracer,
+    profile_call,
+    span,
+    trace_to,
+)
 from ginx.utils import (
     expand_variables,
     extract_commands_from_shell_string,
     format_duration,
     parse_command_and_extra,
+    run_command_captured,
     run_command_with_streaming,
     run_command_with_streaming_shell,
+    terminate_running_commands,
     validate_command,
 )
+from ginx.utils.sharding import (
+    apportion_duration,
+    collect_shard_items,
+    get_shard_variable,
+    load_shard_timings,
+    parse_shard_spec,
+    partition_items,
+    substitute_shard_items,
+)
 
 
 def execute_script_logic(
@@ -28,13 +80,33 @@ def execute_script_logic(
     streaming: bool,
     dry_run: bool,
     verbose: bool,
+    jobs: Optional[int] = None,
+    shard: Optional[str] = None,
+    trace: Optional[str] = None,
 ) -> None:
     """
     Enhanced script execution with dependency support.
+
+    With trace, the run is recorded as a Chrome trace in that file.
     """
+    with trace_to(trace):
+        _execute_script_logic(script_name, extra, streaming, dry_run, verbose, jobs, shard)
+
+
+def _execute_script_logic(
+    script_name: str,
+    extra: str,
+    streaming: bool,
+    dry_run: bool,
+    verbose: bool,
+    jobs: Optional[int],
+    shard: Optional[str],
+) -> None:
     from ginx.config.scripts import resolve_execution_order, validate_dependencies
 
-    scripts = get_scripts()
+    overhead = get_overhead()
+    with span("load config", CONFIG), overhead.measure(CONFIG):
+        scripts = get_scripts()
     if script_name not in scripts:
         typer.secho(f"Script '{script_name}' not found.", fg=typer.colors.RED)
         typer.echo("\nAvailable scripts:")
@@ -42,19 +114,27 @@ def execute_script_logic(
             typer.echo(f"  - {name}")
         raise typer.Exit(code=1)
 
-    # Validate dependencies
-    dependency_errors = validate_dependencies(scripts)
-    if dependency_errors:
-        typer.secho("Dependency validation failed:", fg=typer.colors.RED)
-        for error in dependency_errors:
-            typer.secho(f"  ✗ {error}", fg=typer.colors.RED)
-        raise typer.Exit(code=1)
+    with span("resolve plan", PLAN, target=script_name), overhead.measure(PLAN):
+        # Validate dependencies
+        dependency_errors = validate_dependencies(scripts)
+        if dependency_errors:
+            typer.secho("Dependency validation failed:", fg=typer.colors.RED)
+            for error in dependency_errors:
+                typer.secho(f"  ✗ {error}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
 
-    # Resolve execution order
-    execution_order = resolve_execution_order(scripts, script_name)
+        # Fail early on a bad shard specification
+        _resolve_shard(script_name, scripts[script_name], shard)
+
+        # Resolve execution order
+        execution_order = resolve_execution_order(scripts, script_name)
+
+    if jobs is None:
+        jobs = int(get_setting("jobs"))
 
     if verbose or len(execution_order) > 1:
-        typer.secho("Execution plan:", fg=typer.colors.BLUE, bold=True)
+        parallelism = f" (up to {jobs} parallel jobs)" if jobs > 1 else ""
+        typer.secho(f"Execution plan{parallelism}:", fg=typer.colors.BLUE, bold=True)
         for i, script in enumerate(execution_order, 1):
             is_target = script == script_name
             marker = "▶" if is_target else "○"
@@ -67,30 +147,124 @@ def execute_script_logic(
         typer.secho("Dry run - no scripts executed", fg=typer.colors.YELLOW)
         return
 
+    execute_plan(execution_order, scripts, script_name, extra, streaming, verbose, jobs=jobs, shard=shard)
+
+
+def execute_plan(
+    execution_order: List[str],
+    scripts: Dict[str, Dict[str, Any]],
+    target_script: str,
+    extra: str,
+    streaming: bool,
+    verbose: bool,
+    cancel_event: Optional[threading.Event] = None,
+    jobs: int = 1,
+    shard: Optional[str] = None,
+) -> None:
+    """
+    Execute an already resolved plan, dependencies first.
+
+    With more than one job, independent scripts run concurrently and ready
+    scripts are started in critical-path order (see ginx.config.scheduling).
+
+    Args:
+        execution_order: Script names in execution order
+        scripts: Dictionary of script configurations
+        target_script: Script that receives the extra arguments
+        extra: Extra CLI arguments for the target script
+        streaming: Whether to stream output
+        verbose: Whether to show verbose output
+        cancel_event: When set, no further scripts are started
+        jobs: Maximum number of scripts running at once
+        shard: 'K/N' shard of the target script's items to run
+    """
+    plan_id = uuid.uuid4().hex[:12]
+    plan_target = target_script or (execution_order[-1] if execution_order else "")
+    run_store = get_run_store() if get_setting("history") else None
+    plugins = get_plugin_manager()
+    background_hooks = plugins.has_hooks("post_execution_hook") and bool(get_setting("background_hooks"))
+    # Subscribes to the event bus, so create it before the first event
+    metrics = get_metrics_exporter()
+    events = get_event_bus()
+    if events.wants(PLAN_RESOLVED):
+        events.emit(PLAN_RESOLVED, target=plan_target, scripts=list(execution_order), jobs=jobs)
+    tracer = get_tracer()
+
     # Execute scripts in dependency order
     total_start_time = time.time()
 
-    for i, current_script in enumerate(execution_order):
-        is_target = current_script == script_name
-        current_config = scripts[current_script]
+    try:
+        if jobs > 1 and len(execution_order) > 1:
+            _execute_plan_parallel(
+                execution_order,
+                scripts,
+                target_script,
+                extra,
+                streaming,
+                verbose,
+                jobs,
+                cancel_event,
+                shard=shard,
+                run_store=run_store,
+                plan_id=plan_id,
+                plan_target=plan_target,
+                background_hooks=background_hooks,
+            )
+        else:
+            for i, current_script in enumerate(execution_order):
+                if cancel_event is not None and cancel_event.is_set():
+                    return
 
-        # Use provided extra args only for target script
-        current_extra = extra if is_target else ""
+                is_target = current_script == target_script
+                current_config = scripts[current_script]
 
-        typer.secho(
-            f"\n[{i+1}/{len(execution_order)}] Running: {current_script}",
-            fg=typer.colors.BLUE,
-            bold=True,
-        )
+                # Use provided extra args only for target script
+                current_extra = extra if is_target else ""
 
-        try:
-            _execute_single_script(current_script, current_config, current_extra, streaming, verbose)
-        except typer.Exit as e:
-            typer.secho(
-                f"\n✗ Dependency '{current_script}' exited. Stopping execution.",
-                fg=typer.colors.RED,
-            )
-            raise e
+                if events.wants(SCRIPT_QUEUED):
+                    events.emit(SCRIPT_QUEUED, current_script)
+                if tracer is not None:
+                    tracer.queued(current_script)
+
+                typer.secho(
+                    f"\n[{i+1}/{len(execution_order)}] Running: {current_script}",
+                    fg=typer.colors.BLUE,
+                    bold=True,
+                )
+
+                try:
+                    _execute_single_script(
+                        current_script,
+                        current_config,
+                        current_extra,
+                        streaming,
+                        verbose,
+                        shard=shard if is_target else None,
+                        run_store=run_store,
+                        plan_id=plan_id,
+                        plan_target=plan_target,
+                        background_hooks=background_hooks,
+                    )
+                except typer.Exit as e:
+                    typer.secho(
+                        f"\n✗ Dependency '{current_script}' exited. Stopping execution.",
+                        fg=typer.colors.RED,
+                    )
+                    raise e
+    finally:
+        if background_hooks:
+            plugins.wait_for_hooks()
+        events.flush()
+        overhead = get_overhead().take()
+        if metrics is not None:
+            _write_metrics(metrics, overhead)
+        if run_store is not None:
+            _flush_run_store(run_store)
+        if verbose:
+            _show_overhead(overhead)
+
+    if cancel_event is not None and cancel_event.is_set():
+        return
 
     total_duration = time.time() - total_start_time
     typer.secho(
@@ -100,14 +274,305 @@ def execute_script_logic(
     )
 
 
+def _load_known_durations(execution_order: List[str]) -> Dict[str, float]:
+    """Historical median durations of the plan's scripts (empty if unavailable)."""
+    try:
+        return get_run_store().get_median_durations(execution_order)
+    except (sqlite3.Error, OSError):
+        return {}
+
+
+def _execute_plan_parallel(
+    execution_order: List[str],
+    scripts: Dict[str, Dict[str, Any]],
+    target_script: str,
+    extra: str,
+    streaming: bool,
+    verbose: bool,
+    jobs: int,
+    cancel_event: Optional[threading.Event] = None,
+    shard: Optional[str] = None,
+    run_store: Optional[RunStore] = None,
+    plan_id: str = "",
+    plan_target: str = "",
+    background_hooks: bool = False,
+) -> None:
+    """
+    Run a plan on up to `jobs` worker threads.
+
+    Whenever a worker is free, the ready script with the longest remaining
+    downstream path (weighted by historical median durations) is started.
+    After a failure no new scripts are started; running ones are awaited.
+    """
+    with get_overhead().measure(PLAN):
+        dependencies = get_plan_dependencies(scripts, execution_order)
+        durations = estimate_plan_durations(execution_order, _load_known_durations(execution_order))
+        queue = ReadyQueue(execution_order, dependencies, compute_priorities(execution_order, dependencies, durations))
+
+    failure: Optional[typer.Exit] = None
+    started = 0
+    running: Dict["Future[None]", str] = {}
+
+    events = get_event_bus()
+    tracer = get_tracer()
+    for script in execution_order:
+        if not dependencies[script]:
+            if events.wants(SCRIPT_QUEUED):
+                events.emit(SCRIPT_QUEUED, script)
+            if tracer is not None:
+                tracer.queued(script)
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="ginx-job") as pool:
+        try:
+            while True:
+                while failure is None and len(running) < jobs and not (cancel_event is not None and cancel_event.is_set()):
+                    current_script = queue.pop()
+                    if current_script is None:
+                        break
+
+                    started += 1
+                    typer.secho(
+                        f"\n[{started}/{len(execution_order)}] Running: {current_script}",
+                        fg=typer.colors.BLUE,
+                        bold=True,
+                    )
+                    future = pool.submit(
+                        _execute_single_script,
+                        current_script,
+                        scripts[current_script],
+                        extra if current_script == target_script else "",
+                        streaming,
+                        verbose,
+                        shard=shard if current_script == target_script else None,
+                        run_store=run_store,
+                        plan_id=plan_id,
+                        plan_target=plan_target,
+                        output_prefix=f"[{current_script}] ",
+                        background_hooks=background_hooks,
+                    )
+                    running[future] = current_script
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_script = running.pop(future)
+                    try:
+                        future.result()
+                    except typer.Exit as e:
+                        if failure is None:
+                            failure = e
+                            typer.secho(
+                                f"\n✗ Dependency '{current_script}' exited. Waiting for running scripts to finish.",
+                                fg=typer.colors.RED,
+                            )
+                    else:
+                        released = queue.complete(current_script)
+                        for script in released:
+                            if events.wants(SCRIPT_QUEUED):
+                                events.emit(SCRIPT_QUEUED, script)
+                            if tracer is not None:
+                                tracer.queued(script)
+        except KeyboardInterrupt:
+            terminate_running_commands()
+            typer.secho("\n⚠ Execution interrupted", fg=typer.colors.YELLOW)
+            raise typer.Exit(code=130)
+
+    if failure is not None:
+        raise failure
+
+
+def _resolve_shard(script_name: str, script_config: Dict[str, Any], shard: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Work out which shard of a script's items to run.
+
+    Returns:
+        Tuple of (index, count), or None if the script is not sharded
+    """
+    shard_config = script_config.get("shard")
+
+    if shard is None:
+        if not shard_config:
+            return None
+        if shard_config.get("index") is None:
+            # Not split across jobs, run every item
+            return (1, 1)
+        spec = f"{expand_variables(str(shard_config['index']))}/{expand_variables(str(shard_config.get('count', 1)))}"
+    else:
+        if not shard_config:
+            typer.secho(f"Script '{script_name}' has no 'shard' configuration.", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+        spec = shard if "/" in shard else f"{shard}/{shard_config.get('count', 1)}"
+
+    try:
+        return parse_shard_spec(spec)
+    except ValueError as e:
+        typer.secho(f"✗ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+def _load_item_durations(script_name: str) -> Dict[str, float]:
+    """Recorded per-item durations of a script (empty if unavailable)."""
+    try:
+        return get_run_store().get_item_durations(script_name)
+    except (sqlite3.Error, OSError):
+        return {}
+
+
+def _load_shard_timings(script_name: str, script_config: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Per-item durations to balance shards with, from the script's 'shard.timings' file.
+
+    Every shard must compute the same partition, so only a shared input is
+    used, never the local history. Without a timings file, items are split
+    evenly.
+    """
+    path = script_config["shard"].get("timings")
+    if not path:
+        return {}
+    try:
+        return load_shard_timings(str(path), script_config.get("cwd"))
+    except (OSError, ValueError) as e:
+        typer.secho(f"✗ Script '{script_name}': cannot read shard timings: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+def _select_shard_items(
+    script_name: str,
+    script_config: Dict[str, Any],
+    command_str: str,
+    shard: Tuple[int, int],
+    timings: Dict[str, float],
+) -> Tuple[str, List[str]]:
+    """
+    Pick this shard's bucket of items and substitute it into the command.
+
+    Returns:
+        Tuple of (command, items in this shard)
+    """
+    shard_config = script_config["shard"]
+    index, count = shard
+
+    try:
+        variable = get_shard_variable(command_str, shard_config)
+        items = collect_shard_items(shard_config, script_config.get("cwd"))
+    except ValueError as e:
+        typer.secho(f"✗ Script '{script_name}': {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    except subprocess.CalledProcessError as e:
+        typer.secho(f"✗ Shard item command failed with exit code {e.returncode}", fg=typer.colors.RED)
+        if e.stderr:
+            typer.echo(e.stderr)
+        raise typer.Exit(code=e.returncode)
+
+    bucket = partition_items(items, count, timings)[index - 1]
+    if count > 1:
+        typer.secho(f"Shard {index}/{count}: {len(bucket)} of {len(items)} items", fg=typer.colors.CYAN)
+
+    return substitute_shard_items(command_str, variable, bucket), bucket
+
+
+def _flush_run_store(run_store: RunStore) -> None:
+    """Write buffered run records, never failing the run because of history."""
+    try:
+        run_store.flush()
+    except (sqlite3.Error, OSError) as e:
+        typer.secho(f"Warning: Could not record run history: {e}", fg=typer.colors.YELLOW)
+
+
+def _write_metrics(metrics: TextfileExporter, overhead: Dict[str, float]) -> None:
+    """Add the finished run to the metrics file."""
+    try:
+        metrics.finish_run(self_seconds={phase: overhead.get(phase, 0.0) for phase in PHASES})
+    except OSError as e:
+        typer.secho(f"Warning: Could not write metrics to {metrics.path}: {e}", fg=typer.colors.YELLOW)
+
+
+def _show_overhead(overhead: Dict[str, float]) -> None:
+    """
+    Show the time ginx itself spent, per phase, next to the time of the scripts.
+
+    Script times are summed over all scripts, so with parallel jobs they can exceed the run's wall time.
+    """
+
+    def ms(seconds: float) -> str:
+        return f"{seconds * 1000:.1f}ms"
+
+    own = sum(overhead.get(phase, 0.0) for phase in PHASES)
+    phases = ", ".join(f"{phase} {ms(overhead.get(phase, 0.0))}" for phase in PHASES)
+    children = f"{format_duration(overhead.get(CHILD, 0.0))} wall"
+    if CHILD_CPU in overhead:
+        children += f", {format_duration(overhead[CHILD_CPU])} CPU"
+    typer.secho(f"\nGinx overhead: {ms(own)} ({phases}); scripts (summed): {children}", fg=typer.colors.CYAN)
+
+
+# Run statistics included in script_finished events
+_FINISHED_FIELDS = ("exit_code", "duration", "cpu_time", "max_rss_kb")
+
+
 def _execute_single_script(
     script_name: str,
     script_config: Dict[str, Any],
     extra: str,
     streaming: bool,
     verbose: bool,
+    shard: Optional[str] = None,
+    run_store: Optional[RunStore] = None,
+    plan_id: str = "",
+    plan_target: str = "",
+    output_prefix: str = "",
+    background_hooks: bool = False,
+) -> None:
+    """
+    Execute a single script without dependency resolution.
+
+    When tracing, the script is recorded as a span on the track of the thread
+    it runs on. When profiling, scripts on job threads are profiled too.
+    """
+    tracer = get_tracer()
+    if tracer is not None:
+        tracer.dequeued(script_name)
+        tracer.count("running scripts", 1)
+    try:
+        with span(script_name, SCRIPT):
+            profile_call(
+                _run_single_script,
+                script_name,
+                script_config,
+                extra,
+                streaming,
+                verbose,
+                shard=shard,
+                run_store=run_store,
+                plan_id=plan_id,
+                plan_target=plan_target,
+                output_prefix=output_prefix,
+                background_hooks=background_hooks,
+            )
+    finally:
+        if tracer is not None:
+            tracer.count("running scripts", -1)
+
+
+def _run_single_script(
+    script_name: str,
+    script_config: Dict[str, Any],
+    extra: str,
+    streaming: bool,
+    verbose: bool,
+    shard: Optional[str] = None,
+    run_store: Optional[RunStore] = None,
+    plan_id: str = "",
+    plan_target: str = "",
+    output_prefix: str = "",
+    background_hooks: bool = False,
 ) -> None:
-    """Execute a single script without dependency resolution."""
+    plugins = get_plugin_manager()
+    if plugins.has_hooks("process_script"):
+        # Plugins get a copy, the loaded configuration is shared between runs
+        with span("process_script", HOOK):
+            script_config = plugins.process_script(script_name, dict(script_config))
 
     command_str = script_config["command"]
 
@@ -115,6 +580,92 @@ def _execute_single_script(
     script_env = script_config.get("env", {})
     command_str = expand_variables(command_str, script_env)
 
+    # Substitute this shard's items into the command
+    shard_spec = _resolve_shard(script_name, script_config, shard)
+    shard_items: List[str] = []
+    item_durations: Dict[str, float] = {}
+    if shard_spec is not None:
+        item_durations = _load_item_durations(script_name)
+        timings = _load_shard_timings(script_name, script_config)
+        command_str, shard_items = _select_shard_items(script_name, script_config, command_str, shard_spec, timings)
+        if not shard_items:
+            typer.secho(f"{output_prefix}Shard {shard_spec[0]}/{shard_spec[1]} has no items, nothing to run.", fg=typer.colors.YELLOW)
+            return
+
+    with get_overhead().measure(VALIDATION):
+        full_command, command_display, needs_shell = _prepare_command(command_str, extra)
+    if plugins.has_hooks("pre_execution_hook"):
+        with span("pre_execution_hook", HOOK):
+            full_command, command_display = _run_pre_execution_hooks(plugins, script_name, full_command, command_display)
+
+    if verbose:
+        typer.secho(f"{output_prefix}Command: {command_display}", fg=typer.colors.CYAN)
+
+    events = get_event_bus()
+    if events.wants(SCRIPT_STARTED):
+        events.emit(SCRIPT_STARTED, script_name, command=command_display)
+    output_chunker = OutputChunker(events, script_name) if events.wants(OUTPUT_CHUNK) else None
+
+    start_time = time.time()
+    stats: Dict[str, Any] = {}
+
+    try:
+        _execute_command(
+            full_command=full_command,
+            needs_shell=needs_shell,
+            streaming=streaming,
+            script=script_config,
+            script_name=script_name,
+            start_time=start_time,
+            stats=stats,
+            output_prefix=output_prefix,
+            on_output=output_chunker,
+        )
+    finally:
+        if output_chunker is not None:
+            output_chunker.close()
+        if "cpu_time" in stats:
+            get_overhead().add(CHILD_CPU, stats["cpu_time"])
+        tracer = get_tracer()
+        if tracer is not None:
+            tracer.add_span("run", SCRIPT, start_time, time.time(), command=command_display, exit_code=stats.get("exit_code"))
+            if stats.get("cache_hit"):
+                tracer.instant("cache hit", CACHE)
+        if "exit_code" in stats:
+            if stats.get("cache_hit") and events.wants(CACHE_HIT):
+                events.emit(CACHE_HIT, script_name)
+            if events.wants(SCRIPT_FINISHED):
+                events.emit(SCRIPT_FINISHED, script_name, **{key: stats[key] for key in _FINISHED_FIELDS if key in stats})
+        if "exit_code" in stats and plugins.has_hooks("post_execution_hook"):
+            with span("post_execution_hook", HOOK, background=background_hooks):
+                plugins.run_post_execution_hooks(script_name, stats["exit_code"], stats["duration"], background=background_hooks)
+        if run_store is not None and "exit_code" in stats:
+            run_store.record(
+                plan_id=plan_id,
+                target=plan_target or script_name,
+                script=script_name,
+                started_at=start_time,
+                wall_time=stats["duration"],
+                exit_code=stats["exit_code"],
+                cpu_time=stats.get("cpu_time"),
+                max_rss_kb=stats.get("max_rss_kb"),
+                cache_hit=stats.get("cache_hit", False),
+            )
+            if shard_items and stats["exit_code"] == 0:
+                run_store.record_item_durations(
+                    script_name,
+                    apportion_duration(shard_items, stats["duration"], item_durations),
+                    start_time,
+                )
+
+
+def _prepare_command(command_str: str, extra: str) -> Tuple[str | list[str], str, bool]:
+    """
+    Validate a command, decide whether it needs a shell and add the extra arguments.
+
+    Returns:
+        Tuple of (command, display string, needs shell)
+    """
     # Validate command
     if not validate_command(command_str):
         typer.secho("Command validation failed. Aborting.", fg=typer.colors.RED)
@@ -146,24 +697,64 @@ def _execute_single_script(
 
     # Parse command and add extra arguments
     full_command, command_display = parse_command_and_extra(command_str, extra, needs_shell=needs_shell)
+    return full_command, command_display, needs_shell
 
-    if verbose:
-        typer.secho(f"Command: {command_display}", fg=typer.colors.CYAN)
 
-    start_time = time.time()
+def _run_pre_execution_hooks(
+    plugins: PluginManager,
+    script_name: str,
+    full_command: str | list[str],
+    command_display: str,
+) -> Tuple[str | list[str], str]:
+    """
+    Let plugins rewrite a command.
 
-    try:
-        _execute_command(
-            full_command=full_command,
-            needs_shell=needs_shell,
-            streaming=streaming,
-            script=script_config,
-            script_name=script_name,
-            start_time=start_time,
-        )
-    except Exception:
-        # Re-raise to stop dependency chain
-        raise
+    Shell commands are passed to the hooks as a one-element list, and the
+    returned list is joined with spaces.
+
+    Returns:
+        Tuple of (command, display string)
+    """
+    if isinstance(full_command, list):
+        command = plugins.run_pre_execution_hooks(script_name, list(full_command))
+        return command, (command_display if command == full_command else shlex.join(command))
+
+    command_str = " ".join(plugins.run_pre_execution_hooks(script_name, [full_command]))
+    return command_str, (command_display if command_str == full_command else command_str)
+
+
+def _run_on_executor(
+    executor_name: str,
+    full_command: str | list[str],
+    needs_shell: bool,
+    script: Dict[str, Any],
+    stats: Dict[str, Any],
+    output_prefix: str,
+    on_output: Optional[Callable[[str], None]],
+) -> int:
+    """
+    Run a command on a named executor, printing its output as it arrives.
+
+    Raises:
+        ExecutorError: If the executor is unknown or cannot run the command
+    """
+    executor = get_executor(executor_name)
+    if needs_shell:
+        command: str | list[str] = " ".join(full_command) if isinstance(full_command, list) else full_command
+    else:
+        command = full_command if isinstance(full_command, list) else shlex.split(full_command)
+
+    def handle_output(line: str) -> None:
+        typer.echo(f"{output_prefix}{line}")
+        if on_output is not None:
+            on_output(line)
+
+    return executor.run(command, needs_shell, script.get("cwd"), script.get("env"), handle_output, stats)
+
+
+def _echo_captured(text: str, output_prefix: str) -> None:
+    """Print captured output with every line prefixed like streamed output, in one write."""
+    typer.echo("\n".join(f"{output_prefix}{line}" for line in text.splitlines()))
 
 
 def _execute_command(
@@ -173,89 +764,107 @@ def _execute_command(
     script: Dict[str, Any],
     script_name: str,
     start_time: float,
+    stats: Optional[Dict[str, Any]] = None,
+    output_prefix: str = "",
+    on_output: Optional[Callable[[str], None]] = None,
 ) -> None:
-    """Execute the actual command with proper error handling."""
+    """
+    Execute the actual command with proper error handling.
+
+    When given, stats receives 'exit_code' and 'duration' (plus 'cpu_time'
+    and 'max_rss_kb' when the platform reports them). output_prefix is put
+    in front of every output line, to tell concurrent scripts apart.
+    on_output receives every output line. Scripts with an 'executor'
+    other than 'local' run on that executor.
+    """
+    if stats is None:
+        stats = {}
+    executor_name = script.get("executor", LOCAL_EXECUTOR)
 
     try:
-        if streaming:
-            # Use streaming output
-            if needs_shell:
+        if executor_name != LOCAL_EXECUTOR or streaming:
+            # Use streaming output (other executors always stream)
+            if executor_name != LOCAL_EXECUTOR:
+                exit_code = _run_on_executor(executor_name, full_command, needs_shell, script, stats, output_prefix, on_output)
+            elif needs_shell:
                 exit_code = run_command_with_streaming_shell(
                     (str(full_command) if isinstance(full_command, list) else full_command),
                     cwd=script.get("cwd"),
                     env=script.get("env"),
+                    stats=stats,
+                    prefix=output_prefix,
+                    on_output=on_output,
                 )
             else:
                 exit_code = run_command_with_streaming(
                     (full_command if isinstance(full_command, list) else shlex.split(full_command)),
                     cwd=script.get("cwd"),
                     env=script.get("env"),
+                    stats=stats,
+                    prefix=output_prefix,
+                    on_output=on_output,
                 )
 
+            duration = time.time() - start_time
+            stats["exit_code"] = exit_code
+            stats["duration"] = duration
+
             if exit_code == 0:
-                duration = time.time() - start_time
                 typer.secho(
-                    f"\n✓ Script completed successfully in {format_duration(duration)}",
+                    f"\n{output_prefix}✓ Script completed successfully in {format_duration(duration)}",
                     fg=typer.colors.GREEN,
                 )
             else:
-                typer.secho(f"\n✗ Script exited with exit code {exit_code}", fg=typer.colors.RED)
+                typer.secho(f"\n{output_prefix}✗ Script exited with exit code {exit_code}", fg=typer.colors.RED)
                 raise typer.Exit(code=exit_code)
         else:
             # Capture output
-            if needs_shell:
-                result = subprocess.run(
-                    full_command,
-                    shell=True,
-                    check=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                    capture_output=True,
-                    cwd=script.get("cwd"),
-                    env=script.get("env"),
-                )
-            else:
-                result = subprocess.run(
-                    full_command,
-                    check=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                    capture_output=True,
-                    cwd=script.get("cwd"),
-                    env=script.get("env"),
-                )
+            # wait4() gives this child's own usage, even with concurrent scripts
+            result = run_command_captured(full_command, shell=needs_shell, cwd=script.get("cwd"), env=script.get("env"), stats=stats)
+            result.check_returncode()
 
             duration = time.time() - start_time
+            # Output is captured by the child's pipes, so all of it is child time
+            get_overhead().add(CHILD, duration)
+            stats["exit_code"] = result.returncode
+            stats["duration"] = duration
 
             if result.stdout:
-                typer.echo(result.stdout)
+                _echo_captured(result.stdout, output_prefix)
+                if on_output is not None:
+                    for line in result.stdout.splitlines():
+                        on_output(line)
 
             typer.secho(
-                f"✓ Script completed successfully in {format_duration(duration)}",
+                f"{output_prefix}✓ Script completed successfully in {format_duration(duration)}",
                 fg=typer.colors.GREEN,
             )
 
+    except ExecutorError as e:
+        typer.secho(f"{output_prefix}✗ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
     except subprocess.CalledProcessError as e:
         duration = time.time() - start_time
+        get_overhead().add(CHILD, duration)
+        stats["exit_code"] = e.returncode
+        stats["duration"] = duration
         typer.secho(
-            f"\n✗ Script execution failed after {format_duration(duration)}",
+            f"\n{output_prefix}✗ Script execution failed after {format_duration(duration)}",
             fg=typer.colors.RED,
         )
 
         if e.stderr:
-            typer.echo("Error output:")
-            typer.echo(e.stderr)
+            _echo_captured("Error output:\n" + e.stderr, output_prefix)
         elif hasattr(e, "output") and e.output:
-            typer.echo("Output:")
-            typer.echo(e.output)
+            _echo_captured("Output:\n" + e.output, output_prefix)
 
         raise typer.Exit(code=e.returncode)
     except KeyboardInterrupt:
         duration = time.time() - start_time
+        stats["exit_code"] = 130
+        stats["duration"] = duration
         typer.secho(
-            f"\n⚠ Script interrupted after {format_duration(duration)}",
+            f"\n{output_prefix}⚠ Script interrupted after {format_duration(duration)}",
             fg=typer.colors.YELLOW,
         )
         raise typer.Exit(code=130)
@@ -2,7 +2,7 @@
 Dynamic script command registration.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import typer
 
@@ -19,8 +19,11 @@ def create_script_command(script_name: str, script_config: Dict[str, Any]):
         streaming: bool = typer.Option(True, "--stream/--no-stream", help="Stream output"),
         dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Dry run"),
         verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+        jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=1, help="Parallel jobs"),
+        shard: Optional[str] = typer.Option(None, "--shard", help="Only run shard K/N"),
+        trace: Optional[str] = typer.Option(None, "--trace", help="Write a Chrome trace of the run to FILE"),
     ) -> None:
-        return execute_script_logic(script_name, script_config, extra, streaming, dry_run, verbose)
+        return execute_script_logic(script_name, script_config, extra, streaming, dry_run, verbose, jobs=jobs, shard=shard, trace=trace)
 
     script_command.__name__ = f"script_{script_name}"
     script_command.__doc__ = script_config.get("description", f"Run {script_name} script")
@@ -41,3 +44,11 @@ def register_script_commands(app: typer.Typer) -> None:
                 pass
     except Exception as e:
         typer.echo(f"Warning: Could not load scripts: {e}")
+
+
+def refresh_script_commands(app: typer.Typer) -> None:
+    """Drop previously registered script commands and register them again from the current config."""
+    app.registered_commands = [
+        command_info for command_info in app.registered_commands if getattr(command_info.callback, "__module__", None) != __name__
+    ]
+    register_script_commands(app)
@@ -10,4 +10,8 @@ RESERVED_COMMANDS: Set[str] = {
     "deps",
     "graph",
     "debug-plugins",
+    "watch",
+    "daemon",
+    "history",
+    "worker",
 }
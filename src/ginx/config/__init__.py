@@ -12,13 +12,28 @@ from .discovery import DEFAULT_CONFIG_FILES, find_config_file
 from .loader import load_config, load_raw_config, save_config
 from .plugins import (
     get_plugin_directories,
+    get_plugin_settings,
     is_plugin_enabled,
 )
 from .plugins import load_plugin_config
 from .plugins import load_plugin_config as get_plugin_config
 
+# Scheduling
+from .scheduling import (
+    compute_priorities,
+    estimate_makespan,
+    estimate_plan_durations,
+    find_critical_path,
+    get_plan_dependencies,
+)
+
 # Specialized loaders
-from .scripts import get_script_variables, has_variables
+from .scripts import (
+    find_affected_scripts,
+    get_script_inputs,
+    get_script_variables,
+    has_variables,
+)
 from .scripts import load_scripts
 from .scripts import load_scripts as get_scripts
 from .scripts import resolve_execution_order
@@ -76,6 +91,7 @@ __all__ = [
     "get_setting",
     "is_plugin_enabled",
     "get_plugin_directories",
+    "get_plugin_settings",
     "is_dangerous_commands_enabled",
     "has_variables",
     "get_script_variables",
@@ -89,4 +105,12 @@ __all__ = [
     "DEFAULT_SETTINGS",
     # Executable commands
     "resolve_execution_order",
+    "find_affected_scripts",
+    "get_script_inputs",
+    # Scheduling
+    "get_plan_dependencies",
+    "estimate_plan_durations",
+    "compute_priorities",
+    "find_critical_path",
+    "estimate_makespan",
 ]
@@ -2,14 +2,21 @@
 Core YAML configuration loading.
 """
 
+import copy
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import typer
 import yaml
 
+from ginx.tracing.overhead import CONFIG, get_overhead
+
 from .discovery import find_config_file
 
+# Parsed configuration keyed by path, valid while the file's stat signature is unchanged
+_config_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
 
 class ConfigLoadError(Exception):
     """Exception raised when configuration loading fails."""
@@ -30,6 +37,11 @@ def load_raw_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     Raises:
         ConfigLoadError: If configuration cannot be loaded
     """
+    with get_overhead().measure(CONFIG):
+        return _load_raw_config(config_path)
+
+
+def _load_raw_config(config_path: Optional[Path]) -> Dict[str, Any]:
     if config_path is None:
         config_path = find_config_file()
 
@@ -40,10 +52,17 @@ def load_raw_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
         raise ConfigLoadError(f"Configuration file not found: {config_path}")
 
     try:
+        stat = os.stat(config_path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = _config_cache.get(str(config_path))
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
         with open(config_path, "r", encoding="utf-8") as f:
             config: Dict[Any, Any] = yaml.safe_load(f) or {}
 
-        return config
+        _config_cache[str(config_path)] = (signature, config)
+        return copy.deepcopy(config)
 
     except yaml.YAMLError as e:
         raise ConfigLoadError(f"Error parsing YAML file: {e}")
@@ -51,6 +70,11 @@ def load_raw_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
         raise ConfigLoadError(f"Error loading configuration: {e}")
 
 
+def clear_config_cache() -> None:
+    """Forget all parsed configuration files."""
+    _config_cache.clear()
+
+
 def normalize_config(raw_config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize configuration structure with default sections.
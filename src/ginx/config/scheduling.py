@@ -0,0 +1,197 @@
+"""
+Critical-path scheduling of script dependency plans.
+
+Scripts are prioritized by the longest chain of work that still depends on
+them (their own duration included), so the scripts that hold up the end of
+the plan are started first when several are ready.
+"""
+
+import heapq
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+
+from ginx.constants import DEFAULT_SCRIPT_DURATION
+
+
+def get_plan_dependencies(scripts: Dict[str, Dict[str, Any]], plan: List[str]) -> Dict[str, List[str]]:
+    """
+    Get the dependencies of each script, restricted to the plan.
+
+    Args:
+        scripts: Dictionary of script configurations
+        plan: Script names in dependency order
+
+    Returns:
+        Dictionary mapping script names to the plan scripts they depend on
+    """
+    in_plan = set(plan)
+    return {name: [dep for dep in scripts[name].get("depends", []) if dep in in_plan] for name in plan}
+
+
+def _get_dependents(plan: List[str], dependencies: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    dependents: Dict[str, List[str]] = {name: [] for name in plan}
+    for name in plan:
+        for dep in dependencies[name]:
+            dependents[dep].append(name)
+    return dependents
+
+
+def estimate_plan_durations(plan: List[str], known: Dict[str, float], default: Optional[float] = None) -> Dict[str, float]:
+    """
+    Fill in duration estimates for every script of a plan.
+
+    Args:
+        plan: Script names
+        known: Historical (median) durations in seconds
+        default: Estimate for scripts without history (defaults to the median
+            of the known durations, or DEFAULT_SCRIPT_DURATION without any)
+
+    Returns:
+        Dictionary mapping every plan script to an estimated duration
+    """
+    if default is None:
+        default = statistics.median(known.values()) if known else DEFAULT_SCRIPT_DURATION
+    return {name: known.get(name, default) for name in plan}
+
+
+def compute_priorities(plan: List[str], dependencies: Dict[str, List[str]], durations: Dict[str, float]) -> Dict[str, float]:
+    """
+    Compute the longest remaining path through each script.
+
+    Args:
+        plan: Script names in dependency order
+        dependencies: Plan dependencies (see get_plan_dependencies)
+        durations: Estimated duration of each script
+
+    Returns:
+        Dictionary mapping script names to the duration of the longest chain
+        starting with that script
+    """
+    dependents = _get_dependents(plan, dependencies)
+    priorities: Dict[str, float] = {}
+
+    # Dependents always come later in the plan
+    for name in reversed(plan):
+        downstream = [priorities[child] for child in dependents[name]]
+        priorities[name] = durations[name] + (max(downstream) if downstream else 0.0)
+
+    return priorities
+
+
+def find_critical_path(plan: List[str], dependencies: Dict[str, List[str]], durations: Dict[str, float]) -> List[str]:
+    """
+    Find the chain of scripts that bounds the plan's duration.
+
+    Args:
+        plan: Script names in dependency order
+        dependencies: Plan dependencies (see get_plan_dependencies)
+        durations: Estimated duration of each script
+
+    Returns:
+        Script names along the critical path, first to last
+    """
+    if not plan:
+        return []
+
+    priorities = compute_priorities(plan, dependencies, durations)
+    dependents = _get_dependents(plan, dependencies)
+
+    current = max((name for name in plan if not dependencies[name]), key=lambda name: priorities[name])
+    path = [current]
+    while dependents[current]:
+        current = max(dependents[current], key=lambda name: priorities[name])
+        path.append(current)
+
+    return path
+
+
+class ReadyQueue:
+    """Hands out scripts whose dependencies have completed, highest priority first."""
+
+    def __init__(self, plan: List[str], dependencies: Dict[str, List[str]], priorities: Dict[str, float]) -> None:
+        self._priorities = priorities
+        self._position = {name: i for i, name in enumerate(plan)}
+        self._dependents = _get_dependents(plan, dependencies)
+        self._waiting_on = {name: len(dependencies[name]) for name in plan}
+        self._ready: List[Tuple[float, int, str]] = []
+
+        for name in plan:
+            if not self._waiting_on[name]:
+                self._push(name)
+
+    def _push(self, name: str) -> None:
+        # Ties keep plan order
+        heapq.heappush(self._ready, (-self._priorities[name], self._position[name], name))
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def pop(self) -> Optional[str]:
+        """Get the most urgent ready script (None if nothing is ready)."""
+        if not self._ready:
+            return None
+        return heapq.heappop(self._ready)[2]
+
+    def complete(self, name: str) -> List[str]:
+        """
+        Mark a script as finished, releasing the scripts waiting on it.
+
+        Returns:
+            The scripts that became ready
+        """
+        released: List[str] = []
+        for child in self._dependents[name]:
+            self._waiting_on[child] -= 1
+            if not self._waiting_on[child]:
+                self._push(child)
+                released.append(child)
+        return released
+
+
+def simulate_schedule(
+    plan: List[str],
+    dependencies: Dict[str, List[str]],
+    durations: Dict[str, float],
+    jobs: int = 1,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Predict when each script starts and ends when run with the given parallelism.
+
+    Args:
+        plan: Script names in dependency order
+        dependencies: Plan dependencies (see get_plan_dependencies)
+        durations: Estimated duration of each script
+        jobs: Maximum number of scripts running at once
+
+    Returns:
+        Dictionary mapping script names to (start, end) offsets in seconds
+    """
+    queue = ReadyQueue(plan, dependencies, compute_priorities(plan, dependencies, durations))
+    position = {name: i for i, name in enumerate(plan)}
+    running: List[Tuple[float, int, str]] = []
+    schedule: Dict[str, Tuple[float, float]] = {}
+    now = 0.0
+
+    while queue or running:
+        while queue and len(running) < max(jobs, 1):
+            name = queue.pop()
+            if name is None:
+                break
+            schedule[name] = (now, now + durations[name])
+            heapq.heappush(running, (now + durations[name], position[name], name))
+
+        now, _, finished = heapq.heappop(running)
+        queue.complete(finished)
+
+    return schedule
+
+
+def estimate_makespan(
+    plan: List[str],
+    dependencies: Dict[str, List[str]],
+    durations: Dict[str, float],
+    jobs: int = 1,
+) -> float:
+    """Predict the total duration of a plan run with the given parallelism."""
+    schedule = simulate_schedule(plan, dependencies, durations, jobs)
+    return max((end for _, end in schedule.values()), default=0.0)
@@ -2,7 +2,8 @@
 Script configuration loading and validation.
 """
 
-from typing import Any, Dict, List, Optional, Set, cast
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, cast
 
 import typer
 
@@ -101,6 +102,40 @@ def validate_script_config(name: str, script: Any) -> Optional[Dict[str, Any]]:
         else:
             script_dict["depends"] = [str(dep) for dep in depends]
 
+        if "inputs" in script_dict:
+            inputs = script_dict["inputs"]
+            if isinstance(inputs, str):
+                script_dict["inputs"] = [inputs]
+            else:
+                script_dict["inputs"] = [str(pattern) for pattern in inputs or []]
+
+        if "executor" in script_dict and not isinstance(script_dict["executor"], str):
+            typer.secho(
+                f"Script '{name}' has an invalid 'executor'. Expected the name of an executor.",
+                fg=typer.colors.RED,
+            )
+            return None
+
+        if "shard" in script_dict:
+            shard = script_dict["shard"]
+            if isinstance(shard, str):
+                shard = {"items": [shard]}
+            elif not isinstance(shard, dict):
+                typer.secho(
+                    f"Script '{name}' has an invalid 'shard' block. Expected a glob pattern or a mapping.",
+                    fg=typer.colors.RED,
+                )
+                return None
+            if isinstance(shard.get("items"), str):
+                shard["items"] = [shard["items"]]
+            if "timings" in shard and not isinstance(shard["timings"], str):
+                typer.secho(
+                    f"Script '{name}' has an invalid 'shard.timings'. Expected the path of a JSON file.",
+                    fg=typer.colors.RED,
+                )
+                return None
+            script_dict["shard"] = shard
+
         return script_dict
 
     else:
@@ -277,6 +312,129 @@ def has_variables(script_config: Dict[str, Any]) -> bool:
     return has_new_syntax or has_legacy_syntax or has_variable_definitions
 
 
+def get_script_inputs(script_config: Dict[str, Any]) -> List[str]:
+    """
+    Get the input path patterns declared by a script.
+
+    Args:
+        script_config: Script configuration dictionary
+
+    Returns:
+        List of glob patterns relative to the project root
+    """
+    return script_config.get("inputs", [])
+
+
+def _compile_input_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    Translate an input glob pattern into a regular expression.
+
+    ``**`` matches across directories, ``*``, ``?`` and ``[...]`` classes
+    (negated with ``[!...]``) stay within a single path segment, and a
+    pattern without wildcards matches the path itself or anything below it.
+    """
+    pattern = pattern.replace("\\", "/").strip("/")
+    if pattern.startswith("./"):
+        pattern = pattern[2:]
+
+    if not any(char in pattern for char in "*?["):
+        return re.compile(re.escape(pattern) + r"(?:/.*)?$")
+
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += r"(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += r".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += r"[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += r"[^/]"
+            i += 1
+        elif pattern[i] == "[":
+            end = _find_class_end(pattern, i)
+            if end < 0:
+                regex += re.escape("[")
+                i += 1
+                continue
+            members = pattern[i + 1 : end]
+            negated = members.startswith("!")
+            if negated:
+                members = members[1:]
+            members = members.replace("\\", "\\\\").replace("^", "\\^").replace("[", "\\[")
+            regex += "(?!/)[" + ("^" if negated else "") + members + "]"
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+
+    return re.compile(regex + "$")
+
+
+def _find_class_end(pattern: str, start: int) -> int:
+    """Index of the ']' closing the class opened at start, or -1 (a leading ']' is a member, as in fnmatch)."""
+    i = start + 1
+    if i < len(pattern) and pattern[i] == "!":
+        i += 1
+    if i < len(pattern) and pattern[i] == "]":
+        i += 1
+    end = pattern.find("]", i)
+    return -1 if end < 0 or "/" in pattern[start:end] else end
+
+
+def match_script_inputs(script_config: Dict[str, Any], paths: Iterable[str]) -> bool:
+    """
+    Check whether any of the given paths matches a script's declared inputs.
+
+    Args:
+        script_config: Script configuration dictionary
+        paths: Changed paths, relative to the project root with '/' separators
+
+    Returns:
+        True if at least one path matches an input pattern
+    """
+    patterns = [_compile_input_pattern(pattern) for pattern in get_script_inputs(script_config)]
+    return any(regex.match(path) for path in paths for regex in patterns)
+
+
+def find_affected_scripts(scripts: Dict[str, Dict[str, Any]], plan: List[str], changed_paths: Iterable[str]) -> List[str]:
+    """
+    Find the part of an execution plan affected by a set of changed paths.
+
+    A script is affected when one of its declared inputs matches a changed
+    path, or when it (transitively) depends on an affected script. If no
+    script in the plan declares inputs, every change affects the whole plan.
+
+    Args:
+        scripts: Dictionary of script configurations
+        plan: Script names in execution order (dependencies first)
+        changed_paths: Changed paths, relative to the project root
+
+    Returns:
+        Affected script names, in plan order
+    """
+    changed = list(changed_paths)
+    if not changed:
+        return []
+
+    if not any(get_script_inputs(scripts[name]) for name in plan):
+        return list(plan)
+
+    affected: Set[str] = set()
+    for name in plan:
+        script_config = scripts[name]
+        if match_script_inputs(script_config, changed):
+            affected.add(name)
+        elif any(dep in affected for dep in script_config.get("depends", [])):
+            affected.add(name)
+
+    return [name for name in plan if name in affected]
+
+
 def get_reserved_commands() -> Set[str]:
     """
     Get the set of reserved command names.
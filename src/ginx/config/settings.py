@@ -8,7 +8,11 @@ from .loader import load_config
 
 # Default global settings
 DEFAULT_SETTINGS: Dict[str, Any] = {
+    "background_hooks": False,
     "dangerous_commands": True,
+    "history": True,
+    "jobs": 1,
+    "metrics_file": "",
 }
 
 
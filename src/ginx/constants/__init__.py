@@ -82,6 +82,29 @@ COMMON_SHELL_RESERVED_COMMANDS = [
     "ginx",  # not including it in the dependecies
 ]
 
+# Directory names never watched by `ginx watch`
+DEFAULT_WATCH_IGNORE = [
+    ".git",
+    ".hg",
+    ".svn",
+    ".ginx",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".tox",
+    ".nox",
+    ".venv",
+    "venv",
+    "node_modules",
+    "build",
+    "dist",
+    "htmlcov",
+]
+
+# Estimated duration (seconds) of scripts without any recorded history
+DEFAULT_SCRIPT_DURATION = 1.0
+
 
 __all__ = [
     "DANGEROUS_PATTERNS",
@@ -89,4 +112,6 @@ __all__ = [
     "DEFAULT_REQUIREMENTS_FILES",
     "COMMON_DEV_PACKAGES",
     "COMMON_SHELL_RESERVED_COMMANDS",
+    "DEFAULT_WATCH_IGNORE",
+    "DEFAULT_SCRIPT_DURATION",
 ]
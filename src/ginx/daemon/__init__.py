@@ -0,0 +1,130 @@
+"""
+Resident Ginx daemon.
+
+The daemon keeps the CLI application, plugin registry and parsed configuration
+loaded for a project. A thin client forwards argv, environment, working
+directory and terminal file descriptors over a Unix socket, and the daemon
+forks a warm worker that runs the command directly on the caller's terminal.
+
+This package only depends on the standard library so the client stays cheap
+to import.
+"""
+
+import hashlib
+import os
+import stat
+from typing import Optional
+
+# Mirrors ginx.config.discovery.DEFAULT_CONFIG_FILES (importing it would pull in Typer and PyYAML)
+CONFIG_FILES = ["ginx.yaml", "ginx.yml", ".ginx.yaml", ".ginx.yml"]
+
+# Set to a non-empty value other than "0" to bypass a running daemon
+DISABLE_ENV_VAR = "GINX_NO_DAEMON"
+
+# Mirrors ginx.plugins.timings.TIMINGS_ENV_VAR: plugin timings are measured
+# while loading plugins and written at exit, which a warm worker cannot do
+TIMINGS_ENV_VAR = "GINX_PLUGIN_TIMINGS"
+
+
+def find_project_root(start_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Find the directory holding the nearest Ginx configuration file.
+
+    Uses os.path rather than pathlib to keep client startup cheap.
+
+    Args:
+        start_dir: Directory to start searching from (defaults to current directory)
+
+    Returns:
+        Project root directory if found, None otherwise
+    """
+    directory = os.path.abspath(start_dir or os.getcwd())
+
+    while True:
+        for config_name in CONFIG_FILES:
+            if os.path.exists(os.path.join(directory, config_name)):
+                return directory
+
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def get_socket_dir() -> str:
+    """
+    Get the directory holding daemon sockets.
+
+    $XDG_RUNTIME_DIR is private to the user. Without it, sockets go into a
+    per-user 0700 directory in the temporary directory, so other users can
+    neither plant a socket nor reach the daemon.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return runtime_dir
+    return os.path.join(os.environ.get("TMPDIR") or "/tmp", f"ginx-{os.getuid()}")
+
+
+def get_socket_path(project_root: str) -> str:
+    """
+    Get the daemon socket path for a project.
+
+    Socket paths are limited to ~100 bytes, so the path lives in the runtime
+    directory and is derived from a hash of the project root.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Absolute socket path
+    """
+    digest = hashlib.sha1(os.path.realpath(project_root).encode()).hexdigest()[:12]
+    return os.path.join(get_socket_dir(), f"ginx-{os.getuid()}-{digest}.sock")
+
+
+def ensure_socket_dir() -> str:
+    """
+    Create the socket directory if needed and check that it is private.
+
+    Returns:
+        Socket directory
+
+    Raises:
+        PermissionError: If the directory belongs to another user or others can write to it
+    """
+    socket_dir = get_socket_dir()
+    try:
+        os.mkdir(socket_dir, 0o700)
+    except FileExistsError:
+        pass
+    if not is_private(socket_dir):
+        raise PermissionError(f"{socket_dir} must be owned by the current user and not writable by others")
+    return socket_dir
+
+
+def is_private(path: str) -> bool:
+    """
+    Check that a path (not following symlinks) belongs to the current user and only they can write to it.
+
+    Args:
+        path: File or directory path
+
+    Returns:
+        True if the path is safe to trust
+    """
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return info.st_uid == os.getuid() and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+__all__ = [
+    "CONFIG_FILES",
+    "DISABLE_ENV_VAR",
+    "ensure_socket_dir",
+    "find_project_root",
+    "get_socket_dir",
+    "get_socket_path",
+    "is_private",
+]
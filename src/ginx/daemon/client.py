@@ -0,0 +1,130 @@
+"""
+Thin daemon client.
+
+Imports nothing beyond the standard library so that forwarding a command to a
+running daemon costs little more than interpreter startup.
+"""
+
+import os
+import signal
+import socket
+import stat
+from typing import Any, Dict, List, Optional
+
+from . import DISABLE_ENV_VAR, TIMINGS_ENV_VAR, find_project_root, get_socket_path, is_private
+from .protocol import get_peer_uid, recv_message, send_message
+
+# Commands that must always run in the calling process
+LOCAL_ONLY_COMMANDS = {"daemon", "worker"}
+
+
+def _connect(project_root: str) -> Optional[socket.socket]:
+    """
+    Connect to the project's daemon, returning None if it is not running.
+
+    Requests carry the environment and the terminal, so a socket is only
+    used if it and its directory belong to the current user, are not
+    writable by others, and the process listening on it runs as this user.
+    """
+    socket_path = get_socket_path(project_root)
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return None
+    if not stat.S_ISSOCK(info.st_mode) or not is_private(socket_path) or not is_private(os.path.dirname(socket_path)):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        if get_peer_uid(sock) not in (None, os.getuid()):
+            sock.close()
+            return None
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward_to_daemon(argv: List[str]) -> Optional[int]:
+    """
+    Run a Ginx command through the resident daemon, if one is running.
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        Exit code of the command, or None if it must run locally instead
+    """
+    if os.environ.get(DISABLE_ENV_VAR, "") not in ("", "0"):
+        return None
+
+    # Timing plugins needs a fresh process
+    if os.environ.get(TIMINGS_ENV_VAR):
+        return None
+
+    if argv and argv[0] in LOCAL_ONLY_COMMANDS:
+        return None
+
+    project_root = find_project_root()
+    if project_root is None:
+        return None
+
+    sock = _connect(project_root)
+    if sock is None:
+        return None
+
+    with sock:
+        request = {"command": "run", "argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+        try:
+            send_message(sock, request, fds=[0, 1, 2])
+        except OSError:
+            return None
+
+        worker_pid: Optional[int] = None
+        while True:
+            try:
+                message, _ = recv_message(sock)
+            except KeyboardInterrupt:
+                # The worker is not in the terminal's foreground process group, relay the interrupt
+                if worker_pid is not None:
+                    os.kill(worker_pid, signal.SIGINT)
+                    continue
+                return 130
+            except OSError:
+                message = None
+
+            if message is None:
+                # Only fall back to a local run if the command never started
+                return None if worker_pid is None else 1
+
+            if "pid" in message:
+                worker_pid = int(message["pid"])
+            elif "exit_code" in message:
+                return int(message["exit_code"])
+            elif "error" in message and worker_pid is None:
+                return None
+
+
+def daemon_request(project_root: str, command: str) -> Optional[Dict[str, Any]]:
+    """
+    Send a control command (ping, stop) to a project's daemon.
+
+    Args:
+        project_root: Project root directory
+        command: Control command name
+
+    Returns:
+        Daemon response, or None if no daemon is running
+    """
+    sock = _connect(project_root)
+    if sock is None:
+        return None
+
+    with sock:
+        try:
+            send_message(sock, {"command": command})
+            message, _ = recv_message(sock)
+        except OSError:
+            return None
+        return message
@@ -0,0 +1,109 @@
+"""
+Wire protocol shared by the daemon client and server.
+
+Messages are length-prefixed JSON objects. The first client message can carry
+file descriptors as SCM_RIGHTS ancillary data.
+"""
+
+import array
+import json
+import os
+import socket
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_HEADER = struct.Struct("!I")
+_MAX_FDS = 8
+
+# Largest message accepted by default (requests carry the whole environment)
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any], fds: Optional[Sequence[int]] = None) -> None:
+    """
+    Send one framed message, optionally passing file descriptors.
+
+    Args:
+        sock: Connected AF_UNIX socket
+        message: JSON-serializable message
+        fds: File descriptors to pass along with the message
+    """
+    payload = json.dumps(message, separators=(",", ":")).encode()
+    data = _HEADER.pack(len(payload)) + payload
+
+    if fds:
+        ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))]
+        sent = sock.sendmsg([data], ancillary)
+        data = data[sent:]
+
+    if data:
+        sock.sendall(data)
+
+
+def _recv_exact(sock: socket.socket, size: int, data: bytes = b"") -> Optional[bytes]:
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def recv_message(sock: socket.socket, max_size: int = MAX_MESSAGE_SIZE) -> Tuple[Optional[Dict[str, Any]], List[int]]:
+    """
+    Receive one framed message and any file descriptors sent with it.
+
+    Only the bytes of this message are consumed, so consecutive messages on
+    the same connection are never merged.
+
+    Args:
+        sock: Connected socket
+        max_size: Largest payload to accept, in bytes
+
+    Returns:
+        Tuple of (message or None if the peer closed the connection, received fds)
+
+    Raises:
+        ValueError: If the message is larger than max_size or not valid JSON
+    """
+    fds = array.array("i")
+    data, ancdata, _, _ = sock.recvmsg(_HEADER.size, socket.CMSG_LEN(_MAX_FDS * fds.itemsize))
+
+    for level, kind, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[: len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+
+    header = _recv_exact(sock, _HEADER.size, data) if data else None
+    if header is None:
+        return None, list(fds)
+
+    (length,) = _HEADER.unpack(header)
+    if length > max_size:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError(f"message of {length} bytes exceeds the limit of {max_size}")
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        return None, list(fds)
+
+    return json.loads(payload.decode()), list(fds)
+
+
+def get_peer_uid(sock: socket.socket) -> Optional[int]:
+    """
+    Get the user id of the process at the other end of a Unix socket.
+
+    Returns:
+        The peer's uid, or None if the platform does not report it
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", credentials)
+    return int(uid)
+
+
+def is_same_user(sock: socket.socket) -> bool:
+    """Check that the peer of a Unix socket runs as the current user (assumed where not reported)."""
+    uid = get_peer_uid(sock)
+    return uid is None or uid == os.getuid()
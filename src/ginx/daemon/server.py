@@ -0,0 +1,296 @@
+"""
+Daemon server.
+
+Keeps the Typer application (with plugins and script commands registered) and
+the parsed configuration in memory, and forks a worker per client request.
+"""
+
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import ensure_socket_dir, find_project_root, get_socket_dir, get_socket_path
+from .protocol import is_same_user, recv_message, send_message
+
+
+class DaemonServer:
+    """Serves Ginx commands for one project over a Unix socket."""
+
+    def __init__(self, project_root: str, socket_path: Optional[str] = None) -> None:
+        self.project_root = project_root
+        self.socket_path = socket_path or get_socket_path(project_root)
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._listener: Optional[socket.socket] = None
+        self._running = False
+        self._config_signature: Optional[Tuple[int, int, int]] = None
+        self._plugin_signature: Tuple[Tuple[str, int], ...] = ()
+        # Set when plugins changed: the server stops and main() starts a fresh one
+        self.restart_requested = False
+        self._app: Any = None
+        self._command: Any = None
+
+    def warm_up(self) -> None:
+        """Import the CLI and load plugins and configuration."""
+        os.chdir(self.project_root)
+
+        import typer
+
+        from ginx.cli import app
+
+        self._app = app
+        self._command = typer.main.get_command(app)
+        self._config_signature = self._get_config_signature()
+        self._plugin_signature = self._get_plugin_signature()
+
+    def _get_config_signature(self) -> Optional[Tuple[int, int, int]]:
+        from pathlib import Path
+
+        from ginx.config import find_config_file
+
+        config_path = find_config_file(Path(self.project_root))
+        if config_path is None:
+            return None
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _get_plugin_signature(self) -> Tuple[Tuple[str, int], ...]:
+        """
+        Get the mtimes of everything the plugin registry was built from.
+
+        Covers the plugin directories and their files, and the sys.path
+        directories, whose mtime changes when a distribution (and with it an
+        entry point) is installed or removed.
+        """
+        from ginx.plugins import get_plugin_manager
+
+        paths: List[str] = []
+        for plugin_dir in get_plugin_manager().get_default_plugin_dirs():
+            paths.append(plugin_dir)
+            try:
+                paths.extend(os.path.join(plugin_dir, name) for name in sorted(os.listdir(plugin_dir)) if name.endswith(".py"))
+            except OSError:
+                continue
+        paths.extend(entry or "." for entry in sys.path)
+
+        signature = []
+        for path in paths:
+            try:
+                signature.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                continue
+        return tuple(signature)
+
+    def plugins_changed(self) -> bool:
+        """Check whether plugins were edited, added or (un)installed since warm_up()."""
+        return self._get_plugin_signature() != self._plugin_signature
+
+    def _refresh_if_stale(self) -> None:
+        """Re-register script commands when the configuration file changed."""
+        signature = self._get_config_signature()
+        if signature == self._config_signature:
+            return
+
+        import typer
+
+        from ginx.cli import refresh_script_commands
+
+        refresh_script_commands(self._app)
+        self._command = typer.main.get_command(self._app)
+        self._config_signature = signature
+
+    def serve_forever(self) -> None:
+        """Accept and serve requests until stopped."""
+        if os.path.dirname(self.socket_path) == get_socket_dir():
+            ensure_socket_dir()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            listener.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        listener.listen(64)
+        listener.settimeout(1.0)
+
+        self._listener = listener
+        self._running = True
+        signal.signal(signal.SIGTERM, lambda *_: self.stop())
+
+        try:
+            while self._running:
+                self._reap_workers()
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    if not self._running:
+                        break
+                    raise
+
+                conn.settimeout(None)
+                try:
+                    self._handle_connection(conn)
+                except Exception as e:
+                    try:
+                        send_message(conn, {"error": str(e)})
+                    except OSError:
+                        pass
+                finally:
+                    conn.close()
+        finally:
+            listener.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _reap_workers(self) -> None:
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        # Check the peer before reading anything it sent
+        if not is_same_user(conn):
+            send_message(conn, {"error": "permission denied"})
+            return
+
+        message, fds = recv_message(conn)
+        try:
+            if message is None:
+                return
+
+            command = message.get("command")
+            if command == "ping":
+                send_message(conn, self.status())
+            elif command == "stop":
+                send_message(conn, {"stopping": True, "pid": os.getpid()})
+                self.stop()
+            elif command == "run":
+                if len(fds) < 3:
+                    send_message(conn, {"error": "run requests must pass stdin, stdout and stderr"})
+                    return
+                if self.plugins_changed():
+                    # Loaded plugin modules can't be replaced in place, so restart. The
+                    # client runs this command locally, as no worker has started.
+                    send_message(conn, {"error": "plugins changed, restarting"})
+                    self.restart_requested = True
+                    self.stop()
+                    return
+                self._refresh_if_stale()
+                self._fork_worker(conn, message, fds)
+                self.requests_served += 1
+            else:
+                send_message(conn, {"error": f"unknown command: {command}"})
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "project_root": self.project_root,
+            "socket": self.socket_path,
+            "uptime": time.time() - self.started_at,
+            "requests_served": self.requests_served,
+        }
+
+    def _fork_worker(self, conn: socket.socket, message: Dict[str, Any], fds: List[int]) -> None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        pid = os.fork()
+        if pid != 0:
+            return
+
+        # Worker process: adopt the client's terminal, environment and working directory
+        exit_code = 1
+        try:
+            if self._listener is not None:
+                self._listener.close()
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+            for target, fd in zip((0, 1, 2), fds):
+                os.dup2(fd, target)
+            for stream in (sys.stdout, sys.stderr):
+                stream.reconfigure(line_buffering=True)  # type: ignore[attr-defined]
+
+            os.environ.clear()
+            os.environ.update(message.get("env", {}))
+            os.chdir(message.get("cwd", self.project_root))
+
+            argv = [str(arg) for arg in message.get("argv", [])]
+            sys.argv = ["ginx"] + argv
+            send_message(conn, {"pid": os.getpid()})
+
+            exit_code = self._run_cli(argv)
+        except BaseException as e:
+            try:
+                sys.stderr.write(f"ginx daemon: {e}\n")
+            except Exception:
+                pass
+        finally:
+            # os._exit() skips atexit handlers, so stop executor workers here
+            try:
+                from ginx.executors import close_executors
+
+                close_executors()
+            except Exception:
+                pass
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                send_message(conn, {"exit_code": exit_code})
+            except Exception:
+                pass
+            os._exit(exit_code)
+
+    def _run_cli(self, argv: List[str]) -> int:
+        try:
+            self._command.main(args=argv, prog_name="ginx")
+        except SystemExit as e:
+            if e.code is None:
+                return 0
+            return e.code if isinstance(e.code, int) else 1
+        except KeyboardInterrupt:
+            return 130
+        return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the daemon in the foreground for the project containing the given (or current) directory."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    project_root = find_project_root(argv[0] if argv else None)
+    if project_root is None:
+        sys.stderr.write("ginx daemon: no configuration file found\n")
+        return 1
+
+    server = DaemonServer(project_root)
+    server.warm_up()
+    server.serve_forever()
+    if server.restart_requested:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, [sys.executable, "-m", "ginx.daemon.server", project_root])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Executor backends that run script commands.
+
+Scripts pick an executor by name with `executor:`. Scripts without one run
+as local child processes. Executors are defined in
+`settings.executors`, or registered by plugins:
+
+    settings:
+      executors:
+        buildbox:
+          type: remote
+          address: 127.0.0.1:7777  # through an SSH tunnel
+          token_env: BUILDBOX_TOKEN
+        warm:
+          type: pool
+          size: 4
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ginx.config import get_setting
+from ginx.utils import run_command_with_streaming, run_command_with_streaming_shell
+
+# Name of the built-in executor that runs commands as local child processes
+LOCAL_EXECUTOR = "local"
+
+OutputHandler = Callable[[str], None]
+
+
+class ExecutorError(Exception):
+    """An executor could not run a command (as opposed to the command failing)."""
+
+
+class Executor(ABC):
+    """Runs script commands somewhere and streams their output back."""
+
+    @abstractmethod
+    def run(
+        self,
+        command: Union[str, List[str]],
+        shell: bool,
+        cwd: Optional[str],
+        env: Optional[Dict[str, str]],
+        on_output: OutputHandler,
+        stats: Dict[str, Any],
+    ) -> int:
+        """
+        Run a command to completion.
+
+        Args:
+            command: Argument list, or a string for shell commands
+            shell: Run the command through the shell
+            cwd: Working directory
+            env: Variables added to the environment
+            on_output: Called with every output line (stdout and stderr)
+            stats: Receives 'cpu_time' and 'max_rss_kb' when known
+
+        Returns:
+            Exit code of the command
+
+        Raises:
+            ExecutorError: If the command could not be run
+        """
+
+    def close(self) -> None:
+        """Release connections and worker processes."""
+
+
+class LocalExecutor(Executor):
+    """Runs commands as child processes of Ginx."""
+
+    def run(
+        self,
+        command: Union[str, List[str]],
+        shell: bool,
+        cwd: Optional[str],
+        env: Optional[Dict[str, str]],
+        on_output: OutputHandler,
+        stats: Dict[str, Any],
+    ) -> int:
+        if shell:
+            command_str = command if isinstance(command, str) else " ".join(command)
+            return run_command_with_streaming_shell(command_str, cwd=cwd, env=env, stats=stats, on_output=on_output, echo=False)
+        command_list = command if isinstance(command, list) else [command]
+        return run_command_with_streaming(command_list, cwd=cwd, env=env, stats=stats, on_output=on_output, echo=False)
+
+
+ExecutorFactory = Callable[[Dict[str, Any]], Executor]
+
+_executor_types: Dict[str, ExecutorFactory] = {}
+_executors: Dict[str, Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def register_executor_type(type_name: str, factory: ExecutorFactory) -> None:
+    """
+    Register a type of executor that can be configured in settings.executors.
+
+    Args:
+        type_name: Value of 'type' in the executor configuration
+        factory: Creates an executor from its configuration
+    """
+    _executor_types[type_name] = factory
+
+
+def register_executor(name: str, executor: Executor) -> None:
+    """Register a ready-made executor under a name scripts can select."""
+    with _executors_lock:
+        _executors[name] = executor
+
+
+def get_executor(name: str) -> Executor:
+    """
+    Get an executor by name, creating configured ones on first use.
+
+    Raises:
+        ExecutorError: If no executor of that name is registered or configured
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is not None:
+            return executor
+
+        configured = get_setting("executors") or {}
+        options = configured.get(name) if isinstance(configured, dict) else None
+        if not isinstance(options, dict):
+            raise ExecutorError(f"Unknown executor '{name}'")
+        factory = _executor_types.get(str(options.get("type", "")))
+        if factory is None:
+            raise ExecutorError(f"Executor '{name}' has an unknown type '{options.get('type', '')}'")
+
+        try:
+            executor = factory(options)
+        except (TypeError, ValueError) as e:
+            raise ExecutorError(f"Invalid configuration of executor '{name}': {e}") from e
+        _executors[name] = executor
+        return executor
+
+
+def close_executors() -> None:
+    """Close every executor created or registered so far."""
+    with _executors_lock:
+        executors = list(_executors.values())
+    for executor in executors:
+        executor.close()
+
+
+from .pool import PoolExecutor  # noqa: E402
+from .remote import RemoteExecutor, WorkerServer  # noqa: E402
+
+register_executor_type(LOCAL_EXECUTOR, lambda options: LocalExecutor())
+register_executor_type("remote", RemoteExecutor.from_options)
+register_executor_type("pool", PoolExecutor.from_options)
+register_executor(LOCAL_EXECUTOR, LocalExecutor())
+
+__all__ = [
+    "LOCAL_EXECUTOR",
+    "Executor",
+    "ExecutorError",
+    "LocalExecutor",
+    "PoolExecutor",
+    "RemoteExecutor",
+    "WorkerServer",
+    "close_executors",
+    "get_executor",
+    "register_executor",
+    "register_executor_type",
+]
@@ -0,0 +1,137 @@
+"""
+Executor backed by a pool of warm local worker processes.
+"""
+
+import atexit
+import os
+import secrets
+import subprocess
+import sys
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from . import Executor, ExecutorError, OutputHandler
+from .remote import TOKEN_ENV_VAR, RemoteExecutor
+
+DEFAULT_POOL_SIZE = 4
+
+
+class _Worker(NamedTuple):
+    """A worker process and the connection to it."""
+
+    process: "subprocess.Popen[str]"
+    executor: RemoteExecutor
+
+
+class PoolExecutor(Executor):
+    """
+    Runs commands on a pool of up to `size` worker processes.
+
+    Workers are started when a command finds all running ones busy, and
+    each runs one command at a time, so further scripts wait for a free
+    worker. Each worker listens on 127.0.0.1 with its own random token, and
+    all are stopped when the executor is closed or Ginx exits.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE) -> None:
+        if size < 1:
+            raise ValueError("'size' must be at least 1")
+        self.size = size
+        self._workers: List[_Worker] = []
+        self._free: List[_Worker] = []
+        # Workers started or being started, at most size
+        self._started = 0
+        self._condition = threading.Condition()
+        self._atexit_registered = False
+
+    @classmethod
+    def from_options(cls, options: Dict[str, Any]) -> "PoolExecutor":
+        """Create an executor from its settings.executors entry."""
+        return cls(int(options.get("size", DEFAULT_POOL_SIZE)))
+
+    def _start_worker(self) -> _Worker:
+        token = secrets.token_hex(16)
+        command = [sys.executable, "-m", "ginx.executors.worker", "--host", "127.0.0.1", "--port", "0"]
+        # Through the environment, as other users can read command lines
+        env = dict(os.environ, **{TOKEN_ENV_VAR: token})
+        try:
+            process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, text=True, env=env)
+        except OSError as e:
+            raise ExecutorError(f"Cannot start worker: {e}") from e
+
+        address = process.stdout.readline().strip() if process.stdout is not None else ""
+        if not address:
+            process.kill()
+            process.wait()
+            raise ExecutorError("Worker exited before listening")
+        return _Worker(process, RemoteExecutor(address, token))
+
+    def _checkout(self) -> _Worker:
+        """Take a free worker, starting one if all are busy and the pool is not full."""
+        with self._condition:
+            while not self._free and self._started >= self.size:
+                self._condition.wait()
+            if self._free:
+                return self._free.pop()
+            self._started += 1
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+        try:
+            worker = self._start_worker()
+        except BaseException:
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._workers.append(worker)
+        return worker
+
+    def _checkin(self, worker: _Worker) -> None:
+        with self._condition:
+            alive = worker in self._workers and worker.process.poll() is None
+            if alive:
+                self._free.append(worker)
+            elif worker in self._workers:
+                # Died while running: make room for a new one
+                self._workers.remove(worker)
+                self._started -= 1
+            self._condition.notify()
+        if not alive:
+            _stop(worker)
+
+    def run(
+        self,
+        command: Union[str, List[str]],
+        shell: bool,
+        cwd: Optional[str],
+        env: Optional[Dict[str, str]],
+        on_output: OutputHandler,
+        stats: Dict[str, Any],
+    ) -> int:
+        worker = self._checkout()
+        try:
+            return worker.executor.run(command, shell, cwd, env, on_output, stats)
+        finally:
+            self._checkin(worker)
+
+    def close(self) -> None:
+        with self._condition:
+            workers, self._workers, self._free = self._workers, [], []
+            self._started -= len(workers)
+            self._condition.notify_all()
+        for worker in workers:
+            _stop(worker)
+
+
+def _stop(worker: _Worker) -> None:
+    worker.executor.close()
+    if worker.process.poll() is None:
+        worker.process.terminate()
+    try:
+        worker.process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        worker.process.kill()
+        worker.process.wait()
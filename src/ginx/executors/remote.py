@@ -0,0 +1,373 @@
+"""
+Remote executor and the worker it talks to over TCP.
+
+Each connection starts with a challenge-response handshake in which both
+sides prove they hold the token without sending it. The client then sends
+one 'run' request per command on the persistent connection; the worker
+streams the output back in batches and ends with an 'exit' message.
+Messages use the daemon wire protocol (length-prefixed JSON).
+
+Workers run arbitrary commands for anyone holding their token, so they bind
+to 127.0.0.1 unless told otherwise and refuse to start without a token.
+Traffic is not encrypted: reach workers on other hosts through an SSH tunnel.
+"""
+
+import hashlib
+import hmac
+import os
+import secrets
+import socket
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ginx.daemon.protocol import recv_message, send_message
+from ginx.utils import wait_for_process
+
+from . import Executor, ExecutorError, OutputHandler
+
+# Environment variable holding the worker token when none is configured
+TOKEN_ENV_VAR = "GINX_WORKER_TOKEN"
+
+# Output lines are sent when this many are buffered, or after this many seconds
+OUTPUT_BATCH_LINES = 64
+OUTPUT_BATCH_DELAY = 0.05
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+
+# Limits for the handshake, before the peer has proven it holds the token
+HANDSHAKE_MESSAGE_SIZE = 1024
+HANDSHAKE_TIMEOUT = 10.0
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    Split a 'host:port' address.
+
+    Raises:
+        ValueError: If the address has no valid port
+    """
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Expected 'host:port', got '{address}'")
+    return host.strip("[]"), int(port)
+
+
+class RemoteExecutor(Executor):
+    """
+    Runs commands on a worker started with `ginx worker`.
+
+    Connections are kept open and reused, one per concurrently running command.
+    """
+
+    def __init__(self, address: str, token: str, connect_timeout: float = DEFAULT_CONNECT_TIMEOUT) -> None:
+        self.address = address
+        self._host, self._port = parse_address(address)
+        self._token = token
+        self._connect_timeout = connect_timeout
+        self._idle: List[socket.socket] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_options(cls, options: Dict[str, Any]) -> "RemoteExecutor":
+        """Create an executor from its settings.executors entry."""
+        if "address" not in options:
+            raise ValueError("'address' is required")
+        return cls(str(options["address"]), _get_token(options), float(options.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)))
+
+    def _connect(self) -> socket.socket:
+        try:
+            sock = socket.create_connection((self._host, self._port), timeout=self._connect_timeout)
+        except OSError as e:
+            raise ExecutorError(f"Cannot connect to worker at {self.address}: {e}") from e
+        try:
+            self._authenticate(sock)
+        except (OSError, ValueError) as e:
+            sock.close()
+            raise ExecutorError(f"Handshake with worker at {self.address} failed: {e}") from e
+        except ExecutorError:
+            sock.close()
+            raise
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _authenticate(self, sock: socket.socket) -> None:
+        challenge, _ = recv_message(sock, HANDSHAKE_MESSAGE_SIZE)
+        if challenge is None or challenge.get("type") != "challenge":
+            raise ExecutorError(f"Worker at {self.address} did not send a challenge")
+
+        nonce = secrets.token_hex(16)
+        send_message(sock, {"type": "auth", "mac": _sign(self._token, "client", str(challenge.get("nonce", ""))), "nonce": nonce})
+        reply, _ = recv_message(sock, HANDSHAKE_MESSAGE_SIZE)
+        if reply is not None and reply.get("type") == "error":
+            raise ExecutorError(f"Worker at {self.address}: {reply.get('message', 'authentication failed')}")
+        if reply is None or reply.get("type") != "ready" or not hmac.compare_digest(str(reply.get("mac", "")), _sign(self._token, "worker", nonce)):
+            raise ExecutorError(f"Worker at {self.address} could not prove it holds the token")
+
+    def _checkout(self) -> Tuple[socket.socket, bool]:
+        with self._lock:
+            sock = self._idle.pop() if self._idle else None
+        if sock is not None:
+            if _is_open(sock):
+                return sock, True
+            # The worker closed it while idle; others idle as long may be closed too
+            sock.close()
+        return self._connect(), False
+
+    def run(
+        self,
+        command: Union[str, List[str]],
+        shell: bool,
+        cwd: Optional[str],
+        env: Optional[Dict[str, str]],
+        on_output: OutputHandler,
+        stats: Dict[str, Any],
+    ) -> int:
+        request = {"type": "run", "command": command, "shell": shell, "cwd": cwd, "env": env or {}}
+
+        sock, reused = self._checkout()
+        try:
+            send_message(sock, request)
+        except OSError as e:
+            sock.close()
+            if not reused:
+                raise ExecutorError(f"Lost connection to worker at {self.address}: {e}") from e
+            # The request never left, so it is safe to send once more on a new connection
+            sock = self._connect()
+            try:
+                send_message(sock, request)
+            except OSError as e:
+                sock.close()
+                raise ExecutorError(f"Lost connection to worker at {self.address}: {e}") from e
+
+        # From here on the worker may have started the command, so it is never sent again
+        try:
+            message, _ = recv_message(sock)
+            return self._receive(sock, message, on_output, stats)
+        except (OSError, ValueError) as e:
+            sock.close()
+            raise ExecutorError(f"Lost connection to worker at {self.address}: {e}") from e
+        except BaseException:
+            # Interrupted mid-command: dropping the connection makes the worker stop it
+            sock.close()
+            raise
+
+    def _receive(self, sock: socket.socket, message: Optional[Dict[str, Any]], on_output: OutputHandler, stats: Dict[str, Any]) -> int:
+        while message is not None:
+            kind = message.get("type")
+            if kind == "output":
+                for line in message.get("lines", []):
+                    on_output(line)
+            elif kind == "exit":
+                stats.update(message.get("stats") or {})
+                with self._lock:
+                    self._idle.append(sock)
+                return int(message.get("code", 1))
+            elif kind == "error":
+                sock.close()
+                raise ExecutorError(f"Worker at {self.address}: {message.get('message', 'request failed')}")
+            message, _ = recv_message(sock)
+
+        sock.close()
+        raise ExecutorError(f"Worker at {self.address} closed the connection")
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for sock in idle:
+            sock.close()
+
+
+def _is_open(sock: socket.socket) -> bool:
+    """Check, without blocking, that an idle connection was not closed by the worker."""
+    sock.setblocking(False)
+    try:
+        # Idle workers send nothing, so readable data means EOF (or a confused peer)
+        sock.recv(1, socket.MSG_PEEK)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.setblocking(True)
+    return False
+
+
+def _get_token(options: Dict[str, Any]) -> str:
+    token = options.get("token") or os.environ.get(str(options.get("token_env", TOKEN_ENV_VAR)), "")
+    if not token:
+        raise ValueError(f"a 'token', or a token in ${options.get('token_env', TOKEN_ENV_VAR)}, is required")
+    return str(token)
+
+
+def _sign(token: str, role: str, nonce: str) -> str:
+    # The role keeps one side's answer from being replayed as the other's
+    return hmac.new(token.encode(), f"{role}:{nonce}".encode(), hashlib.sha256).hexdigest()
+
+
+class _OutputSender:
+    """Batches a command's output lines into 'output' messages."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._lines: List[str] = []
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self.failed = False
+        self._thread = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._thread.start()
+
+    def add(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            if len(self._lines) >= OUTPUT_BATCH_LINES:
+                self._send()
+
+    def _send(self) -> None:
+        if not self._lines or self.failed:
+            return
+        lines, self._lines = self._lines, []
+        try:
+            send_message(self._sock, {"type": "output", "lines": lines})
+        except OSError:
+            self.failed = True
+
+    def _flush_periodically(self) -> None:
+        while not self._done.wait(OUTPUT_BATCH_DELAY):
+            with self._lock:
+                self._send()
+
+    def close(self) -> None:
+        """Stop the flusher and send the remaining lines."""
+        self._done.set()
+        self._thread.join()
+        with self._lock:
+            self._send()
+
+
+class WorkerServer:
+    """
+    Serves run requests from remote executors.
+
+    Each connection is handled on its own thread and may carry any number of
+    requests. If the client goes away mid-command, the command is terminated.
+    """
+
+    def __init__(self, token: str, host: str = "127.0.0.1", port: int = 0) -> None:
+        if not token:
+            raise ValueError("A worker token is required")
+        self._token = token
+        self._listener = socket.create_server((host, port))
+        self._running = True
+
+    @property
+    def address(self) -> str:
+        """Address clients connect to, as 'host:port'."""
+        host, port = self._listener.getsockname()[:2]
+        return f"{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """Accept connections until shutdown() is called."""
+        while self._running:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                break
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+
+    def start(self) -> threading.Thread:
+        """Serve on a background thread."""
+        thread = threading.Thread(target=self.serve_forever, name="ginx-worker", daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self) -> None:
+        """Stop accepting connections."""
+        self._running = False
+        try:
+            self._listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._listener.close()
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        with conn:
+            try:
+                if not self._authenticate(conn):
+                    return
+            except (OSError, ValueError):
+                return
+
+            while True:
+                try:
+                    message, _ = recv_message(conn)
+                except (OSError, ValueError):
+                    return
+                if message is None:
+                    return
+
+                try:
+                    if message.get("type") != "run":
+                        send_message(conn, {"type": "error", "message": f"unknown request '{message.get('type')}'"})
+                        return
+                    if not self._run(conn, message):
+                        return
+                except OSError:
+                    return
+
+    def _authenticate(self, conn: socket.socket) -> bool:
+        """Check that the client holds the token, and prove that this worker does."""
+        conn.settimeout(HANDSHAKE_TIMEOUT)
+        nonce = secrets.token_hex(16)
+        send_message(conn, {"type": "challenge", "nonce": nonce})
+        message, _ = recv_message(conn, HANDSHAKE_MESSAGE_SIZE)
+        if message is None:
+            return False
+        if message.get("type") != "auth" or not hmac.compare_digest(str(message.get("mac", "")), _sign(self._token, "client", nonce)):
+            send_message(conn, {"type": "error", "message": "authentication failed"})
+            return False
+        send_message(conn, {"type": "ready", "mac": _sign(self._token, "worker", str(message.get("nonce", "")))})
+        conn.settimeout(None)
+        return True
+
+    def _run(self, conn: socket.socket, message: Dict[str, Any]) -> bool:
+        """Run one command, returning False if the client went away."""
+        env = os.environ.copy()
+        env.update({str(key): str(value) for key, value in (message.get("env") or {}).items()})
+
+        try:
+            process = subprocess.Popen(
+                message["command"],
+                shell=bool(message.get("shell")),
+                cwd=message.get("cwd") or None,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+            )
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            send_message(conn, {"type": "output", "lines": [f"✗ Error running command: {e}"]})
+            send_message(conn, {"type": "exit", "code": 1, "stats": {}})
+            return True
+
+        sender = _OutputSender(conn)
+        if process.stdout is not None:
+            for line in iter(process.stdout.readline, ""):
+                sender.add(line.rstrip())
+                if sender.failed:
+                    process.terminate()
+                    break
+
+        stats: Dict[str, Any] = {}
+        code = wait_for_process(process, stats)
+        sender.close()
+        if sender.failed:
+            return False
+
+        send_message(conn, {"type": "exit", "code": code, "stats": stats})
+        return True
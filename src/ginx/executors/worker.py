@@ -0,0 +1,38 @@
+"""
+Standalone executor worker (`python -m ginx.executors.worker`).
+
+Prints the address it listens on as the first line of stdout.
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from .remote import TOKEN_ENV_VAR, WorkerServer
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="ginx-worker", description="Run commands for Ginx remote executors.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--token", default=os.environ.get(TOKEN_ENV_VAR, ""))
+    args = parser.parse_args(argv)
+
+    if not args.token:
+        print(f"A token is required (--token or ${TOKEN_ENV_VAR})", file=sys.stderr)
+        return 2
+
+    server = WorkerServer(args.token, args.host, args.port)
+    print(server.address, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""
+Historical run database.
+
+Every script execution is recorded (timestamps, wall and CPU time, peak RSS,
+exit code) in a SQLite database under the project's '.ginx/' directory.
+"""
+
+from .store import (
+    HISTORY_DIR_ENV_VAR,
+    RunStore,
+    get_history_dir,
+    get_run_store,
+    median,
+)
+
+__all__ = [
+    "HISTORY_DIR_ENV_VAR",
+    "RunStore",
+    "get_history_dir",
+    "get_run_store",
+    "median",
+]
@@ -0,0 +1,371 @@
+"""
+SQLite-backed store of past script executions.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Set to a directory to keep the history database outside the project
+HISTORY_DIR_ENV_VAR = "GINX_HISTORY_DIR"
+HISTORY_DB_NAME = "history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    plan_id TEXT NOT NULL,
+    target TEXT NOT NULL,
+    script TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    ended_at REAL NOT NULL,
+    wall_time REAL NOT NULL,
+    cpu_time REAL,
+    max_rss_kb INTEGER,
+    exit_code INTEGER NOT NULL,
+    cache_hit INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_script ON runs (script, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_plan ON runs (plan_id);
+CREATE TABLE IF NOT EXISTS item_durations (
+    script TEXT NOT NULL,
+    item TEXT NOT NULL,
+    duration REAL NOT NULL,
+    samples INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (script, item)
+);
+"""
+
+# Weight of the newest sample in the per-item moving average
+ITEM_DURATION_SMOOTHING = 0.3
+
+_COLUMNS = (
+    "plan_id",
+    "target",
+    "script",
+    "started_at",
+    "ended_at",
+    "wall_time",
+    "cpu_time",
+    "max_rss_kb",
+    "exit_code",
+    "cache_hit",
+)
+
+
+class RunStore:
+    """
+    Records one row per script execution.
+
+    Records are buffered in memory and written in a single transaction by
+    flush(), so recording adds no I/O to the execution path itself.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._pending: List[Tuple[Any, ...]] = []
+        self._pending_items: List[Tuple[Any, ...]] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.db_path), timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def record(
+        self,
+        plan_id: str,
+        target: str,
+        script: str,
+        started_at: float,
+        wall_time: float,
+        exit_code: int,
+        cpu_time: Optional[float] = None,
+        max_rss_kb: Optional[int] = None,
+        cache_hit: bool = False,
+    ) -> None:
+        """Buffer a script execution record."""
+        row = (plan_id, target, script, started_at, started_at + wall_time, wall_time, cpu_time, max_rss_kb, exit_code, int(cache_hit))
+        with self._lock:
+            self._pending.append(row)
+
+    def record_item_durations(self, script: str, durations: Dict[str, float], recorded_at: float) -> None:
+        """
+        Buffer per-item durations of a script run (e.g. test files of a shard).
+
+        Args:
+            script: Script name
+            durations: Dictionary mapping items to durations in seconds
+            recorded_at: Timestamp of the run
+        """
+        rows = [(script, item, duration, recorded_at) for item, duration in durations.items()]
+        with self._lock:
+            self._pending_items.extend(rows)
+
+    def flush(self) -> int:
+        """
+        Write buffered records to the database.
+
+        Returns:
+            Number of records written
+        """
+        with self._lock:
+            rows, self._pending = self._pending, []
+            item_rows, self._pending_items = self._pending_items, []
+
+        if not rows and not item_rows:
+            return 0
+
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(f"INSERT INTO runs ({', '.join(_COLUMNS)}) VALUES ({placeholders})", rows)
+                connection.executemany(
+                    """
+                    INSERT INTO item_durations (script, item, duration, samples, updated_at) VALUES (?, ?, ?, 1, ?)
+                    ON CONFLICT (script, item) DO UPDATE SET
+                        duration = duration * (1 - ?) + excluded.duration * ?,
+                        samples = samples + 1,
+                        updated_at = excluded.updated_at
+                    """,
+                    [row + (ITEM_DURATION_SMOOTHING, ITEM_DURATION_SMOOTHING) for row in item_rows],
+                )
+        finally:
+            connection.close()
+
+        return len(rows) + len(item_rows)
+
+    def get_item_durations(self, script: str) -> Dict[str, float]:
+        """
+        Get the smoothed duration of every item recorded for a script.
+
+        Args:
+            script: Script name
+
+        Returns:
+            Dictionary mapping items to durations in seconds
+        """
+        if not self.db_path.exists():
+            return {}
+
+        connection = self._connect()
+        try:
+            rows = connection.execute("SELECT item, duration FROM item_durations WHERE script = ?", (script,)).fetchall()
+        finally:
+            connection.close()
+
+        return dict(rows)
+
+    def query_runs(self, script: Optional[str] = None, limit: int = 20, failed_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the most recent runs, newest first.
+
+        Args:
+            script: Only include runs of this script
+            limit: Maximum number of runs to return
+            failed_only: Only include runs with a non-zero exit code
+
+        Returns:
+            List of run records as dictionaries
+        """
+        if not self.db_path.exists():
+            return []
+
+        conditions: List[str] = []
+        params: List[Any] = []
+        if script:
+            conditions.append("script = ?")
+            params.append(script)
+        if failed_only:
+            conditions.append("exit_code != 0")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+
+        connection = self._connect()
+        connection.row_factory = sqlite3.Row
+        try:
+            rows = connection.execute(f"SELECT * FROM runs {where} ORDER BY started_at DESC, id DESC LIMIT ?", params).fetchall()
+        finally:
+            connection.close()
+
+        return [dict(row) for row in rows]
+
+    def get_durations(self, scripts: Optional[List[str]] = None, successful_only: bool = True, per_script_limit: int = 50) -> Dict[str, List[float]]:
+        """
+        Get recent wall times per script, newest first.
+
+        Args:
+            scripts: Only include these scripts (all scripts if None)
+            successful_only: Ignore failed runs
+            per_script_limit: Maximum number of samples per script
+
+        Returns:
+            Dictionary mapping script names to wall times in seconds
+        """
+        if not self.db_path.exists():
+            return {}
+
+        conditions: List[str] = []
+        params: List[Any] = []
+        if successful_only:
+            conditions.append("exit_code = 0")
+        if scripts is not None:
+            if not scripts:
+                return {}
+            conditions.append(f"script IN ({', '.join('?' for _ in scripts)})")
+            params.extend(scripts)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        connection = self._connect()
+        try:
+            rows = connection.execute(f"SELECT script, wall_time FROM runs {where} ORDER BY started_at DESC", params).fetchall()
+        finally:
+            connection.close()
+
+        durations: Dict[str, List[float]] = {}
+        for script, wall_time in rows:
+            samples = durations.setdefault(script, [])
+            if len(samples) < per_script_limit:
+                samples.append(wall_time)
+
+        return durations
+
+    def get_median_durations(self, scripts: Optional[List[str]] = None) -> Dict[str, float]:
+        """
+        Get the median wall time of recent successful runs per script.
+
+        Args:
+            scripts: Only include these scripts (all scripts if None)
+
+        Returns:
+            Dictionary mapping script names to median wall times in seconds
+        """
+        medians: Dict[str, float] = {}
+        for script, samples in self.get_durations(scripts).items():
+            value = median(samples)
+            if value is not None:
+                medians[script] = value
+        return medians
+
+    def summarize(self, script: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregate statistics per script.
+
+        Args:
+            script: Only summarize this script
+
+        Returns:
+            List of per-script summaries sorted by script name
+        """
+        if not self.db_path.exists():
+            return []
+
+        where = "WHERE script = ?" if script else ""
+        params = [script] if script else []
+
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                f"""
+                SELECT script, COUNT(*), SUM(exit_code != 0), AVG(wall_time), MAX(wall_time),
+                       AVG(cpu_time), MAX(max_rss_kb), SUM(cache_hit), MAX(started_at)
+                FROM runs {where} GROUP BY script ORDER BY script
+                """,
+                params,
+            ).fetchall()
+        finally:
+            connection.close()
+
+        durations = self.get_durations([row[0] for row in rows], successful_only=False, per_script_limit=1000)
+
+        summaries: List[Dict[str, Any]] = []
+        for name, count, failures, avg_wall, max_wall, avg_cpu, max_rss, cache_hits, last_run in rows:
+            summaries.append(
+                {
+                    "script": name,
+                    "runs": count,
+                    "failures": failures or 0,
+                    "median_wall_time": median(durations.get(name, [])),
+                    "avg_wall_time": avg_wall,
+                    "max_wall_time": max_wall,
+                    "avg_cpu_time": avg_cpu,
+                    "max_rss_kb": max_rss,
+                    "cache_hits": cache_hits or 0,
+                    "last_run": last_run,
+                }
+            )
+
+        return summaries
+
+    def clear(self) -> None:
+        """Delete all recorded runs."""
+        with self._lock:
+            self._pending = []
+            self._pending_items = []
+        if self.db_path.exists():
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute("DELETE FROM runs")
+                    connection.execute("DELETE FROM item_durations")
+            finally:
+                connection.close()
+
+
+def median(values: List[float]) -> Optional[float]:
+    """Median of a list of numbers (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def get_history_dir() -> Path:
+    """
+    Get the directory holding the history database.
+
+    Defaults to '.ginx/' next to the configuration file (or in the current
+    directory when there is none).
+    """
+    override = os.environ.get(HISTORY_DIR_ENV_VAR)
+    if override:
+        return Path(override)
+
+    from ginx.config import find_config_file
+
+    config_path = find_config_file()
+    base_dir = config_path.parent if config_path else Path.cwd()
+    return base_dir / ".ginx"
+
+
+_stores: Dict[Path, RunStore] = {}
+
+
+def get_run_store() -> RunStore:
+    """Get the run store for the current project."""
+    db_path = get_history_dir() / HISTORY_DB_NAME
+    store = _stores.get(db_path)
+    if store is None:
+        store = RunStore(db_path)
+        _stores[db_path] = store
+    return store
+
+
+@atexit.register
+def _flush_all_stores() -> None:
+    for store in _stores.values():
+        try:
+            store.flush()
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,50 @@
+"""
+Run metrics for Prometheus.
+
+When `settings.metrics_file` (or $GINX_METRICS_FILE) names a file, every run
+adds its script durations, exit codes, queue waits, idle time and ginx
+self time to that file, in the format of node_exporter's textfile collector.
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+from ginx.config import get_setting
+from ginx.plugins.events import get_event_bus
+
+from .textfile import EVENT_TYPES, FAMILIES, METRICS_FILE_ENV_VAR, TextfileExporter, parse_samples, render
+
+_exporters: Dict[str, TextfileExporter] = {}
+_exporters_lock = threading.Lock()
+
+
+def get_metrics_exporter() -> Optional[TextfileExporter]:
+    """
+    Get the exporter for the configured metrics file (None if not configured).
+
+    Exporters subscribe to the event bus when created, and are kept for the
+    rest of the process.
+    """
+    path = os.environ.get(METRICS_FILE_ENV_VAR) or get_setting("metrics_file")
+    if not path:
+        return None
+
+    path = os.path.abspath(os.path.expanduser(str(path)))
+    with _exporters_lock:
+        exporter = _exporters.get(path)
+        if exporter is None:
+            exporter = TextfileExporter(path)
+            get_event_bus().subscribe(exporter.handle_events, EVENT_TYPES)
+            _exporters[path] = exporter
+    return exporter
+
+
+__all__ = [
+    "FAMILIES",
+    "METRICS_FILE_ENV_VAR",
+    "TextfileExporter",
+    "get_metrics_exporter",
+    "parse_samples",
+    "render",
+]
@@ -0,0 +1,272 @@
+"""
+Prometheus textfile exporter (for node_exporter's textfile collector).
+
+The exporter subscribes to the execution events of each run. After the run,
+it adds them to the counters and histograms already in the file and
+replaces the file atomically. The file is thus the only state, and counters
+keep growing across ginx processes.
+"""
+
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from ginx.plugins.events import PLAN_RESOLVED, SCRIPT_FINISHED, SCRIPT_QUEUED, SCRIPT_STARTED, Event
+
+# Set to a file path to write metrics there, overriding settings.metrics_file
+METRICS_FILE_ENV_VAR = "GINX_METRICS_FILE"
+
+# Upper bounds (seconds) of the duration and queue wait histogram buckets
+DURATION_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+QUEUE_WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class Family(NamedTuple):
+    """A metric family written to the file."""
+
+    name: str
+    type: str  # counter, gauge or histogram
+    help: str
+
+
+SCRIPT_DURATION = Family("ginx_script_duration_seconds", "histogram", "Wall time of script runs.")
+SCRIPT_QUEUE_WAIT = Family("ginx_script_queue_wait_seconds", "histogram", "Time scripts waited for a free job after their dependencies finished.")
+SCRIPT_RUNS = Family("ginx_script_runs_total", "counter", "Script runs by exit code.")
+RUNS = Family("ginx_runs_total", "counter", "Runs by target and status.")
+IDLE = Family("ginx_idle_seconds_total", "counter", "Wall time of runs during which no script was running.")
+SELF_SECONDS = Family("ginx_self_seconds_total", "counter", "Time ginx itself spent in runs, by phase (excluding child processes).")
+LAST_RUN_TIMESTAMP = Family("ginx_last_run_timestamp_seconds", "gauge", "End time of the last run.")
+LAST_RUN_DURATION = Family("ginx_last_run_duration_seconds", "gauge", "Wall time of the last run.")
+LAST_RUN_IDLE = Family("ginx_last_run_idle_seconds", "gauge", "Wall time of the last run during which no script was running.")
+
+FAMILIES = (
+    SCRIPT_DURATION,
+    SCRIPT_QUEUE_WAIT,
+    SCRIPT_RUNS,
+    RUNS,
+    IDLE,
+    SELF_SECONDS,
+    LAST_RUN_TIMESTAMP,
+    LAST_RUN_DURATION,
+    LAST_RUN_IDLE,
+)
+
+EVENT_TYPES = (PLAN_RESOLVED, SCRIPT_QUEUED, SCRIPT_STARTED, SCRIPT_FINISHED)
+
+_SAMPLE_RE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{.*\})?\s+(\S+)$")
+
+# (sample name, label string) -> value
+Samples = Dict[Tuple[str, str], float]
+
+
+def format_labels(**labels: str) -> str:
+    """Format labels as '{name="value",...}', escaped as the exposition format requires."""
+    if not labels:
+        return ""
+    return "{" + ",".join(_escape(name, value) for name, value in labels.items()) + "}"
+
+
+def _escape(name: str, value: str) -> str:
+    value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'{name}="{value}"'
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def parse_samples(text: str) -> Samples:
+    """Parse the samples of a file written by this exporter (comments are skipped)."""
+    samples: Samples = {}
+    for line in text.splitlines():
+        match = _SAMPLE_RE.match(line.strip())
+        if match is None or not match.group(1).startswith("ginx_"):
+            continue
+        try:
+            samples[(match.group(1), match.group(2) or "")] = float(match.group(3))
+        except ValueError:
+            continue
+    return samples
+
+
+def observe(samples: Samples, family: Family, buckets: Tuple[float, ...], value: float, **labels: str) -> None:
+    """Add an observation to a histogram."""
+    # Buckets are cumulative, and every bucket of a series must be present
+    for bound in buckets + (math.inf,):
+        key = (f"{family.name}_bucket", format_labels(**labels, le=_format_value(bound)))
+        samples[key] = samples.get(key, 0.0) + (1 if value <= bound else 0)
+    for suffix, amount in (("_sum", value), ("_count", 1.0)):
+        key = (family.name + suffix, format_labels(**labels))
+        samples[key] = samples.get(key, 0.0) + amount
+
+
+def increment(samples: Samples, family: Family, amount: float = 1.0, **labels: str) -> None:
+    """Add to a counter."""
+    key = (family.name, format_labels(**labels))
+    samples[key] = samples.get(key, 0.0) + amount
+
+
+def set_gauge(samples: Samples, family: Family, value: float, **labels: str) -> None:
+    """Set a gauge."""
+    samples[(family.name, format_labels(**labels))] = value
+
+
+def render(samples: Samples) -> str:
+    """Render samples in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for family in FAMILIES:
+        names = (family.name + "_bucket", family.name + "_sum", family.name + "_count") if family.type == "histogram" else (family.name,)
+        family_samples = [(key, value) for key, value in samples.items() if key[0] in names]
+        if not family_samples:
+            continue
+        lines.append(f"# HELP {family.name} {family.help}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        # Keep buckets in bound order, followed by _sum and _count
+        family_samples.sort(key=lambda item: (_series_key(item[0][1]), names.index(item[0][0]), _bucket_bound(item[0][1])))
+        lines.extend(f"{name}{labels} {_format_value(value)}" for (name, labels), value in family_samples)
+    return "\n".join(lines) + "\n"
+
+
+def _series_key(labels: str) -> str:
+    return re.sub(r',?le="[^"]*"', "", labels)
+
+
+def _bucket_bound(labels: str) -> float:
+    match = re.search(r'le="([^"]*)"', labels)
+    return float(match.group(1)) if match else 0.0
+
+
+def _union_length(intervals: List[Tuple[float, float]]) -> float:
+    total = 0.0
+    covered_until = -math.inf
+    for start, end in sorted(intervals):
+        start = max(start, covered_until)
+        if end > start:
+            total += end - start
+        covered_until = max(covered_until, end)
+    return total
+
+
+class TextfileExporter:
+    """Collects the events of runs and adds them to a .prom file after each run."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._target = ""
+        self._started_at: Optional[float] = None
+        self._queued: Dict[str, float] = {}
+        self._queue_waits: List[Tuple[str, float]] = []
+        self._finished: List[Event] = []
+
+    def handle_events(self, events: List[Event]) -> None:
+        """Event bus handler."""
+        with self._lock:
+            for event in events:
+                if event.type == PLAN_RESOLVED:
+                    self._target = str(event.data.get("target", ""))
+                    self._started_at = event.time
+                elif event.type == SCRIPT_QUEUED:
+                    self._queued[event.script] = event.time
+                elif event.type == SCRIPT_STARTED:
+                    queued_at = self._queued.pop(event.script, None)
+                    if queued_at is not None:
+                        self._queue_waits.append((event.script, max(0.0, event.time - queued_at)))
+                elif event.type == SCRIPT_FINISHED:
+                    self._finished.append(event)
+
+    def finish_run(self, ended_at: Optional[float] = None, self_seconds: Optional[Dict[str, float]] = None) -> None:
+        """
+        Add the collected run to the file and start collecting the next one.
+
+        Call after the event bus was flushed. Runs in which no script finished
+        are not recorded.
+
+        Args:
+            ended_at: End time of the run (defaults to now)
+            self_seconds: Time ginx itself spent in the run, by phase
+        """
+        ended_at = time.time() if ended_at is None else ended_at
+        with self._lock:
+            target, started_at = self._target, self._started_at
+            queue_waits, finished = self._queue_waits, self._finished
+            self._reset()
+
+        if not finished:
+            return
+        if started_at is None:
+            started_at = min(event.time - float(event.data.get("duration", 0.0)) for event in finished)
+
+        with _locked(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    samples = parse_samples(f.read())
+            except FileNotFoundError:
+                samples = {}
+
+            for event in finished:
+                exit_code = str(event.data.get("exit_code", ""))
+                observe(samples, SCRIPT_DURATION, DURATION_BUCKETS, float(event.data.get("duration", 0.0)), script=event.script)
+                increment(samples, SCRIPT_RUNS, script=event.script, exit_code=exit_code)
+            for script, wait in queue_waits:
+                observe(samples, SCRIPT_QUEUE_WAIT, QUEUE_WAIT_BUCKETS, wait, script=script)
+
+            duration = max(0.0, ended_at - started_at)
+            busy = _union_length([(event.time - float(event.data.get("duration", 0.0)), event.time) for event in finished])
+            idle = max(0.0, duration - busy)
+            status = "success" if all(event.data.get("exit_code") == 0 for event in finished) else "failure"
+            increment(samples, RUNS, target=target, status=status)
+            increment(samples, IDLE, idle, target=target)
+            for phase, seconds in (self_seconds or {}).items():
+                increment(samples, SELF_SECONDS, seconds, target=target, phase=phase)
+            set_gauge(samples, LAST_RUN_TIMESTAMP, ended_at, target=target)
+            set_gauge(samples, LAST_RUN_DURATION, duration, target=target)
+            set_gauge(samples, LAST_RUN_IDLE, idle, target=target)
+
+            _write_atomically(self.path, render(samples))
+
+
+class _locked:
+    """Serializes read-modify-write cycles of ginx processes sharing a file."""
+
+    def __init__(self, path: str) -> None:
+        self._lock_path = path + ".lock"
+        self._fd: Optional[int] = None
+
+    def __enter__(self) -> None:
+        if fcntl is not None:
+            self._fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _write_atomically(path: str, text: str) -> None:
+    # Rename within the directory, so the collector never reads a partial file
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".ginx-metrics-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
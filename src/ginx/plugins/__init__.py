@@ -5,16 +5,23 @@ This module provides the foundation for extending Ginx with custom plugins.
 Plugins can add new commands, script processors, or other functionality.
 """
 
+import atexit
 import importlib
 import importlib.util
 import os
 import sys
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import CodeType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import typer
 
+from .events import Event, get_event_bus
+from .timings import ADD_COMMANDS, DISCOVERY, IMPORT, INITIALIZE, INSTANTIATE, TIMINGS_ENV_VAR, PluginTimings
+
 
 class GinxPlugin(ABC):
     """Base class for Ginx plugins."""
@@ -81,6 +88,49 @@ class GinxPlugin(ABC):
         """
         pass
 
+    @property
+    def event_types(self) -> Sequence[str]:
+        """Event types (see ginx.plugins.events) delivered to on_events()."""
+        return ()
+
+    def on_events(self, events: List[Event]) -> None:
+        """
+        Handle a batch of execution events.
+
+        Called on the event bus thread, only with the types in event_types.
+
+        Args:
+            events: Events in emission order
+        """
+        pass
+
+
+# Execution hooks, dispatched only to plugins that implement them
+HOOK_METHODS = ("process_script", "pre_execution_hook", "post_execution_hook")
+
+
+def _code_signature(code: CodeType, docstring: Optional[str]) -> Tuple[Any, ...]:
+    return code.co_code, code.co_names, tuple(const for const in code.co_consts if const is not docstring)
+
+
+def implements_hook(plugin: GinxPlugin, hook: str) -> bool:
+    """
+    Check whether a plugin implements an execution hook.
+
+    Methods inherited from GinxPlugin, and overrides whose code is the same
+    as the default's (e.g. 'return command' kept as a placeholder), are
+    no-ops.
+    """
+    implementation = getattr(type(plugin), hook, None)
+    default = getattr(GinxPlugin, hook)
+    if implementation is None or implementation is default:
+        return False
+
+    code = getattr(implementation, "__code__", None)
+    if code is None:
+        return True
+    return _code_signature(code, implementation.__doc__) != _code_signature(default.__code__, default.__doc__)
+
 
 class PluginManager:
     """Manages Ginx plugins."""
@@ -88,6 +138,10 @@ class PluginManager:
     def __init__(self) -> None:
         self._plugins: Dict[str, GinxPlugin] = {}
         self._initialized = False
+        # Per-hook dispatch tables, rebuilt when a plugin is registered
+        self._hooks: Dict[str, List[GinxPlugin]] = {hook: [] for hook in HOOK_METHODS}
+        self._hook_worker: Optional[ThreadPoolExecutor] = None
+        self.timings = PluginTimings()
 
     def discover_plugins(self, plugin_dirs: Optional[List[str]] = None) -> None:
         """
@@ -98,13 +152,15 @@ class PluginManager:
                         If None, uses default locations.
         """
         if plugin_dirs is None:
-            plugin_dirs = self._get_default_plugin_dirs()
+            plugin_dirs = self.get_default_plugin_dirs()
 
         for plugin_dir in plugin_dirs:
             if os.path.exists(plugin_dir):
+                started = time.perf_counter()
                 self._load_plugins_from_directory(plugin_dir)
+                self.timings.record(plugin_dir, DISCOVERY, time.perf_counter() - started)
 
-    def _get_default_plugin_dirs(self) -> List[str]:
+    def get_default_plugin_dirs(self) -> List[str]:
         """Get default plugin directories."""
         dirs: List[str] = []
 
@@ -149,11 +205,13 @@ class PluginManager:
         module_name = f"ginx_plugin_{plugin_file.stem}"
 
         spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-        if spec is None or spec.config is None:
+        if spec is None or spec.loader is None:
             raise ImportError(f"Could not load spec for {plugin_file}")
 
+        started = time.perf_counter()
         module = importlib.util.module_from_spec(spec)
-        spec.config.exec_module(module)
+        spec.loader.exec_module(module)
+        self.timings.record(module_name, IMPORT, time.perf_counter() - started)
 
         # Look for plugin classes
         for attr_name in dir(module):
@@ -162,7 +220,9 @@ class PluginManager:
             if isinstance(attr, type) and issubclass(attr, GinxPlugin) and attr != GinxPlugin:
 
                 try:
+                    started = time.perf_counter()
                     plugin_instance = attr()
+                    self.timings.record(plugin_instance.name, INSTANTIATE, time.perf_counter() - started)
                     self.register_plugin(plugin_instance)
                 except Exception as e:
                     typer.secho(
@@ -180,7 +240,20 @@ class PluginManager:
             return
 
         self._plugins[plugin.name] = plugin
+        for hook, plugins in self._hooks.items():
+            if implements_hook(plugin, hook):
+                plugins.append(plugin)
+
+        try:
+            if plugin.event_types:
+                get_event_bus().subscribe(plugin.on_events, plugin.event_types)
+        except Exception as e:
+            typer.secho(
+                f"Warning: Plugin '{plugin.name}' event subscription failed: {e}",
+                fg=typer.colors.YELLOW,
+            )
 
+        started = time.perf_counter()
         try:
             plugin.initialize()
         except Exception as e:
@@ -188,6 +261,7 @@ class PluginManager:
                 f"Warning: Plugin '{plugin.name}' initialization failed: {e}",
                 fg=typer.colors.YELLOW,
             )
+        self.timings.record(plugin.name, INITIALIZE, time.perf_counter() - started)
 
     def get_plugin(self, name: str) -> Optional[GinxPlugin]:
         """Get a plugin by name."""
@@ -200,6 +274,7 @@ class PluginManager:
     def add_plugin_commands(self, app: typer.Typer) -> None:
         """Add commands from all plugins to the CLI app."""
         for plugin in self._plugins.values():
+            started = time.perf_counter()
             try:
                 plugin.add_commands(app)
             except Exception as e:
@@ -207,10 +282,17 @@ class PluginManager:
                     f"Warning: Plugin '{plugin.name}' failed to add commands: {e}",
                     fg=typer.colors.YELLOW,
                 )
+            self.timings.record(plugin.name, ADD_COMMANDS, time.perf_counter() - started)
+
+    def has_hooks(self, hook: str) -> bool:
+        """Check whether any registered plugin implements a hook (one of HOOK_METHODS)."""
+        return bool(self._hooks[hook])
 
     def process_script(self, script_name: str, script_config: Dict[str, Any]) -> Dict[str, Any]:
         """Process script configuration through all plugins."""
-        for plugin in self._plugins.values():
+        timed = self.timings.hooks_enabled
+        for plugin in self._hooks["process_script"]:
+            started = time.perf_counter() if timed else 0.0
             try:
                 script_config = plugin.process_script(script_name, script_config)
             except Exception as e:
@@ -218,12 +300,16 @@ class PluginManager:
                     f"Warning: Plugin '{plugin.name}' script processing failed: {e}",
                     fg=typer.colors.YELLOW,
                 )
+            if timed:
+                self.timings.record(plugin.name, "process_script", time.perf_counter() - started)
 
         return script_config
 
     def run_pre_execution_hooks(self, script_name: str, command: List[str]) -> List[str]:
         """Run pre-execution hooks from all plugins."""
-        for plugin in self._plugins.values():
+        timed = self.timings.hooks_enabled
+        for plugin in self._hooks["pre_execution_hook"]:
+            started = time.perf_counter() if timed else 0.0
             try:
                 command = plugin.pre_execution_hook(script_name, command)
             except Exception as e:
@@ -231,12 +317,38 @@ class PluginManager:
                     f"Warning: Plugin '{plugin.name}' pre-execution hook failed: {e}",
                     fg=typer.colors.YELLOW,
                 )
+            if timed:
+                self.timings.record(plugin.name, "pre_execution_hook", time.perf_counter() - started)
 
         return command
 
-    def run_post_execution_hooks(self, script_name: str, exit_code: int, duration: float) -> None:
-        """Run post-execution hooks from all plugins."""
-        for plugin in self._plugins.values():
+    def run_post_execution_hooks(self, script_name: str, exit_code: int, duration: float, background: bool = False) -> None:
+        """
+        Run post-execution hooks from all plugins.
+
+        Args:
+            script_name: Name of the script that was executed
+            exit_code: Exit code of the executed command
+            duration: Execution duration in seconds
+            background: Run the hooks on a background worker (in submission
+                order) instead of delaying the caller; see wait_for_hooks()
+        """
+        plugins = self._hooks["post_execution_hook"]
+        if not plugins:
+            return
+
+        if not background:
+            self._run_post_execution_hooks(plugins, script_name, exit_code, duration)
+            return
+
+        if self._hook_worker is None:
+            self._hook_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ginx-hooks")
+        self._hook_worker.submit(self._run_post_execution_hooks, plugins, script_name, exit_code, duration)
+
+    def _run_post_execution_hooks(self, plugins: List[GinxPlugin], script_name: str, exit_code: int, duration: float) -> None:
+        timed = self.timings.hooks_enabled
+        for plugin in plugins:
+            started = time.perf_counter() if timed else 0.0
             try:
                 plugin.post_execution_hook(script_name, exit_code, duration)
             except Exception as e:
@@ -244,11 +356,24 @@ class PluginManager:
                     f"Warning: Plugin '{plugin.name}' post-execution hook failed: {e}",
                     fg=typer.colors.YELLOW,
                 )
+            if timed:
+                self.timings.record(plugin.name, "post_execution_hook", time.perf_counter() - started)
+
+    def wait_for_hooks(self, timeout: Optional[float] = None) -> None:
+        """Wait for post-execution hooks running in the background."""
+        if self._hook_worker is not None:
+            # The worker runs hooks in order, so this finishes after all earlier ones
+            wait([self._hook_worker.submit(lambda: None)], timeout=timeout)
 
 
 # Global plugin manager instance
 plugin_manager = PluginManager()
 
+_timings_path = os.environ.get(TIMINGS_ENV_VAR)
+if _timings_path:
+    plugin_manager.timings.hooks_enabled = True
+    atexit.register(plugin_manager.timings.write, _timings_path)
+
 
 def get_plugin_manager() -> PluginManager:
     """Get the global plugin manager instance."""
@@ -259,7 +384,9 @@ def auto_register_builtin_plugins() -> None:
     """Auto-register all discovered built-in plugins."""
     for plugin_name, plugin_class in _builtin_plugins.items():
         try:
+            started = time.perf_counter()
             plugin_instance = plugin_class()
+            plugin_manager.timings.record(plugin_instance.name, INSTANTIATE, time.perf_counter() - started)
             plugin_manager.register_plugin(plugin_instance)
         except Exception as e:
             typer.secho(
@@ -272,11 +399,14 @@ def _discover_builtin_plugins() -> Dict[str, Any]:
     """Discover and import built-in plugins from this directory."""
     plugins: Dict[Any, Any] = {}
     current_dir = Path(__file__).parent
+    discovery_started = time.perf_counter()
 
     for item in current_dir.iterdir():
         if item.is_dir() and not item.name.startswith("_") and item.name != "__pycache__":
             try:
+                started = time.perf_counter()
                 module = importlib.import_module(f".{item.name}", package=__name__)
+                plugin_manager.timings.record(module.__name__, IMPORT, time.perf_counter() - started)
 
                 for attr_name in dir(module):
                     attr = getattr(module, attr_name)
@@ -291,6 +421,7 @@ def _discover_builtin_plugins() -> Dict[str, Any]:
                     fg=typer.colors.YELLOW,
                 )
 
+    plugin_manager.timings.record("built-in", DISCOVERY, time.perf_counter() - discovery_started)
     return plugins
 
 
@@ -301,6 +432,11 @@ _builtin_plugins = _discover_builtin_plugins()
 __all__ = [
     "GinxPlugin",
     "PluginManager",
+    "HOOK_METHODS",
+    "implements_hook",
+    "Event",
+    "get_event_bus",
+    "PluginTimings",
     "plugin_manager",
     "get_plugin_manager",
 ] + list(
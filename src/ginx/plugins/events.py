@@ -0,0 +1,244 @@
+"""
+Event bus delivering execution events to plugins in batches.
+"""
+
+import functools
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+
+import typer
+
+# Event types
+PLAN_RESOLVED = "plan_resolved"  # data: target, scripts (execution order), jobs
+SCRIPT_QUEUED = "script_queued"  # Dependencies done, waiting for a free job
+SCRIPT_STARTED = "script_started"  # data: command
+OUTPUT_CHUNK = "output_chunk"  # data: lines
+SCRIPT_FINISHED = "script_finished"  # data: exit_code, duration (and cpu_time, max_rss_kb if known)
+CACHE_HIT = "cache_hit"  # Reserved: ginx has no result cache yet, so this is never emitted
+
+EVENT_TYPES = (PLAN_RESOLVED, SCRIPT_QUEUED, SCRIPT_STARTED, OUTPUT_CHUNK, SCRIPT_FINISHED, CACHE_HIT)
+
+# Default batch bounds: delivered when this many events are buffered, or when
+# the oldest buffered event is this many seconds old
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_DELAY = 0.25
+
+# Output lines per output_chunk event
+OUTPUT_CHUNK_LINES = 64
+
+
+class Event(NamedTuple):
+    """An execution event."""
+
+    type: str
+    time: float  # Unix timestamp
+    script: str  # Empty for plan-level events
+    data: Dict[str, Any]
+
+
+EventHandler = Callable[[List[Event]], None]
+
+
+class _Subscription:
+    def __init__(self, handler: EventHandler, event_types: FrozenSet[str], max_batch: int, max_delay: float) -> None:
+        self.handler = handler
+        self.event_types = event_types
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.buffer: List[Event] = []
+        self.deadline = 0.0
+
+
+class _Timer(NamedTuple):
+    deadline: float  # time.monotonic()
+    callback: Callable[[], None]
+
+
+_STOP = object()
+
+
+class EventBus:
+    """
+    Publishes events to subscribers on a dedicated delivery thread.
+
+    Subscribers declare the event types they handle; wants() tells producers
+    whether anybody listens, so events of other types are never built.
+    Handlers receive lists of events, delivered when a subscriber's batch is
+    full or its oldest event reaches the subscriber's max_delay.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: List[_Subscription] = []
+        self._wanted: FrozenSet[str] = frozenset()
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # Scheduled callbacks, only touched by the delivery thread
+        self._timers: List[_Timer] = []
+
+    def subscribe(
+        self,
+        handler: EventHandler,
+        event_types: Iterable[str],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ) -> None:
+        """
+        Subscribe a handler to event types.
+
+        Args:
+            handler: Called with a list of events, on the delivery thread
+            event_types: Event types to receive (see EVENT_TYPES)
+            max_batch: Deliver as soon as this many events are buffered
+            max_delay: Deliver buffered events after at most this many seconds
+
+        Raises:
+            ValueError: On unknown event types
+        """
+        types = frozenset(event_types)
+        unknown = types - set(EVENT_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown event types: {', '.join(sorted(unknown))}")
+
+        with self._lock:
+            self._subscriptions = self._subscriptions + [_Subscription(handler, types, max(1, max_batch), max_delay)]
+            self._wanted = self._wanted | types
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ginx-events", daemon=True)
+                self._thread.start()
+
+    def wants(self, event_type: str) -> bool:
+        """Check whether any subscriber handles an event type."""
+        return event_type in self._wanted
+
+    def emit(self, event_type: str, script: str = "", **data: Any) -> None:
+        """Publish an event (dropped if nobody subscribed to its type)."""
+        if event_type in self._wanted:
+            self._queue.put(Event(event_type, time.time(), script, data))
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> None:
+        """
+        Call a function on the delivery thread after a delay.
+
+        Producers that buffer data use this to emit it on time. Does nothing
+        while nobody is subscribed.
+        """
+        if self._thread is not None:
+            self._queue.put(_Timer(time.monotonic() + delay, callback))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Deliver all events emitted so far and wait until the handlers return."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self) -> None:
+        """Deliver pending events and stop the delivery thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _deliver(self, subscription: _Subscription) -> None:
+        events, subscription.buffer = subscription.buffer, []
+        try:
+            subscription.handler(events)
+        except Exception as e:
+            typer.secho(f"Warning: Event handler failed: {e}", fg=typer.colors.YELLOW)
+
+    def _run(self) -> None:
+        while True:
+            deadlines = [s.deadline for s in self._subscriptions if s.buffer] + [timer.deadline for timer in self._timers]
+            timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, Event):
+                for subscription in self._subscriptions:
+                    if item.type not in subscription.event_types:
+                        continue
+                    if not subscription.buffer:
+                        subscription.deadline = time.monotonic() + subscription.max_delay
+                    subscription.buffer.append(item)
+                    if len(subscription.buffer) >= subscription.max_batch:
+                        self._deliver(subscription)
+                continue
+            if isinstance(item, _Timer):
+                self._timers.append(item)
+                continue
+
+            # Timeout, flush request or stop
+            now = time.monotonic()
+            due = [timer for timer in self._timers if timer.deadline <= now]
+            if due:
+                self._timers = [timer for timer in self._timers if timer.deadline > now]
+                for timer in due:
+                    try:
+                        timer.callback()
+                    except Exception as e:
+                        typer.secho(f"Warning: Event timer failed: {e}", fg=typer.colors.YELLOW)
+            for subscription in self._subscriptions:
+                if subscription.buffer and (item is not None or subscription.deadline <= now):
+                    self._deliver(subscription)
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+
+class OutputChunker:
+    """
+    Collects a script's output lines into output_chunk events.
+
+    A chunk is emitted every OUTPUT_CHUNK_LINES lines, when its first line
+    is max_delay old (on the bus's delivery thread, so quiet scripts don't
+    hold lines back), and on close().
+    """
+
+    def __init__(self, bus: EventBus, script: str, max_delay: float = DEFAULT_MAX_DELAY) -> None:
+        self._bus = bus
+        self._script = script
+        self._max_delay = max_delay
+        self._lines: List[str] = []
+        # Number of chunks emitted, so timers of chunks emitted early do nothing
+        self._chunks = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            if len(self._lines) == 1:
+                self._bus.schedule(self._max_delay, functools.partial(self._expire, self._chunks))
+            if len(self._lines) >= OUTPUT_CHUNK_LINES:
+                self._emit()
+
+    def _expire(self, chunk: int) -> None:
+        with self._lock:
+            if chunk == self._chunks:
+                self._emit()
+
+    def _emit(self) -> None:
+        if self._lines:
+            lines, self._lines = self._lines, []
+            self._chunks += 1
+            self._bus.emit(OUTPUT_CHUNK, self._script, lines=lines)
+
+    def close(self) -> None:
+        """Emit the buffered lines."""
+        with self._lock:
+            self._emit()
+
+
+_event_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Get the global event bus."""
+    return _event_bus
@@ -0,0 +1,73 @@
+"""
+Timings of plugin loading and hook calls.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Tuple
+
+# Set to a file path to time hook calls and write all timings there as JSON on exit
+TIMINGS_ENV_VAR = "GINX_PLUGIN_TIMINGS"
+
+# Loading phases, in the order they happen
+DISCOVERY = "discovery"  # Scanning a plugin directory, including the imports below
+IMPORT = "import"
+INSTANTIATE = "instantiate"
+INITIALIZE = "initialize"
+ADD_COMMANDS = "add_commands"
+
+LOAD_PHASES = (DISCOVERY, IMPORT, INSTANTIATE, INITIALIZE, ADD_COMMANDS)
+
+
+class PluginTimings:
+    """
+    Collects durations per subject (plugin, module or directory) and phase.
+
+    Loading phases are always recorded: each happens once per plugin and
+    costs two clock reads. Hook calls happen per script, so they are only
+    timed when hooks_enabled is set.
+    """
+
+    def __init__(self, hooks_enabled: bool = False) -> None:
+        self.hooks_enabled = hooks_enabled
+        # (subject, phase) -> [calls, total seconds, max seconds], in first-recorded order
+        self._records: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, subject: str, phase: str, seconds: float) -> None:
+        """Add one measurement."""
+        with self._lock:
+            entry = self._records.get((subject, phase))
+            if entry is None:
+                self._records[(subject, phase)] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Get one row per subject and phase, with calls, total and max (in seconds)."""
+        with self._lock:
+            records = list(self._records.items())
+        return [
+            {"subject": subject, "phase": phase, "calls": int(calls), "total": total, "max": longest}
+            for (subject, phase), (calls, total, longest) in records
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON-serializable dump of all timings."""
+        return {"hooks_enabled": self.hooks_enabled, "timings": self.rows()}
+
+    def write(self, path: str) -> None:
+        """Write the JSON dump to a file, replacing it atomically."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".ginx-timings-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -0,0 +1,131 @@
+"""
+On-disk cache of trimmed PyPI package metadata.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .version_utils import normalize_package_name
+
+# Overrides the cache root (defaults to $XDG_CACHE_HOME/ginx or ~/.cache/ginx)
+CACHE_DIR_ENV_VAR = "GINX_CACHE_DIR"
+
+# Seconds a cached entry is served without contacting the index
+DEFAULT_CACHE_TTL = 3600
+
+_INFO_FIELDS = ("name", "version", "summary", "requires_python", "yanked")
+
+
+def get_cache_root() -> Path:
+    """Get the root of Ginx's cache directory."""
+    override = os.environ.get(CACHE_DIR_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ginx"
+
+
+def get_pypi_cache_dir() -> Path:
+    """Get the directory holding cached PyPI metadata."""
+    return get_cache_root() / "pypi"
+
+
+def trim_package_info(package_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a PyPI JSON API document to the fields Ginx uses.
+
+    Drops descriptions, classifiers and per-file URLs and digests, which make
+    up almost all of the document for packages with many releases.
+
+    Args:
+        package_info: Full /pypi/<name>/json document
+
+    Returns:
+        Document with 'info' (name, version, summary, requires_python, yanked)
+        and 'releases' mapping each version to a single summary entry
+        (empty if the release has no files)
+    """
+    info = package_info.get("info") or {}
+    releases: Dict[str, Any] = {}
+    for version, files in (package_info.get("releases") or {}).items():
+        if not files:
+            releases[version] = []
+            continue
+        releases[version] = [
+            {
+                "yanked": all(bool(file.get("yanked")) for file in files),
+                "requires_python": files[0].get("requires_python"),
+            }
+        ]
+
+    return {"info": {field: info.get(field) for field in _INFO_FIELDS}, "releases": releases}
+
+
+class MetadataCache:
+    """
+    Stores one JSON file per package with its metadata and validators.
+
+    Entries record when they were fetched plus the ETag/Last-Modified
+    headers, so stale entries can be revalidated with conditional requests.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        self._directory = directory
+        self.ttl = ttl
+
+    @property
+    def directory(self) -> Path:
+        # Resolved lazily so the location follows the environment at use time
+        return self._directory or get_pypi_cache_dir()
+
+    def _path(self, index_url: str, package_name: str) -> Path:
+        index_key = hashlib.sha1(index_url.encode()).hexdigest()[:12]
+        return self.directory / index_key / f"{normalize_package_name(package_name)}.json"
+
+    def get(self, index_url: str, package_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry.
+
+        Returns:
+            Dictionary with 'data', 'fetched_at', 'etag' and 'last_modified',
+            or None if the package is not cached
+        """
+        try:
+            with open(self._path(index_url, package_name), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "data" in entry else None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry is still within the TTL."""
+        return time.time() - float(entry.get("fetched_at", 0)) < self.ttl
+
+    def put(
+        self,
+        index_url: str,
+        package_name: str,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store an entry (atomically, so concurrent readers never see partial files)."""
+        entry = {"fetched_at": time.time(), "etag": etag, "last_modified": last_modified, "data": data}
+        path = self._path(index_url, package_name)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError:
+            # Caching is best-effort
+            pass
+
+    def touch(self, index_url: str, package_name: str, entry: Dict[str, Any]) -> None:
+        """Mark a revalidated entry as fresh again."""
+        self.put(index_url, package_name, entry["data"], entry.get("etag"), entry.get("last_modified"))
@@ -2,28 +2,71 @@
 Command implementations for version sync plugin.
 """
 
+import csv
+import io
 import json
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import typer
 
+from .dependency_index import get_dependency_index
+from .hash_utils import collect_hashes
+from .install_utils import bisect_install, pip_install
 from .package_utils import (
-    compare_package_sets,
     create_pinned_requirements,
     filter_system_packages,
+    get_constraints_from_file,
     get_installed_packages,
     get_packages_from_requirements,
 )
-from .pypi_utils import get_pypi_package_info
-from .version_utils import compare_versions
+from .pypi_utils import DEFAULT_CONCURRENCY, PyPIClient, configure_pypi_client, fetch_package_infos, get_pip_index_options
+from .version_diff import VersionMatrix, build_version_matrix
+from .version_utils import compare_versions, is_version_constraint, normalize_package_name, resolve_versions
+
+
+def _configure_client(offline: bool, index_url: str = "") -> PyPIClient:
+    """Configure the shared PyPI client, exiting on invalid plugin settings."""
+    try:
+        return configure_pypi_client(offline=offline, index_url=index_url)
+    except ValueError as e:
+        typer.secho(f"✗ {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+# Output formats of check-updates
+OUTPUT_FORMATS = ("table", "json", "ndjson")
+
+# Output formats of version-diff
+DIFF_FORMATS = ("table", "json", "csv")
+
+_DISTANCE_COLORS = {"major": typer.colors.RED, "minor": typer.colors.YELLOW, "same": typer.colors.GREEN}
 
 
 class CheckUpdatesCommand:
     """Command for checking package updates from PyPI."""
 
-    def execute(self, requirements_file: str, show_all: bool, json_output: bool, timeout: int) -> None:
+    def execute(
+        self,
+        requirements_file: str,
+        show_all: bool,
+        json_output: bool,
+        timeout: int,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        offline: bool = False,
+        index_url: str = "",
+        output_format: str = "table",
+    ) -> None:
         """Execute the check-updates command."""
+        if json_output:
+            output_format = "json"
+        if output_format not in OUTPUT_FORMATS:
+            typer.secho(f"✗ Unknown format '{output_format}', expected one of: {', '.join(OUTPUT_FORMATS)}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+
+        _configure_client(offline, index_url)
+
         # Determine which packages to check
         if requirements_file:
             if not Path(requirements_file).exists():
@@ -36,12 +79,17 @@ class CheckUpdatesCommand:
         else:
             packages_to_check = get_installed_packages()
 
+        if output_format == "ndjson":
+            self._stream_results(packages_to_check, timeout, concurrency)
+            return
+
         if not packages_to_check:
             typer.secho("No packages found to check.", fg=typer.colors.YELLOW)
             return
 
         # Check each package
-        results = self._check_packages(packages_to_check, timeout, json_output)
+        json_output = output_format == "json"
+        results = self._check_packages(packages_to_check, timeout, json_output, concurrency)
 
         # Output results
         if json_output:
@@ -49,8 +97,14 @@ class CheckUpdatesCommand:
         else:
             self._display_results(results, show_all)
 
-    def _check_packages(self, packages: Dict[str, str], timeout: int, json_output: bool) -> List[Dict[str, Any]]:
-        """Check packages against PyPI and return results."""
+    def _check_packages(
+        self,
+        packages: Dict[str, str],
+        timeout: int,
+        json_output: bool,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """Check packages against PyPI and return results (in the order of packages)."""
         results: List[Dict[str, Any]] = []
         total_packages = len(packages)
 
@@ -60,40 +114,48 @@ class CheckUpdatesCommand:
                 fg=typer.colors.BLUE,
             )
 
-        for i, (package_name, current_version) in enumerate(packages.items(), 1):
+        lookups = fetch_package_infos(packages.keys(), timeout, concurrency)
+        for i, (package_name, pypi_info) in enumerate(lookups, 1):
             if not json_output:
                 typer.echo(f"Checking {package_name} ({i}/{total_packages})...", nl=False)
 
-            pypi_info = get_pypi_package_info(package_name, timeout)
-
-            if pypi_info:
-                latest_version = pypi_info["info"]["version"]
-                status = compare_versions(current_version, latest_version)
-
-                result: Dict[str, Any] = {
-                    "package": package_name,
-                    "current": current_version,
-                    "latest": latest_version,
-                    "status": status,
-                }
-
-                if not json_output:
-                    self._print_status(status, latest_version)
-            else:
-                result = {
-                    "package": package_name,
-                    "current": current_version,
-                    "latest": "unknown",
-                    "status": "error",
-                }
-
-                if not json_output:
+            result = self._make_result(package_name, packages[package_name], pypi_info)
+            if not json_output:
+                if result["status"] == "error":
                     typer.secho(" ✗ error", fg=typer.colors.RED)
+                else:
+                    self._print_status(result["status"], result["latest"])
 
             results.append(result)
 
         return results
 
+    def _make_result(self, package_name: str, current_version: str, pypi_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the result record of one package."""
+        if not pypi_info:
+            return {"package": package_name, "current": current_version, "latest": "unknown", "status": "error"}
+
+        latest_version = pypi_info["info"]["version"]
+        return {
+            "package": package_name,
+            "current": current_version,
+            "latest": latest_version,
+            "status": compare_versions(current_version, latest_version),
+        }
+
+    def _stream_results(self, packages: Dict[str, str], timeout: int, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Print one compact JSON record per package as lookups complete, then a summary record."""
+        start_time = time.time()
+        counts: Dict[str, int] = {"current": 0, "outdated": 0, "ahead": 0, "unknown": 0, "error": 0}
+
+        for package_name, pypi_info in fetch_package_infos(packages.keys(), timeout, concurrency, ordered=False):
+            result = self._make_result(package_name, packages[package_name], pypi_info)
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+            typer.echo(json.dumps({"type": "package", **result}, separators=(",", ":")))
+
+        summary = {"type": "summary", "total": len(packages), **counts, "duration": round(time.time() - start_time, 3)}
+        typer.echo(json.dumps(summary, separators=(",", ":")))
+
     def _print_status(self, status: str, latest_version: str) -> None:
         """Print status indicator for a package."""
         if status == "outdated":
@@ -136,8 +198,21 @@ class CheckUpdatesCommand:
 class SyncVersionsCommand:
     """Command for syncing package versions."""
 
-    def execute(self, target: str, requirements_file: str, dry_run: bool, yes: bool) -> None:
+    def execute(
+        self,
+        target: str,
+        requirements_file: str,
+        dry_run: bool,
+        yes: bool,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        offline: bool = False,
+        report_file: str = "",
+        constraints_file: str = "",
+        index_url: str = "",
+    ) -> None:
         """Command for syncing package versions."""
+        _configure_client(offline, index_url)
+        package_constraints = self._load_constraints(constraints_file) if constraints_file else {}
 
         # Get current installed packages
         current_packages = get_installed_packages()
@@ -146,7 +221,7 @@ class SyncVersionsCommand:
             raise typer.Exit(code=1)
 
         # Determine target versions based on sync target
-        target_packages = self._determine_target_versions(target, requirements_file, current_packages)
+        target_packages = self._determine_target_versions(target, requirements_file, current_packages, concurrency, package_constraints)
 
         if not target_packages:
             typer.secho("No target packages to sync to.", fg=typer.colors.YELLOW)
@@ -161,6 +236,7 @@ class SyncVersionsCommand:
 
         # Display what will be updated
         self._display_planned_updates(updates_needed, dry_run)
+        self._display_impact(updates_needed, dry_run)
 
         if dry_run:
             typer.secho("Dry run complete. No packages were updated.", fg=typer.colors.BLUE)
@@ -172,18 +248,28 @@ class SyncVersionsCommand:
             return
 
         # Execute the updates
-        self._execute_updates(updates_needed)
+        self._execute_updates(updates_needed, report_file)
 
-    def _determine_target_versions(self, target: str, requirements_file: str, current_packages: Dict[str, str]) -> Dict[str, str]:
+    def _determine_target_versions(
+        self,
+        target: str,
+        requirements_file: str,
+        current_packages: Dict[str, str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        package_constraints: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
         """Determine target versions based on sync target."""
 
         if target == "latest":
-            return self._get_latest_versions(current_packages)
+            if package_constraints:
+                # Latest versions allowed by the constraints file
+                return self._apply_version_constraint(current_packages, "", concurrency, package_constraints)
+            return self._get_latest_versions(current_packages, concurrency)
         elif target == "requirements" or requirements_file:
             return self._get_requirements_versions(requirements_file or "requirements.txt")
-        elif target.startswith(">=") or target.startswith("==") or target.startswith("~="):
-            # Handle version constraint targets like ">=2.0.0"
-            return self._apply_version_constraint(current_packages, target)
+        elif is_version_constraint(target):
+            # Handle version constraint targets like ">=2.0.0" or "~=1.4,!=1.4.2"
+            return self._apply_version_constraint(current_packages, target, concurrency, package_constraints)
         elif Path(target).exists():
             # Target is a requirements file path
             return self._get_requirements_versions(target)
@@ -196,7 +282,7 @@ class SyncVersionsCommand:
             typer.echo("  >=1.0.0             - Apply version constraint")
             raise typer.Exit(code=1)
 
-    def _get_latest_versions(self, current_packages: Dict[str, str]) -> Dict[str, str]:
+    def _get_latest_versions(self, current_packages: Dict[str, str], concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, str]:
         """Get latest versions from PyPI for all packages."""
         target_packages: Dict[str, Any] = {}
         total_packages = len(current_packages)
@@ -206,10 +292,10 @@ class SyncVersionsCommand:
             fg=typer.colors.BLUE,
         )
 
-        for i, package_name in enumerate(current_packages.keys(), 1):
+        lookups = fetch_package_infos(current_packages.keys(), timeout=30, concurrency=concurrency)
+        for i, (package_name, pypi_info) in enumerate(lookups, 1):
             typer.echo(f"Checking {package_name} ({i}/{total_packages})...", nl=False)
 
-            pypi_info = get_pypi_package_info(package_name, timeout=30)
             if pypi_info:
                 latest_version = pypi_info["info"]["version"]
                 target_packages[package_name] = latest_version
@@ -230,27 +316,55 @@ class SyncVersionsCommand:
         typer.secho(f"Reading target versions from {requirements_file}...", fg=typer.colors.BLUE)
         return get_packages_from_requirements(requirements_file)
 
-    def _apply_version_constraint(self, current_packages: Dict[str, str], constraint: str) -> Dict[str, str]:
-        """Apply a version constraint to all packages."""
-        typer.secho(f"Applying constraint {constraint} to all packages...", fg=typer.colors.BLUE)
+    def _load_constraints(self, constraints_file: str) -> Dict[str, str]:
+        """Load per-package constraints, exiting on errors."""
+        if not Path(constraints_file).exists():
+            typer.secho(f"Constraints file not found: {constraints_file}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
 
-        # For now, this is a simplified implementation
-        # In practice, you'd want to use packaging.specifiers for proper constraint handling
-        target_packages: Dict[str, Any] = {}
+        try:
+            return get_constraints_from_file(constraints_file)
+        except ValueError as e:
+            typer.secho(f"✗ {e}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
 
-        for package_name in current_packages.keys():
-            # This is a simplified example - you'd want more sophisticated constraint handling
-            if constraint.startswith(">="):
-                # min_version = constraint[2:]
-                pypi_info = get_pypi_package_info(package_name, timeout=30)
-                if pypi_info:
-                    latest = pypi_info["info"]["version"]
-                    # Use latest if it satisfies constraint, otherwise keep current
-                    target_packages[package_name] = latest
-                else:
-                    target_packages[package_name] = current_packages[package_name]
-            else:
-                target_packages[package_name] = current_packages[package_name]
+    def _apply_version_constraint(
+        self,
+        current_packages: Dict[str, str],
+        constraint: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        package_constraints: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """Pick the highest non-yanked release of each package that satisfies the constraints."""
+        if constraint:
+            typer.secho(f"Applying constraint {constraint} to all packages...", fg=typer.colors.BLUE)
+        if package_constraints:
+            typer.secho(f"Applying {len(package_constraints)} per-package constraints...", fg=typer.colors.BLUE)
+
+        lookups = fetch_package_infos(current_packages.keys(), timeout=30, concurrency=concurrency)
+        releases = {name: pypi_info.get("releases") or {} for name, pypi_info in lookups if pypi_info}
+
+        try:
+            selected = resolve_versions(releases, constraint, package_constraints)
+        except ValueError as e:
+            typer.secho(f"✗ Invalid version constraint: {e}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+
+        target_packages: Dict[str, str] = {}
+        unresolved: List[str] = []
+        for package_name, current_version in current_packages.items():
+            version = selected.get(package_name)
+            if version is None:
+                # Keep the current version if no release matches or the lookup failed
+                unresolved.append(package_name)
+                version = current_version
+            target_packages[package_name] = version
+
+        if unresolved:
+            typer.secho(
+                f"No matching release found for {len(unresolved)} packages, keeping their current versions.",
+                fg=typer.colors.YELLOW,
+            )
 
         return target_packages
 
@@ -298,171 +412,173 @@ class SyncVersionsCommand:
 
             typer.secho(f"  {symbol} {package}: {current} → {target}", fg=color)
 
+    def _display_impact(self, updates_needed: List[Dict[str, str]], dry_run: bool) -> None:
+        """Show installed dependents of the updated packages and flag specifier conflicts."""
+        try:
+            index = get_dependency_index()
+        except ValueError:
+            return
+
+        if dry_run:
+            affected = [(update, index.get_dependents(update["package"])) for update in updates_needed]
+            affected = [(update, dependents) for update, dependents in affected if dependents]
+            if affected:
+                typer.echo()
+                typer.secho("Affected dependents:", fg=typer.colors.BLUE, bold=True)
+                for update, dependents in affected:
+                    names = ", ".join(dependent["package"] for dependent in dependents)
+                    typer.echo(f"  {update['package']}: {names}")
+
+        conflicts = index.find_conflicts(updates_needed)
+        if conflicts:
+            typer.echo()
+            typer.secho(f"⚠ {len(conflicts)} specifier conflicts:", fg=typer.colors.YELLOW, bold=True)
+            for conflict in conflicts:
+                note = " (also being updated)" if conflict["dependent_updated"] else ""
+                typer.secho(
+                    f"  {conflict['dependent']} {conflict['dependent_version']} requires "
+                    f"{conflict['package']}{conflict['specifier']}, target is {conflict['target']}{note}",
+                    fg=typer.colors.YELLOW,
+                )
+
     def _confirm_updates(self, updates_needed: List[Dict[str, str]]) -> bool:
         """Ask user to confirm updates."""
         typer.echo()
         return typer.confirm(f"Proceed with updating {len(updates_needed)} packages?")
 
-    def _execute_updates(self, updates_needed: List[Dict[str, str]]) -> None:
-        """Execute the package updates."""
-        import subprocess
-        import sys
-
+    def _execute_updates(self, updates_needed: List[Dict[str, str]], report_file: str = "") -> None:
+        """Install the updates with one pip run, bisecting the set on failure."""
         typer.echo()
         typer.secho("Executing updates...", fg=typer.colors.BLUE, bold=True)
 
-        # Group updates into batches to avoid command line length limits
-        batch_size = 10
-        batches = [updates_needed[i : i + batch_size] for i in range(0, len(updates_needed), batch_size)]
+        attempts: Dict[str, int] = {update["package"]: 0 for update in updates_needed}
+        # Install from the index the versions were looked up in
+        index_options = get_pip_index_options()
 
-        success_count = 0
-        failed_packages: List[str] = []
+        def install(group: List[Dict[str, str]]) -> bool:
+            if len(group) < len(updates_needed):
+                typer.secho(f"  Retrying {len(group)} of {len(updates_needed)} packages...", fg=typer.colors.YELLOW)
+            for update in group:
+                attempts[update["package"]] += 1
+            return pip_install([f"{update['package']}=={update['target']}" for update in group], index_options)
 
-        for batch_num, batch in enumerate(batches, 1):
-            if len(batches) > 1:
-                typer.echo(f"Batch {batch_num}/{len(batches)}:")
-
-            # Build pip install command
-            package_specs = [f"{update['package']}=={update['target']}" for update in batch]
-            cmd = [sys.executable, "-m", "pip", "install"] + package_specs
-
-            try:
-                # Execute pip install
-                result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-
-                if result.returncode == 0:
-                    for update in batch:
-                        typer.secho(
-                            f"  ✓ {update['package']}: {update['current']} → {update['target']}",
-                            fg=typer.colors.GREEN,
-                        )
-                        success_count += 1
-                else:
-                    # If batch fails, try individual packages
-                    typer.secho(
-                        f"  Batch failed, trying individual packages...",
-                        fg=typer.colors.YELLOW,
-                    )
-                    for update in batch:
-                        if self._install_single_package(update):
-                            success_count += 1
-                        else:
-                            failed_packages.append(update["package"])
-
-            except Exception as e:
-                typer.secho(f"  Error executing batch: {e}", fg=typer.colors.RED)
-                for update in batch:
-                    failed_packages.append(update["package"])
+        start_time = time.time()
+        installed, failed, pip_runs = bisect_install(updates_needed, install)
+        duration = time.time() - start_time
 
         # Display final results
         typer.echo()
         typer.secho("Update Summary:", fg=typer.colors.BLUE, bold=True)
-        typer.secho(f"  ✓ Successfully updated: {success_count}", fg=typer.colors.GREEN)
+        for update in installed:
+            typer.secho(f"  ✓ {update['package']}: {update['current']} → {update['target']}", fg=typer.colors.GREEN)
+        typer.secho(f"  ✓ Successfully updated: {len(installed)}", fg=typer.colors.GREEN)
+        typer.echo(f"  pip runs: {pip_runs}")
 
-        if failed_packages:
-            typer.secho(f"  ✗ Failed to update: {len(failed_packages)}", fg=typer.colors.RED)
+        if failed:
+            typer.secho(f"  ✗ Failed to update: {len(failed)}", fg=typer.colors.RED)
             typer.echo("Failed packages:")
-            for package in failed_packages:
-                typer.echo(f"    - {package}")
+            for update in failed:
+                typer.echo(f"    - {update['package']}")
             typer.echo()
             typer.echo("You may need to update these packages manually or resolve conflicts.")
 
-    def _install_single_package(self, update: Dict[str, str]) -> bool:
-        """Install a single package and return success status."""
-        import subprocess
-        import sys
-
-        package_spec = f"{update['package']}=={update['target']}"
-        cmd = [sys.executable, "-m", "pip", "install", package_spec]
-
-        try:
-            result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-            if result.returncode == 0:
-                typer.secho(
-                    f"  ✓ {update['package']}: {update['current']} → {update['target']}",
-                    fg=typer.colors.GREEN,
-                )
-                return True
-            else:
-                typer.secho(f"  ✗ {update['package']}: failed to update", fg=typer.colors.RED)
-                return False
-        except Exception:
-            typer.secho(f"  ✗ {update['package']}: error during update", fg=typer.colors.RED)
-            return False
+        if report_file:
+            failed_names = {update["package"] for update in failed}
+            report = {
+                "pip_runs": pip_runs,
+                "duration": round(duration, 3),
+                "packages": [
+                    {
+                        "package": update["package"],
+                        "current": update["current"],
+                        "target": update["target"],
+                        "status": "failed" if update["package"] in failed_names else "updated",
+                        "attempts": attempts[update["package"]],
+                    }
+                    for update in updates_needed
+                ],
+            }
+            Path(report_file).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+            typer.echo(f"Report written to {report_file}")
 
 
 class VersionDiffCommand:
     """Command for comparing versions between files."""
 
-    def execute(self, file1: str, file2: str, show_all: bool) -> None:
+    def execute(self, files: List[str], show_all: bool, output_format: str = "table") -> None:
         """Execute the version-diff command."""
-        if not Path(file1).exists():
-            typer.secho(f"File not found: {file1}", fg=typer.colors.RED)
+        if output_format not in DIFF_FORMATS:
+            typer.secho(f"Unknown format '{output_format}' (expected one of: {', '.join(DIFF_FORMATS)})", fg=typer.colors.RED)
             raise typer.Exit(code=1)
 
-        if not Path(file2).exists():
-            typer.secho(f"File not found: {file2}", fg=typer.colors.RED)
+        if len(files) < 2:
+            typer.secho("Give at least two files to compare.", fg=typer.colors.RED)
             raise typer.Exit(code=1)
 
-        # Parse both files
-        packages1 = get_packages_from_requirements(file1)
-        packages2 = get_packages_from_requirements(file2)
-
-        # Compare packages
-        comparison = compare_package_sets(packages1, packages2)
-
-        # Display results
-        self._display_comparison(file1, file2, comparison, show_all)
-
-    def _display_comparison(
-        self,
-        file1: str,
-        file2: str,
-        comparison: Dict[str, Dict[str, str]],
-        show_all: bool,
-    ) -> None:
-        """Display comparison results."""
-        typer.secho(
-            f"Comparing {Path(file1).name} vs {Path(file2).name}:",
-            fg=typer.colors.BLUE,
-            bold=True,
-        )
-        typer.echo()
-
-        different = comparison["different"]
-        same = comparison["same"]
-        only_first = comparison["only_in_first"]
-        only_second = comparison["only_in_second"]
-
-        if different:
-            typer.secho("Different versions:", fg=typer.colors.YELLOW, bold=True)
-            for package, versions in different.items():
-                typer.echo(f"  {package}:")
-                typer.echo(f"    {Path(file1).name}: {versions[0]}")
-                typer.echo(f"    {Path(file2).name}: {versions[1]}")
-
-        if only_first:
-            typer.echo()
-            typer.secho(f"Only in {Path(file1).name}:", fg=typer.colors.CYAN, bold=True)
-            for package, version in only_first.items():
-                typer.echo(f"  {package}: {version}")
+        for file in files:
+            if not Path(file).exists():
+                typer.secho(f"File not found: {file}", fg=typer.colors.RED)
+                raise typer.Exit(code=1)
 
-        if only_second:
-            typer.echo()
-            typer.secho(f"Only in {Path(file2).name}:", fg=typer.colors.CYAN, bold=True)
-            for package, version in only_second.items():
-                typer.echo(f"  {package}: {version}")
+        matrix = build_version_matrix(files)
+        rows = matrix.rows(show_all)
+
+        if output_format == "json":
+            result = {
+                "environments": matrix.environments,
+                "groups": [{"pattern": group["pattern"], "packages": [row["package"] for row in group["packages"]]} for group in matrix.groups(rows)],
+                "packages": rows,
+                "summary": matrix.summary(),
+            }
+            typer.echo(json.dumps(result, indent=2))
+        elif output_format == "csv":
+            self._write_csv(matrix.environments, rows)
+        else:
+            self._display_comparison(matrix, rows)
+
+    def _write_csv(self, environments: List[str], rows: List[Dict[str, Any]]) -> None:
+        """Write one CSV line per package with a column per environment."""
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(["package", "distance", "pattern", *environments])
+        for row in rows:
+            writer.writerow([row["package"], row["distance"], row["pattern"], *(row["versions"][env] or "" for env in environments)])
+        typer.echo(output.getvalue(), nl=False)
+
+    def _display_comparison(self, matrix: VersionMatrix, rows: List[Dict[str, Any]]) -> None:
+        """Display comparison results grouped by divergence pattern."""
+        environments = matrix.environments
+        typer.secho(f"Comparing {' vs '.join(environments)}:", fg=typer.colors.BLUE, bold=True)
+
+        name_width = max([len("Package")] + [len(row["package"]) for row in rows])
+        widths = [max([len(env)] + [len(row["versions"][env] or "-") for row in rows]) for env in environments]
+
+        for group in matrix.groups(rows):
+            letters = group["pattern"].split()
+            classes: Dict[str, List[str]] = {}
+            for env, letter in zip(environments, letters):
+                classes.setdefault(letter, []).append(env)
+            description = " | ".join(", ".join(envs) for letter, envs in classes.items() if letter != "-")
+            if "-" in classes:
+                description += f" (missing in {', '.join(classes['-'])})"
 
-        if show_all and same:
             typer.echo()
-            typer.secho("Same versions:", fg=typer.colors.GREEN, bold=True)
-            for package, version in same.items():
-                typer.echo(f"  {package}: {version}")
+            count = len(group["packages"])
+            typer.secho(f"{description}: {count} package{'s' if count != 1 else ''}", fg=typer.colors.YELLOW, bold=True)
+            header = "  ".join(env.ljust(width) for env, width in zip(environments, widths))
+            typer.secho(f"  {'Package'.ljust(name_width)}  {'Distance'.ljust(8)}  {header}", fg=typer.colors.CYAN)
+            for row in group["packages"]:
+                versions = "  ".join((row["versions"][env] or "-").ljust(width) for env, width in zip(environments, widths))
+                line = f"  {row['package'].ljust(name_width)}  {row['distance'].ljust(8)}  {versions}".rstrip()
+                typer.secho(line, fg=_DISTANCE_COLORS.get(row["distance"]))
+
+        summary = matrix.summary()
+        different = sum(count for distance, count in summary.items() if distance != "same")
+        details = ", ".join(f"{count} {distance}" for distance, count in summary.items() if count and distance != "same")
 
         typer.echo()
-        total_differences = len(different) + len(only_first) + len(only_second)
         typer.secho(
-            f"Summary: {total_differences} differences, {len(same)} same",
+            f"Summary: {different} differences{f' ({details})' if details else ''}, {summary['same']} same",
             fg=typer.colors.BLUE,
         )
 
@@ -470,7 +586,7 @@ class VersionDiffCommand:
 class PinVersionsCommand:
     """Command for pinning package versions."""
 
-    def execute(self, requirements_file: str, output_file: str, force: bool) -> None:
+    def execute(self, requirements_file: str, output_file: str, force: bool, hashes: bool = False, wheelhouses: Optional[List[str]] = None) -> None:
         """Execute the pin-versions command."""
         # Get installed packages
         installed = get_installed_packages()
@@ -498,7 +614,8 @@ class PinVersionsCommand:
 
         # Create pinned requirements
         header_comment = "Pinned package versions generated from current environment"
-        pinned_lines = create_pinned_requirements(installed, header_comment)
+        package_hashes = self._collect_hashes(installed, wheelhouses or []) if hashes else None
+        pinned_lines = create_pinned_requirements(installed, header_comment, package_hashes)
 
         # Write to file
         try:
@@ -509,8 +626,85 @@ class PinVersionsCommand:
                 f"✓ Pinned {len(installed)} packages to {output_file}",
                 fg=typer.colors.GREEN,
             )
-            typer.echo(f"Install with: pip install -r {output_file}")
+            typer.echo(f"Install with: pip install{' --require-hashes' if hashes else ''} -r {output_file}")
 
         except Exception as e:
             typer.secho(f"Error writing to {output_file}: {e}", fg=typer.colors.RED)
             raise typer.Exit(code=1)
+
+    def _collect_hashes(self, packages: Dict[str, str], wheelhouses: List[str]) -> Dict[str, List[str]]:
+        """Collect archive hashes, warning about packages without any."""
+        if not wheelhouses:
+            # A file:// index configured for the plugin is a wheelhouse too
+            wheelhouse = _configure_client(offline=True).wheelhouse
+            if wheelhouse is not None:
+                wheelhouses = [wheelhouse.directory]
+
+        for directory in wheelhouses:
+            if not Path(directory).is_dir():
+                typer.secho(f"Wheelhouse directory not found: {directory}", fg=typer.colors.RED)
+                raise typer.Exit(code=1)
+
+        typer.secho("Collecting distribution hashes...", fg=typer.colors.BLUE)
+        package_hashes = collect_hashes(packages, wheelhouses)
+
+        missing = sorted(set(packages) - set(package_hashes))
+        if missing:
+            typer.secho(
+                f"⚠ No archive found for {len(missing)} packages (pip --require-hashes will reject them): {', '.join(missing)}",
+                fg=typer.colors.YELLOW,
+            )
+        return package_hashes
+
+
+class WhyCommand:
+    """Command for showing which installed packages depend on a package."""
+
+    def execute(self, package: str, target: str, json_output: bool) -> None:
+        """Execute the why command."""
+        try:
+            index = get_dependency_index()
+        except ValueError as e:
+            typer.secho(f"✗ {e}", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+
+        name = normalize_package_name(package)
+        installed = index.packages.get(name)
+        dependents = index.get_dependents(name)
+        if installed is None and not dependents:
+            typer.secho(f"Package '{package}' is not installed.", fg=typer.colors.RED)
+            raise typer.Exit(code=1)
+
+        version = target or (installed["version"] if installed else "")
+        conflicts = index.find_conflicts([{"package": name, "target": version}]) if version else []
+        conflicting = {conflict["dependent"] for conflict in conflicts}
+
+        if json_output:
+            result = {
+                "package": name,
+                "installed": installed["version"] if installed else None,
+                "target": target or None,
+                "dependents": [{**dependent, "satisfied": dependent["package"] not in conflicting} for dependent in dependents],
+            }
+            typer.echo(json.dumps(result, indent=2))
+            return
+
+        label = f"{name} {installed['version']}" if installed else f"{name} (not installed)"
+        if not dependents:
+            typer.echo(f"{label} is not required by any installed package.")
+            return
+
+        typer.secho(f"{label} is required by:", fg=typer.colors.BLUE, bold=True)
+        for dependent in dependents:
+            specifier = f"{name}{dependent['specifier']}" if dependent["specifier"] else f"{name} (any version)"
+            if dependent["package"] in conflicting:
+                typer.secho(f"  ✗ {dependent['package']} {dependent['version']}: {specifier}", fg=typer.colors.RED)
+            else:
+                typer.secho(f"  ✓ {dependent['package']} {dependent['version']}: {specifier}", fg=typer.colors.GREEN)
+
+        if conflicts:
+            typer.echo()
+            typer.secho(
+                f"{len(conflicts)} dependents do not accept {name} {version}.",
+                fg=typer.colors.YELLOW,
+            )
@@ -2,6 +2,8 @@
 Core plugin class for version synchronization.
 """
 
+from typing import List, Optional
+
 import typer
 
 from ginx.plugins import GinxPlugin
@@ -11,7 +13,9 @@ from .commands import (
     PinVersionsCommand,
     SyncVersionsCommand,
     VersionDiffCommand,
+    WhyCommand,
 )
+from .pypi_utils import DEFAULT_CONCURRENCY
 from .version_utils import has_packaging_library
 
 
@@ -23,6 +27,7 @@ class VersionSyncPlugin(GinxPlugin):
         self.sync_versions_cmd = SyncVersionsCommand()
         self.version_diff_cmd = VersionDiffCommand()
         self.pin_versions_cmd = PinVersionsCommand()
+        self.why_cmd = WhyCommand()
 
     @property
     def name(self) -> str:
@@ -52,10 +57,20 @@ class VersionSyncPlugin(GinxPlugin):
             requirements_file: str = typer.Option("", "--requirements", "-r", help="Specific requirements file to check"),
             show_all: bool = typer.Option(False, "--all", help="Show all packages, not just outdated ones"),
             json_output: bool = typer.Option(False, "--json", help="Output results in JSON format"),
+            output_format: str = typer.Option(
+                "table", "--format", help="Output format: table, json, or ndjson (one record per package as it completes)"
+            ),
             timeout: int = typer.Option(10, "--timeout", help="Timeout for PyPI requests in seconds"),
+            concurrency: int = typer.Option(
+                DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, help="Maximum number of concurrent PyPI requests"
+            ),
+            offline: bool = typer.Option(False, "--offline", help="Only use cached PyPI metadata, never contact the index"),
+            index_url: str = typer.Option(
+                "", "--index-url", help="Package index (http(s) PEP 503/691 URL) or file:// wheelhouse directory"
+            ),
         ):
             """Check for package updates from PyPI."""
-            self.check_updates_cmd.execute(requirements_file, show_all, json_output, timeout)
+            self.check_updates_cmd.execute(requirements_file, show_all, json_output, timeout, concurrency, offline, index_url, output_format)
 
         @app.command(
             "sync-versions",
@@ -68,6 +83,9 @@ class VersionSyncPlugin(GinxPlugin):
                 help="Sync target: latest, requirements, or specific file",
             ),
             requirements_file: str = typer.Option("", "--requirements", "-r", help="Requirements file to sync with"),
+            constraints_file: str = typer.Option(
+                "", "--constraints", "-c", help="Constraints file with version specifiers for individual packages"
+            ),
             dry_run: bool = typer.Option(
                 False,
                 "--dry-run",
@@ -75,24 +93,48 @@ class VersionSyncPlugin(GinxPlugin):
                 help="Show what would be updated without updating",
             ),
             yes: bool = typer.Option(False, "--yes", "-y", help="Auto-confirm updates"),
+            report_file: str = typer.Option("", "--report", help="Write per-package install results to this JSON file"),
+            concurrency: int = typer.Option(
+                DEFAULT_CONCURRENCY, "--concurrency", "-j", min=1, help="Maximum number of concurrent PyPI requests"
+            ),
+            offline: bool = typer.Option(False, "--offline", help="Only use cached PyPI metadata, never contact the index"),
+            index_url: str = typer.Option(
+                "", "--index-url", help="Package index (http(s) PEP 503/691 URL) or file:// wheelhouse directory"
+            ),
         ):
             """Sync package versions with PyPI or requirements file."""
-            self.sync_versions_cmd.execute(target, requirements_file, dry_run, yes)
+            self.sync_versions_cmd.execute(target, requirements_file, dry_run, yes, concurrency, offline, report_file, constraints_file, index_url)
 
         @app.command("version-diff", help="Compare package versions between environments.")
         def version_diff(  # type: ignore
-            file1: str = typer.Option(..., "--file1", help="First requirements file"),
-            file2: str = typer.Option(..., "--file2", help="Second requirements file"),
+            files: Optional[List[str]] = typer.Argument(None, help="Requirements or lock files to compare (one per environment)"),
+            file1: str = typer.Option("", "--file1", help="First requirements file"),
+            file2: str = typer.Option("", "--file2", help="Second requirements file"),
             show_all: bool = typer.Option(False, "--all", help="Show all packages, not just differences"),
+            output_format: str = typer.Option("table", "--format", help="Output format: table, json, or csv"),
         ):
-            """Compare package versions between two requirements files."""
-            self.version_diff_cmd.execute(file1, file2, show_all)
+            """Compare package versions between two or more requirements files."""
+            all_files = [file for file in (file1, file2) if file] + list(files or [])
+            self.version_diff_cmd.execute(all_files, show_all, output_format)
 
         @app.command("pin-versions", help="Pin all packages to specific versions.")
         def pin_versions(  # type: ignore
             requirements_file: str = typer.Option("", "--requirements", "-r", help="Requirements file to pin"),
             output_file: str = typer.Option("", "--output", "-o", help="Output file for pinned requirements"),
             force: bool = typer.Option(False, "--force", help="Overwrite existing output file"),
+            hashes: bool = typer.Option(False, "--hashes", help="Add --hash=sha256 entries for pip's hash-checking mode"),
+            wheelhouses: Optional[List[str]] = typer.Option(
+                None, "--wheelhouse", "-w", help="Directory with wheels/sdists to hash (repeatable; default: a file:// index_url)"
+            ),
         ):
             """Pin all packages to their currently installed versions."""
-            self.pin_versions_cmd.execute(requirements_file, output_file, force)
+            self.pin_versions_cmd.execute(requirements_file, output_file, force, hashes, wheelhouses)
+
+        @app.command("why", help="Show which installed packages depend on a package.")
+        def why(  # type: ignore
+            package: str = typer.Argument(..., help="Package name"),
+            target: str = typer.Option("", "--target", "-t", help="Check whether dependents accept this version"),
+            json_output: bool = typer.Option(False, "--json", help="Output results in JSON format"),
+        ):
+            """Show which installed packages depend on a package."""
+            self.why_cmd.execute(package, target, json_output)
@@ -0,0 +1,178 @@
+"""
+Reverse-dependency index of the installed distributions.
+"""
+
+import json
+import os
+import tempfile
+from importlib import metadata as importlib_metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.specifiers import SpecifierSet
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Requirement = None  # type: ignore[assignment,misc]
+
+from .cache import get_cache_root
+from .package_utils import get_environment_fingerprint
+from .version_utils import normalize_package_name
+
+# Index files kept on disk (one per environment state)
+MAX_CACHED_INDEXES = 16
+
+# Index of the last lookup, keyed by environment fingerprint
+_index_cache: Optional[Tuple[str, "DependencyIndex"]] = None
+
+
+def _read_requirements() -> Dict[str, Dict[str, Any]]:
+    """Read the version and applicable Requires-Dist entries of every installed distribution."""
+    packages: Dict[str, Dict[str, Any]] = {}
+    for distribution in importlib_metadata.distributions():
+        name = distribution.metadata["Name"]
+        if not name:
+            continue
+        normalized = normalize_package_name(name)
+        if normalized in packages:
+            # Shadowed by a distribution earlier on sys.path
+            continue
+
+        requires: List[List[str]] = []
+        for line in distribution.requires or []:
+            try:
+                requirement = Requirement(line)
+            except InvalidRequirement:
+                continue
+            # Requirements of extras and of other platforms don't apply
+            if requirement.marker is not None and not requirement.marker.evaluate({"extra": ""}):
+                continue
+            requires.append([normalize_package_name(requirement.name), str(requirement.specifier)])
+
+        packages[normalized] = {"version": distribution.version, "requires": requires}
+    return packages
+
+
+class DependencyIndex:
+    """Forward and reverse dependencies of the installed distributions."""
+
+    def __init__(self, packages: Dict[str, Dict[str, Any]]) -> None:
+        self.packages = packages
+        self._dependents: Dict[str, List[Tuple[str, str]]] = {}
+        for name, info in packages.items():
+            for dependency, specifier in info["requires"]:
+                self._dependents.setdefault(dependency, []).append((name, specifier))
+
+    def get_dependents(self, package_name: str) -> List[Dict[str, str]]:
+        """
+        Get the installed packages that depend on a package.
+
+        Returns:
+            List of dictionaries with 'package', 'version' and 'specifier'
+            (empty if any version is accepted), sorted by package name
+        """
+        return [
+            {"package": name, "version": self.packages[name]["version"], "specifier": specifier}
+            for name, specifier in sorted(self._dependents.get(normalize_package_name(package_name), []))
+        ]
+
+    def find_conflicts(self, updates: Iterable[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Find installed dependents whose specifiers exclude the target version of an update.
+
+        Args:
+            updates: Planned updates with 'package' and 'target'
+
+        Returns:
+            List of conflicts with 'package', 'target', 'dependent',
+            'dependent_version', 'specifier' and 'dependent_updated' (the
+            dependent is part of the plan too, so its new release may accept
+            the target)
+        """
+        updates = list(updates)
+        updated = {normalize_package_name(update["package"]) for update in updates}
+        specifiers: Dict[str, Any] = {}
+        conflicts: List[Dict[str, Any]] = []
+
+        for update in updates:
+            try:
+                target = Version(update["target"])
+            except InvalidVersion:
+                continue
+            for dependent in self.get_dependents(update["package"]):
+                if not dependent["specifier"]:
+                    continue
+                specifier = specifiers.get(dependent["specifier"])
+                if specifier is None:
+                    specifier = specifiers[dependent["specifier"]] = SpecifierSet(dependent["specifier"])
+                if specifier.contains(target, prereleases=True):
+                    continue
+                conflicts.append(
+                    {
+                        "package": update["package"],
+                        "target": update["target"],
+                        "dependent": dependent["package"],
+                        "dependent_version": dependent["version"],
+                        "specifier": dependent["specifier"],
+                        "dependent_updated": dependent["package"] in updated,
+                    }
+                )
+
+        return conflicts
+
+
+def _load_index_file(path: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            packages = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return packages if isinstance(packages, dict) else None
+
+
+def _store_index_file(path: Path, packages: Dict[str, Dict[str, Any]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(packages, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+        # Every install changes the fingerprint, only keep the most recent indexes
+        indexes = sorted(path.parent.glob("*.json"), key=lambda index: index.stat().st_mtime, reverse=True)
+        for stale in indexes[MAX_CACHED_INDEXES:]:
+            stale.unlink()
+    except OSError:
+        # Caching is best-effort
+        pass
+
+
+def get_dependency_index() -> DependencyIndex:
+    """
+    Get the dependency index of the current environment.
+
+    The Requires-Dist metadata is parsed once per environment state and
+    cached in memory and on disk, keyed by the environment fingerprint.
+
+    Raises:
+        ValueError: If the packaging library is not available
+    """
+    global _index_cache
+
+    if Requirement is None:
+        raise ValueError("Dependency analysis requires the 'packaging' library")
+
+    fingerprint = get_environment_fingerprint()
+    if _index_cache is not None and _index_cache[0] == fingerprint:
+        return _index_cache[1]
+
+    path = get_cache_root() / "deps" / f"{fingerprint}.json"
+    packages = _load_index_file(path)
+    if packages is None:
+        packages = _read_requirements()
+        _store_index_file(path, packages)
+
+    index = DependencyIndex(packages)
+    _index_cache = (fingerprint, index)
+    return index
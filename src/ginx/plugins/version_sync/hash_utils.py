@@ -0,0 +1,239 @@
+"""
+Distribution archive hashes for hash-pinned requirements files.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata as importlib_metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Version = None  # type: ignore[assignment,misc]
+
+from .cache import get_cache_root
+from .version_utils import normalize_package_name, parse_distribution_filename
+
+# Threads hashing files (hashlib releases the GIL while hashing)
+DEFAULT_HASH_WORKERS = 8
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _version_key(version: str) -> object:
+    # Equal versions may be spelled differently ('1.2' and '1.2.0')
+    if Version is None:
+        return version
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return version
+
+
+class HashCache:
+    """
+    SHA-256 digests of local files, keyed by path, size and mtime.
+
+    Stored as one JSON file under the cache root; entries for files that
+    changed since they were hashed are ignored.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._path = path
+        self._entries: Optional[Dict[str, List[object]]] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @property
+    def path(self) -> Path:
+        return self._path or get_cache_root() / "hashes.json"
+
+    def _load(self) -> Dict[str, List[object]]:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        """Get the digest of a file if it hasn't changed since it was hashed."""
+        with self._lock:
+            entry = self._load().get(path)
+        if isinstance(entry, list) and len(entry) == 3 and entry[0] == size and entry[1] == mtime_ns:
+            return str(entry[2])
+        return None
+
+    def put(self, path: str, size: int, mtime_ns: int, digest: str) -> None:
+        """Record the digest of a file (kept in memory until save())."""
+        with self._lock:
+            self._load()[path] = [size, mtime_ns, digest]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write new entries to disk (atomically; best-effort)."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".json")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f, separators=(",", ":"))
+                os.replace(temp_path, self.path)
+                self._dirty = False
+            except OSError:
+                pass
+
+
+def file_sha256(path: str, cache: Optional[HashCache] = None) -> str:
+    """
+    Get the SHA-256 hex digest of a file, using the cache when possible.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    stat = os.stat(path)
+    if cache is not None:
+        digest = cache.get(path, stat.st_size, stat.st_mtime_ns)
+        if digest is not None:
+            return digest
+
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    digest = sha256.hexdigest()
+
+    if cache is not None:
+        cache.put(path, stat.st_size, stat.st_mtime_ns, digest)
+    return digest
+
+
+def hash_files(paths: Sequence[str], cache: Optional[HashCache] = None, max_workers: int = DEFAULT_HASH_WORKERS) -> Dict[str, str]:
+    """
+    Hash files in a thread pool.
+
+    Returns:
+        Dictionary mapping paths to SHA-256 hex digests (unreadable files
+        are left out)
+    """
+
+    def hash_one(path: str) -> Tuple[str, Optional[str]]:
+        try:
+            return path, file_sha256(path, cache)
+        except OSError:
+            return path, None
+
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+        return {path: digest for path, digest in executor.map(hash_one, paths) if digest is not None}
+
+
+def get_direct_url_hashes() -> Dict[str, List[str]]:
+    """
+    Get archive hashes recorded by pip for distributions installed from archive URLs.
+
+    Returns:
+        Dictionary mapping normalized package names to 'sha256:<digest>' entries
+    """
+    hashes: Dict[str, List[str]] = {}
+    for distribution in importlib_metadata.distributions():
+        name = distribution.metadata["Name"]
+        if not name:
+            continue
+        try:
+            direct_url = json.loads(distribution.read_text("direct_url.json") or "null")
+        except ValueError:
+            continue
+        archive_info = direct_url.get("archive_info") if isinstance(direct_url, dict) else None
+        if not isinstance(archive_info, dict):
+            continue
+
+        # 'hashes' (PEP 610) supersedes the older single 'hash' ('sha256=<digest>')
+        digest = (archive_info.get("hashes") or {}).get("sha256")
+        if not digest and str(archive_info.get("hash", "")).startswith("sha256="):
+            digest = archive_info["hash"].split("=", 1)[1]
+        if digest:
+            hashes.setdefault(normalize_package_name(name), []).append(f"sha256:{digest}")
+    return hashes
+
+
+def find_distribution_files(directories: Iterable[str], packages: Dict[str, str]) -> Dict[str, List[str]]:
+    """
+    Find the wheels and sdists of specific package versions in local directories.
+
+    Directories are searched recursively; project names and versions are
+    parsed from the file names.
+
+    Args:
+        directories: Wheelhouse or cache directories
+        packages: Normalized package names -> versions
+
+    Returns:
+        Dictionary mapping package names to matching file paths
+    """
+    wanted = {name: _version_key(version) for name, version in packages.items()}
+    files: Dict[str, List[str]] = {}
+    seen: Set[str] = set()
+    for directory in directories:
+        for root, _, filenames in os.walk(directory):
+            for filename in filenames:
+                parsed = parse_distribution_filename(filename)
+                if parsed is None or wanted.get(parsed[0]) != _version_key(parsed[1]):
+                    continue
+                path = os.path.realpath(os.path.join(root, filename))
+                if path not in seen:
+                    seen.add(path)
+                    files.setdefault(parsed[0], []).append(path)
+    return files
+
+
+def collect_hashes(
+    packages: Dict[str, str],
+    wheelhouses: Sequence[str] = (),
+    cache: Optional[HashCache] = None,
+    max_workers: int = DEFAULT_HASH_WORKERS,
+) -> Dict[str, List[str]]:
+    """
+    Collect the archive hashes of pinned packages.
+
+    Hashes pip recorded in direct_url.json are used as they are, and the
+    files of the pinned versions found in the wheelhouse directories are
+    hashed in parallel (cached by path, size and mtime).
+
+    Args:
+        packages: Normalized package names -> pinned versions
+        wheelhouses: Directories with distribution files
+        cache: Digest cache (a default on-disk one if None)
+        max_workers: Hashing threads
+
+    Returns:
+        Dictionary mapping package names to sorted 'sha256:<digest>' entries;
+        packages without any known artifact are left out
+    """
+    cache = cache if cache is not None else HashCache()
+    hashes: Dict[str, Set[str]] = {}
+
+    for name, entries in get_direct_url_hashes().items():
+        if name in packages:
+            hashes.setdefault(name, set()).update(entries)
+
+    files = find_distribution_files(wheelhouses, packages)
+    digests = hash_files([path for paths in files.values() for path in paths], cache, max_workers)
+    for name, paths in files.items():
+        for path in paths:
+            if path in digests:
+                hashes.setdefault(name, set()).add(f"sha256:{digests[path]}")
+
+    cache.save()
+    return {name: sorted(entries) for name, entries in hashes.items()}
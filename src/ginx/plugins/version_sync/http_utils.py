@@ -0,0 +1,176 @@
+"""
+Minimal HTTP client with per-host keep-alive connection pooling.
+"""
+
+import gzip
+import http.client
+import ssl
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+# Idle connections kept open per (scheme, host, port)
+DEFAULT_POOL_SIZE = 8
+
+# Methods that are safe to send again when a reused connection turns out to be stale
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_MAX_REDIRECTS = 5
+
+_PoolKey = Tuple[str, str, int]
+
+
+class HTTPResponseData:
+    """A fully read HTTP response."""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes, url: str) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.url = url
+
+    def header(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a response header (case-insensitive)."""
+        return self.headers.get(name.lower(), default)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent HTTP/HTTPS connections.
+
+    Each connection is used by one request at a time; finished connections
+    go back to the pool unless the server asked to close them.
+    """
+
+    def __init__(self, max_per_host: int = DEFAULT_POOL_SIZE, user_agent: Optional[str] = None) -> None:
+        self.max_per_host = max_per_host
+        self.user_agent = user_agent
+        self._idle: Dict[_PoolKey, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+    def _new_connection(self, key: _PoolKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _acquire(self, key: _PoolKey, timeout: float, fresh: bool = False) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = None if fresh else self._idle.get(key)
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        return self._new_connection(key, timeout), False
+
+    def _release(self, key: _PoolKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        follow_redirects: bool = True,
+    ) -> HTTPResponseData:
+        """
+        Send a request and read the whole response.
+
+        Args:
+            method: HTTP method
+            url: Absolute http(s) URL
+            headers: Extra request headers
+            timeout: Socket timeout in seconds
+            follow_redirects: Follow 3xx responses with a Location header
+
+        Returns:
+            The response, with a gzip/deflate body already decoded
+
+        Raises:
+            OSError: On connection problems and timeouts
+            http.client.HTTPException: On protocol errors
+            ValueError: On unsupported URLs or too many redirects
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            response = self._request_once(method, url, headers, timeout)
+            location = response.header("location")
+            if not follow_redirects or response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            url = urljoin(url, location)
+            if response.status == 303:
+                method = "GET"
+
+        raise ValueError(f"Too many redirects for {url}")
+
+    def _request_once(self, method: str, url: str, headers: Optional[Dict[str, str]], timeout: float) -> HTTPResponseData:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+
+        key: _PoolKey = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        request_headers = {"Accept-Encoding": "gzip, deflate"}
+        if self.user_agent:
+            request_headers["User-Agent"] = self.user_agent
+        request_headers.update(headers or {})
+
+        fresh = False
+        while True:
+            connection, reused = self._acquire(key, timeout, fresh)
+            try:
+                connection.request(method, path, headers=request_headers)
+                raw = connection.getresponse()
+                body = raw.read()
+            except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine):
+                connection.close()
+                # The server closed an idle keep-alive connection. Others idle as long
+                # are likely stale too, so retry once on a new connection.
+                if reused and method in _IDEMPOTENT_METHODS:
+                    fresh = True
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            if raw.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+
+            response_headers = {name.lower(): value for name, value in raw.getheaders()}
+            return HTTPResponseData(raw.status, response_headers, _decode_body(body, response_headers), url)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+
+def _decode_body(body: bytes, headers: Dict[str, str]) -> bytes:
+    encoding = headers.get("content-encoding", "").lower()
+    try:
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            return zlib.decompress(body)
+    except (OSError, EOFError, zlib.error) as e:
+        raise http.client.HTTPException(f"Invalid {encoding} response body: {e}") from e
+    return body
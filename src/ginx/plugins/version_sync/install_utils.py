@@ -0,0 +1,77 @@
+"""
+Installing package updates with pip.
+"""
+
+import os
+import sys
+import tempfile
+from typing import Callable, List, Sequence, Tuple, TypeVar
+
+from ginx.utils import run_command_with_streaming
+
+T = TypeVar("T")
+
+
+def pip_install(specs: Sequence[str], options: Sequence[str] = (), prefix: str = "    ") -> bool:
+    """
+    Install requirement specifiers with a single pip invocation.
+
+    The specifiers go through a temporary requirements file, so the whole
+    set is resolved together and no command line length limit applies.
+
+    Args:
+        specs: Requirement specifiers, e.g. 'requests==2.31.0'
+        options: Extra pip install options (e.g. the index to use)
+        prefix: Text prepended to every line of pip's (streamed) output
+
+    Returns:
+        True if pip succeeded
+    """
+    fd, requirements_path = tempfile.mkstemp(prefix="ginx-install-", suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(specs) + "\n")
+        command = [sys.executable, "-m", "pip", "install", *options, "-r", requirements_path]
+        return run_command_with_streaming(command, prefix=prefix) == 0
+    finally:
+        os.unlink(requirements_path)
+
+
+def bisect_install(items: List[T], install: Callable[[List[T]], bool]) -> Tuple[List[T], List[T], int]:
+    """
+    Install all items at once, isolating the failing ones by bisection.
+
+    A failing group is split in halves that are retried separately, so k
+    failing items among n cost O(k log n) installer runs instead of one
+    run per item.
+
+    Args:
+        items: Items to install
+        install: Installs a group of items, returns True on success
+
+    Returns:
+        Tuple of (installed items, failed items, number of installer runs),
+        both lists in the original order
+    """
+    position = {id(item): index for index, item in enumerate(items)}
+    installed: List[T] = []
+    failed: List[T] = []
+    runs = 0
+
+    pending = [items] if items else []
+    while pending:
+        group = pending.pop()
+        runs += 1
+        if install(group):
+            installed.extend(group)
+        elif len(group) == 1:
+            failed.extend(group)
+        else:
+            middle = len(group) // 2
+            # Stack: the first half is tried first
+            pending.append(group[middle:])
+            pending.append(group[:middle])
+
+    installed.sort(key=lambda item: position[id(item)])
+    failed.sort(key=lambda item: position[id(item)])
+    return installed, failed, runs
@@ -2,15 +2,109 @@
 Package management and requirements file utilities.
 """
 
+import hashlib
 import json
-import subprocess
+import os
+import re
 import sys
+from importlib import metadata as importlib_metadata
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
 
-from ginx.utils import parse_requirements_file
+try:
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+except ImportError:
+    SpecifierSet = None  # type: ignore[assignment,misc]
 
-from .version_utils import normalize_package_name, parse_package_line
+from ginx.utils import parse_requirements
+
+from .version_utils import normalize_package_name
+
+_PathKey = Tuple[Tuple[str, int], ...]
+
+# Operators whose version a requirement targets, most specific first. Versions
+# from !=, < and <= are excluded or upper bounds, so they are never used.
+_TARGET_OPERATORS = ("===", "==", ">=", "~=", ">")
+_CLAUSE_PATTERN = re.compile(r"^(===|==|~=|!=|<=|>=|<|>)(.+)$")
+
+# Installed distributions of the last scan, keyed by the sys.path directory mtimes
+_distributions_cache: Optional[Tuple[_PathKey, Dict[str, Dict[str, Any]]]] = None
+
+
+def _sys_path_key() -> _PathKey:
+    # Installing or removing a distribution adds or removes an entry in its
+    # site-packages directory, which changes the directory's mtime
+    key = []
+    for entry in sys.path:
+        try:
+            key.append((entry, os.stat(entry or ".").st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(key)
+
+
+def get_environment_fingerprint() -> str:
+    """
+    Get a fingerprint of the installed distributions.
+
+    It changes whenever a directory on sys.path changes (e.g. when packages
+    are installed or removed), or when another interpreter is used.
+    """
+    return hashlib.sha1(repr((sys.executable, _sys_path_key())).encode()).hexdigest()
+
+
+def _editable_location(distribution: Any, name: str) -> Optional[str]:
+    # PEP 660 editables (and pip >= 20.1 installs in general) record a direct_url.json
+    try:
+        direct_url = json.loads(distribution.read_text("direct_url.json") or "null")
+    except ValueError:
+        direct_url = None
+    if isinstance(direct_url, dict) and (direct_url.get("dir_info") or {}).get("editable"):
+        url = urlsplit(str(direct_url.get("url", "")))
+        return url2pathname(url.path) if url.scheme == "file" else str(direct_url.get("url"))
+
+    # Legacy 'setup.py develop' installs leave an .egg-link file in site-packages
+    for entry in sys.path:
+        egg_link = os.path.join(entry or ".", f"{name}.egg-link")
+        if os.path.isfile(egg_link):
+            with open(egg_link, encoding="utf-8") as f:
+                return f.readline().strip() or "unknown"
+    return None
+
+
+def _get_distributions() -> Dict[str, Dict[str, Any]]:
+    """
+    Scan sys.path for installed distributions (cached until a directory on it changes).
+
+    Returns:
+        Dictionary mapping normalized package names to 'version' and
+        'editable' (the project location, or None)
+    """
+    global _distributions_cache
+
+    key = _sys_path_key()
+    if _distributions_cache is not None and _distributions_cache[0] == key:
+        return _distributions_cache[1]
+
+    distributions: Dict[str, Dict[str, Any]] = {}
+    for distribution in importlib_metadata.distributions():
+        name = distribution.metadata["Name"]
+        if not name:
+            # Leftover or broken metadata directory
+            continue
+        normalized = normalize_package_name(name)
+        if normalized in distributions:
+            # Like the import system (and pip), the first one on sys.path wins
+            continue
+        distributions[normalized] = {
+            "version": distribution.version,
+            "editable": _editable_location(distribution, name),
+        }
+
+    _distributions_cache = (key, distributions)
+    return distributions
 
 
 def get_installed_packages() -> Dict[str, str]:
@@ -20,28 +114,19 @@ def get_installed_packages() -> Dict[str, str]:
     Returns:
         Dictionary mapping normalized package names to versions
     """
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "list", "--format=json"],
-            check=True,
-            text=True,
-            capture_output=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-
-        packages = json.loads(result.stdout)
-        return {normalize_package_name(pkg["name"]): pkg["version"] for pkg in packages}
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
-        return {}
+    return {name: info["version"] for name, info in _get_distributions().items()}
 
 
 def get_packages_from_requirements(requirements_file: str) -> Dict[str, str]:
     """
     Extract packages and versions from a requirements file.
 
+    A package's version is its pin, or else its lower bound. Packages
+    without either (e.g. 'foo<3') and packages named only in included -c
+    constraints files are not part of the result.
+
     Args:
-        requirements_file: Path to requirements file
+        requirements_file: Path to requirements file (-r includes are followed)
 
     Returns:
         Dictionary mapping normalized package names to versions
@@ -49,17 +134,68 @@ def get_packages_from_requirements(requirements_file: str) -> Dict[str, str]:
     if not Path(requirements_file).exists():
         return {}
 
-    packages: Dict[Any, Any] = {}
-    req_packages = parse_requirements_file(requirements_file)
-
-    for pkg_line in req_packages:
-        name, _, ver = parse_package_line(pkg_line)
-        if name and ver:
-            packages[normalize_package_name(name)] = ver
+    packages: Dict[str, str] = {}
+    for requirement in parse_requirements(requirements_file).requirements:
+        if not requirement.name or not requirement.specifier or requirement.constraint:
+            continue
+        version = _target_version(requirement.specifier)
+        if version is not None:
+            packages[requirement.name] = version
 
     return packages
 
 
+def _target_version(specifier: str) -> Optional[str]:
+    """Get the pinned version of a specifier, or else its lower bound ('>=2.0,<3' -> '2.0')."""
+    clauses: Dict[str, str] = {}
+    for clause in specifier.split(","):
+        match = _CLAUSE_PATTERN.match(clause)
+        # Wildcard pins ('==1.*') don't name a single version
+        if match and "*" not in match.group(2):
+            clauses.setdefault(match.group(1), match.group(2))
+    for operator in _TARGET_OPERATORS:
+        if operator in clauses:
+            return clauses[operator]
+    return None
+
+
+def get_constraints_from_file(constraints_file: str) -> Dict[str, str]:
+    """
+    Read per-package version specifiers from a constraints file.
+
+    Args:
+        constraints_file: Path to a pip-style constraints file
+
+    Returns:
+        Dictionary mapping normalized package names to specifiers (several
+        lines for one package are combined)
+
+    Raises:
+        ValueError: If a line is not a valid requirement or packaging is missing
+    """
+    if SpecifierSet is None:
+        raise ValueError("Constraints files require the 'packaging' library")
+
+    parsed = parse_requirements(constraints_file)
+    if parsed.errors:
+        raise ValueError(f"Invalid constraint: {parsed.errors[0]}")
+
+    constraints: Dict[str, str] = {}
+    for requirement in parsed.requirements:
+        if not requirement.name or not requirement.specifier:
+            continue
+        name = requirement.name
+        constraints[name] = f"{constraints[name]},{requirement.specifier}" if name in constraints else requirement.specifier
+
+    for name, specifier in constraints.items():
+        try:
+            SpecifierSet(specifier)
+        except InvalidSpecifier as e:
+            raise ValueError(f"Invalid constraint for '{name}' in {constraints_file}: {e}") from e
+
+    return constraints
+
+
 def compare_package_sets(packages1: Dict[str, str], packages2: Dict[str, str]) -> Dict[str, Dict[str, str]]:
     """
     Compare two sets of packages and their versions.
@@ -133,13 +269,19 @@ def filter_system_packages(packages: Dict[str, str], exclude_system: bool = True
     return {name: version for name, version in packages.items() if name not in system_packages}
 
 
-def create_pinned_requirements(packages: Dict[str, str], header_comment: str = "") -> List[str]:
+def create_pinned_requirements(
+    packages: Dict[str, str],
+    header_comment: str = "",
+    hashes: Optional[Dict[str, List[str]]] = None,
+) -> List[str]:
     """
     Create pinned requirements file content from package dictionary.
 
     Args:
         packages: Dictionary of packages and versions
         header_comment: Optional header comment
+        hashes: Optional 'sha256:<digest>' entries per package, written as
+            --hash options (pip's hash-checking mode)
 
     Returns:
         List of requirement lines
@@ -157,32 +299,25 @@ def create_pinned_requirements(packages: Dict[str, str], header_comment: str = "
 
     # Sort packages for consistent output
     for package, version in sorted(packages.items()):
-        lines.append(f"{package}=={version}")
+        package_hashes = (hashes or {}).get(package)
+        if not package_hashes:
+            lines.append(f"{package}=={version}")
+            continue
+        lines.append(f"{package}=={version} \\")
+        lines.extend(f"    --hash={entry} \\" for entry in package_hashes[:-1])
+        lines.append(f"    --hash={package_hashes[-1]}")
 
     return lines
 
 
 def get_editable_packages() -> Dict[str, str]:
     """
-    Get editable (development) packages from pip list.
+    Get editable (development) packages.
 
     Returns:
-        Dictionary mapping package names to their paths
+        Dictionary mapping package names to their project locations
     """
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "list", "--format=json", "--editable"],
-            check=True,
-            text=True,
-            capture_output=True,
-            encoding="utf-8",
-            errors="replace",
-        )
-
-        packages = json.loads(result.stdout)
-        return {normalize_package_name(pkg["name"]): pkg.get("location", "unknown") for pkg in packages}
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
-        return {}
+    return {name: info["editable"] for name, info in _get_distributions().items() if info["editable"] is not None}
 
 
 def exclude_editable_packages(packages: Dict[str, str]) -> Dict[str, str]:
@@ -215,24 +350,16 @@ def validate_requirements_file(requirements_file: str) -> List[str]:
         issues.append(f"File does not exist: {requirements_file}")
         return issues
 
-    try:
-        req_packages = parse_requirements_file(requirements_file)
-        line_num = 0
-
-        for pkg_line in req_packages:
-            line_num += 1
-
-            if not pkg_line.strip() or pkg_line.strip().startswith("#"):
-                continue
-
-            name, _, ver = parse_package_line(pkg_line)
-
-            if not name:
-                issues.append(f"Line {line_num}: Could not parse package name from '{pkg_line}'")
-            elif not ver and not pkg_line.startswith("-"):
-                issues.append(f"Line {line_num}: Package '{name}' has no version specified")
-
-    except Exception as e:
-        issues.append(f"Error reading file: {e}")
+    parsed = parse_requirements(requirements_file)
+    issues.extend(parsed.errors)
+
+    for requirement in parsed.requirements:
+        if requirement.constraint:
+            continue
+        location = f"{requirement.source}:{requirement.line}"
+        if not requirement.name:
+            issues.append(f"{location}: Could not determine the package name of '{requirement.text}'")
+        elif not requirement.specifier and not requirement.url:
+            issues.append(f"{location}: Package '{requirement.name}' has no version specified")
 
     return issues
@@ -2,18 +2,174 @@
 PyPI API interaction utilities.
 """
 
+import http.client
 import json
-import urllib.error
-import urllib.request
-from typing import Any, Dict, Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from ginx.config import get_plugin_settings
+
+from .cache import DEFAULT_CACHE_TTL, MetadataCache, trim_package_info
+from .http_utils import DEFAULT_POOL_SIZE, ConnectionPool
+from .version_utils import normalize_package_name, select_latest_version, version_from_filename
+from .wheelhouse import WheelhouseIndex, wheelhouse_path
+
+# Full per-package JSON API (/pypi/<name>/json)
+JSON_API = "json"
+# PEP 691 Simple Repository JSON API (/simple/<name>/)
+SIMPLE_API = "simple"
+
+DEFAULT_PYPI_URL = "https://pypi.org/pypi"
+DEFAULT_SIMPLE_URL = "https://pypi.org/simple"
+
+SIMPLE_JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+# Prefer PEP 691 JSON, accept PEP 503 HTML from older indexes
+SIMPLE_ACCEPT = f"{SIMPLE_JSON_CONTENT_TYPE}, text/html;q=0.01"
+
+# Maximum number of PyPI requests in flight at once
+DEFAULT_CONCURRENCY = 16
+
+
+class _SimpleHTMLParser(HTMLParser):
+    """Collects the file links of a PEP 503 project page."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.files: List[Dict[str, Any]] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag != "a":
+            return
+        attributes = dict(attrs)
+        href = attributes.get("href") or ""
+        filename = unquote(urlsplit(href).path.rsplit("/", 1)[-1])
+        if not filename:
+            return
+
+        file: Dict[str, Any] = {"filename": filename, "url": href}
+        if attributes.get("data-requires-python"):
+            file["requires-python"] = attributes["data-requires-python"]
+        if "data-yanked" in attributes:
+            # The attribute may be empty or hold the reason
+            file["yanked"] = attributes["data-yanked"] or True
+        self.files.append(file)
+
+
+def parse_simple_html(html: str, package_name: str) -> Dict[str, Any]:
+    """
+    Convert a PEP 503 HTML project page into its PEP 691 JSON equivalent.
+
+    Args:
+        html: Project page
+        package_name: Name of the project
+
+    Returns:
+        Dictionary with 'name' and 'files'
+    """
+    parser = _SimpleHTMLParser()
+    parser.feed(html)
+    parser.close()
+    return {"name": normalize_package_name(package_name), "files": parser.files}
+
+
+def parse_simple_project(document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a PEP 691 project page into the trimmed package document.
+
+    The latest version is the highest final release with at least one
+    non-yanked file (pre-releases only count when there is no final release).
+
+    Args:
+        document: JSON project page from a Simple Repository API
+
+    Returns:
+        Document shaped like trim_package_info() output, or None if the
+        project has no installable release
+    """
+    files_by_version: Dict[str, List[Dict[str, Any]]] = {}
+    for file in document.get("files") or []:
+        version = version_from_filename(str(file.get("filename", "")))
+        if version is not None:
+            files_by_version.setdefault(version, []).append(file)
+
+    releases: Dict[str, Any] = {}
+    for version, files in files_by_version.items():
+        # The files that make the version installable decide its Python requirement
+        installable = [file for file in files if not file.get("yanked")]
+        releases[version] = [
+            {
+                "yanked": not installable,
+                "requires_python": (installable or files)[0].get("requires-python"),
+            }
+        ]
+    # API version 1.1 also lists versions without files
+    for version in document.get("versions") or []:
+        releases.setdefault(version, [])
+
+    installable = [version for version, summary in releases.items() if summary and not summary[0]["yanked"]]
+    latest = select_latest_version(installable)
+    if latest is None:
+        return None
+
+    return {
+        "info": {
+            "name": document.get("name"),
+            "version": latest,
+            "summary": None,
+            "requires_python": releases[latest][0]["requires_python"],
+            "yanked": False,
+        },
+        "releases": releases,
+    }
 
 
 class PyPIClient:
-    """Client for interacting with PyPI API."""
+    """
+    Client for interacting with PyPI API.
+
+    With api='json' (the default) base_url points at a /pypi JSON API root;
+    with api='simple' it points at any PEP 691 (or PEP 503 HTML) Simple
+    Repository root, and only the file list of each project is downloaded.
+    A file:// base_url is a local wheelhouse directory, indexed in memory.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = "ginx-version-sync-plugin/1.0.0",
+        base_url: str = DEFAULT_PYPI_URL,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache: Optional[MetadataCache] = None,
+        offline: bool = False,
+        api: str = JSON_API,
+    ):
+        if api not in (JSON_API, SIMPLE_API):
+            raise ValueError(f"Unknown index API '{api}', expected '{JSON_API}' or '{SIMPLE_API}'")
 
-    def __init__(self, user_agent: str = "ginx-version-sync-plugin/1.0.0"):
         self.user_agent = user_agent
-        self.base_url = "https://pypi.org/pypi"
+        self.base_url = base_url.rstrip("/")
+        self.api = api
+        # Keep-alive connections shared by all requests (and threads) of this client
+        self.pool = ConnectionPool(max_per_host=pool_size, user_agent=user_agent)
+        self.cache = cache
+        # Only answer from the cache, never touch the network
+        self.offline = offline
+        self._wheelhouse: Optional[WheelhouseIndex] = None
+        self._wheelhouse_lock = threading.Lock()
+
+    @property
+    def wheelhouse(self) -> Optional[WheelhouseIndex]:
+        """Index of the local wheelhouse if base_url is a file:// URL."""
+        if not self.base_url.startswith("file:"):
+            return None
+        with self._wheelhouse_lock:
+            if self._wheelhouse is None or self._wheelhouse.url != self.base_url:
+                self._wheelhouse = WheelhouseIndex(self.base_url)
+            return self._wheelhouse
 
     def get_package_info(self, package_name: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
         """
@@ -24,22 +180,103 @@ class PyPIClient:
             timeout: Request timeout in seconds
 
         Returns:
-            Package information dict or None if failed
+            Package information dict or None if failed (trimmed to the
+            fields Ginx uses when the client has a cache)
         """
-        try:
+        wheelhouse = self.wheelhouse
+        if wheelhouse is not None:
+            project = wheelhouse.get_project(package_name)
+            return parse_simple_project(project) if project is not None else None
+
+        entry = self.cache.get(self.base_url, package_name) if self.cache is not None else None
+        if entry is not None and (self.offline or self.cache.is_fresh(entry)):  # type: ignore[union-attr]
+            return entry["data"]
+        if self.offline:
+            return None
+
+        if self.api == SIMPLE_API:
+            url = f"{self.base_url}/{normalize_package_name(package_name)}/"
+            headers = {"Accept": SIMPLE_ACCEPT}
+        else:
             url = f"{self.base_url}/{package_name}/json"
-            req = urllib.request.Request(url)
-            req.add_header("User-Agent", self.user_agent)
+            headers = {"Accept": "application/json"}
+        if entry is not None:
+            # Revalidate the stale entry instead of downloading it again
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
 
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                return json.loads(response.read().decode())
+        try:
+            response = self.pool.request("GET", url, headers=headers, timeout=timeout)
+            if response.status == 304 and entry is not None:
+                self.cache.touch(self.base_url, package_name, entry)  # type: ignore[union-attr]
+                return entry["data"]
+            if response.status != 200:
+                return None
+            if self.api == SIMPLE_API and (response.header("content-type") or "").startswith("text/html"):
+                package_info = parse_simple_html(response.body.decode(), package_name)
+            else:
+                package_info = json.loads(response.body.decode())
         except (
-            urllib.error.URLError,
-            urllib.error.HTTPError,
+            http.client.HTTPException,
             json.JSONDecodeError,
-            TimeoutError,
+            UnicodeDecodeError,
+            OSError,
+            ValueError,
         ):
-            return None
+            # Better a stale answer than none
+            return entry["data"] if entry is not None else None
+
+        if self.api == SIMPLE_API:
+            package_info = parse_simple_project(package_info)
+            if package_info is None:
+                return None
+        elif self.cache is not None:
+            package_info = trim_package_info(package_info)
+
+        if self.cache is not None:
+            self.cache.put(self.base_url, package_name, package_info, response.header("etag"), response.header("last-modified"))
+        return package_info
+
+    def fetch_package_infos(
+        self,
+        package_names: Iterable[str],
+        timeout: int = 10,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Get package information for many packages with bounded concurrency.
+
+        Results are yielded in the order of package_names, each one as soon as
+        it and all results before it have arrived (or, if not ordered, each
+        one as soon as it has arrived).
+
+        Args:
+            package_names: Names of the packages
+            timeout: Per-request timeout in seconds
+            concurrency: Maximum number of requests in flight
+            ordered: Keep the order of package_names
+
+        Yields:
+            Tuples of (package name, package information or None if failed)
+        """
+        names = list(package_names)
+        if not names:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(names))), thread_name_prefix="ginx-pypi") as executor:
+            if ordered:
+                results = executor.map(lambda name: self.get_package_info(name, timeout), names)
+                for name, info in zip(names, results):
+                    yield name, info
+                return
+
+            futures = {executor.submit(self.get_package_info, name, timeout): name for name in names}
+            for future in as_completed(futures):
+                # Drop the reference so finished results don't accumulate
+                yield futures.pop(future), future.result()
 
     def get_latest_version(self, package_name: str, timeout: int = 10) -> Optional[str]:
         """
@@ -95,16 +332,65 @@ class PyPIClient:
             timeout: Request timeout in seconds
 
         Returns:
-            Package summary or None if failed
+            Package summary, or None if failed or the index has none (Simple
+            API project pages don't include summaries)
         """
         package_info = self.get_package_info(package_name, timeout)
         if package_info:
-            return str(package_info.get("info", {}).get("summary"))
+            summary = package_info.get("info", {}).get("summary")
+            return str(summary) if summary else None
         return None
 
 
 # Global client instance
-_pypi_client = PyPIClient()
+_pypi_client = PyPIClient(base_url=DEFAULT_SIMPLE_URL, cache=MetadataCache(), api=SIMPLE_API)
+
+
+def configure_pypi_client(offline: bool = False, index_url: str = "") -> PyPIClient:
+    """
+    Apply command-line options and plugin settings to the shared client.
+
+    Reads 'cache_ttl' (seconds), 'api' ('simple' or 'json') and 'index_url'
+    from the version-sync plugin settings.
+
+    Args:
+        offline: Only answer from the on-disk cache
+        index_url: Index to query instead of the configured one; an
+            http(s) index URL, or a file:// URL or path of a wheelhouse
+
+    Returns:
+        The shared client
+
+    Raises:
+        ValueError: If the configured API or index URL is invalid
+    """
+    settings = get_plugin_settings("version-sync") or {}
+    api = settings.get("api", SIMPLE_API)
+    if api not in (JSON_API, SIMPLE_API):
+        raise ValueError(f"Unknown index API '{api}', expected '{JSON_API}' or '{SIMPLE_API}'")
+
+    index_url = index_url or settings.get("index_url") or (DEFAULT_SIMPLE_URL if api == SIMPLE_API else DEFAULT_PYPI_URL)
+    if os.path.isdir(index_url):
+        index_url = Path(index_url).resolve().as_uri()
+    if urlsplit(index_url).scheme not in ("http", "https", "file"):
+        raise ValueError(f"Invalid index URL '{index_url}', expected an http(s):// or file:// URL")
+
+    _pypi_client.api = api
+    _pypi_client.base_url = index_url.rstrip("/")
+    _pypi_client.offline = offline
+    if _pypi_client.cache is not None:
+        _pypi_client.cache.ttl = float(settings.get("cache_ttl", DEFAULT_CACHE_TTL))
+    return _pypi_client
+
+
+def get_pip_index_options() -> List[str]:
+    """Get pip install options that make pip use the shared client's index."""
+    base_url = _pypi_client.base_url
+    if base_url.startswith("file:"):
+        return ["--no-index", "--find-links", wheelhouse_path(base_url)]
+    if _pypi_client.api == SIMPLE_API and base_url != DEFAULT_SIMPLE_URL:
+        return ["--index-url", base_url]
+    return []
 
 
 def get_pypi_package_info(package_name: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
@@ -112,6 +398,16 @@ def get_pypi_package_info(package_name: str, timeout: int = 10) -> Optional[Dict
     return _pypi_client.get_package_info(package_name, timeout)
 
 
+def fetch_package_infos(
+    package_names: Iterable[str],
+    timeout: int = 10,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Get package information for many packages concurrently (convenience function)."""
+    return _pypi_client.fetch_package_infos(package_names, timeout, concurrency, ordered)
+
+
 def get_latest_version(package_name: str, timeout: int = 10) -> Optional[str]:
     """Get the latest version of a package from PyPI (convenience function)."""
     return _pypi_client.get_latest_version(package_name, timeout)
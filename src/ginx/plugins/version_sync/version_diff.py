@@ -0,0 +1,166 @@
+"""
+N-way comparison of package versions across requirements files.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Version = None  # type: ignore[assignment,misc]
+
+from .package_utils import get_packages_from_requirements
+
+# Distances between versions, largest first
+DISTANCES = ("major", "minor", "patch", "other", "unknown", "missing", "same")
+
+_MISSING = "-"
+
+
+def _parse_versions(versions: Sequence[str]) -> Dict[str, Any]:
+    """Parse each distinct version string once (None if it is not a valid version)."""
+    parsed: Dict[str, Any] = {}
+    for version in versions:
+        if version in parsed:
+            continue
+        if Version is None:
+            parsed[version] = None
+            continue
+        try:
+            parsed[version] = Version(version)
+        except InvalidVersion:
+            parsed[version] = None
+    return parsed
+
+
+def _distance(versions: List[Any]) -> str:
+    """Get the largest distance between parsed versions (all different from None)."""
+    releases = [version.release + (0,) * (3 - len(version.release)) for version in versions]
+    for position, name in enumerate(("major", "minor", "patch")):
+        if len({release[position] for release in releases}) > 1:
+            return name
+    # Same major.minor.patch: pre/post/dev releases, local versions or a 4th component
+    return "other"
+
+
+class VersionMatrix:
+    """Versions of every package (rows) in every environment (columns)."""
+
+    def __init__(self, environments: List[str], packages: Dict[str, List[Optional[str]]]) -> None:
+        self.environments = environments
+        self.packages = packages
+        self._parsed = _parse_versions([version for row in packages.values() for version in row if version is not None])
+        self._distances: Dict[str, str] = {}
+
+    def _key(self, version: str) -> Any:
+        # Equal versions may be spelled differently ('1.0' and '1.0.0')
+        parsed = self._parsed.get(version)
+        return parsed if parsed is not None else version
+
+    def pattern(self, package: str) -> str:
+        """
+        Describe which environments agree on a package.
+
+        Returns:
+            One letter per environment, the same letter for the same version
+            ('-' if the package is missing), e.g. 'A B B -'
+        """
+        letters: Dict[Any, str] = {}
+        pattern = []
+        for version in self.packages[package]:
+            if version is None:
+                pattern.append(_MISSING)
+                continue
+            key = self._key(version)
+            if key not in letters:
+                letters[key] = chr(ord("A") + len(letters) % 26)
+            pattern.append(letters[key])
+        return " ".join(pattern)
+
+    def distance(self, package: str) -> str:
+        """Get the semantic distance between a package's versions (one of DISTANCES)."""
+        distance = self._distances.get(package)
+        if distance is None:
+            distance = self._distances[package] = self._compute_distance(package)
+        return distance
+
+    def _compute_distance(self, package: str) -> str:
+        versions = [version for version in self.packages[package] if version is not None]
+        if len({self._key(version) for version in versions}) <= 1:
+            return "missing" if len(versions) < len(self.environments) else "same"
+
+        parsed = [self._parsed[version] for version in versions]
+        if any(version is None for version in parsed):
+            return "unknown"
+        return _distance(parsed)
+
+    def rows(self, show_all: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get one record per package, divergent packages only unless show_all.
+
+        Returns:
+            List of dictionaries with 'package', 'distance', 'pattern' and
+            'versions' (environment -> version or None), sorted by package
+        """
+        rows = []
+        for package in sorted(self.packages):
+            distance = self.distance(package)
+            if distance == "same" and not show_all:
+                continue
+            rows.append(
+                {
+                    "package": package,
+                    "distance": distance,
+                    "pattern": self.pattern(package),
+                    "versions": dict(zip(self.environments, self.packages[package])),
+                }
+            )
+        return rows
+
+    def groups(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Group rows by divergence pattern.
+
+        Returns:
+            List of dictionaries with 'pattern' and 'packages' (rows), largest
+            group first
+        """
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault(row["pattern"], []).append(row)
+        ordered = sorted(grouped.items(), key=lambda item: (-len(item[1]), item[0]))
+        return [{"pattern": pattern, "packages": packages} for pattern, packages in ordered]
+
+    def summary(self) -> Dict[str, int]:
+        """Count packages per distance."""
+        counts = {distance: 0 for distance in DISTANCES}
+        for package in self.packages:
+            counts[self.distance(package)] += 1
+        return counts
+
+
+def environment_labels(files: Sequence[str]) -> List[str]:
+    """Label environments by file name, or by the path given if names collide."""
+    names = [file.replace("\\", "/").rsplit("/", 1)[-1] for file in files]
+    return [name if names.count(name) == 1 else file for name, file in zip(names, files)]
+
+
+def build_version_matrix(files: Sequence[str]) -> VersionMatrix:
+    """
+    Load each requirements file once and build the package x environment matrix.
+
+    Args:
+        files: Requirements or lock files, one per environment
+
+    Returns:
+        The version matrix
+    """
+    environments = environment_labels(files)
+    packages: Dict[str, List[Optional[str]]] = {}
+    for column, file in enumerate(files):
+        for name, version in get_packages_from_requirements(file).items():
+            row = packages.get(name)
+            if row is None:
+                row = packages[name] = [None] * len(files)
+            row[column] = version
+    return VersionMatrix(environments, packages)
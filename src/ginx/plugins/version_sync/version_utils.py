@@ -2,17 +2,28 @@
 Version parsing and comparison utilities.
 """
 
-from typing import Tuple
+import re
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 try:
+    from packaging.specifiers import SpecifierSet
+    from packaging.utils import (
+        InvalidSdistFilename,
+        InvalidWheelFilename,
+        parse_sdist_filename,
+        parse_wheel_filename,
+    )
     from packaging.version import InvalidVersion, parse
 
     has_packaging = True
 except ImportError:
     parse = None
+    SpecifierSet = None
     InvalidVersion = Exception
     has_packaging = False
 
+from ginx.utils.requirements import parse_requirement
+
 
 def has_packaging_library() -> bool:
     """Check if the packaging library is available."""
@@ -27,25 +38,87 @@ def parse_package_line(line: str) -> Tuple[str, str, str]:
         line: Package requirement line (e.g., "requests>=2.0.0")
 
     Returns:
-        Tuple of (package_name, operator, version_spec)
+        Tuple of (package_name, operator, version_spec), where version_spec
+        holds any further clauses (e.g. ('requests', '>=', '2.0,<3'))
     """
     line = line.strip()
 
-    # Skip comments and empty lines
+    # Skip comments, empty lines and pip options
     if not line or line.startswith("#") or line.startswith("-"):
         return "", "", ""
 
-    # Handle different version specifiers
-    for op in [">=", "<=", "==", "~=", "!=", ">", "<"]:
-        if op in line:
-            parts = line.split(op, 1)
-            if len(parts) == 2:
-                package_name = parts[0].strip()
-                version_spec = parts[1].strip()
-                return package_name, op, version_spec
+    # Drop trailing comments and per-requirement options such as --hash
+    text = re.split(r"\s+(?:#|--?[A-Za-z])", line, maxsplit=1)[0]
+    parsed = parse_requirement(text)
+    if parsed is None:
+        return "", "", ""
+
+    name, specifier = parsed[0], parsed[1]
+    operator = re.match(r"(===|==|~=|!=|<=|>=|<|>)?", specifier).group(0)  # type: ignore[union-attr]
+    return name, operator, specifier[len(operator) :]
+
+
+def is_version_constraint(text: str) -> bool:
+    """Check whether text is a version specifier like '>=2.0' or '~=1.4,!=1.4.2'."""
+    return re.match(r"^\s*(===|==|~=|!=|<=|>=|<|>)", text) is not None
+
+
+def resolve_versions(
+    releases: Dict[str, Dict[str, Any]],
+    constraint: str = "",
+    package_constraints: Optional[Dict[str, str]] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    Pick the highest non-yanked release of each package that satisfies its constraints.
+
+    Every distinct version string is parsed once for all packages, and each
+    package's candidates are sorted once, newest first, so the first match
+    wins. Pre-releases are only chosen when a specifier asks for them or
+    nothing else matches (pip's rules).
+
+    Args:
+        releases: Package name -> release map (version -> list of files, as
+            in PyPI JSON documents); releases without files are skipped
+        constraint: Specifier applied to every package (empty for any version)
+        package_constraints: Additional specifier per package name
+
+    Returns:
+        Package name -> selected version, or None if no release matches
 
-    # No version specifier found
-    return line, "", ""
+    Raises:
+        ValueError: If a specifier is invalid (InvalidSpecifier) or the
+            packaging library is not available
+    """
+    if SpecifierSet is None or parse is None:
+        raise ValueError("Version constraints require the 'packaging' library")
+
+    package_constraints = package_constraints or {}
+    base_specifier = SpecifierSet(constraint)
+    specifiers = {package: base_specifier & SpecifierSet(spec) for package, spec in package_constraints.items() if package in releases}
+    installable = {
+        package: [version for version, files in package_releases.items() if files and not all(file.get("yanked") for file in files)]
+        for package, package_releases in releases.items()
+    }
+
+    # Parse each distinct version string once and rank all of them with a single sort
+    parsed_versions: Dict[str, Any] = {}
+    for version in {version for versions in installable.values() for version in versions}:
+        try:
+            parsed_versions[version] = parse(version)
+        except InvalidVersion:
+            continue
+    rank = {version: index for index, version in enumerate(sorted(parsed_versions, key=parsed_versions.__getitem__, reverse=True))}
+
+    selected: Dict[str, Optional[str]] = {}
+    for package, versions in installable.items():
+        # Newest first, so the first match is the highest satisfying version
+        ordered = sorted((version for version in versions if version in rank), key=rank.__getitem__)
+        candidates = [parsed_versions[version] for version in ordered]
+        match = next(iter(specifiers.get(package, base_specifier).filter(candidates)), None)
+        # Keep the index's spelling of the version
+        selected[package] = ordered[candidates.index(match)] if match is not None else None
+
+    return selected
 
 
 def compare_versions(current: str, latest: str) -> str:
@@ -89,9 +162,74 @@ def normalize_package_name(name: str) -> str:
         name: Package name
 
     Returns:
-        Normalized package name
+        Normalized package name (PEP 503)
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def parse_distribution_filename(filename: str) -> Optional[Tuple[str, str]]:
+    """
+    Get the project name and version of a distribution file from its name.
+
+    Args:
+        filename: Wheel or sdist (.tar.gz/.zip) file name
+
+    Returns:
+        Tuple of (normalized project name, version), or None if the name
+        cannot be parsed
     """
-    return name.lower().replace("_", "-")
+    if not has_packaging:
+        return None
+    try:
+        if filename.endswith(".whl"):
+            name, version = parse_wheel_filename(filename)[:2]
+        else:
+            name, version = parse_sdist_filename(filename)
+    except (InvalidWheelFilename, InvalidSdistFilename, InvalidVersion):
+        return None
+    return str(name), str(version)
+
+
+def version_from_filename(filename: str) -> Optional[str]:
+    """
+    Get the version of a distribution file from its name.
+
+    Args:
+        filename: Wheel or sdist file name
+
+    Returns:
+        Version string, or None if the name cannot be parsed
+    """
+    parsed = parse_distribution_filename(filename)
+    return parsed[1] if parsed else None
+
+
+def select_latest_version(versions: Iterable[str]) -> Optional[str]:
+    """
+    Pick the highest version, preferring final releases.
+
+    Pre-releases and development releases are only considered when there is
+    no final release at all.
+
+    Args:
+        versions: Candidate version strings (invalid ones are ignored)
+
+    Returns:
+        Latest version string, or None if there is no valid candidate
+    """
+    if parse is None:
+        return None
+
+    parsed = []
+    for version in versions:
+        try:
+            parsed.append((parse(version), version))
+        except InvalidVersion:
+            continue
+
+    final = [candidate for candidate in parsed if not candidate[0].is_prerelease]
+    candidates = final or parsed
+    return max(candidates)[1] if candidates else None
 
 
 def format_version_comparison(package: str, current: str, latest: str, status: str) -> str:
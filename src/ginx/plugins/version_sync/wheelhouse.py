@@ -0,0 +1,62 @@
+"""
+Package index built from a local directory of wheels and sdists.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+from .version_utils import normalize_package_name, parse_distribution_filename
+
+
+def wheelhouse_path(url: str) -> str:
+    """Convert a file:// URL (or plain path) to a local directory path."""
+    parts = urlsplit(url)
+    if parts.scheme != "file":
+        return url
+    return url2pathname(parts.path)
+
+
+class WheelhouseIndex:
+    """
+    In-memory index of the distributions in a wheelhouse directory.
+
+    The directory is scanned once, on first use; project names and versions
+    are parsed from the file names, so no file is opened.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.directory = wheelhouse_path(url)
+        self._projects: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def _scan(self) -> Dict[str, Dict[str, Any]]:
+        projects: Dict[str, Dict[str, Any]] = {}
+        try:
+            entries = sorted(entry.name for entry in os.scandir(self.directory) if entry.is_file())
+        except OSError:
+            entries = []
+
+        for filename in entries:
+            parsed = parse_distribution_filename(filename)
+            if parsed is None:
+                continue
+            name, _ = parsed
+            project = projects.setdefault(name, {"name": name, "files": []})
+            project["files"].append({"filename": filename, "url": filename, "hashes": {}})
+        return projects
+
+    @property
+    def projects(self) -> Dict[str, Dict[str, Any]]:
+        """PEP 691-shaped project pages by normalized project name."""
+        with self._lock:
+            if self._projects is None:
+                self._projects = self._scan()
+            return self._projects
+
+    def get_project(self, package_name: str) -> Optional[Dict[str, Any]]:
+        """Get the PEP 691-shaped page of a project, or None if it has no files."""
+        return self.projects.get(normalize_package_name(package_name))
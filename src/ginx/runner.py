@@ -2,7 +2,67 @@
 Main entry point for Ginx CLI.
 """
 
-from ginx.cli import app
+import sys
+import time
+from typing import List, Optional, Tuple
+
+
+def main() -> None:
+    """Run the CLI, dispatching through the resident daemon when one is running."""
+    args, profile_path = _split_profile_option(sys.argv[1:])
+    if profile_path is not None:
+        # Profile this process, not the daemon
+        sys.argv[1:] = args
+        from ginx.tracing import run_profiled
+
+        run_profiled(_run_app, profile_path)
+        return
+
+    from ginx.daemon.client import forward_to_daemon
+
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    _run_app()
+
+
+def _run_app() -> None:
+    start = time.perf_counter()
+    from ginx.tracing import IMPORT, get_overhead
+
+    overhead = get_overhead()
+    overhead.add(IMPORT, time.perf_counter() - start)
+    # Config loaded while registering script commands counts as config, not import
+    with overhead.measure(IMPORT):
+        from ginx.cli import app
+
+    app(prog_name="ginx")
+
+
+def _split_profile_option(args: List[str]) -> Tuple[List[str], Optional[str]]:
+    """
+    Take a leading `--profile` or `--profile=FILE` option off the arguments.
+
+    Only options before the command are taken, so scripts can still receive
+    their own --profile.
+    """
+    if not args or not (args[0] == "--profile" or args[0].startswith("--profile=")):
+        return args, None
+
+    from ginx.tracing import DEFAULT_PROFILE_FILE
+
+    return args[1:], args[0].partition("=")[2] or DEFAULT_PROFILE_FILE
+
+
+def __getattr__(name: str):  # type: ignore[no-untyped-def]
+    # Keep 'ginx.runner:app' importable for existing entry points
+    if name == "app":
+        from ginx.cli import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
-    app()
+    main()
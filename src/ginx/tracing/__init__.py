@@ -0,0 +1,37 @@
+"""
+Tracing and profiling of script runs.
+
+`--trace FILE` records config loading, plan resolution, queue waits, script
+runs and plugin hooks as a Chrome Trace Event file, one track per job slot.
+The overhead account adds up the time ginx itself spends per phase, and
+`ginx --profile` runs ginx under cProfile.
+"""
+
+from .overhead import CHILD, CHILD_CPU, IMPORT, OUTPUT, PHASES, SPAWN, VALIDATION, OverheadAccount, get_overhead
+from .profiling import DEFAULT_PROFILE_FILE, profile_call, run_profiled
+from .tracer import CACHE, CONFIG, HOOK, PLAN, QUEUE, SCRIPT, Tracer, get_tracer, span, trace_to
+
+__all__ = [
+    "CACHE",
+    "CHILD",
+    "CHILD_CPU",
+    "CONFIG",
+    "DEFAULT_PROFILE_FILE",
+    "HOOK",
+    "IMPORT",
+    "OUTPUT",
+    "OverheadAccount",
+    "PHASES",
+    "PLAN",
+    "QUEUE",
+    "SCRIPT",
+    "SPAWN",
+    "Tracer",
+    "VALIDATION",
+    "get_overhead",
+    "get_tracer",
+    "profile_call",
+    "run_profiled",
+    "span",
+    "trace_to",
+]
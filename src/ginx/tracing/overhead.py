@@ -0,0 +1,74 @@
+"""
+Accounting of the time ginx itself spends, separate from its children.
+
+Phases nest: time spent in a phase measured inside another (e.g. loading
+the configuration while building the plan) only counts for the inner one,
+so the phases add up to ginx's own time.
+"""
+
+import contextlib
+import threading
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from .tracer import CONFIG, PLAN
+
+# Ginx phases (config and plan share the names of the trace categories)
+IMPORT = "import"
+VALIDATION = "validation"
+SPAWN = "spawn"
+OUTPUT = "output"
+
+PHASES = (IMPORT, CONFIG, PLAN, VALIDATION, SPAWN, OUTPUT)
+
+# Time of child processes: wall time from spawn to exit (without ginx's handling of
+# their output), and CPU time where reported. Both are summed over all children, so
+# with parallel jobs they can exceed the run's wall time.
+CHILD = "child"
+CHILD_CPU = "child_cpu"
+
+
+class OverheadAccount:
+    """Accumulates seconds per phase, from any thread."""
+
+    def __init__(self) -> None:
+        self._totals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time measured by the caller."""
+        with self._lock:
+            self._totals[phase] = self._totals.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """Count the time of a block for a phase, pausing the enclosing phase."""
+        stack: List[Tuple[str, float]] = self._local.__dict__.setdefault("stack", [])
+        now = time.perf_counter()
+        if stack:
+            outer, resumed = stack[-1]
+            self.add(outer, now - resumed)
+        stack.append((phase, now))
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, resumed = stack.pop()
+            self.add(phase, now - resumed)
+            if stack:
+                stack[-1] = (stack[-1][0], now)
+
+    def take(self) -> Dict[str, float]:
+        """Get the time accumulated since the last take(), and start over."""
+        with self._lock:
+            totals, self._totals = self._totals, {}
+        return totals
+
+
+_overhead = OverheadAccount()
+
+
+def get_overhead() -> OverheadAccount:
+    """Get the process-wide overhead account."""
+    return _overhead
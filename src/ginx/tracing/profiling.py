@@ -0,0 +1,89 @@
+"""
+cProfile support for `ginx --profile`.
+
+cProfile only sees the thread it was enabled on (before Python 3.12), so
+scripts running on parallel job threads are profiled separately and merged
+into the main profile.
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+from typing import Any, Callable, List, Optional, TypeVar
+
+DEFAULT_PROFILE_FILE = "ginx.pstats"
+
+# Functions shown in the summary, by cumulative time
+SUMMARY_LINES = 25
+
+T = TypeVar("T")
+
+_active = False
+_thread_profiles: List[cProfile.Profile] = []
+_thread_profiles_lock = threading.Lock()
+
+
+def profile_call(function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call a function, profiling it when profiling and on a thread the main profiler misses."""
+    if not _active or threading.current_thread() is threading.main_thread():
+        return function(*args, **kwargs)
+
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Python 3.12+: the main profiler already sees every thread
+        return function(*args, **kwargs)
+
+    try:
+        return function(*args, **kwargs)
+    finally:
+        profile.disable()
+        with _thread_profiles_lock:
+            _thread_profiles.append(profile)
+
+
+def run_profiled(function: Callable[[], Any], path: str, summary_lines: int = SUMMARY_LINES) -> Any:
+    """
+    Run a function under cProfile, then write the stats and print a summary.
+
+    Args:
+        function: Function to profile (exceptions, including SystemExit, propagate)
+        path: .pstats file to write, for pstats, snakeviz or gprof2dot
+        summary_lines: Number of functions in the summary printed to stderr
+    """
+    global _active
+
+    profile = cProfile.Profile()
+    _active = True
+    profile.enable()
+    try:
+        return function()
+    finally:
+        profile.disable()
+        _active = False
+        _write_profile(profile, path, summary_lines)
+
+
+def _write_profile(profile: cProfile.Profile, path: str, summary_lines: int) -> None:
+    with _thread_profiles_lock:
+        thread_profiles, _thread_profiles[:] = list(_thread_profiles), []
+
+    stats: Optional[pstats.Stats] = None
+    try:
+        stats = pstats.Stats(profile, stream=sys.stderr)
+    except TypeError:
+        # Nothing was recorded on the main thread
+        pass
+    for thread_profile in thread_profiles:
+        if stats is None:
+            stats = pstats.Stats(thread_profile, stream=sys.stderr)
+        else:
+            stats.add(thread_profile)
+    if stats is None:
+        return
+
+    stats.dump_stats(path)
+    sys.stderr.write(f"\nProfile written to {path} (top {summary_lines} functions by cumulative time):\n")
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(summary_lines)
@@ -0,0 +1,177 @@
+"""
+Chrome Trace Event recorder for script runs.
+
+Trace files open in Perfetto (https://ui.perfetto.dev) and chrome://tracing.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import typer
+
+# Trace categories
+CONFIG = "config"
+PLAN = "plan"
+QUEUE = "queue"
+SCRIPT = "script"
+HOOK = "hook"
+CACHE = "cache"
+
+_PID = 1
+
+
+class Tracer:
+    """
+    Records spans, counters and instant events of one run.
+
+    Spans belong to the track (thread) they were recorded on, so each
+    parallel job slot gets its own track. Queue waits overlap, so they are
+    recorded as async spans, which Perfetto lays out on tracks of their own.
+    Timestamps come from time.time() and are made relative on write.
+    """
+
+    def __init__(self) -> None:
+        self._events: List[Dict[str, Any]] = []
+        self._tracks: Dict[str, int] = {}
+        self._counters: Dict[str, int] = {}
+        self._queued: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _track(self) -> int:
+        name = threading.current_thread().name
+        tid = self._tracks.get(name)
+        if tid is None:
+            with self._lock:
+                tid = self._tracks.setdefault(name, len(self._tracks) + 1)
+        return tid
+
+    def _add(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self._events.append(event)
+
+    def add_span(self, name: str, category: str, start: float, end: float, **args: Any) -> None:
+        """Record a span measured by the caller, on the current thread's track."""
+        event = {"name": name, "cat": category, "ph": "X", "ts": start, "dur": max(0.0, end - start), "pid": _PID, "tid": self._track()}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Record the duration of a block as a span.
+
+        Yields the span's args, so results known only at the end can be added.
+        """
+        start = time.time()
+        try:
+            yield args
+        finally:
+            self.add_span(name, category, start, time.time(), **args)
+
+    def instant(self, name: str, category: str, **args: Any) -> None:
+        """Record a point in time on the current thread's track."""
+        event = {"name": name, "cat": category, "ph": "i", "s": "t", "ts": time.time(), "pid": _PID, "tid": self._track()}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def count(self, name: str, delta: int) -> None:
+        """Change a counter and record its new value."""
+        with self._lock:
+            value = self._counters.get(name, 0) + delta
+            self._counters[name] = value
+            self._events.append({"name": name, "ph": "C", "ts": time.time(), "pid": _PID, "args": {name: value}})
+
+    def queued(self, script: str) -> None:
+        """Mark a script as ready to run, waiting for a free job."""
+        self._queued[script] = time.time()
+        self.count("queued scripts", 1)
+
+    def dequeued(self, script: str) -> None:
+        """Mark a queued script as started, recording its queue wait."""
+        start = self._queued.pop(script, None)
+        if start is None:
+            return
+        self.count("queued scripts", -1)
+        end = time.time()
+        span_id = f"queue-{script}"
+        self._add({"name": script, "cat": QUEUE, "ph": "b", "id": span_id, "ts": start, "pid": _PID})
+        self._add({"name": script, "cat": QUEUE, "ph": "e", "id": span_id, "ts": end, "pid": _PID})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the trace in Chrome Trace Event format, timestamps in microseconds from the first event."""
+        with self._lock:
+            events = [dict(event) for event in self._events]
+            tracks = dict(self._tracks)
+
+        origin = min((event["ts"] for event in events), default=0.0)
+        for event in events:
+            event["ts"] = round((event["ts"] - origin) * 1e6, 3)
+            if "dur" in event:
+                event["dur"] = round(event["dur"] * 1e6, 3)
+
+        metadata: List[Dict[str, Any]] = [{"name": "process_name", "ph": "M", "pid": _PID, "args": {"name": "ginx"}}]
+        for name, tid in tracks.items():
+            metadata.append({"name": "thread_name", "ph": "M", "pid": _PID, "tid": tid, "args": {"name": name}})
+            metadata.append({"name": "thread_sort_index", "ph": "M", "pid": _PID, "tid": tid, "args": {"sort_index": tid}})
+
+        return {"traceEvents": metadata + sorted(events, key=lambda event: (event["ts"], -event.get("dur", 0))), "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        """Write the trace to a file, replacing it atomically."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".ginx-trace-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+_active_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the tracer of the current run (None unless tracing)."""
+    return _active_tracer
+
+
+def span(name: str, category: str, **args: Any) -> "contextlib.AbstractContextManager[Any]":
+    """Record a span with the active tracer, if any."""
+    tracer = _active_tracer
+    if tracer is None:
+        return contextlib.nullcontext(args)
+    return tracer.span(name, category, **args)
+
+
+@contextlib.contextmanager
+def trace_to(path: Optional[str]) -> Iterator[Optional[Tracer]]:
+    """
+    Trace everything run in the block and write it to a file, also on failure.
+
+    Does nothing when path is None.
+    """
+    global _active_tracer
+
+    if path is None:
+        yield None
+        return
+
+    tracer = Tracer()
+    _active_tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _active_tracer = None
+        try:
+            tracer.write(path)
+        except OSError as e:
+            typer.secho(f"Warning: Could not write trace to {path}: {e}", fg=typer.colors.YELLOW)
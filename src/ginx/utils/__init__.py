@@ -8,9 +8,12 @@ from .command import (
     extract_commands_from_shell_string,
     parse_command_and_extra,
     parse_command_with_extras,
+    run_command_captured,
     run_command_with_streaming,
     run_command_with_streaming_shell,
+    terminate_running_commands,
     validate_command,
+    wait_for_process,
 )
 
 # File and project utilities
@@ -27,30 +30,74 @@ from .format import (
     format_duration,
 )
 
+# Requirements file parsing
+from .requirements import (
+    ParsedRequirements,
+    RequirementLine,
+    iter_requirements,
+    parse_requirement,
+    parse_requirements,
+)
+
+# Sharding utilities
+from .sharding import (
+    apportion_duration,
+    collect_shard_items,
+    load_shard_timings,
+    parse_shard_spec,
+    partition_items,
+)
+
 # System and environment utilities
 from .system import (
     expand_variables,
     get_shell,
 )
 
+# File watching utilities
+from .watch import (
+    create_file_watcher,
+    get_watch_roots,
+    wait_for_changes,
+)
+
 __all__ = [
     # Command execution utilities
     "validate_command",
+    "run_command_captured",
     "run_command_with_streaming",
     "run_command_with_streaming_shell",
     "extract_commands_from_shell_string",
     "check_dependencies",
     "parse_command_with_extras",
     "parse_command_and_extra",
+    "terminate_running_commands",
+    "wait_for_process",
     # File and project utilities
     "get_project_root",
     "safe_filename",
     "find_requirements_files",
     "parse_requirements_file",
+    # Requirements file parsing
+    "RequirementLine",
+    "ParsedRequirements",
+    "iter_requirements",
+    "parse_requirement",
+    "parse_requirements",
+    # Sharding utilities
+    "parse_shard_spec",
+    "partition_items",
+    "apportion_duration",
+    "collect_shard_items",
+    "load_shard_timings",
     # System and environment utilities
     "get_shell",
     "expand_variables",
     # Formatting utilities
     "format_duration",
     "colorize_output",
+    # File watching utilities
+    "create_file_watcher",
+    "wait_for_changes",
+    "get_watch_roots",
 ]
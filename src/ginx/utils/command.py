@@ -7,13 +7,40 @@ import platform
 import re
 import shlex
 import subprocess
+import sys
+import threading
+import time
 import typing
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
 import typer
 
 from ginx.config import get_global_config
 from ginx.constants import DANGEROUS_PATTERNS
+from ginx.tracing.overhead import CHILD, OUTPUT, SPAWN, get_overhead
+
+# Child processes currently being streamed, so they can be cancelled from another thread
+_running_processes: Set["subprocess.Popen[str]"] = set()
+_running_processes_lock = threading.Lock()
+
+
+def terminate_running_commands() -> int:
+    """
+    Terminate every command currently running through the streaming helpers.
+
+    Returns:
+        Number of processes that were signalled
+    """
+    with _running_processes_lock:
+        processes = list(_running_processes)
+
+    for process in processes:
+        try:
+            process.terminate()
+        except OSError:
+            pass
+
+    return len(processes)
 
 
 def validate_command(command: str) -> bool:
@@ -60,7 +87,67 @@ def validate_command(command: str) -> bool:
     return True
 
 
-def run_command_with_streaming(command: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> int:
+def wait_for_process(process: "subprocess.Popen[str]", stats: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Wait for a process to exit, collecting its resource usage into stats.
+
+    Uses wait4() where available so CPU time and peak RSS belong to this
+    child only, even when several commands run concurrently.
+    """
+    if stats is None or not hasattr(os, "wait4"):
+        return process.wait()
+
+    try:
+        _, status, rusage = os.wait4(process.pid, 0)
+    except ChildProcessError:
+        return process.wait()
+
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+
+    stats["cpu_time"] = rusage.ru_utime + rusage.ru_stime
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    stats["max_rss_kb"] = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    return process.returncode
+
+
+def _pump_output(process: "subprocess.Popen[str]", prefix: str, on_output: Optional[Callable[[str], None]], echo: bool) -> float:
+    """
+    Print and hand on a process's output lines until it closes its output.
+
+    Time spent on the lines (not waiting for them) counts as ginx's output overhead.
+
+    Returns:
+        Seconds spent handling the lines, which callers leave out of the child's time
+    """
+    if process.stdout is None:
+        return 0.0
+
+    handling = 0.0
+    for line in iter(process.stdout.readline, ""):
+        started = time.perf_counter()
+        line = line.rstrip()
+        if echo:
+            typer.echo(f"{prefix}{line}")
+        if on_output is not None:
+            on_output(line)
+        handling += time.perf_counter() - started
+
+    get_overhead().add(OUTPUT, handling)
+    return handling
+
+
+def run_command_with_streaming(
+    command: List[str],
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    prefix: str = "",
+    on_output: Optional[Callable[[str], None]] = None,
+    echo: bool = True,
+) -> int:
     """
     Run a command with real-time output streaming.
 
@@ -68,12 +155,18 @@ def run_command_with_streaming(command: List[str], cwd: Optional[str] = None, en
         command: Command and arguments as a list
         cwd: Working directory to run the command in
         env: Environment variables
+        stats: Optional dict that receives 'cpu_time' and 'max_rss_kb' of the child
+        prefix: Text prepended to every output line
+        on_output: Called with every output line (without prefix and line ending)
+        echo: Print output lines (with False, they only go to on_output)
 
     Returns:
         Exit code of the command
     """
     process = None
+    overhead = get_overhead()
     try:
+        spawn_started = time.perf_counter()
         # Merge environment variables
         full_env = os.environ.copy()
         if env:
@@ -90,14 +183,17 @@ def run_command_with_streaming(command: List[str], cwd: Optional[str] = None, en
             env=full_env,
             bufsize=1,
         )
+        spawned = time.perf_counter()
+        overhead.add(SPAWN, spawned - spawn_started)
+        with _running_processes_lock:
+            _running_processes.add(process)
 
         # Stream output in real-time
-        if process.stdout is not None:
-            for line in iter(process.stdout.readline, ""):
-                typer.echo(line.rstrip())
+        handling = _pump_output(process, prefix, on_output, echo)
 
-        process.wait()
-        return process.returncode
+        exit_code = wait_for_process(process, stats)
+        overhead.add(CHILD, time.perf_counter() - spawned - handling)
+        return exit_code
 
     except KeyboardInterrupt:
         typer.secho("\nCommand interrupted by user", fg=typer.colors.YELLOW)
@@ -107,9 +203,80 @@ def run_command_with_streaming(command: List[str], cwd: Optional[str] = None, en
     except Exception as e:
         typer.secho(f"✗ Error running command: {e}", fg=typer.colors.RED)
         return 1
+    finally:
+        if process:
+            with _running_processes_lock:
+                _running_processes.discard(process)
+
+
+def run_command_captured(
+    command: typing.Union[str, List[str]],
+    shell: bool = False,
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    stats: Optional[Dict[str, Any]] = None,
+) -> "subprocess.CompletedProcess[str]":
+    """
+    Run a command and capture its output.
 
+    Unlike subprocess.run(), the process can be cancelled with
+    terminate_running_commands() while it runs.
 
-def run_command_with_streaming_shell(command: str, cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None) -> int:
+    Args:
+        command: Command string (with shell) or command and arguments as a list
+        shell: Run the command through the shell
+        cwd: Working directory to run the command in
+        env: Environment of the command (None inherits ginx's)
+        stats: Optional dict that receives 'cpu_time' and 'max_rss_kb' of the child
+
+    Returns:
+        Completed process with the exit code and captured stdout and stderr
+    """
+    process = subprocess.Popen(
+        command,
+        shell=shell,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+    )
+    with _running_processes_lock:
+        _running_processes.add(process)
+
+    try:
+        # Drain both pipes without reaping the child, so wait4() can still collect its usage
+        stderr: List[str] = []
+        reader = threading.Thread(target=lambda: stderr.append(process.stderr.read() if process.stderr else ""), daemon=True)
+        reader.start()
+        stdout = process.stdout.read() if process.stdout else ""
+        reader.join()
+        exit_code = wait_for_process(process, stats)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        with _running_processes_lock:
+            _running_processes.discard(process)
+        for pipe in (process.stdout, process.stderr):
+            if pipe is not None:
+                pipe.close()
+
+    return subprocess.CompletedProcess(command, exit_code, stdout, "".join(stderr))
+
+
+def run_command_with_streaming_shell(
+    command: str,
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    prefix: str = "",
+    on_output: Optional[Callable[[str], None]] = None,
+    echo: bool = True,
+) -> int:
     """
     Run a shell command with real-time output streaming.
 
@@ -117,12 +284,18 @@ def run_command_with_streaming_shell(command: str, cwd: Optional[str] = None, en
         command: Command string to execute through shell
         cwd: Working directory to run the command in
         env: Environment variables
+        stats: Optional dict that receives 'cpu_time' and 'max_rss_kb' of the child
+        prefix: Text prepended to every output line
+        on_output: Called with every output line (without prefix and line ending)
+        echo: Print output lines (with False, they only go to on_output)
 
     Returns:
         Exit code of the command
     """
     process = None
+    overhead = get_overhead()
     try:
+        spawn_started = time.perf_counter()
         # Merge environment variables
         full_env = os.environ.copy()
         if env:
@@ -140,14 +313,17 @@ def run_command_with_streaming_shell(command: str, cwd: Optional[str] = None, en
             env=full_env,
             bufsize=1,
         )
+        spawned = time.perf_counter()
+        overhead.add(SPAWN, spawned - spawn_started)
+        with _running_processes_lock:
+            _running_processes.add(process)
 
         # Stream output in real-time
-        if process.stdout is not None:
-            for line in iter(process.stdout.readline, ""):
-                typer.echo(line.rstrip())
+        handling = _pump_output(process, prefix, on_output, echo)
 
-        process.wait()
-        return process.returncode
+        exit_code = wait_for_process(process, stats)
+        overhead.add(CHILD, time.perf_counter() - spawned - handling)
+        return exit_code
 
     except KeyboardInterrupt:
         typer.secho("\nCommand interrupted by user", fg=typer.colors.YELLOW)
@@ -157,6 +333,10 @@ def run_command_with_streaming_shell(command: str, cwd: Optional[str] = None, en
     except Exception as e:
         typer.secho(f"Error running command: {e}", fg=typer.colors.RED)
         return 1
+    finally:
+        if process:
+            with _running_processes_lock:
+                _running_processes.discard(process)
 
 
 def extract_commands_from_shell_string(command_str: str) -> typing.Set[str]:
@@ -10,6 +10,8 @@ import typer
 
 from ginx.constants import COMMON_PROJECT_ROOT_MARKERS, DEFAULT_REQUIREMENTS_FILES
 
+from .requirements import parse_requirements
+
 
 def get_project_root() -> Optional[Path]:
     """
@@ -65,18 +67,17 @@ def find_requirements_files() -> List[str]:
 
 
 def parse_requirements_file(file_path: str) -> List[str]:
-    """Parse a requirements file and return list of packages."""
-    packages: List[str] = []
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if line and not line.startswith("#") and not line.startswith("-"):
-                    # Handle package names with version specifiers
-                    package_name = line.split("==")[0].split(">=")[0].split("<=")[0].split("~=")[0].split(">")[0].split("<")[0].strip()
-                    if package_name:
-                        packages.append(line)  # Keep full specification for installation
-    except Exception as e:
-        typer.secho(f"Warning: Could not parse {file_path}: {e}", fg=typer.colors.YELLOW)
-    return packages
+    """
+    Parse a requirements file (following -r includes) and return its requirements.
+
+    Args:
+        file_path: Path to the requirements file
+
+    Returns:
+        Requirement strings without options and comments, in file order;
+        entries of -c constraints files are not included
+    """
+    parsed = parse_requirements(file_path)
+    for error in parsed.errors:
+        typer.secho(f"Warning: Could not parse {error}", fg=typer.colors.YELLOW)
+    return [requirement.text for requirement in parsed.requirements if not requirement.constraint]
@@ -0,0 +1,222 @@
+"""
+Streaming parser for pip requirements files (PEP 508 requirements plus pip options).
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from packaging.requirements import InvalidRequirement, Requirement
+
+# Only pip's own syntax is parsed here, requirements themselves go to packaging
+_COMMENT_PATTERN = re.compile(r"(^|\s+)#.*$")
+_HASH_PATTERN = re.compile(r"--hash[=\s]\s*(\S+)")
+_OPTION_PATTERN = re.compile(r"^(-r|--requirement|-c|--constraint|-e|--editable)(?:\s*=\s*|\s+|(?<=^-[rce]))(\S.*)$")
+_EGG_PATTERN = re.compile(r"[#&]egg=([^&\s]+)")
+
+
+class RequirementLine(NamedTuple):
+    """One requirement of a requirements file."""
+
+    name: str  # Normalized (PEP 503), empty for unnamed URLs and paths
+    specifier: str  # e.g. '>=2.0,<3', whitespace removed
+    extras: Tuple[str, ...]
+    marker: str  # e.g. 'python_version < "3.8"'
+    url: str  # Direct reference, editable path or URL
+    hashes: Tuple[str, ...]  # e.g. 'sha256:...'
+    editable: bool
+    constraint: bool  # From a -c file: restricts versions, doesn't request installation
+    source: str  # File the line is in
+    line: int  # Line number (of the first physical line)
+    text: str  # The requirement without options and comments ('-e <url>' for editables)
+
+
+class ParsedRequirements(NamedTuple):
+    """Result of parsing a requirements file and its includes."""
+
+    requirements: List[RequirementLine]
+    errors: List[str]  # 'path:line: message'
+    files: List[str]  # Every file read, in order
+
+
+_FileKey = Tuple[str, int, int]
+
+# Parsed files by absolute path, with the (path, mtime, size) of every file read
+_parse_cache: Dict[str, Tuple[Tuple[_FileKey, ...], ParsedRequirements]] = {}
+_parse_cache_lock = threading.Lock()
+
+
+def _normalize_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _file_key(path: str) -> Optional[_FileKey]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _logical_lines(path: str) -> Iterator[Tuple[int, str]]:
+    """Yield (line number, line) with comments removed and continuations joined."""
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        start = 0
+        for number, raw in enumerate(f, 1):
+            line = raw.rstrip("\r\n")
+            if not buffer:
+                start = number
+            if line.endswith("\\"):
+                buffer += line[:-1]
+                continue
+            line = _COMMENT_PATTERN.sub("", buffer + line).strip()
+            buffer = ""
+            if line:
+                yield start, line
+        if buffer.strip():
+            yield start, _COMMENT_PATTERN.sub("", buffer).strip()
+
+
+def parse_requirement(text: str) -> Optional[Tuple[str, str, Tuple[str, ...], str, str]]:
+    """
+    Parse a PEP 508 requirement string.
+
+    Args:
+        text: Requirement, e.g. 'requests[socks]>=2.0,<3; python_version >= "3.8"'
+
+    Returns:
+        Tuple of (normalized name, specifier, extras, marker, url), or None
+        if the string is not a valid requirement
+    """
+    try:
+        requirement = Requirement(text.strip())
+    except InvalidRequirement:
+        return None
+
+    # SpecifierSet doesn't keep the order of its clauses, so restore the written one
+    compact = re.sub(r"\s+", "", text)
+    specifier = ",".join(sorted((str(clause) for clause in requirement.specifier), key=compact.find))
+    extras = tuple(sorted(_normalize_name(extra) for extra in requirement.extras))
+    marker = str(requirement.marker) if requirement.marker is not None else ""
+    return _normalize_name(requirement.name), specifier, extras, marker, requirement.url or ""
+
+
+def _iter_file(
+    path: str,
+    constraint: bool,
+    stack: List[str],
+    seen: Set[Tuple[str, bool]],
+    errors: List[str],
+    files: List[_FileKey],
+) -> Iterator[RequirementLine]:
+    key = _file_key(path)
+    if key is None:
+        errors.append(f"{path}: file not found")
+        return
+    files.append(key)
+    seen.add((path, constraint))
+    stack.append(path)
+
+    try:
+        for number, line in _logical_lines(path):
+            location = f"{path}:{number}"
+
+            if line.startswith("-"):
+                option = _OPTION_PATTERN.match(line)
+                if not option:
+                    # Other pip options (--index-url, --pre, ...) don't name requirements
+                    continue
+                flag, value = option.group(1), option.group(2).strip()
+
+                if flag in ("-r", "--requirement", "-c", "--constraint"):
+                    if "://" in value:
+                        errors.append(f"{location}: remote include '{value}' is not supported")
+                        continue
+                    include = os.path.normpath(os.path.join(os.path.dirname(path), value))
+                    if include in stack:
+                        errors.append(f"{location}: circular include of {value}")
+                        continue
+                    # A file read as requirements may still be needed as constraints, and vice versa
+                    include_constraint = constraint or flag in ("-c", "--constraint")
+                    if (include, include_constraint) not in seen:
+                        yield from _iter_file(include, include_constraint, stack, seen, errors, files)
+                    continue
+
+                # Editable install: a path or VCS URL, named by its #egg= fragment
+                egg = _EGG_PATTERN.search(value)
+                name = _normalize_name(egg.group(1).split("[")[0]) if egg else ""
+                yield RequirementLine(name, "", (), "", value, (), True, constraint, path, number, f"-e {value}")
+                continue
+
+            hashes = tuple(_HASH_PATTERN.findall(line))
+            text = re.split(r"\s+--?[A-Za-z]", " " + line, maxsplit=1)[0].strip()
+            parsed = parse_requirement(text)
+            if parsed is None:
+                if "/" in text or text.endswith((".whl", ".zip", ".tar.gz")):
+                    # Unnamed path or URL
+                    yield RequirementLine("", "", (), "", text, hashes, False, constraint, path, number, text)
+                else:
+                    errors.append(f"{location}: invalid requirement '{text}'")
+                continue
+
+            name, specifier, extras, marker, url = parsed
+            yield RequirementLine(name, specifier, extras, marker, url, hashes, False, constraint, path, number, text)
+    except (OSError, UnicodeDecodeError) as e:
+        errors.append(f"{path}: {e}")
+    finally:
+        stack.pop()
+
+
+def iter_requirements(
+    path: str,
+    errors: Optional[List[str]] = None,
+    files: Optional[List[_FileKey]] = None,
+) -> Iterator[RequirementLine]:
+    """
+    Stream the requirements of a file, following -r and -c includes.
+
+    Includes are resolved relative to the including file; each file is read
+    at most once as requirements and once as constraints, and circular
+    includes are reported instead of followed.
+
+    Args:
+        path: Requirements file
+        errors: Receives 'path:line: message' for invalid lines and includes
+        files: Receives (path, mtime, size) of every file read
+
+    Yields:
+        Requirement records in file order
+    """
+    yield from _iter_file(os.path.abspath(path), False, [], set(), errors if errors is not None else [], files if files is not None else [])
+
+
+def parse_requirements(path: str) -> ParsedRequirements:
+    """
+    Parse a requirements file and its includes (memoized).
+
+    Results are reused until one of the files read changes (mtime or size).
+
+    Args:
+        path: Requirements file
+
+    Returns:
+        Requirements, errors and the files read
+    """
+    path = os.path.abspath(path)
+    with _parse_cache_lock:
+        cached = _parse_cache.get(path)
+    if cached is not None and all(_file_key(key[0]) == key for key in cached[0]):
+        return cached[1]
+
+    errors: List[str] = []
+    files: List[_FileKey] = []
+    requirements = list(iter_requirements(path, errors, files))
+    result = ParsedRequirements(requirements, errors, [key[0] for key in files])
+
+    # Files that were missing are not cached, so they are looked for again
+    if not any(error.endswith("file not found") for error in errors):
+        with _parse_cache_lock:
+            _parse_cache[path] = (tuple(files), result)
+    return result
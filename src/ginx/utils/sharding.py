@@ -0,0 +1,213 @@
+"""
+Splitting work items (test files, packages, ...) into balanced shards.
+"""
+
+import glob
+import heapq
+import json
+import os
+import re
+import shlex
+import statistics
+import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+
+from ginx.constants import DEFAULT_SCRIPT_DURATION
+
+_SHARD_SPEC_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+_ARGS_PLACEHOLDER_PATTERN = re.compile(r"\$\{([^}:]+):args\}")
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """
+    Parse a 'K/N' shard specification.
+
+    Args:
+        spec: Shard specification, e.g. '3/8' (1-based index)
+
+    Returns:
+        Tuple of (index, count)
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    match = _SHARD_SPEC_PATTERN.match(spec)
+    if not match:
+        raise ValueError(f"Invalid shard '{spec}', expected INDEX/COUNT (e.g. 3/8)")
+
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}', index must be between 1 and {max(count, 1)}")
+
+    return index, count
+
+
+def partition_items(
+    items: List[str],
+    count: int,
+    durations: Optional[Dict[str, float]] = None,
+    default: Optional[float] = None,
+) -> List[List[str]]:
+    """
+    Split items into count buckets of roughly equal total duration.
+
+    Uses longest-processing-time-first greedy packing: items are placed,
+    slowest first, into the currently lightest bucket. The result only
+    depends on the inputs, so shards agree on the partition only if they
+    all get the same items and durations.
+
+    Args:
+        items: Items to distribute
+        count: Number of buckets
+        durations: Known duration of items in seconds
+        default: Duration of items without a known duration (defaults to the
+            median of the known durations)
+
+    Returns:
+        List of count buckets, each keeping the original item order
+    """
+    durations = durations or {}
+    if default is None:
+        known = [durations[item] for item in items if item in durations]
+        default = statistics.median(known) if known else DEFAULT_SCRIPT_DURATION
+
+    weights = [durations.get(item, default) for item in items]
+    # Stable sort: equal weights keep their original order
+    ordered = sorted(range(len(items)), key=weights.__getitem__, reverse=True)
+
+    loads: List[Tuple[float, int]] = [(0.0, bucket) for bucket in range(count)]
+    assignment: List[List[int]] = [[] for _ in range(count)]
+    for index in ordered:
+        load, bucket = loads[0]
+        assignment[bucket].append(index)
+        heapq.heapreplace(loads, (load + weights[index], bucket))
+
+    return [[items[i] for i in sorted(indexes)] for indexes in assignment]
+
+
+def apportion_duration(
+    items: List[str],
+    duration: float,
+    durations: Optional[Dict[str, float]] = None,
+    default: Optional[float] = None,
+) -> Dict[str, float]:
+    """
+    Split the measured duration of a shard run over its items.
+
+    The split is proportional to the items' current estimates (evenly when
+    nothing is known yet), so repeated runs refine the estimates of items
+    that keep landing in slow shards.
+
+    Args:
+        items: Items that ran together
+        duration: Measured wall time of the run in seconds
+        durations: Current per-item estimates
+        default: Estimate for unknown items (defaults to the median of the
+            known estimates)
+
+    Returns:
+        Dictionary mapping each item to its share of the duration
+    """
+    durations = durations or {}
+    if default is None:
+        known = [durations[item] for item in items if item in durations]
+        default = statistics.median(known) if known else DEFAULT_SCRIPT_DURATION
+
+    weights = [durations.get(item, default) for item in items]
+    total = sum(weights)
+    if total <= 0:
+        return {item: duration / len(items) for item in items} if items else {}
+
+    return {item: duration * weight / total for item, weight in zip(items, weights)}
+
+
+def get_shard_variable(command: str, shard_config: Dict[str, Any]) -> str:
+    """
+    Get the name of the ${name:args} placeholder that receives the shard items.
+
+    Raises:
+        ValueError: If the placeholder is missing or ambiguous
+    """
+    names = _ARGS_PLACEHOLDER_PATTERN.findall(command)
+    variable = shard_config.get("variable")
+
+    if variable:
+        if variable not in names:
+            raise ValueError(f"Command has no ${{{variable}:args}} placeholder for the shard items")
+        return str(variable)
+
+    if len(set(names)) != 1:
+        raise ValueError("Command needs exactly one ${name:args} placeholder for the shard items (or set 'shard.variable')")
+    return str(names[0])
+
+
+def substitute_shard_items(command: str, variable: str, items: List[str]) -> str:
+    """Replace the ${variable:args} placeholder with the quoted items."""
+    return command.replace(f"${{{variable}:args}}", " ".join(shlex.quote(item) for item in items))
+
+
+def load_shard_timings(path: str, cwd: Optional[str] = None) -> Dict[str, float]:
+    """
+    Load shared per-item durations from a JSON file mapping items to seconds.
+
+    Args:
+        path: Timings file, relative to cwd
+        cwd: Directory the path is relative to
+
+    Returns:
+        Dictionary mapping items to durations
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a JSON object of numbers
+    """
+    with open(os.path.join(cwd or os.getcwd(), path), "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must contain a JSON object mapping items to seconds")
+    try:
+        return {str(item): float(seconds) for item, seconds in data.items()}
+    except (TypeError, ValueError):
+        raise ValueError(f"{path} must contain a JSON object mapping items to seconds")
+
+
+def collect_shard_items(shard_config: Dict[str, Any], cwd: Optional[str] = None) -> List[str]:
+    """
+    Collect the items to shard.
+
+    Items come from 'items' glob patterns (relative to cwd) or from the output
+    of a generator 'command', one item per line.
+
+    Args:
+        shard_config: The script's 'shard' configuration
+        cwd: Directory to expand globs and run the generator in
+
+    Returns:
+        Sorted, de-duplicated list of items
+
+    Raises:
+        ValueError: If no item source is configured
+        subprocess.CalledProcessError: If the generator command fails
+    """
+    base_dir = cwd or os.getcwd()
+
+    if shard_config.get("command"):
+        result = subprocess.run(
+            shard_config["command"],
+            shell=True,
+            check=True,
+            text=True,
+            capture_output=True,
+            cwd=base_dir,
+        )
+        items = [line.strip() for line in result.stdout.splitlines()]
+    elif shard_config.get("items"):
+        items = []
+        for pattern in shard_config["items"]:
+            matches = glob.glob(os.path.join(base_dir, pattern), recursive=True)
+            items.extend(os.path.relpath(match, base_dir).replace(os.sep, "/") for match in matches)
+    else:
+        raise ValueError("Shard configuration needs 'items' glob patterns or a generator 'command'")
+
+    return sorted(set(item for item in items if item))
@@ -0,0 +1,281 @@
+"""
+File system watching utilities.
+
+Uses inotify on Linux (through ctypes, no third-party dependency) and falls
+back to mtime polling everywhere else.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ginx.constants import DEFAULT_WATCH_IGNORE
+
+# inotify event masks (see <sys/inotify.h>)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class FileWatcher(ABC):
+    """Base class for file watchers."""
+
+    def __init__(self, paths: Iterable[str], ignore: Optional[Iterable[str]] = None) -> None:
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.ignore: Set[str] = set(DEFAULT_WATCH_IGNORE if ignore is None else ignore)
+
+    def _is_ignored(self, name: str) -> bool:
+        return name in self.ignore or name.endswith(".egg-info")
+
+    @abstractmethod
+    def read_changes(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        Wait for changes and return the changed paths.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            Set of absolute paths that changed (empty on timeout)
+        """
+        pass
+
+    def close(self) -> None:
+        """Release watcher resources."""
+        pass
+
+
+class InotifyWatcher(FileWatcher):
+    """Linux inotify-based watcher."""
+
+    def __init__(self, paths: Iterable[str], ignore: Optional[Iterable[str]] = None) -> None:
+        super().__init__(paths, ignore)
+
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self._watches: Dict[int, str] = {}
+        for path in self.paths:
+            if os.path.isdir(path):
+                self._add_tree(path)
+            elif os.path.exists(path):
+                self._add_watch(path)
+
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = path
+
+    def _add_tree(self, root: str) -> None:
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [name for name in dirnames if not self._is_ignored(name)]
+            self._add_watch(dirpath)
+
+    def read_changes(self, timeout: Optional[float] = None) -> Set[str]:
+        changes: Set[str] = set()
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return changes
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changes
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + name_len].rstrip(b"\0").decode(errors="replace")
+            offset += name_len
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped, report every watched root as changed
+                changes.update(self.paths)
+                continue
+
+            base = self._watches.get(wd)
+            if base is None:
+                continue
+
+            if mask & _IN_IGNORED:
+                del self._watches[wd]
+                # Editors often replace files on save, re-arm plain file watches
+                if base in self.paths and os.path.isfile(base):
+                    self._add_watch(base)
+                continue
+
+            if name and self._is_ignored(name):
+                continue
+
+            path = os.path.join(base, name) if name else base
+            changes.add(path)
+
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                self._add_tree(path)
+
+        return changes
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher(FileWatcher):
+    """Portable watcher that compares file modification times."""
+
+    def __init__(self, paths: Iterable[str], ignore: Optional[Iterable[str]] = None, interval: float = 0.5) -> None:
+        super().__init__(paths, ignore)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot: Dict[str, Tuple[int, int]] = {}
+
+        def record(path: str) -> None:
+            try:
+                stat = os.stat(path)
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+
+        for root in self.paths:
+            if not os.path.isdir(root):
+                record(root)
+                continue
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [name for name in dirnames if not self._is_ignored(name)]
+                for filename in filenames:
+                    record(os.path.join(dirpath, filename))
+
+        return snapshot
+
+    def read_changes(self, timeout: Optional[float] = None) -> Set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            current = self._take_snapshot()
+            changes = {path for path in current.keys() | self._snapshot.keys() if current.get(path) != self._snapshot.get(path)}
+            self._snapshot = current
+            if changes:
+                return changes
+
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+
+def create_file_watcher(
+    paths: Iterable[str],
+    ignore: Optional[Iterable[str]] = None,
+    force_polling: bool = False,
+    interval: float = 0.5,
+) -> FileWatcher:
+    """
+    Create the best available file watcher for this platform.
+
+    Args:
+        paths: Files or directories to watch (directories recursively)
+        ignore: Directory/file names to skip (defaults to DEFAULT_WATCH_IGNORE)
+        force_polling: Always use the polling watcher
+        interval: Polling interval in seconds
+
+    Returns:
+        A FileWatcher instance
+    """
+    paths = list(paths)
+
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths, ignore)
+        except (OSError, AttributeError):
+            pass
+
+    return PollingWatcher(paths, ignore, interval=interval)
+
+
+def wait_for_changes(watcher: FileWatcher, debounce: float = 0.2, timeout: Optional[float] = None) -> Set[str]:
+    """
+    Block until files change, then collect events until things settle.
+
+    Args:
+        watcher: File watcher to read from
+        debounce: Quiet period in seconds that ends a batch of events
+        timeout: Maximum time to wait for the first event (None waits forever)
+
+    Returns:
+        Set of changed absolute paths (empty on timeout)
+    """
+    changes = watcher.read_changes(timeout)
+    if not changes:
+        return changes
+
+    while True:
+        more = watcher.read_changes(debounce)
+        if not more:
+            return changes
+        changes.update(more)
+
+
+def get_watch_roots(patterns: Iterable[str], base_dir: str) -> List[str]:
+    """
+    Reduce input glob patterns to the set of paths that must be watched.
+
+    Args:
+        patterns: Glob patterns relative to base_dir
+        base_dir: Project root directory
+
+    Returns:
+        Sorted absolute paths, without paths nested inside other roots
+    """
+    roots: Set[str] = set()
+
+    for pattern in patterns:
+        static_parts: List[str] = []
+        for part in pattern.replace("\\", "/").split("/"):
+            if any(char in part for char in "*?["):
+                break
+            static_parts.append(part)
+
+        path = os.path.normpath(os.path.join(base_dir, *static_parts))
+
+        # Not created yet, watch the closest existing parent directory
+        while not os.path.exists(path) and os.path.dirname(path) != path:
+            path = os.path.dirname(path)
+        roots.add(path)
+
+    result: List[str] = []
+    for root in sorted(roots):
+        if not any(root.startswith(parent.rstrip(os.sep) + os.sep) for parent in result):
+            result.append(root)
+
+    return result
@@ -0,0 +1,114 @@
+"""
+Local HTTP stand-in for PyPI.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+class FakePyPIServer:
+    """Serves /pypi/<name>/json for a fixed set of packages on localhost."""
+
+    def __init__(self, packages: Optional[Dict[str, List[str]]] = None, delay: float = 0.0) -> None:
+        # Package name -> released versions, newest last
+        self.packages: Dict[str, List[str]] = packages or {}
+        self.delay = delay
+        # Compress responses for clients that accept gzip
+        self.gzip = False
+        # Silently close every connection after one response, like a server dropping idle keep-alives
+        self.drop_connections = False
+        self.connections = 0
+        self.requests: List[str] = []
+        # Conditional requests answered with 304 Not Modified
+        self.not_modified = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakePyPIServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def package_json(self, name: str) -> Dict[str, Any]:
+        versions = self.packages[name]
+        return {
+            "info": {"name": name, "version": versions[-1], "summary": f"The {name} package"},
+            "releases": {version: [{"filename": f"{name}-{version}.tar.gz", "yanked": False}] for version in versions},
+        }
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, don't let Nagle delay the body
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def setup(self) -> None:
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self) -> None:
+                with server._lock:
+                    server.requests.append(self.path)
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    if server.delay:
+                        time.sleep(server.delay)
+                    self._respond()
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def _respond(self) -> None:
+                parts = [part for part in self.path.split("/") if part]
+                if len(parts) == 3 and parts[0] == "pypi" and parts[2] == "json" and parts[1] in server.packages:
+                    body = json.dumps(server.package_json(parts[1])).encode()
+                    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        with server._lock:
+                            server.not_modified += 1
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("ETag", etag)
+                else:
+                    body = b"Not Found"
+                    self.send_response(404)
+                if server.gzip and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                if server.drop_connections:
+                    self.close_connection = True
+
+        return Handler
@@ -0,0 +1,74 @@
+"""
+Directory-backed stand-in for a PEP 691 Simple Repository index.
+"""
+
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SIMPLE_JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+
+
+def write_simple_project(root: Path, name: str, files: List[Dict[str, Any]], versions: Optional[List[str]] = None) -> None:
+    """
+    Write <root>/<name>/index.json as a PEP 691 project page.
+
+    Args:
+        root: Index directory
+        name: Normalized project name
+        files: File entries ('filename' plus optional 'yanked'/'requires-python')
+        versions: Versions to list (API version 1.1), if any
+    """
+    page: Dict[str, Any] = {
+        "meta": {"api-version": "1.1" if versions is not None else "1.0"},
+        "name": name,
+        "files": [{"url": f"../../files/{file['filename']}", "hashes": {}, **file} for file in files],
+    }
+    if versions is not None:
+        page["versions"] = versions
+
+    project_dir = root / name
+    project_dir.mkdir(parents=True, exist_ok=True)
+    (project_dir / "index.json").write_text(json.dumps(page), encoding="utf-8")
+
+
+class _SimpleIndexHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    extensions_map = {**SimpleHTTPRequestHandler.extensions_map, ".json": SIMPLE_JSON_CONTENT_TYPE}
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def translate_path(self, path: str) -> str:
+        # /<project>/ is served from /<project>/index.json
+        translated = super().translate_path(path)
+        if Path(translated).is_dir():
+            translated = str(Path(translated) / "index.json")
+        return translated
+
+
+class SimpleIndexServer:
+    """Serves a directory of PEP 691 project pages on localhost."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_SimpleIndexHandler, directory=str(directory)))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "SimpleIndexServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
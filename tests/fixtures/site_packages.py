@@ -0,0 +1,41 @@
+"""
+Fake installed distributions in an isolated site-packages directory.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+
+def install_distribution(
+    site: Path,
+    name: str,
+    version: str,
+    requires: Optional[List[str]] = None,
+    direct_url: object = None,
+) -> Path:
+    """
+    Write a minimal <name>-<version>.dist-info directory.
+
+    Args:
+        site: site-packages directory
+        name: Project name, as written in METADATA
+        version: Installed version
+        requires: Requires-Dist entries
+        direct_url: Contents of direct_url.json (PEP 610), if any
+
+    Returns:
+        The dist-info directory
+    """
+    dist_info = site / f"{name.replace('-', '_')}-{version}.dist-info"
+    dist_info.mkdir()
+    lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+    lines += [f"Requires-Dist: {requirement}" for requirement in requires or []]
+    (dist_info / "METADATA").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if direct_url is not None:
+        (dist_info / "direct_url.json").write_text(json.dumps(direct_url), encoding="utf-8")
+    # Make sure the directory looks modified even on coarse-grained file systems
+    stat = os.stat(site)
+    os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    return dist_info
@@ -2,12 +2,19 @@
 Tests for script execution functionality.
 """
 
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
 from unittest.mock import MagicMock, patch
 
 import pytest
 import typer
 
 from ginx.cli.execution import execute_script_logic
+from ginx.history import get_run_store
 
 
 class TestScriptExecution:
@@ -399,3 +406,126 @@ class TestScriptExecution:
 
         # Should execute one script
         assert mock_run.call_count == 1
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_parallel_execution(self, mock_get_scripts: MagicMock, capsys: MagicMock):
+        """Independent dependencies run concurrently, the target runs last."""
+        mock_get_scripts.return_value = {
+            "lint": {"command": "echo lint", "description": "Lint", "depends": []},
+            "types": {"command": "echo types", "description": "Types", "depends": []},
+            "ci": {"command": "echo ci", "description": "CI", "depends": ["lint", "types"]},
+        }
+
+        execute_script_logic("ci", {}, "", True, False, False, jobs=2)
+
+        captured = capsys.readouterr()
+        assert "up to 2 parallel jobs" in captured.out
+        assert "[lint] lint" in captured.out
+        assert "[types] types" in captured.out
+        assert captured.out.index("[3/3] Running: ci") > captured.out.index("[types] types")
+        assert "All scripts completed successfully" in captured.out
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_parallel_captured_output_is_prefixed(self, mock_get_scripts: MagicMock, capsys: MagicMock):
+        """Captured (--no-stream) output of concurrent scripts is prefixed like streamed output."""
+        mock_get_scripts.return_value = {
+            "lint": {"command": "printf 'one\\ntwo\\n'", "description": "Lint", "depends": []},
+            "types": {"command": "echo types", "description": "Types", "depends": []},
+            "ci": {"command": "echo ci", "description": "CI", "depends": ["lint", "types"]},
+        }
+
+        execute_script_logic("ci", {}, "", False, False, False, jobs=2)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "[lint] one" in lines and "[lint] two" in lines
+        assert "[types] types" in lines
+        assert "one" not in lines and "types" not in lines
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_parallel_execution_failure(self, mock_get_scripts: MagicMock, capsys: MagicMock):
+        """A failing script prevents its dependents from starting."""
+        mock_get_scripts.return_value = {
+            "lint": {"command": "false", "description": "Lint", "depends": []},
+            "types": {"command": "echo types", "description": "Types", "depends": []},
+            "ci": {"command": "echo ci", "description": "CI", "depends": ["lint", "types"]},
+        }
+
+        with pytest.raises(typer.Exit):
+            execute_script_logic("ci", {}, "", True, False, False, jobs=2)
+
+        captured = capsys.readouterr()
+        assert "Dependency 'lint' exited" in captured.out
+        assert "Running: ci" not in captured.out
+
+
+class TestResourceUsage:
+    """Test the resource usage recorded for scripts."""
+
+    @pytest.mark.skipif(not hasattr(os, "wait4"), reason="needs wait4()")
+    @patch("ginx.cli.execution.get_scripts")
+    def test_captured_parallel_runs_have_their_own_cpu_time(self, mock_get_scripts: MagicMock):
+        """Concurrent captured scripts do not get each other's CPU time."""
+        burn = f"{sys.executable} -c \"sum(i * i for i in range(3_000_000))\""
+        idle = f"{sys.executable} -c \"__import__('time').sleep(0.5)\""
+        mock_get_scripts.return_value = {
+            "burn": {"command": burn, "description": "Burn", "depends": []},
+            "idle": {"command": idle, "description": "Idle", "depends": []},
+            "ci": {"command": "echo ci", "description": "CI", "depends": ["burn", "idle"]},
+        }
+
+        execute_script_logic("ci", {}, "", False, False, False, jobs=2)
+
+        cpu_times = {run["script"]: run["cpu_time"] for run in get_run_store().query_runs()}
+        assert cpu_times["burn"] > 0.1
+        assert cpu_times["idle"] < cpu_times["burn"] / 2
+
+
+class TestShardedExecution:
+    """Test running shards of a script's items."""
+
+    ITEMS = ["a", "b", "c", "d", "e", "f"]
+
+    def run_shards(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, shard_config: Dict[str, str]) -> List[List[str]]:
+        scripts = {
+            "test": {
+                "command": "echo ${files:args}",
+                "description": "Test",
+                "depends": [],
+                "cwd": str(tmp_path),
+                "shard": dict(shard_config, command="printf 'a\\nb\\nc\\nd\\ne\\nf\\n'"),
+            }
+        }
+        # Each CI runner has its own history
+        histories = [{"a": 100.0}, {"f": 100.0, "b": 50.0}]
+        shards = []
+        for index, history in enumerate(histories, 1):
+            monkeypatch.setenv("GINX_HISTORY_DIR", str(tmp_path / f"runner-{index}"))
+            get_run_store().record_item_durations("test", history, time.time())
+            get_run_store().flush()
+
+            with patch("ginx.cli.execution.get_scripts", return_value=scripts), patch(
+                "ginx.cli.execution.run_command_with_streaming", return_value=0
+            ) as mock_run:
+                execute_script_logic("test", {}, "", True, False, False, shard=f"{index}/2")
+            shards.append(mock_run.call_args[0][0][1:])
+        return shards
+
+    def test_shards_ignore_local_history(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Shards with different histories still split the items exactly once."""
+        first, second = self.run_shards(tmp_path, monkeypatch, {})
+
+        assert sorted(first + second) == self.ITEMS
+        assert len(first) == len(second) == 3
+
+    def test_shards_balance_with_shared_timings(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """A shared timings file balances the shards."""
+        (tmp_path / "timings.json").write_text(json.dumps({"a": 10.0, "b": 1.0, "c": 1.0, "d": 1.0, "e": 1.0, "f": 1.0}))
+        first, second = self.run_shards(tmp_path, monkeypatch, {"timings": "timings.json"})
+
+        assert sorted(first + second) == self.ITEMS
+        assert {tuple(first), tuple(second)} == {("a",), ("b", "c", "d", "e", "f")}
+
+    def test_unreadable_timings_fail(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """A missing timings file fails instead of silently splitting differently."""
+        with pytest.raises(typer.Exit):
+            self.run_shards(tmp_path, monkeypatch, {"timings": "missing.json"})
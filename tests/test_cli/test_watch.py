@@ -0,0 +1,67 @@
+"""
+Tests for cancelling and restarting watch runs.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ginx.cli.commands.watch import WatchSession
+
+
+def sleeper_scripts(marker: Path) -> Dict[str, Dict[str, Any]]:
+    # No shell operators, so the script is the child itself rather than a shell's grandchild
+    command = f"{sys.executable} -c \"open('{marker}', 'w').close() or __import__('time').sleep(30)\""
+    return {
+        "slow": {"command": command, "description": "Slow", "depends": []},
+        "after": {"command": "echo after", "description": "After", "depends": ["slow"]},
+    }
+
+
+class TestWatchSession:
+    """Test the in-flight run of a watch session."""
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_cancel_terminates_running_script(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: Any, streaming: bool):
+        """Cancelling stops the running script, also when output is captured, and skips the rest of the plan."""
+        monkeypatch.chdir(tmp_path)
+        marker = tmp_path / "started"
+        session = WatchSession(["after"], streaming, False)
+        assert session.load(sleeper_scripts(marker)) == []
+        assert session.plan == ["slow", "after"]
+
+        session.start_run(session.plan)
+        deadline = time.time() + 10
+        while not marker.exists():
+            assert time.time() < deadline, "script did not start"
+            time.sleep(0.02)
+
+        started = time.time()
+        assert session.cancel_run() == ["slow", "after"]
+        assert time.time() - started < 5
+        assert not session.is_running()
+        assert "Running: after" not in capsys.readouterr().out
+
+    def test_restart_after_cancel(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: Any):
+        """A new run can start right after a cancelled one."""
+        monkeypatch.chdir(tmp_path)
+        session = WatchSession(["after"], True, False)
+        session.load(sleeper_scripts(tmp_path / "started"))
+
+        session.start_run(session.plan)
+        session.cancel_run()
+        capsys.readouterr()
+
+        session.start_run(["after"])
+        assert session._thread is not None
+        session._thread.join(10)
+        assert not session.is_running()
+        assert "✓ All scripts completed" in capsys.readouterr().out
+
+    def test_cancel_without_run(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Cancelling when nothing runs does nothing."""
+        monkeypatch.chdir(tmp_path)
+        assert WatchSession(["after"], True, False).cancel_run() == []
@@ -0,0 +1,74 @@
+"""
+Tests for critical-path scheduling.
+"""
+
+from typing import Any, Dict
+
+from ginx.config.scheduling import (
+    ReadyQueue,
+    compute_priorities,
+    estimate_makespan,
+    estimate_plan_durations,
+    find_critical_path,
+    get_plan_dependencies,
+    simulate_schedule,
+)
+from ginx.constants import DEFAULT_SCRIPT_DURATION
+
+# ci depends on a long chain (a -> b) and two independent scripts
+SCRIPTS: Dict[str, Dict[str, Any]] = {
+    "a": {"command": "true", "depends": []},
+    "b": {"command": "true", "depends": ["a"]},
+    "c": {"command": "true", "depends": []},
+    "d": {"command": "true", "depends": []},
+    "ci": {"command": "true", "depends": ["b", "c", "d"]},
+}
+PLAN = ["a", "b", "c", "d", "ci"]
+DURATIONS = {"a": 1.0, "b": 4.0, "c": 2.0, "d": 3.0, "ci": 1.0}
+
+
+class TestScheduling:
+    """Test plan priorities and schedule predictions."""
+
+    def test_plan_dependencies_are_restricted_to_plan(self):
+        """Dependencies outside the plan are ignored."""
+        dependencies = get_plan_dependencies(SCRIPTS, ["a", "b"])
+        assert dependencies == {"a": [], "b": ["a"]}
+
+    def test_estimate_plan_durations_default(self):
+        """Scripts without history get the median of known durations."""
+        assert estimate_plan_durations(["a", "b"], {}) == {"a": DEFAULT_SCRIPT_DURATION, "b": DEFAULT_SCRIPT_DURATION}
+        assert estimate_plan_durations(["a", "b", "c", "d"], {"a": 1.0, "b": 2.0, "c": 9.0}) == {
+            "a": 1.0,
+            "b": 2.0,
+            "c": 9.0,
+            "d": 2.0,
+        }
+
+    def test_priorities_and_critical_path(self):
+        """Priority is the longest remaining path through a script."""
+        dependencies = get_plan_dependencies(SCRIPTS, PLAN)
+        priorities = compute_priorities(PLAN, dependencies, DURATIONS)
+
+        assert priorities == {"a": 6.0, "b": 5.0, "c": 3.0, "d": 4.0, "ci": 1.0}
+        assert find_critical_path(PLAN, dependencies, DURATIONS) == ["a", "b", "ci"]
+
+    def test_ready_queue_orders_by_priority(self):
+        """Ready scripts come out longest-path first and dependents wait."""
+        dependencies = get_plan_dependencies(SCRIPTS, PLAN)
+        queue = ReadyQueue(PLAN, dependencies, compute_priorities(PLAN, dependencies, DURATIONS))
+
+        assert [queue.pop(), queue.pop(), queue.pop()] == ["a", "d", "c"]
+        assert queue.pop() is None
+
+        queue.complete("a")
+        assert queue.pop() == "b"
+
+    def test_makespan(self):
+        """Critical-path order finishes the plan as early as possible."""
+        dependencies = get_plan_dependencies(SCRIPTS, PLAN)
+
+        assert estimate_makespan(PLAN, dependencies, DURATIONS, jobs=1) == 11.0
+        # a+b on one worker while d and c share the other, then ci
+        assert estimate_makespan(PLAN, dependencies, DURATIONS, jobs=2) == 6.0
+        assert simulate_schedule(PLAN, dependencies, DURATIONS, jobs=2)["ci"] == (5.0, 6.0)
@@ -5,10 +5,12 @@ Tests for script configuration loading and validation.
 from typing import Any, Dict
 
 from ginx.config.scripts import (
+    find_affected_scripts,
     get_reserved_commands,
     is_script_name_reserved,
     list_conflicting_scripts,
     load_scripts,
+    match_script_inputs,
     validate_script_config,
 )
 
@@ -115,3 +117,67 @@ class TestScriptConfiguration:
         load_scripts(sample_config, show_warnings=False)
         captured = capsys.readouterr()
         assert "conflicts with built-in command" not in captured.out
+
+
+class TestScriptInputs:
+    """Test input declarations and change impact analysis."""
+
+    def test_validate_script_config_single_input_string(self):
+        """Test converting a single input pattern to a list."""
+        result = validate_script_config("docs", {"command": "mkdocs build", "inputs": "docs/**"})
+        assert result is not None
+        assert result["inputs"] == ["docs/**"]
+
+    def test_match_script_inputs_globs(self):
+        """Test glob matching rules for input patterns."""
+        script = {"command": "pytest", "inputs": ["src/**/*.py", "setup.cfg", "docs"]}
+
+        assert match_script_inputs(script, ["src/ginx/cli/app.py"])
+        assert match_script_inputs(script, ["src/app.py"])
+        assert match_script_inputs(script, ["setup.cfg"])
+        assert match_script_inputs(script, ["docs/index.md"])
+        assert not match_script_inputs(script, ["src/app.txt"])
+        assert not match_script_inputs(script, ["docs-old/index.md"])
+
+    def test_single_star_stays_in_directory(self):
+        """Test that '*' does not cross directory boundaries."""
+        script = {"command": "pytest", "inputs": ["tests/*.py"]}
+
+        assert match_script_inputs(script, ["tests/test_a.py"])
+        assert not match_script_inputs(script, ["tests/unit/test_a.py"])
+
+    def test_character_classes(self):
+        """Test that '[...]' classes match one character within a segment."""
+        script = {"command": "pytest", "inputs": ["src/file[12].py", "tests/test_[!x]*.py"]}
+
+        assert match_script_inputs(script, ["src/file1.py"])
+        assert match_script_inputs(script, ["src/file2.py"])
+        assert not match_script_inputs(script, ["src/file3.py"])
+        assert not match_script_inputs(script, ["src/file[12].py"])
+        assert match_script_inputs(script, ["tests/test_a.py"])
+        assert not match_script_inputs(script, ["tests/test_x.py"])
+        # An unclosed bracket is matched literally
+        assert match_script_inputs({"command": "pytest", "inputs": ["a[b*"]}, ["a[bc"])
+
+    def test_find_affected_scripts_propagates_to_dependents(self):
+        """Test that dependents of an affected script are re-run."""
+        scripts: Dict[str, Any] = {
+            "build": {"command": "make", "depends": [], "inputs": ["src/**"]},
+            "docs": {"command": "mkdocs build", "depends": [], "inputs": ["docs/**"]},
+            "test": {"command": "pytest", "depends": ["build"], "inputs": ["tests/**"]},
+        }
+        plan = ["build", "docs", "test"]
+
+        assert find_affected_scripts(scripts, plan, ["src/main.c"]) == ["build", "test"]
+        assert find_affected_scripts(scripts, plan, ["tests/test_x.py"]) == ["test"]
+        assert find_affected_scripts(scripts, plan, ["README.md"]) == []
+
+    def test_find_affected_scripts_without_inputs(self):
+        """Test that any change affects the whole plan when no inputs are declared."""
+        scripts: Dict[str, Any] = {
+            "lint": {"command": "flake8", "depends": []},
+            "test": {"command": "pytest", "depends": ["lint"]},
+        }
+
+        assert find_affected_scripts(scripts, ["lint", "test"], ["anything.txt"]) == ["lint", "test"]
+        assert find_affected_scripts(scripts, ["lint", "test"], []) == []
@@ -0,0 +1,188 @@
+"""
+Tests for the daemon protocol, socket location and forwarding.
+"""
+
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Set
+
+import pytest
+
+from ginx.daemon import TIMINGS_ENV_VAR, ensure_socket_dir, get_socket_dir, get_socket_path, is_private
+from ginx.daemon.client import _connect, daemon_request, forward_to_daemon
+from ginx.daemon.protocol import get_peer_uid, recv_message, send_message
+from ginx.plugins.timings import TIMINGS_ENV_VAR as PLUGIN_TIMINGS_ENV_VAR
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+@pytest.fixture
+def runtime_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "runtime"
+    directory.mkdir(mode=0o700)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(directory))
+    return directory
+
+
+class TestProtocol:
+    """Test message framing and file descriptor passing."""
+
+    def test_fds_round_trip(self):
+        """File descriptors sent with a message can be used by the receiver."""
+        left, right = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        read_fd, write_fd = os.pipe()
+        try:
+            send_message(left, {"command": "run", "argv": ["build"]}, fds=[write_fd])
+            send_message(left, {"second": True})
+
+            message, fds = recv_message(right)
+            assert message == {"command": "run", "argv": ["build"]}
+            assert len(fds) == 1
+            os.write(fds[0], b"through the socket")
+            os.close(fds[0])
+            assert os.read(read_fd, 100) == b"through the socket"
+
+            # Messages are not merged, and later ones carry no fds
+            assert recv_message(right) == ({"second": True}, [])
+            left.close()
+            assert recv_message(right) == (None, [])
+        finally:
+            for fd in (read_fd, write_fd):
+                os.close(fd)
+            left.close()
+            right.close()
+
+    def test_peer_uid(self):
+        """The peer of a socket pair is this user."""
+        left, right = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        with left, right:
+            assert get_peer_uid(left) in (None, os.getuid())
+
+
+class TestSocketLocation:
+    """Test where sockets live and when they are trusted."""
+
+    def test_private_dir_without_runtime_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Without $XDG_RUNTIME_DIR, sockets go into a 0700 per-user directory."""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+
+        socket_dir = ensure_socket_dir()
+        assert socket_dir == get_socket_dir() == str(tmp_path / f"ginx-{os.getuid()}")
+        assert stat.S_IMODE(os.lstat(socket_dir).st_mode) == 0o700
+        assert os.path.dirname(get_socket_path(str(tmp_path))) == socket_dir
+
+        os.chmod(socket_dir, 0o777)
+        assert not is_private(socket_dir)
+        with pytest.raises(PermissionError):
+            ensure_socket_dir()
+
+    def test_client_skips_shared_sockets(self, runtime_dir: Path, tmp_path: Path):
+        """Sockets in directories others can write to are not connected to."""
+        socket_path = get_socket_path(str(tmp_path))
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with listener:
+            listener.bind(socket_path)
+            listener.listen(1)
+
+            os.chmod(runtime_dir, 0o777)
+            assert _connect(str(tmp_path)) is None
+
+            os.chmod(runtime_dir, 0o700)
+            os.chmod(socket_path, 0o666)
+            assert _connect(str(tmp_path)) is None
+
+            os.chmod(socket_path, 0o600)
+            sock = _connect(str(tmp_path))
+            assert sock is not None
+            sock.close()
+
+
+class TestForwarding:
+    """Test running commands through a daemon."""
+
+    @pytest.fixture
+    def daemon(self, runtime_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+        project = tmp_path / "project"
+        project.mkdir()
+        command = f"{sys.executable} -c 'import sys; sys.exit(3)'"
+        (project / "ginx.yaml").write_text(
+            "settings:\n  executors:\n    warm:\n      type: pool\n      size: 1\n"
+            f"scripts:\n  fail:\n    command: \"{command}\"\n  pooled:\n    command: \"echo pooled\"\n    executor: warm\n"
+        )
+        monkeypatch.chdir(project)
+        monkeypatch.delenv("GINX_NO_DAEMON", raising=False)
+        # Forwarded requests carry this environment to the daemon's workers
+        monkeypatch.setenv("PYTHONPATH", str(SRC_DIR))
+
+        process = subprocess.Popen([sys.executable, "-m", "ginx.daemon.server", str(project)])
+        try:
+            deadline = time.time() + 20
+            while daemon_request(str(project), "ping") is None:
+                assert process.poll() is None and time.time() < deadline, "daemon did not start"
+                time.sleep(0.05)
+            yield project
+        finally:
+            daemon_request(str(project), "stop")
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def test_exit_code_of_forked_worker(self, daemon: Path):
+        """A forwarded command runs in a forked worker and its exit code is returned."""
+        assert forward_to_daemon(["run", "fail"]) == 3
+        assert daemon_request(str(daemon), "ping")["requests_served"] == 1
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+    def test_pool_workers_stop_with_the_forked_worker(self, daemon: Path):
+        """Forked workers exit with os._exit(), which skips atexit, but still stop their pool."""
+        before = _pool_workers()
+        assert forward_to_daemon(["run", "pooled"]) == 0
+        deadline = time.time() + 5
+        while _pool_workers() - before and time.time() < deadline:
+            time.sleep(0.05)
+        assert not _pool_workers() - before
+
+    def test_restart_when_plugins_change(self, daemon: Path):
+        """Changed plugins make the daemon restart instead of serving stale commands."""
+        assert forward_to_daemon(["run", "fail"]) == 3
+        (daemon / "ginx_plugins").mkdir()
+        (daemon / "ginx_plugins" / "extra.py").write_text("", encoding="utf-8")
+
+        # The request that notices runs locally while the daemon restarts
+        assert forward_to_daemon(["run", "fail"]) is None
+        deadline = time.time() + 20
+        while (daemon_request(str(daemon), "ping") or {}).get("requests_served") != 0:
+            assert time.time() < deadline, "daemon did not restart"
+            time.sleep(0.05)
+        assert forward_to_daemon(["run", "fail"]) == 3
+
+    def test_local_only_commands_are_not_forwarded(self, daemon: Path):
+        """Commands that must run in the calling process are never forwarded."""
+        assert forward_to_daemon(["daemon", "status"]) is None
+
+    def test_plugin_timings_run_locally(self, daemon: Path, monkeypatch: pytest.MonkeyPatch):
+        """Plugin timings need a fresh process, so they are never forwarded."""
+        assert TIMINGS_ENV_VAR == PLUGIN_TIMINGS_ENV_VAR
+        monkeypatch.setenv(TIMINGS_ENV_VAR, str(daemon / "timings.json"))
+        assert forward_to_daemon(["run", "fail"]) is None
+        assert daemon_request(str(daemon), "ping")["requests_served"] == 0
+
+
+def _pool_workers() -> Set[int]:
+    pids: Set[int] = set()
+    for entry in os.listdir("/proc"):
+        try:
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                if b"ginx.executors.worker" in f.read():
+                    pids.add(int(entry))
+        except (OSError, ValueError):
+            continue
+    return pids
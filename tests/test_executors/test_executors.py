@@ -0,0 +1,238 @@
+"""
+Tests for executor backends, using a worker on localhost.
+"""
+
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+import typer
+
+from ginx.cli.execution import execute_script_logic
+from ginx.daemon.protocol import recv_message, send_message
+from ginx.executors import ExecutorError, LocalExecutor, PoolExecutor, RemoteExecutor, WorkerServer, get_executor, register_executor
+from ginx.executors.remote import parse_address
+
+
+@pytest.fixture
+def worker() -> Iterator[WorkerServer]:
+    server = WorkerServer("secret")
+    server.start()
+    yield server
+    server.shutdown()
+
+
+def run(executor: Any, command: Any, shell: bool = False) -> Dict[str, Any]:
+    lines: List[str] = []
+    stats: Dict[str, Any] = {}
+    code = executor.run(command, shell, None, {"GREETING": "hello"}, lines.append, stats)
+    return {"code": code, "lines": lines, "stats": stats}
+
+
+class TestRemoteExecutor:
+    """Test running commands on a worker."""
+
+    def test_output_and_exit_code(self, worker: WorkerServer):
+        """Output is streamed back and connections are reused."""
+        executor = RemoteExecutor(worker.address, "secret")
+
+        first = run(executor, [sys.executable, "-c", "import os; print(os.environ['GREETING']); print('done')"])
+        second = run(executor, "echo again && exit 3", shell=True)
+
+        assert first["code"] == 0 and first["lines"] == ["hello", "done"]
+        assert "cpu_time" in first["stats"]
+        assert second["code"] == 3 and second["lines"] == ["again"]
+        assert len(executor._idle) == 1
+        executor.close()
+
+    def test_many_lines_are_batched(self, worker: WorkerServer):
+        """Every line arrives, in order."""
+        executor = RemoteExecutor(worker.address, "secret")
+        result = run(executor, [sys.executable, "-c", "for i in range(500): print(i)"])
+        assert result["lines"] == [str(i) for i in range(500)]
+        executor.close()
+
+    def test_closed_idle_connection_is_replaced(self, worker: WorkerServer):
+        """An idle connection the worker closed is swapped for a new one before sending."""
+        executor = RemoteExecutor(worker.address, "secret")
+
+        def exit_and_close(conn: socket.socket, message: Dict[str, Any]) -> bool:
+            send_message(conn, {"type": "exit", "code": 0, "stats": {}})
+            return False
+
+        with patch.object(worker, "_run", side_effect=exit_and_close):
+            assert run(executor, ["true"])["code"] == 0
+        time.sleep(0.2)
+
+        assert run(executor, ["echo", "fresh"])["lines"] == ["fresh"]
+        executor.close()
+
+    def test_accepted_command_is_not_resent(self, worker: WorkerServer):
+        """If the worker goes away after accepting a command, the command is not run again."""
+        executor = RemoteExecutor(worker.address, "secret")
+        assert run(executor, ["true"])["code"] == 0
+        accepted: List[Any] = []
+
+        def accept_and_die(conn: socket.socket, message: Dict[str, Any]) -> bool:
+            accepted.append(message["command"])
+            return False
+
+        with patch.object(worker, "_run", side_effect=accept_and_die):
+            with pytest.raises(ExecutorError, match="closed the connection"):
+                run(executor, ["touch", "marker"])
+        assert accepted == [["touch", "marker"]]
+        executor.close()
+
+    def test_wrong_token(self, worker: WorkerServer):
+        """Requests with a wrong token are refused."""
+        executor = RemoteExecutor(worker.address, "wrong")
+        with pytest.raises(ExecutorError, match="authentication failed"):
+            run(executor, ["true"])
+
+    def test_unreachable_worker(self, worker: WorkerServer):
+        """A worker that is not listening is an executor error, not an exit code."""
+        address = worker.address
+        worker.shutdown()
+        with pytest.raises(ExecutorError, match="Cannot connect"):
+            run(RemoteExecutor(address, "secret"), ["true"])
+
+    def test_worker_requires_token(self):
+        """Workers never run unauthenticated."""
+        with pytest.raises(ValueError):
+            WorkerServer("")
+
+    def test_token_is_never_sent(self, worker: WorkerServer):
+        """Only proofs of the token go over the wire."""
+        sent: List[bytes] = []
+        original = socket.socket.sendall
+
+        def record(sock: socket.socket, data: bytes, *args: Any) -> None:
+            sent.append(bytes(data))
+            original(sock, data, *args)
+
+        with patch.object(socket.socket, "sendall", record):
+            assert run(RemoteExecutor(worker.address, "secret"), ["true"])["code"] == 0
+        assert sent and not any(b"secret" in data for data in sent)
+
+    def test_impostor_worker(self):
+        """Workers that cannot prove they hold the token get no requests."""
+        listener = socket.create_server(("127.0.0.1", 0))
+        received: List[Any] = []
+
+        def serve() -> None:
+            conn, _ = listener.accept()
+            with conn:
+                send_message(conn, {"type": "challenge", "nonce": "abc"})
+                received.append(recv_message(conn)[0])
+                send_message(conn, {"type": "ready", "mac": "forged"})
+                received.append(recv_message(conn)[0])
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        host, port = listener.getsockname()
+        with pytest.raises(ExecutorError, match="could not prove"):
+            run(RemoteExecutor(f"{host}:{port}", "secret"), ["true"])
+        thread.join()
+        listener.close()
+        assert received[0]["type"] == "auth"
+        assert received[1] is None
+
+    def test_oversized_frame_before_handshake(self, worker: WorkerServer):
+        """Unauthenticated peers cannot make the worker read large frames."""
+        host, port = parse_address(worker.address)
+        with socket.create_connection((host, port)) as sock:
+            assert recv_message(sock)[0]["type"] == "challenge"
+            sock.sendall(struct.pack("!I", 1 << 30))
+            assert sock.recv(1) == b""
+
+
+class TestPoolExecutor:
+    """Test the pool of warm local workers."""
+
+    def test_runs_on_started_worker(self):
+        """Workers are started on first use and stopped on close."""
+        executor = PoolExecutor(size=2)
+        try:
+            assert run(executor, "echo pooled", shell=True)["lines"] == ["pooled"]
+            assert run(executor, ["false"])["code"] == 1
+            # Sequential runs reuse the first worker
+            assert len(executor._workers) == 1
+            process = executor._workers[0].process
+        finally:
+            executor.close()
+        assert executor._workers == []
+        assert process.poll() is not None
+
+    def test_concurrent_runs_use_separate_workers(self):
+        """Up to size commands run at once, each on its own worker process."""
+        executor = PoolExecutor(size=2)
+        code = "import os, time; time.sleep(0.3); print(os.getppid())"
+        results: List[Dict[str, Any]] = []
+        try:
+            threads = [threading.Thread(target=lambda: results.append(run(executor, [sys.executable, "-c", code]))) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            worker_pids = {worker.process.pid for worker in executor._workers}
+            assert len(worker_pids) == 2
+            assert {int(result["lines"][0]) for result in results} == worker_pids
+        finally:
+            executor.close()
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/cmdline"), reason="needs /proc")
+    def test_token_not_in_command_line(self):
+        """Other users can read command lines, so the token goes through the environment."""
+        executor = PoolExecutor(size=1)
+        try:
+            run(executor, ["true"])
+            worker = executor._workers[0]
+            with open(f"/proc/{worker.process.pid}/cmdline", "rb") as f:
+                command_line = f.read()
+            assert b"ginx.executors.worker" in command_line
+            assert worker.executor._token.encode() not in command_line
+        finally:
+            executor.close()
+
+
+class TestExecutorSelection:
+    """Test scripts selecting executors."""
+
+    def test_configured_executor(self, worker: WorkerServer):
+        """Executors are created from settings.executors."""
+        with patch("ginx.executors.get_setting", return_value={"box": {"type": "remote", "address": worker.address, "token": "secret"}}):
+            executor = get_executor("box")
+        assert isinstance(executor, RemoteExecutor)
+        assert get_executor("local").__class__ is LocalExecutor
+
+        with patch("ginx.executors.get_setting", return_value={}):
+            with pytest.raises(ExecutorError, match="Unknown executor 'nope'"):
+                get_executor("nope")
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_script_runs_on_its_executor(self, mock_get_scripts: MagicMock, worker: WorkerServer, capsys: Any):
+        """Scripts with 'executor' run there, and show its output."""
+        mock_get_scripts.return_value = {"build": {"command": "echo remote build", "description": "Build", "depends": [], "executor": "test-box"}}
+        register_executor("test-box", RemoteExecutor(worker.address, "secret"))
+
+        with patch("ginx.cli.execution.run_command_with_streaming") as mock_local:
+            execute_script_logic("build", {}, "", True, False, False)
+
+        mock_local.assert_not_called()
+        assert "remote build" in capsys.readouterr().out
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_unknown_executor_fails(self, mock_get_scripts: MagicMock):
+        """Selecting an executor that does not exist fails the script."""
+        mock_get_scripts.return_value = {"build": {"command": "echo hi", "description": "Build", "depends": [], "executor": "missing"}}
+
+        with pytest.raises(typer.Exit) as exc_info:
+            execute_script_logic("build", {}, "", True, False, False)
+        assert exc_info.value.exit_code == 1
@@ -0,0 +1,109 @@
+"""
+Tests for the run history store.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from ginx.cli.execution import execute_script_logic
+from ginx.history import RunStore, get_run_store, median
+
+
+class TestRunStore:
+    """Test recording and querying script runs."""
+
+    def test_record_is_buffered_until_flush(self, temp_dir: Path):
+        """Records are only written on flush."""
+        store = RunStore(temp_dir / "history.db")
+        store.record("plan1", "test", "lint", started_at=100.0, wall_time=1.5, exit_code=0)
+
+        assert store.query_runs() == []
+        assert store.flush() == 1
+
+        runs = store.query_runs()
+        assert len(runs) == 1
+        assert runs[0]["script"] == "lint"
+        assert runs[0]["ended_at"] == 101.5
+        assert runs[0]["cache_hit"] == 0
+
+    def test_query_runs_filters(self, temp_dir: Path):
+        """Runs can be filtered by script and exit code."""
+        store = RunStore(temp_dir / "history.db")
+        store.record("plan1", "test", "lint", started_at=1.0, wall_time=1.0, exit_code=0)
+        store.record("plan1", "test", "test", started_at=2.0, wall_time=2.0, exit_code=1)
+        store.record("plan2", "test", "test", started_at=3.0, wall_time=3.0, exit_code=0)
+        store.flush()
+
+        assert [run["started_at"] for run in store.query_runs("test")] == [3.0, 2.0]
+        assert [run["plan_id"] for run in store.query_runs(failed_only=True)] == ["plan1"]
+        assert len(store.query_runs(limit=1)) == 1
+
+    def test_durations_and_summary(self, temp_dir: Path):
+        """Durations are grouped per script and summarized with medians."""
+        store = RunStore(temp_dir / "history.db")
+        for i, wall_time in enumerate([1.0, 5.0, 3.0]):
+            store.record("plan", "test", "test", started_at=float(i), wall_time=wall_time, exit_code=0)
+        store.record("plan", "test", "test", started_at=10.0, wall_time=99.0, exit_code=2)
+        store.flush()
+
+        assert store.get_durations(["test"]) == {"test": [3.0, 5.0, 1.0]}
+
+        (summary,) = store.summarize("test")
+        assert summary["runs"] == 4
+        assert summary["failures"] == 1
+        assert summary["max_wall_time"] == 99.0
+
+    def test_clear(self, temp_dir: Path):
+        """Clearing removes written and pending records."""
+        store = RunStore(temp_dir / "history.db")
+        store.record("plan", "test", "test", started_at=1.0, wall_time=1.0, exit_code=0)
+        store.flush()
+        store.record("plan", "test", "test", started_at=2.0, wall_time=1.0, exit_code=0)
+        store.clear()
+
+        assert store.flush() == 0
+        assert store.query_runs() == []
+
+    def test_median(self):
+        """Test median helper."""
+        assert median([]) is None
+        assert median([3.0, 1.0, 2.0]) == 2.0
+        assert median([4.0, 1.0, 2.0, 3.0]) == 2.5
+
+
+class TestExecutionRecording:
+    """Test that executed scripts end up in the history."""
+
+    @patch("ginx.cli.execution.get_setting", return_value=True)
+    @patch("ginx.cli.execution.get_scripts")
+    def test_plan_is_recorded(self, mock_get_scripts: MagicMock, _mock_setting: MagicMock):
+        """Each script of a plan is recorded under the same plan id."""
+        mock_get_scripts.return_value = {
+            "build": {"command": "true", "description": "Build", "depends": []},
+            "test": {"command": "true", "description": "Test", "depends": ["build"]},
+        }
+
+        execute_script_logic("test", {}, "", True, False, False)
+
+        runs = get_run_store().query_runs()
+        assert sorted(run["script"] for run in runs) == ["build", "test"]
+        assert len({run["plan_id"] for run in runs}) == 1
+        assert all(run["target"] == "test" and run["exit_code"] == 0 for run in runs)
+        assert all(run["cpu_time"] is not None for run in runs)
+
+
+class TestItemDurations:
+    """Test per-item duration tracking."""
+
+    def test_item_durations_are_smoothed(self, temp_dir: Path):
+        """New samples move the stored estimate towards them."""
+        store = RunStore(temp_dir / "history.db")
+        store.record_item_durations("test", {"a.py": 10.0, "b.py": 1.0}, recorded_at=1.0)
+        store.flush()
+        store.record_item_durations("test", {"a.py": 20.0}, recorded_at=2.0)
+        store.flush()
+
+        durations = store.get_item_durations("test")
+        assert durations["b.py"] == 1.0
+        assert 10.0 < durations["a.py"] < 20.0
+        assert store.get_item_durations("other") == {}
@@ -0,0 +1,112 @@
+"""
+Tests for the Prometheus textfile exporter.
+"""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import typer
+
+from ginx.cli.execution import execute_script_logic
+from ginx.metrics import TextfileExporter, parse_samples
+from ginx.metrics.textfile import EVENT_TYPES, format_labels
+from ginx.plugins.events import PLAN_RESOLVED, SCRIPT_FINISHED, SCRIPT_QUEUED, SCRIPT_STARTED, Event, EventBus
+
+
+def run_events(target: str, start: float, *scripts: Any) -> list:
+    """Events of a sequential run of (script, duration, exit code) tuples."""
+    events = [Event(PLAN_RESOLVED, start, "", {"target": target})]
+    now = start
+    for script, duration, exit_code in scripts:
+        events.append(Event(SCRIPT_QUEUED, now, script, {}))
+        events.append(Event(SCRIPT_STARTED, now + 0.5, script, {}))
+        now += 0.5 + duration
+        events.append(Event(SCRIPT_FINISHED, now, script, {"exit_code": exit_code, "duration": duration}))
+    return events
+
+
+class TestTextfileExporter:
+    """Test the metrics written after each run."""
+
+    def test_counters_accumulate_across_runs(self, tmp_path: Path):
+        """Counters and histograms add up, gauges describe the last run."""
+        path = tmp_path / "ginx.prom"
+
+        exporter = TextfileExporter(str(path))
+        exporter.handle_events(run_events("ci", 1000.0, ("lint", 2.0, 0), ("test", 20.0, 0)))
+        exporter.finish_run(ended_at=1023.5)
+
+        # A new process only has the file to go on
+        exporter = TextfileExporter(str(path))
+        exporter.handle_events(run_events("ci", 2000.0, ("lint", 0.3, 0), ("test", 4.0, 1)))
+        exporter.finish_run(ended_at=2005.8)
+
+        samples = parse_samples(path.read_text())
+        lint, test = format_labels(script="lint"), format_labels(script="test")
+        assert samples[("ginx_script_duration_seconds_count", lint)] == 2
+        assert samples[("ginx_script_duration_seconds_sum", lint)] == pytest.approx(2.3)
+        assert samples[("ginx_script_duration_seconds_bucket", format_labels(script="lint", le="0.5"))] == 1
+        assert samples[("ginx_script_duration_seconds_bucket", format_labels(script="lint", le="0.1"))] == 0
+        assert samples[("ginx_script_duration_seconds_bucket", format_labels(script="lint", le="+Inf"))] == 2
+        assert samples[("ginx_script_runs_total", format_labels(script="test", exit_code="1"))] == 1
+        assert samples[("ginx_script_runs_total", format_labels(script="test", exit_code="0"))] == 1
+        assert samples[("ginx_script_queue_wait_seconds_sum", test)] == pytest.approx(1.0)
+        # Nothing reuses results yet, so there are no cache metrics to report
+        assert not any(name.startswith("ginx_script_cache") for name, _ in samples)
+        assert samples[("ginx_runs_total", format_labels(target="ci", status="success"))] == 1
+        assert samples[("ginx_runs_total", format_labels(target="ci", status="failure"))] == 1
+        # Each run waits 0.5 s before each script and ends 0.5 s after the last one
+        assert samples[("ginx_idle_seconds_total", format_labels(target="ci"))] == pytest.approx(3.0)
+        assert samples[("ginx_last_run_idle_seconds", format_labels(target="ci"))] == pytest.approx(1.5)
+        assert samples[("ginx_last_run_timestamp_seconds", format_labels(target="ci"))] == 2005.8
+
+    def test_file_format(self, tmp_path: Path):
+        """Families are typed, labels escaped and no temporary files are left."""
+        path = tmp_path / "ginx.prom"
+        exporter = TextfileExporter(str(path))
+        exporter.handle_events(run_events('say "hi"', 0.0, ('say "hi"', 1.0, 0)))
+        exporter.finish_run(ended_at=2.0)
+
+        text = path.read_text()
+        assert "# TYPE ginx_script_duration_seconds histogram\n" in text
+        assert "# TYPE ginx_runs_total counter\n" in text
+        assert 'ginx_script_runs_total{script="say \\"hi\\"",exit_code="0"} 1\n' in text
+        assert sorted(p.name for p in tmp_path.iterdir() if p.suffix != ".lock") == ["ginx.prom"]
+
+    def test_runs_without_scripts_are_skipped(self, tmp_path: Path):
+        """Nothing is written when no script finished."""
+        path = tmp_path / "ginx.prom"
+        exporter = TextfileExporter(str(path))
+        exporter.handle_events([Event(PLAN_RESOLVED, 0.0, "", {"target": "ci"})])
+        exporter.finish_run()
+        assert not path.exists()
+
+
+class TestRunMetrics:
+    """Test metrics written by the execution engine."""
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_metrics_after_failed_run(self, mock_get_scripts: MagicMock, tmp_path: Path):
+        """Metrics are written after every run, including failed ones."""
+        mock_get_scripts.return_value = {
+            "lint": {"command": "echo lint", "description": "Lint", "depends": []},
+            "ci": {"command": "false", "description": "CI", "depends": ["lint"]},
+        }
+        bus = EventBus()
+        exporter = TextfileExporter(str(tmp_path / "ginx.prom"))
+        bus.subscribe(exporter.handle_events, EVENT_TYPES)
+
+        with patch("ginx.cli.execution.get_event_bus", return_value=bus), patch("ginx.cli.execution.get_metrics_exporter", return_value=exporter):
+            with pytest.raises(typer.Exit):
+                execute_script_logic("ci", {}, "", True, False, False)
+
+        samples = parse_samples((tmp_path / "ginx.prom").read_text())
+        assert samples[("ginx_script_runs_total", format_labels(script="lint", exit_code="0"))] == 1
+        assert samples[("ginx_script_runs_total", format_labels(script="ci", exit_code="1"))] == 1
+        assert samples[("ginx_runs_total", format_labels(target="ci", status="failure"))] == 1
+        # Every phase of ginx's own time is exported, even when it took no time
+        assert samples[("ginx_self_seconds_total", format_labels(target="ci", phase="spawn"))] > 0
+        assert ("ginx_self_seconds_total", format_labels(target="ci", phase="import")) in samples
+        bus.close()
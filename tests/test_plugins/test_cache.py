@@ -0,0 +1,94 @@
+"""
+Tests for the on-disk PyPI metadata cache.
+"""
+
+import time
+from pathlib import Path
+
+from ginx.plugins.version_sync.cache import MetadataCache, trim_package_info
+from ginx.plugins.version_sync.pypi_utils import PyPIClient
+from tests.fixtures.pypi_server import FakePyPIServer
+
+
+def _client(server: FakePyPIServer, **kwargs) -> PyPIClient:
+    return PyPIClient(base_url=f"{server.url}/pypi", cache=MetadataCache(), **kwargs)
+
+
+class TestTrimPackageInfo:
+    """Test reducing PyPI documents to the used fields."""
+
+    def test_trim(self):
+        """Only the used fields survive, releases are summarized."""
+        document = {
+            "info": {"name": "demo", "version": "2.0", "summary": "Demo", "description": "x" * 1000, "classifiers": ["A"]},
+            "releases": {
+                "1.0": [
+                    {"url": "https://example/a.whl", "yanked": True, "requires_python": ">=3.7"},
+                    {"url": "https://example/a.tar.gz", "yanked": True, "requires_python": ">=3.7"},
+                ],
+                "2.0": [{"url": "https://example/b.whl", "yanked": False, "requires_python": ">=3.8"}],
+                "3.0": [],
+            },
+        }
+
+        trimmed = trim_package_info(document)
+
+        assert trimmed["info"] == {"name": "demo", "version": "2.0", "summary": "Demo", "requires_python": None, "yanked": None}
+        assert trimmed["releases"] == {
+            "1.0": [{"yanked": True, "requires_python": ">=3.7"}],
+            "2.0": [{"yanked": False, "requires_python": ">=3.8"}],
+            "3.0": [],
+        }
+
+
+class TestMetadataCache:
+    """Test cached lookups through the PyPI client."""
+
+    def test_fresh_entry_skips_network(self, pypi_server: FakePyPIServer, isolated_cache: Path):
+        """A second lookup within the TTL is answered from disk."""
+        assert _client(pypi_server).get_latest_version("rich") == "13.7.0"
+        assert _client(pypi_server).get_latest_version("Rich") == "13.7.0"
+
+        assert len(pypi_server.requests) == 1
+        assert list(isolated_cache.glob("pypi/*/rich.json"))
+
+    def test_stale_entry_is_revalidated(self, pypi_server: FakePyPIServer):
+        """Expired entries are revalidated with If-None-Match and refreshed on 304."""
+        client = _client(pypi_server)
+        client.get_package_info("click")
+        client.cache.ttl = 0  # type: ignore[union-attr]
+
+        assert client.get_latest_version("click") == "8.1.7"
+        assert pypi_server.not_modified == 1
+
+        entry = client.cache.get(client.base_url, "click")  # type: ignore[union-attr]
+        assert entry is not None and time.time() - entry["fetched_at"] < 5
+
+    def test_changed_package_is_downloaded(self, pypi_server: FakePyPIServer):
+        """A new release invalidates the validator."""
+        client = _client(pypi_server)
+        client.get_package_info("typer")
+        client.cache.ttl = 0  # type: ignore[union-attr]
+        pypi_server.packages["typer"].append("0.10.0")
+
+        assert client.get_latest_version("typer") == "0.10.0"
+        assert pypi_server.not_modified == 0
+
+    def test_offline(self, pypi_server: FakePyPIServer):
+        """Offline lookups only use the cache, however old."""
+        _client(pypi_server).get_package_info("requests")
+        client = _client(pypi_server, offline=True)
+        client.cache.ttl = 0  # type: ignore[union-attr]
+
+        assert client.get_latest_version("requests") == "2.31.0"
+        assert client.get_package_info("click") is None
+        assert len(pypi_server.requests) == 1
+
+    def test_stale_entry_served_on_error(self, pypi_server: FakePyPIServer):
+        """An unreachable index falls back to the stale entry."""
+        client = _client(pypi_server)
+        client.get_package_info("rich")
+        client.cache.ttl = 0  # type: ignore[union-attr]
+        pypi_server.stop()
+
+        assert client.get_latest_version("rich") == "13.7.0"
@@ -0,0 +1,99 @@
+"""
+Tests for the reverse-dependency index.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from ginx.plugins.version_sync import dependency_index
+from ginx.plugins.version_sync.commands import SyncVersionsCommand, WhyCommand
+from ginx.plugins.version_sync.dependency_index import get_dependency_index
+from tests.fixtures.site_packages import install_distribution
+
+
+@pytest.fixture
+def environment(site_packages: Path) -> Path:
+    """A few interdependent distributions."""
+    install_distribution(site_packages, "requests", "2.31.0", ["urllib3<3,>=1.21.1", "idna>=2.5"])
+    install_distribution(site_packages, "urllib3", "2.2.1")
+    install_distribution(site_packages, "idna", "3.6")
+    install_distribution(site_packages, "botocore", "1.34.0", ["urllib3<2.1,>=1.25.4", 'pywin32; sys_platform == "nonexistent"'])
+    install_distribution(site_packages, "httpx", "0.27.0", ["idna", 'brotli; extra == "brotli"', 'urllib3<1; extra == "legacy"'])
+    return site_packages
+
+
+class TestDependencyIndex:
+    """Test building and querying the index."""
+
+    def test_dependents(self, environment: Path):
+        """Dependents are found, extras and foreign platforms are ignored."""
+        index = get_dependency_index()
+
+        assert index.get_dependents("URLLib3") == [
+            {"package": "botocore", "version": "1.34.0", "specifier": "<2.1,>=1.25.4"},
+            {"package": "requests", "version": "2.31.0", "specifier": "<3,>=1.21.1"},
+        ]
+        assert [dependent["package"] for dependent in index.get_dependents("idna")] == ["httpx", "requests"]
+        assert index.get_dependents("brotli") == []
+        assert index.get_dependents("pywin32") == []
+
+    def test_conflicts(self, environment: Path):
+        """Targets excluded by a dependent's specifier are flagged."""
+        index = get_dependency_index()
+        updates = [
+            {"package": "urllib3", "current": "2.2.1", "target": "3.0.0"},
+            {"package": "idna", "current": "3.6", "target": "3.7"},
+            {"package": "botocore", "current": "1.34.0", "target": "1.35.0"},
+        ]
+
+        conflicts = index.find_conflicts(updates)
+
+        assert [(c["dependent"], c["specifier"], c["dependent_updated"]) for c in conflicts] == [
+            ("botocore", "<2.1,>=1.25.4", True),
+            ("requests", "<3,>=1.21.1", False),
+        ]
+
+    def test_cached_per_environment(self, environment: Path, isolated_cache: Path):
+        """The index is parsed once per environment state and stored on disk."""
+        first = get_dependency_index()
+        assert get_dependency_index() is first
+        assert len(list((isolated_cache / "deps").glob("*.json"))) == 1
+
+        # A fresh process reads the stored index
+        dependency_index._index_cache = None
+        with pytest.MonkeyPatch.context() as patcher:
+            patcher.setattr(dependency_index, "_read_requirements", MagicMock(side_effect=AssertionError))
+            assert get_dependency_index().get_dependents("idna") == first.get_dependents("idna")
+
+        # Installing a package changes the fingerprint
+        install_distribution(environment, "urllib3-extra", "1.0", ["urllib3>=2"])
+        assert len(get_dependency_index().get_dependents("urllib3")) == 3
+
+
+class TestWhyCommand:
+    """Test 'ginx why' and the sync-versions impact display."""
+
+    def test_why_json(self, environment: Path, capsys: MagicMock):
+        """Dependents report whether they accept the target version."""
+        WhyCommand().execute("urllib3", "2.1.0", json_output=True)
+
+        result = json.loads(capsys.readouterr().out)
+        assert result["installed"] == "2.2.1"
+        assert {dependent["package"]: dependent["satisfied"] for dependent in result["dependents"]} == {
+            "botocore": False,
+            "requests": True,
+        }
+
+    def test_dry_run_impact(self, environment: Path, capsys: MagicMock):
+        """Dry runs list dependents and conflicts."""
+        updates = [{"package": "urllib3", "current": "2.2.1", "target": "3.0.0", "status": "outdated"}]
+
+        SyncVersionsCommand()._display_impact(updates, dry_run=True)
+
+        output = capsys.readouterr().out
+        assert "urllib3: botocore, requests" in output
+        assert "2 specifier conflicts" in output
+        assert "requests 2.31.0 requires urllib3<3,>=1.21.1, target is 3.0.0" in output
@@ -0,0 +1,120 @@
+"""
+Tests for the plugin event bus.
+"""
+
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ginx.cli.execution import execute_script_logic
+from ginx.plugins.events import (
+    EVENT_TYPES,
+    OUTPUT_CHUNK,
+    SCRIPT_FINISHED,
+    SCRIPT_STARTED,
+    Event,
+    EventBus,
+    OutputChunker,
+)
+
+
+class TestEventBus:
+    """Test subscription and batched delivery."""
+
+    def test_size_bounded_batches(self):
+        """Full batches are delivered, the rest on flush."""
+        bus = EventBus()
+        batches: List[List[Event]] = []
+        bus.subscribe(batches.append, [SCRIPT_STARTED], max_batch=2, max_delay=60)
+
+        for name in "abcde":
+            bus.emit(SCRIPT_STARTED, name)
+        bus.flush()
+
+        assert [[event.script for event in batch] for batch in batches] == [["a", "b"], ["c", "d"], ["e"]]
+        bus.close()
+
+    def test_time_bounded_batches(self):
+        """Buffered events are delivered after max_delay without a flush."""
+        bus = EventBus()
+        batches: List[List[Event]] = []
+        bus.subscribe(batches.append, [SCRIPT_STARTED], max_delay=0.05)
+
+        bus.emit(SCRIPT_STARTED, "a", command="true")
+        deadline = time.time() + 5
+        while not batches and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert batches[0][0].data == {"command": "true"}
+        bus.close()
+
+    def test_quiet_output_is_not_held_back(self):
+        """A chunk is emitted after max_delay even if no further line arrives."""
+        bus = EventBus()
+        batches: List[List[Event]] = []
+        bus.subscribe(batches.append, [OUTPUT_CHUNK], max_delay=0.01)
+        chunker = OutputChunker(bus, "serve", max_delay=0.05)
+
+        chunker("listening on :8000")
+        deadline = time.time() + 5
+        while not batches and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert [event.data["lines"] for batch in batches for event in batch] == [["listening on :8000"]]
+        chunker.close()
+        bus.flush()
+        assert len([event for batch in batches for event in batch]) == 1
+        bus.close()
+
+    def test_only_subscribed_types(self):
+        """Unsubscribed types are neither wanted nor delivered."""
+        bus = EventBus()
+        batches: List[List[Event]] = []
+        assert not bus.wants(SCRIPT_STARTED)
+
+        bus.subscribe(batches.append, [SCRIPT_FINISHED])
+        bus.emit(SCRIPT_STARTED, "a")
+        bus.emit(SCRIPT_FINISHED, "a", exit_code=0)
+        bus.flush()
+
+        assert bus.wants(SCRIPT_FINISHED) and not bus.wants(SCRIPT_STARTED)
+        assert [event.type for batch in batches for event in batch] == [SCRIPT_FINISHED]
+        with pytest.raises(ValueError, match="Unknown event types"):
+            bus.subscribe(batches.append, ["nope"])
+        bus.close()
+
+
+class TestExecutionEvents:
+    """Test the events emitted by the execution engine."""
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_plan_events(self, mock_get_scripts: MagicMock):
+        """A run emits plan, queue, start, output and finish events in order."""
+        mock_get_scripts.return_value = {
+            "lint": {"command": "echo linted", "description": "Lint", "depends": []},
+            "ci": {"command": "echo done", "description": "CI", "depends": ["lint"]},
+        }
+        bus = EventBus()
+        events: List[Event] = []
+        bus.subscribe(events.extend, EVENT_TYPES)
+
+        with patch("ginx.cli.execution.get_event_bus", return_value=bus):
+            execute_script_logic("ci", {}, "", True, False, False)
+
+        assert [(event.type, event.script) for event in events] == [
+            ("plan_resolved", ""),
+            ("script_queued", "lint"),
+            ("script_started", "lint"),
+            ("output_chunk", "lint"),
+            ("script_finished", "lint"),
+            ("script_queued", "ci"),
+            ("script_started", "ci"),
+            ("output_chunk", "ci"),
+            ("script_finished", "ci"),
+        ]
+        assert events[0].data["scripts"] == ["lint", "ci"]
+        assert [event.data["lines"] for event in events if event.type == OUTPUT_CHUNK] == [["linted"], ["done"]]
+        assert events[-1].data["exit_code"] == 0
+        bus.close()
@@ -0,0 +1,66 @@
+"""
+Tests for collecting distribution hashes.
+"""
+
+import hashlib
+from pathlib import Path
+
+from ginx.plugins.version_sync.hash_utils import HashCache, collect_hashes, file_sha256
+from ginx.plugins.version_sync.package_utils import create_pinned_requirements
+from ginx.utils.requirements import parse_requirements
+from tests.fixtures.site_packages import install_distribution
+
+
+class TestHashCache:
+    """Test caching file digests."""
+
+    def test_cached_by_size_and_mtime(self, tmp_path: Path):
+        """Digests are reused until the file changes, and persisted."""
+        artifact = tmp_path / "demo-1.0.tar.gz"
+        artifact.write_bytes(b"first")
+        cache = HashCache(tmp_path / "hashes.json")
+
+        assert file_sha256(str(artifact), cache) == hashlib.sha256(b"first").hexdigest()
+        cache.save()
+
+        # Served from the persisted cache while size and mtime are unchanged
+        stat = artifact.stat()
+        reloaded = HashCache(tmp_path / "hashes.json")
+        reloaded.put(str(artifact), stat.st_size, stat.st_mtime_ns, "cached")
+        assert file_sha256(str(artifact), reloaded) == "cached"
+
+        artifact.write_bytes(b"second!")
+        assert file_sha256(str(artifact), reloaded) == hashlib.sha256(b"second!").hexdigest()
+
+
+class TestCollectHashes:
+    """Test finding the archive hashes of pinned packages."""
+
+    def test_direct_url_and_wheelhouse(self, site_packages: Path, tmp_path: Path):
+        """Hashes come from direct_url.json and from wheelhouse files of the pinned version."""
+        vendored_url = {"url": "file:///tmp/vendored.whl", "archive_info": {"hashes": {"sha256": "abc"}}}
+        install_distribution(site_packages, "vendored", "2.0", direct_url=vendored_url)
+        install_distribution(site_packages, "legacy", "1.0", direct_url={"url": "file:///tmp/legacy.whl", "archive_info": {"hash": "sha256=def"}})
+        wheelhouse = tmp_path / "wheelhouse"
+        (wheelhouse / "nested").mkdir(parents=True)
+        (wheelhouse / "demo_lib-1.2.0-py3-none-any.whl").write_bytes(b"wheel")
+        (wheelhouse / "nested" / "demo-lib-1.2.0.tar.gz").write_bytes(b"sdist")
+        (wheelhouse / "demo_lib-1.1.0-py3-none-any.whl").write_bytes(b"old")
+
+        packages = {"vendored": "2.0", "legacy": "1.0", "demo-lib": "1.2", "missing": "1.0"}
+        hashes = collect_hashes(packages, [str(wheelhouse)], HashCache(tmp_path / "hashes.json"))
+
+        assert hashes["vendored"] == ["sha256:abc"]
+        assert hashes["legacy"] == ["sha256:def"]
+        assert hashes["demo-lib"] == sorted(f"sha256:{hashlib.sha256(content).hexdigest()}" for content in (b"wheel", b"sdist"))
+        assert "missing" not in hashes
+
+    def test_pinned_lines_round_trip(self, tmp_path: Path):
+        """Hash-pinned lines are valid requirements file entries."""
+        lines = create_pinned_requirements({"click": "8.1.7", "rich": "13.0"}, hashes={"click": ["sha256:aaa", "sha256:bbb"]})
+        lock_file = tmp_path / "pinned.txt"
+        lock_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        click, rich = parse_requirements(str(lock_file)).requirements
+        assert (click.specifier, click.hashes) == ("==8.1.7", ("sha256:aaa", "sha256:bbb"))
+        assert (rich.specifier, rich.hashes) == ("==13.0", ())
@@ -0,0 +1,83 @@
+"""
+Tests for plugin execution hooks.
+"""
+
+import threading
+from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock, patch
+
+from ginx.cli.execution import execute_script_logic
+from ginx.plugins import GinxPlugin, PluginManager
+from ginx.plugins.example import ExamplePlugin
+
+
+class RecordingPlugin(GinxPlugin):
+    """Plugin implementing every execution hook."""
+
+    def __init__(self) -> None:
+        self.finished: List[Tuple[str, int, str]] = []
+
+    @property
+    def name(self) -> str:
+        return "recording"
+
+    @property
+    def version(self) -> str:
+        return "1.0.0"
+
+    def process_script(self, script_name: str, script_config: Dict[str, Any]) -> Dict[str, Any]:
+        script_config["command"] = script_config["command"].replace("original", "processed")
+        return script_config
+
+    def pre_execution_hook(self, script_name: str, command: List[str]) -> List[str]:
+        return command + ["hooked"]
+
+    def post_execution_hook(self, script_name: str, exit_code: int, duration: float) -> None:
+        self.finished.append((script_name, exit_code, threading.current_thread().name))
+
+
+class TestDispatchTables:
+    """Test which plugins hooks are dispatched to."""
+
+    def test_only_implementations_are_dispatched(self):
+        """Inherited and placeholder hooks are skipped."""
+        manager = PluginManager()
+        manager.register_plugin(ExamplePlugin())
+        assert not any(manager.has_hooks(hook) for hook in ("process_script", "pre_execution_hook", "post_execution_hook"))
+
+        manager.register_plugin(RecordingPlugin())
+        assert all(manager.has_hooks(hook) for hook in ("process_script", "pre_execution_hook", "post_execution_hook"))
+
+    def test_background_post_hooks(self):
+        """Background hooks run in order on a worker thread."""
+        manager = PluginManager()
+        plugin = RecordingPlugin()
+        manager.register_plugin(plugin)
+
+        manager.run_post_execution_hooks("a", 0, 1.0, background=True)
+        manager.run_post_execution_hooks("b", 1, 1.0, background=True)
+        manager.wait_for_hooks()
+
+        assert [(name, code) for name, code, _ in plugin.finished] == [("a", 0), ("b", 1)]
+        assert all(thread.startswith("ginx-hooks") for _, _, thread in plugin.finished)
+
+
+class TestExecutionHooks:
+    """Test hooks being called by the execution engine."""
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_hooks_wrap_execution(self, mock_get_scripts: MagicMock, capsys: MagicMock):
+        """Scripts are processed, commands rewritten and results reported."""
+        config = {"command": "echo original", "description": "Echo", "depends": []}
+        mock_get_scripts.return_value = {"echo": config}
+        manager = PluginManager()
+        plugin = RecordingPlugin()
+        manager.register_plugin(plugin)
+
+        with patch("ginx.cli.execution.get_plugin_manager", return_value=manager):
+            execute_script_logic("echo", {}, "", True, False, False)
+
+        assert "processed hooked" in capsys.readouterr().out
+        assert [(name, code) for name, code, _ in plugin.finished] == [("echo", 0)]
+        # The loaded configuration is left alone
+        assert config["command"] == "echo original"
@@ -0,0 +1,86 @@
+"""
+Tests for installing package updates.
+"""
+
+import json
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+from ginx.plugins.version_sync.commands import SyncVersionsCommand
+from ginx.plugins.version_sync.install_utils import bisect_install, pip_install
+
+
+class TestBisectInstall:
+    """Test isolating failing packages."""
+
+    def test_everything_installs_in_one_run(self):
+        """A clean plan needs a single installer run."""
+        groups: List[List[int]] = []
+
+        installed, failed, runs = bisect_install(list(range(100)), lambda group: groups.append(group) is None)
+
+        assert installed == list(range(100))
+        assert failed == []
+        assert runs == 1
+        assert groups == [list(range(100))]
+
+    def test_failures_are_isolated(self):
+        """k bad items among n are found in O(k log n) runs."""
+        bad = {13, 77}
+
+        installed, failed, runs = bisect_install(list(range(128)), lambda group: not bad & set(group))
+
+        assert failed == [13, 77]
+        assert installed == [item for item in range(128) if item not in bad]
+        # Each bad item costs at most two runs per level of the 7-level bisection
+        assert runs <= 1 + 2 * len(bad) * 7
+
+    def test_empty(self):
+        """Nothing to install means no installer runs."""
+        assert bisect_install([], lambda group: True) == ([], [], 0)
+
+
+class TestPipInstall:
+    """Test the pip invocation."""
+
+    def test_specs_go_through_requirements_file(self):
+        """All specs are resolved by one pip process."""
+        seen = {}
+
+        def fake_run(command, prefix=""):
+            seen["command"] = command
+            seen["requirements"] = Path(command[-1]).read_text(encoding="utf-8")
+            return 0
+
+        with patch("ginx.plugins.version_sync.install_utils.run_command_with_streaming", side_effect=fake_run):
+            assert pip_install(["requests==2.31.0", "click==8.1.7"])
+
+        assert seen["command"][1:5] == ["-m", "pip", "install", "-r"]
+        assert seen["requirements"] == "requests==2.31.0\nclick==8.1.7\n"
+        assert not Path(seen["command"][-1]).exists()
+
+
+class TestExecuteUpdates:
+    """Test sync-versions installs."""
+
+    def test_report(self, tmp_path: Path):
+        """Per-package results and attempts are written to the report."""
+        updates = [{"package": name, "current": "1.0", "target": "2.0", "status": "outdated"} for name in ("a", "b", "c", "d")]
+        report_file = tmp_path / "report.json"
+
+        def fake_pip_install(specs, options=()):
+            return "c==2.0" not in specs
+
+        with patch("ginx.plugins.version_sync.commands.pip_install", side_effect=fake_pip_install):
+            SyncVersionsCommand()._execute_updates(updates, str(report_file))
+
+        report = json.loads(report_file.read_text(encoding="utf-8"))
+        assert report["pip_runs"] == 5
+        assert {entry["package"]: entry["status"] for entry in report["packages"]} == {
+            "a": "updated",
+            "b": "updated",
+            "c": "failed",
+            "d": "updated",
+        }
+        assert {entry["package"]: entry["attempts"] for entry in report["packages"]} == {"a": 2, "b": 2, "c": 3, "d": 3}
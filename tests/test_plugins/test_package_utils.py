@@ -0,0 +1,116 @@
+"""
+Tests for installed package discovery.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from packaging.specifiers import SpecifierSet
+
+from ginx.plugins.version_sync import package_utils
+from ginx.plugins.version_sync.package_utils import (
+    exclude_editable_packages,
+    get_constraints_from_file,
+    get_editable_packages,
+    get_installed_packages,
+    get_packages_from_requirements,
+)
+from tests.fixtures.site_packages import install_distribution
+
+
+class TestInstalledPackages:
+    """Test reading installed distributions in-process."""
+
+    def test_installed_and_editable(self, site_packages: Path, tmp_path: Path):
+        """Versions are read from metadata, editables from direct_url.json."""
+        project = tmp_path / "project"
+        install_distribution(site_packages, "Demo_Lib", "1.2.0")
+        install_distribution(site_packages, "my-app", "0.1.0", direct_url={"url": project.as_uri(), "dir_info": {"editable": True}})
+        install_distribution(site_packages, "vendored", "2.0", direct_url={"url": "file:///tmp/vendored.whl", "archive_info": {}})
+
+        assert get_installed_packages() == {"demo-lib": "1.2.0", "my-app": "0.1.0", "vendored": "2.0"}
+        assert get_editable_packages() == {"my-app": str(project)}
+        assert exclude_editable_packages(get_installed_packages()) == {"demo-lib": "1.2.0", "vendored": "2.0"}
+
+    def test_legacy_egg_link(self, site_packages: Path, tmp_path: Path):
+        """'setup.py develop' installs are detected through their .egg-link."""
+        install_distribution(site_packages, "old-style", "1.0")
+        (site_packages / "old-style.egg-link").write_text(f"{tmp_path / 'old'}\n.\n", encoding="utf-8")
+
+        assert get_editable_packages() == {"old-style": str(tmp_path / "old")}
+
+    def test_first_on_sys_path_wins(self, site_packages: Path, tmp_path: Path):
+        """Shadowed distributions are ignored."""
+        user_site = tmp_path / "user-site"
+        user_site.mkdir()
+        install_distribution(user_site, "demo", "2.0")
+        install_distribution(site_packages, "demo", "1.0")
+        sys.path.insert(0, str(user_site))
+
+        assert get_installed_packages() == {"demo": "2.0"}
+
+    def test_cache_follows_site_packages(self, site_packages: Path):
+        """Results are reused until a directory on sys.path changes."""
+        install_distribution(site_packages, "demo", "1.0")
+        first = get_installed_packages()
+        assert get_installed_packages() == first
+        assert package_utils._distributions_cache is not None
+        cached = package_utils._distributions_cache[1]
+        assert package_utils._get_distributions() is cached
+
+        install_distribution(site_packages, "extra", "3.1")
+
+        assert get_installed_packages() == {"demo": "1.0", "extra": "3.1"}
+
+
+class TestConstraintsFile:
+    """Test reading per-package constraints."""
+
+    def test_constraints(self, tmp_path: Path):
+        """Specifiers are normalized and combined per package."""
+        constraints_file = tmp_path / "constraints.txt"
+        constraints_file.write_text(
+            "# Pins\nRequests>=2.28  # security fixes\nrequests<3\nclick==8.1.7\nrich\n",
+            encoding="utf-8",
+        )
+
+        constraints = get_constraints_from_file(str(constraints_file))
+
+        assert set(constraints) == {"requests", "click"}
+        assert SpecifierSet(constraints["requests"]) == SpecifierSet(">=2.28,<3")
+        assert constraints["click"] == "==8.1.7"
+
+    def test_invalid_constraint(self, tmp_path: Path):
+        """Unparsable lines are reported."""
+        constraints_file = tmp_path / "constraints.txt"
+        constraints_file.write_text("requests>=>2\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Invalid constraint"):
+            get_constraints_from_file(str(constraints_file))
+
+
+class TestRequirementsVersions:
+    """Test reading target versions from requirements files."""
+
+    def test_versions_from_includes(self, tmp_path: Path):
+        """Pins win over other clauses, and constraints-only packages are left out."""
+        (tmp_path / "base.txt").write_text("Django>=4.2,<5\n-c constraints.txt\n", encoding="utf-8")
+        (tmp_path / "constraints.txt").write_text("sqlparse==0.4.4\n", encoding="utf-8")
+        requirements_file = tmp_path / "requirements.txt"
+        requirements_file.write_text(
+            "-r base.txt\nclick!=8.1.0,==8.1.7 --hash=sha256:abc\nrich\n",
+            encoding="utf-8",
+        )
+
+        assert get_packages_from_requirements(str(requirements_file)) == {"django": "4.2", "click": "8.1.7"}
+
+    def test_versions_never_come_from_exclusions_or_upper_bounds(self, tmp_path: Path):
+        """Lower bounds are used after pins, and packages without either are left out."""
+        requirements_file = tmp_path / "requirements.txt"
+        requirements_file.write_text(
+            "foo!=1.0,>=0.5\nbar<3\nbaz<=2,!=1.5\nqux<2,~=1.4\nquux>1.0\nexact===2.0\nwild==1.*\n",
+            encoding="utf-8",
+        )
+
+        assert get_packages_from_requirements(str(requirements_file)) == {"foo": "0.5", "qux": "1.4", "quux": "1.0", "exact": "2.0"}
@@ -0,0 +1,278 @@
+"""
+Tests for the version-sync PyPI client.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlsplit
+
+import pytest
+import typer
+
+from ginx.plugins.version_sync.cache import MetadataCache
+from ginx.plugins.version_sync.commands import CheckUpdatesCommand, SyncVersionsCommand
+from ginx.plugins.version_sync.http_utils import ConnectionPool
+from ginx.plugins.version_sync.pypi_utils import SIMPLE_API, PyPIClient, parse_simple_project
+from ginx.plugins.version_sync.version_utils import resolve_versions, select_latest_version, version_from_filename
+from tests.fixtures.pypi_server import FakePyPIServer
+from tests.fixtures.simple_index import SimpleIndexServer
+
+
+class TestPyPIClient:
+    """Test PyPI lookups against a local stand-in server."""
+
+    def test_get_package_info(self, pypi_server: FakePyPIServer):
+        """Test fetching and failing lookups."""
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+
+        assert client.get_latest_version("requests") == "2.31.0"
+        assert client.get_package_info("does-not-exist") is None
+        assert client.get_package_summary("requests") == "The requests package"
+
+    def test_fetch_package_infos_keeps_order(self, pypi_server: FakePyPIServer):
+        """Concurrent lookups are yielded in input order."""
+        pypi_server.delay = 0.05
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+        names = ["rich", "missing", "click", "requests", "typer"]
+
+        results = list(client.fetch_package_infos(names, timeout=5, concurrency=3))
+
+        assert [name for name, _ in results] == names
+        assert [info["info"]["version"] if info else None for _, info in results] == ["13.7.0", None, "8.1.7", "2.31.0", "0.9.0"]
+        assert 1 < pypi_server.max_in_flight <= 3
+
+    def test_fetch_package_infos_timeout(self, pypi_server: FakePyPIServer):
+        """Slow responses fail individually after the request timeout."""
+        pypi_server.delay = 1.2
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+
+        results = dict(client.fetch_package_infos(["rich", "click"], timeout=1, concurrency=2))
+
+        assert results == {"rich": None, "click": None}
+
+    def test_check_updates_uses_fetcher(self, pypi_server: FakePyPIServer, capsys: MagicMock):
+        """check-updates reports results in package order."""
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+        packages = {"requests": "2.30.0", "click": "8.1.7", "nope": "1.0"}
+
+        with patch("ginx.plugins.version_sync.pypi_utils._pypi_client", client):
+            results = CheckUpdatesCommand()._check_packages(packages, timeout=5, json_output=True, concurrency=4)
+
+        assert [(r["package"], r["status"]) for r in results] == [
+            ("requests", "outdated"),
+            ("click", "current"),
+            ("nope", "error"),
+        ]
+
+
+class TestConnectionPool:
+    """Test keep-alive connection reuse."""
+
+    def test_connections_are_reused(self, pypi_server: FakePyPIServer):
+        """Sequential requests share one persistent connection."""
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+
+        for _ in range(5):
+            assert client.get_latest_version("click") == "8.1.7"
+
+        assert pypi_server.connections == 1
+
+    def test_gzip_responses(self, pypi_server: FakePyPIServer):
+        """Compressed responses are decoded."""
+        pypi_server.gzip = True
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+
+        assert client.get_latest_version("rich") == "13.7.0"
+
+    def test_stale_connection_is_retried(self, pypi_server: FakePyPIServer):
+        """A keep-alive connection closed by the server is replaced transparently."""
+        pypi_server.drop_connections = True
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+
+        assert client.get_latest_version("rich") == "13.7.0"
+        assert client.get_latest_version("click") == "8.1.7"
+        assert pypi_server.connections == 2
+
+    def test_stale_connection_is_retried_once(self, pypi_server: FakePyPIServer):
+        """After one stale connection, the retry uses a new one instead of the next idle one."""
+        pypi_server.drop_connections = True
+        pool = ConnectionPool()
+        parts = urlsplit(pypi_server.url)
+        key = ("http", parts.hostname or "", parts.port or 80)
+        idle = [pool._acquire(key, 5)[0] for _ in range(3)]
+        for connection in idle:
+            connection.request("GET", "/pypi/rich/json")
+            connection.getresponse().read()
+            pool._release(key, connection)
+
+        with patch.object(pool, "_acquire", wraps=pool._acquire) as acquire:
+            response = pool.request("GET", f"{pypi_server.url}/pypi/click/json")
+
+        assert response.status == 200
+        assert acquire.call_count == 2
+        assert pypi_server.connections == 4
+
+    def test_concurrent_requests_share_pool(self, pypi_server: FakePyPIServer):
+        """Connections opened by worker threads are reused by later batches."""
+        pypi_server.delay = 0.02
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi", pool_size=4)
+        names = ["rich", "click", "requests", "typer"] * 5
+
+        results = list(client.fetch_package_infos(names, timeout=5, concurrency=4))
+
+        assert all(info is not None for _, info in results)
+        assert pypi_server.connections <= 4
+
+
+class TestSimpleAPI:
+    """Test lookups through a PEP 691 Simple Repository index."""
+
+    def test_latest_version(self, simple_index: SimpleIndexServer):
+        """Yanked files and pre-releases are skipped."""
+        client = PyPIClient(base_url=simple_index.url, api=SIMPLE_API)
+
+        assert client.get_latest_version("requests") == "2.31.0"
+        # Names are normalized before building the project URL
+        assert client.get_latest_version("Typing_Extensions") == "4.9.0"
+        # Only pre-releases available
+        assert client.get_latest_version("nightly") == "1.0a1"
+        assert client.get_package_info("gone") is None
+        assert client.get_package_info("missing") is None
+        # Project pages have no summary
+        assert client.get_package_summary("requests") is None
+
+    def test_requires_python_of_installable_files(self):
+        """A yanked file doesn't decide the Python requirement of its version."""
+        document = {
+            "name": "demo",
+            "files": [
+                {"filename": "demo-1.0-py2.py3-none-any.whl", "yanked": "Wrong metadata", "requires-python": ">=2.7"},
+                {"filename": "demo-1.0.tar.gz", "requires-python": ">=3.8"},
+            ],
+        }
+
+        info = parse_simple_project(document)
+
+        assert info is not None
+        assert info["info"]["requires_python"] == ">=3.8"
+        assert info["releases"]["1.0"] == [{"yanked": False, "requires_python": ">=3.8"}]
+
+    def test_releases(self, simple_index: SimpleIndexServer):
+        """Files are grouped into releases, listed versions without files are kept."""
+        client = PyPIClient(base_url=simple_index.url, api=SIMPLE_API)
+
+        requests_releases = client.get_package_releases("requests")
+        assert requests_releases is not None
+        assert requests_releases["2.32.0"] == [{"yanked": True, "requires_python": None}]
+        assert requests_releases["2.31.0"] == [{"yanked": False, "requires_python": ">=3.7"}]
+        assert client.get_package_releases("typing-extensions") == {
+            "4.9.0": [{"yanked": False, "requires_python": None}],
+            "4.10.0": [],
+        }
+
+    def test_cached_lookups_revalidate(self, simple_index: SimpleIndexServer):
+        """Stale entries are revalidated with If-Modified-Since."""
+        client = PyPIClient(base_url=simple_index.url, api=SIMPLE_API, cache=MetadataCache(ttl=0))
+
+        assert client.get_latest_version("requests") == "2.31.0"
+        entry = client.cache.get(client.base_url, "requests")  # type: ignore[union-attr]
+        assert entry is not None and entry["last_modified"]
+        assert client.get_latest_version("requests") == "2.31.0"
+
+    def test_unknown_api(self):
+        """Only the JSON and Simple APIs are supported."""
+        with pytest.raises(ValueError, match="Unknown index API"):
+            PyPIClient(api="xmlrpc")
+
+
+class TestVersionSelection:
+    """Test version helpers used by the Simple API mode."""
+
+    def test_version_from_filename(self):
+        """Wheel and sdist names are parsed, anything else is ignored."""
+        assert version_from_filename("requests-2.31.0-py3-none-any.whl") == "2.31.0"
+        assert version_from_filename("typing_extensions-4.9.0.tar.gz") == "4.9.0"
+        assert version_from_filename("setup.exe") is None
+
+    def test_select_latest_version(self):
+        """Final releases win over newer pre-releases, invalid versions are ignored."""
+        assert select_latest_version(["1.0", "1.10", "1.9", "2.0rc1", "not a version"]) == "1.10"
+        assert select_latest_version(["1.0a1", "1.0b2"]) == "1.0b2"
+        assert select_latest_version([]) is None
+
+    def test_resolve_versions(self):
+        """The highest non-yanked release matching both constraints wins."""
+        releases = {
+            "requests": {
+                "2.30.0": [{"yanked": False}],
+                "2.31.0": [{"yanked": False}],
+                "2.32.0": [{"yanked": True}],
+                "3.0.0b1": [{"yanked": False}],
+                "3.1.0": [],
+            },
+            "click": {"7.1.2": [{}], "8.0.0": [{}], "8.1.7": [{}], "8.2.0rc1": [{}]},
+            "old": {"0.9": [{}]},
+        }
+
+        assert resolve_versions(releases, "<9") == {"requests": "2.31.0", "click": "8.1.7", "old": "0.9"}
+        assert resolve_versions(releases, ">=1.0", {"click": "~=8.0.0", "unused": "==1"}) == {
+            "requests": "2.31.0",
+            "click": "8.0.0",
+            "old": None,
+        }
+        # Pre-releases only when asked for
+        assert resolve_versions(releases, ">=8.2.0rc1")["click"] == "8.2.0rc1"
+        assert resolve_versions({"beta": {"1.0b1": [{}]}}, "")["beta"] == "1.0b1"
+
+        with pytest.raises(ValueError):
+            resolve_versions(releases, ">=>1")
+
+    def test_apply_version_constraint(self, pypi_server: FakePyPIServer):
+        """sync-versions resolves constraint targets against release lists."""
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi", cache=MetadataCache())
+        current = {"requests": "2.30.0", "click": "8.1.6", "rich": "13.7.0", "missing": "1.0"}
+        package_constraints = {"click": "!=8.1.7", "rich": "<13.7"}
+
+        with patch("ginx.plugins.version_sync.pypi_utils._pypi_client", client):
+            targets = SyncVersionsCommand()._apply_version_constraint(current, "<14", package_constraints=package_constraints)
+
+        assert targets == {"requests": "2.31.0", "click": "8.1.6", "rich": "13.6.0", "missing": "1.0"}
+
+
+class TestNDJSONOutput:
+    """Test streaming check-updates output."""
+
+    def test_unordered_fetch(self, pypi_server: FakePyPIServer):
+        """Unordered lookups yield every package once."""
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+        names = ["rich", "missing", "click", "requests", "typer"]
+
+        results = dict(client.fetch_package_infos(names, timeout=5, concurrency=3, ordered=False))
+
+        assert sorted(results) == sorted(names)
+        assert results["missing"] is None
+
+    def test_records(self, pypi_server: FakePyPIServer, capsys: MagicMock):
+        """One compact record per package, then a summary."""
+        client = PyPIClient(base_url=f"{pypi_server.url}/pypi")
+        packages = {"requests": "2.30.0", "click": "8.1.7", "nope": "1.0"}
+
+        with patch("ginx.plugins.version_sync.pypi_utils._pypi_client", client):
+            CheckUpdatesCommand()._stream_results(packages, timeout=5, concurrency=4)
+
+        lines = capsys.readouterr().out.splitlines()
+        records = [json.loads(line) for line in lines]
+        assert all(" " not in line for line in lines)
+        assert {record["package"]: record["status"] for record in records[:-1]} == {
+            "requests": "outdated",
+            "click": "current",
+            "nope": "error",
+        }
+        summary = records[-1]
+        assert summary["type"] == "summary"
+        assert (summary["total"], summary["outdated"], summary["current"], summary["error"]) == (3, 1, 1, 1)
+
+    def test_invalid_format(self):
+        """Unknown formats are rejected before any lookup."""
+        with pytest.raises(typer.Exit):
+            CheckUpdatesCommand().execute("", False, False, 5, output_format="xml")
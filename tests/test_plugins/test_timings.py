@@ -0,0 +1,70 @@
+"""
+Tests for plugin load and hook timings.
+"""
+
+import json
+from pathlib import Path
+
+from ginx.plugins import PluginManager
+from ginx.plugins.timings import PluginTimings
+
+PLUGIN_SOURCE = '''
+from ginx.plugins import GinxPlugin
+
+class TimedPlugin(GinxPlugin):
+    name = "timed"
+    version = "1.0.0"
+
+    def post_execution_hook(self, script_name, exit_code, duration):
+        self.last = (script_name, exit_code)
+'''
+
+
+def phases(timings: PluginTimings) -> dict:
+    return {(row["subject"], row["phase"]): row["calls"] for row in timings.rows()}
+
+
+class TestPluginTimings:
+    """Test what the plugin manager times."""
+
+    def test_loading_phases(self, tmp_path: Path):
+        """Discovery, import, instantiation and initialization are timed."""
+        (tmp_path / "timed.py").write_text(PLUGIN_SOURCE)
+        manager = PluginManager()
+        manager.discover_plugins([str(tmp_path)])
+
+        assert phases(manager.timings) == {
+            ("ginx_plugin_timed", "import"): 1,
+            ("timed", "instantiate"): 1,
+            ("timed", "initialize"): 1,
+            (str(tmp_path), "discovery"): 1,
+        }
+
+    def test_hooks_only_timed_when_enabled(self, tmp_path: Path):
+        """Hook calls are aggregated per plugin once enabled."""
+        (tmp_path / "timed.py").write_text(PLUGIN_SOURCE)
+        manager = PluginManager()
+        manager.discover_plugins([str(tmp_path)])
+
+        manager.run_post_execution_hooks("build", 0, 1.0)
+        assert ("timed", "post_execution_hook") not in phases(manager.timings)
+
+        manager.timings.hooks_enabled = True
+        manager.run_post_execution_hooks("build", 0, 1.0)
+        manager.run_post_execution_hooks("test", 1, 1.0)
+        assert phases(manager.timings)[("timed", "post_execution_hook")] == 2
+
+    def test_json_dump(self, tmp_path: Path):
+        """Timings are written as JSON."""
+        timings = PluginTimings(hooks_enabled=True)
+        timings.record("timed", "initialize", 0.5)
+        timings.record("timed", "initialize", 0.25)
+
+        path = tmp_path / "timings.json"
+        timings.write(str(path))
+
+        assert json.loads(path.read_text()) == {
+            "hooks_enabled": True,
+            "timings": [{"subject": "timed", "phase": "initialize", "calls": 2, "total": 0.75, "max": 0.5}],
+        }
+        assert [p.name for p in tmp_path.iterdir()] == ["timings.json"]
@@ -0,0 +1,84 @@
+"""
+Tests for N-way version comparison.
+"""
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from ginx.plugins.version_sync.commands import VersionDiffCommand
+from ginx.plugins.version_sync.version_diff import build_version_matrix, environment_labels
+
+
+@pytest.fixture
+def lock_files(tmp_path: Path) -> List[str]:
+    """Lock files of three environments."""
+    files = {
+        "dev.txt": "django==4.2.1\nrequests==2.31.0\nclick==8.1.7\nrich==13.0\n",
+        "ci.txt": "django==5.0\nrequests==2.31.0\nclick==8.1.6\nrich==13.0.0\n",
+        "prod.txt": "django==4.2.1\nrequests==2.28.0\nclick==8.1.7\nrich==13.0\nlegacy==1.0\n",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    return [str(tmp_path / name) for name in files]
+
+
+class TestVersionMatrix:
+    """Test building and classifying the version matrix."""
+
+    def test_distance_and_pattern(self, lock_files: List[str]):
+        """Divergences are classified semantically and by which environments agree."""
+        matrix = build_version_matrix(lock_files)
+
+        assert matrix.environments == ["dev.txt", "ci.txt", "prod.txt"]
+        rows = {row["package"]: row for row in matrix.rows()}
+        assert set(rows) == {"django", "requests", "click", "legacy"}
+        assert (rows["django"]["distance"], rows["django"]["pattern"]) == ("major", "A B A")
+        assert (rows["requests"]["distance"], rows["requests"]["pattern"]) == ("minor", "A A B")
+        assert (rows["click"]["distance"], rows["click"]["pattern"]) == ("patch", "A B A")
+        assert (rows["legacy"]["distance"], rows["legacy"]["pattern"]) == ("missing", "- - A")
+        assert rows["legacy"]["versions"] == {"dev.txt": None, "ci.txt": None, "prod.txt": "1.0"}
+
+        # '13.0' and '13.0.0' are the same version
+        assert matrix.distance("rich") == "same"
+        assert [row["package"] for row in matrix.groups(matrix.rows())[0]["packages"]] == ["click", "django"]
+        assert matrix.summary()["same"] == 1
+
+    def test_labels(self):
+        """Colliding file names are labelled by path."""
+        assert environment_labels(["a/req.txt", "b/req.txt", "c/prod.txt"]) == ["a/req.txt", "b/req.txt", "prod.txt"]
+
+
+class TestVersionDiffCommand:
+    """Test version-diff output formats."""
+
+    def test_json(self, lock_files: List[str], capsys: MagicMock):
+        """JSON output has the matrix, groups and summary."""
+        VersionDiffCommand().execute(lock_files, show_all=False, output_format="json")
+
+        result = json.loads(capsys.readouterr().out)
+        assert result["environments"] == ["dev.txt", "ci.txt", "prod.txt"]
+        assert result["groups"][0] == {"pattern": "A B A", "packages": ["click", "django"]}
+        assert result["summary"]["major"] == 1
+
+    def test_csv(self, lock_files: List[str], capsys: MagicMock):
+        """CSV output has one column per environment, empty if the package is missing."""
+        VersionDiffCommand().execute(lock_files, show_all=True, output_format="csv")
+
+        rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+        assert rows[0] == ["package", "distance", "pattern", "dev.txt", "ci.txt", "prod.txt"]
+        assert ["legacy", "missing", "- - A", "", "", "1.0"] in rows
+        assert len(rows) == 6
+
+    def test_table(self, lock_files: List[str], capsys: MagicMock):
+        """The table groups packages by the environments that agree."""
+        VersionDiffCommand().execute(lock_files[:2], show_all=False)
+
+        output = capsys.readouterr().out
+        assert "dev.txt | ci.txt: 2 packages" in output
+        assert "Summary: 2 differences (1 major, 1 patch), 2 same" in output
@@ -0,0 +1,162 @@
+"""
+Tests for local and mirrored package indexes.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from ginx.plugins.version_sync.pypi_utils import (
+    SIMPLE_API,
+    PyPIClient,
+    configure_pypi_client,
+    get_pip_index_options,
+    parse_simple_html,
+)
+from ginx.plugins.version_sync.wheelhouse import WheelhouseIndex
+
+PROJECT_PAGE = """<!DOCTYPE html>
+<html><body>
+<a href="../../files/demo-1.0.tar.gz#sha256=aa">demo-1.0.tar.gz</a>
+<a href="../../files/demo-1.1-py3-none-any.whl" data-requires-python="&gt;=3.8">demo-1.1-py3-none-any.whl</a>
+<a href="../../files/demo-1.2-py3-none-any.whl" data-yanked="">demo-1.2-py3-none-any.whl</a>
+<a href="../../files/demo-2.0b1.tar.gz">demo-2.0b1.tar.gz</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def wheelhouse(tmp_path: Path) -> Path:
+    """A wheelhouse directory with a few distributions."""
+    directory = tmp_path / "wheels"
+    directory.mkdir()
+    for filename in (
+        "requests-2.31.0-py3-none-any.whl",
+        "requests-2.32.3.tar.gz",
+        "typing_extensions-4.12.2-py3-none-any.whl",
+        "Click-8.1.7-py3-none-any.whl",
+        "click-9.0.0a1.tar.gz",
+        "README.txt",
+    ):
+        (directory / filename).write_bytes(b"")
+    return directory
+
+
+@pytest.fixture
+def html_index():
+    """A PEP 503 index that only speaks HTML."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            if self.path == "/simple/demo/":
+                body = PROJECT_PAGE.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+            else:
+                body = b"Not Found"
+                self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/simple"
+    server.shutdown()
+    server.server_close()
+
+
+class TestWheelhouse:
+    """Test file:// wheelhouse indexes."""
+
+    def test_index(self, wheelhouse: Path):
+        """Projects are indexed by normalized name from the file names."""
+        index = WheelhouseIndex(wheelhouse.as_uri())
+
+        assert set(index.projects) == {"requests", "typing-extensions", "click"}
+        assert index.get_project("Typing_Extensions") is not None
+        assert index.get_project("rich") is None
+
+    def test_client_lookups(self, wheelhouse: Path):
+        """A file:// client answers from the wheelhouse."""
+        client = PyPIClient(base_url=wheelhouse.as_uri(), api=SIMPLE_API)
+
+        assert client.get_latest_version("requests") == "2.32.3"
+        assert client.get_latest_version("click") == "8.1.7"
+        assert client.get_latest_version("typing-extensions") == "4.12.2"
+        assert client.get_package_info("rich") is None
+        assert dict(client.fetch_package_infos(["rich"])) == {"rich": None}
+
+
+class TestSimpleHTML:
+    """Test PEP 503 HTML indexes."""
+
+    def test_parse(self):
+        """Links, yanked markers and Requires-Python are read."""
+        page = parse_simple_html(PROJECT_PAGE, "Demo")
+
+        assert page["name"] == "demo"
+        assert [file["filename"] for file in page["files"]] == [
+            "demo-1.0.tar.gz",
+            "demo-1.1-py3-none-any.whl",
+            "demo-1.2-py3-none-any.whl",
+            "demo-2.0b1.tar.gz",
+        ]
+        assert page["files"][1]["requires-python"] == ">=3.8"
+        assert page["files"][2]["yanked"] is True
+
+    def test_client_falls_back_to_html(self, html_index: str):
+        """HTML-only indexes work in the simple API mode."""
+        client = PyPIClient(base_url=html_index, api=SIMPLE_API)
+
+        assert client.get_latest_version("demo") == "1.1"
+        assert client.get_package_info("missing") is None
+
+
+class TestIndexConfiguration:
+    """Test selecting the index of the shared client."""
+
+    @pytest.fixture(autouse=True)
+    def shared_client(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        client = PyPIClient(api=SIMPLE_API)
+        monkeypatch.setattr("ginx.plugins.version_sync.pypi_utils._pypi_client", client)
+        monkeypatch.chdir(tmp_path)
+        return client
+
+    def test_default(self, shared_client: PyPIClient):
+        """Without settings the public Simple API is used."""
+        configure_pypi_client()
+
+        assert shared_client.base_url == "https://pypi.org/simple"
+        assert get_pip_index_options() == []
+
+    def test_setting(self, shared_client: PyPIClient, tmp_path: Path):
+        """index_url comes from the plugin settings."""
+        config = {"plugins": {"settings": {"version-sync": {"index_url": "https://pypi.internal/simple/"}}}}
+        (tmp_path / "ginx.yaml").write_text(yaml.dump(config), encoding="utf-8")
+
+        configure_pypi_client()
+
+        assert shared_client.base_url == "https://pypi.internal/simple"
+        assert get_pip_index_options() == ["--index-url", "https://pypi.internal/simple"]
+
+    def test_wheelhouse_path(self, shared_client: PyPIClient, wheelhouse: Path):
+        """A directory path is turned into a file:// URL, pip is pointed at it too."""
+        configure_pypi_client(index_url=str(wheelhouse))
+
+        assert shared_client.base_url == wheelhouse.resolve().as_uri()
+        assert shared_client.get_latest_version("requests") == "2.32.3"
+        assert get_pip_index_options() == ["--no-index", "--find-links", str(wheelhouse.resolve())]
+
+    def test_invalid(self):
+        """Unsupported schemes are rejected."""
+        with pytest.raises(ValueError, match="Invalid index URL"):
+            configure_pypi_client(index_url="ftp://mirror/simple")
@@ -0,0 +1,134 @@
+"""
+Tests for self-overhead accounting and profiling.
+"""
+
+import pstats
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ginx.cli.execution import execute_script_logic
+from ginx.runner import _split_profile_option
+from ginx.tracing import CHILD, CONFIG, OUTPUT, PHASES, PLAN, SPAWN, VALIDATION, OverheadAccount, get_overhead, profile_call, run_profiled
+from ginx.utils.command import run_command_with_streaming
+
+
+class TestOverheadAccount:
+    """Test the accumulation of time per phase."""
+
+    def test_nested_phases_are_exclusive(self):
+        """Time of an inner phase is not counted for the enclosing one."""
+        account = OverheadAccount()
+        with account.measure(PLAN):
+            time.sleep(0.02)
+            with account.measure(CONFIG):
+                time.sleep(0.05)
+
+        totals = account.take()
+        assert 0.05 <= totals[CONFIG] < 0.07
+        assert 0.02 <= totals[PLAN] < 0.04
+        assert account.take() == {}
+
+    def test_threads_keep_their_own_nesting(self):
+        """Phases measured on other threads are added to the same totals."""
+        account = OverheadAccount()
+
+        def measure() -> None:
+            with account.measure(VALIDATION):
+                time.sleep(0.01)
+
+        with account.measure(PLAN):
+            thread = threading.Thread(target=measure)
+            thread.start()
+            thread.join()
+
+        totals = account.take()
+        assert totals[VALIDATION] >= 0.01
+        # The main thread's phase is not paused by the worker's
+        assert totals[PLAN] >= totals[VALIDATION]
+
+
+class TestRunOverhead:
+    """Test the phases recorded while running commands."""
+
+    def test_streaming_separates_child_time(self):
+        """Spawning and output handling count for ginx, the child's run does not."""
+        get_overhead().take()
+        lines = []
+        code = "import time; print('a'); time.sleep(0.2); print('b')"
+        exit_code = run_command_with_streaming([sys.executable, "-c", code], on_output=lines.append, echo=False)
+
+        totals = get_overhead().take()
+        assert exit_code == 0
+        assert lines == ["a", "b"]
+        assert totals[CHILD] >= 0.2
+        assert totals[SPAWN] > 0
+        # Waiting for output is child time, only handling it is ginx's
+        assert totals[OUTPUT] < 0.1
+
+    def test_output_handling_is_not_child_time(self):
+        """Time spent handling output lines counts once, as output."""
+        get_overhead().take()
+        code = "print('a'); print('b'); print('c')"
+        exit_code = run_command_with_streaming([sys.executable, "-c", code], on_output=lambda line: time.sleep(0.1), echo=False)
+
+        totals = get_overhead().take()
+        assert exit_code == 0
+        assert totals[OUTPUT] >= 0.3
+        assert totals[CHILD] < 0.3
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_verbose_run_shows_overhead(self, mock_get_scripts: MagicMock, capsys: pytest.CaptureFixture[str]):
+        """Verbose runs end with ginx's own time per phase and the scripts' time."""
+        mock_get_scripts.return_value = {"build": {"command": "echo built", "description": "Build", "depends": []}}
+        execute_script_logic("build", {}, "", True, False, True)
+
+        output = capsys.readouterr().out
+        summary = next(line for line in output.splitlines() if line.startswith("Ginx overhead:"))
+        assert all(f"{phase} " in summary for phase in PHASES)
+        assert "scripts (summed):" in summary
+        # The run's totals were taken
+        assert CHILD not in get_overhead().take()
+
+
+class TestProfiling:
+    """Test running ginx under cProfile."""
+
+    def test_profile_includes_job_threads(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+        """Functions run on other threads end up in the written profile."""
+        path = tmp_path / "ginx.pstats"
+
+        def job() -> None:
+            sum(range(1000))
+
+        def run() -> None:
+            thread = threading.Thread(target=profile_call, args=(job,))
+            thread.start()
+            thread.join()
+
+        run_profiled(run, str(path), summary_lines=5)
+
+        functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+        assert "job" in functions
+        assert f"Profile written to {path}" in capsys.readouterr().err
+
+    def test_profile_is_written_on_exit(self, tmp_path: Path):
+        """The profile is written when the profiled CLI exits."""
+        path = tmp_path / "ginx.pstats"
+
+        def run() -> None:
+            sys.exit(3)
+
+        with pytest.raises(SystemExit):
+            run_profiled(run, str(path))
+        assert path.exists()
+
+    def test_split_profile_option(self):
+        """Only a leading --profile option is taken off the arguments."""
+        assert _split_profile_option(["--profile", "build"]) == (["build"], "ginx.pstats")
+        assert _split_profile_option(["--profile=out.pstats", "build"]) == (["build"], "out.pstats")
+        assert _split_profile_option(["build", "--profile"]) == (["build", "--profile"], None)
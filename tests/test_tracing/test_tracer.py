@@ -0,0 +1,108 @@
+"""
+Tests for Chrome trace recording.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+from ginx.cli.execution import execute_script_logic
+from ginx.tracing import SCRIPT, Tracer, get_tracer, span, trace_to
+
+
+def events_of(trace: Dict[str, Any], phase: str) -> List[Dict[str, Any]]:
+    return [event for event in trace["traceEvents"] if event["ph"] == phase]
+
+
+class TestTracer:
+    """Test the recorded trace events."""
+
+    def test_spans_per_thread_track(self):
+        """Spans are put on the track of the thread recording them."""
+        tracer = Tracer()
+        with tracer.span("outer", SCRIPT):
+            with tracer.span("inner", SCRIPT, step=1):
+                pass
+
+        def record() -> None:
+            with tracer.span("worker", SCRIPT):
+                pass
+
+        thread = threading.Thread(target=record, name="ginx-job_0")
+        thread.start()
+        thread.join()
+        trace = tracer.to_dict()
+
+        tracks = {event["args"]["name"]: event["tid"] for event in events_of(trace, "M") if event["name"] == "thread_name"}
+        spans = {event["name"]: event for event in events_of(trace, "X")}
+        assert spans["outer"]["tid"] == spans["inner"]["tid"] == tracks["MainThread"]
+        assert spans["worker"]["tid"] == tracks["ginx-job_0"]
+        assert spans["inner"]["args"] == {"step": 1}
+        assert spans["outer"]["ts"] <= spans["inner"]["ts"]
+        assert spans["inner"]["ts"] + spans["inner"]["dur"] <= spans["outer"]["ts"] + spans["outer"]["dur"]
+
+    def test_queue_waits_and_counters(self):
+        """Queue waits are async spans, and counters record their values."""
+        tracer = Tracer()
+        tracer.queued("lint")
+        tracer.dequeued("lint")
+        tracer.dequeued("never-queued")
+        trace = tracer.to_dict()
+
+        assert [(event["ph"], event["name"]) for event in trace["traceEvents"] if event.get("cat") == "queue"] == [("b", "lint"), ("e", "lint")]
+        assert [event["args"]["queued scripts"] for event in events_of(trace, "C")] == [1, 0]
+
+    def test_inactive_by_default(self, tmp_path: Path):
+        """Spans are no-ops unless tracing, and the trace is written on failure."""
+        with span("ignored", SCRIPT) as args:
+            assert args == {}
+        assert get_tracer() is None
+
+        path = tmp_path / "trace.json"
+        try:
+            with trace_to(str(path)) as tracer:
+                assert get_tracer() is tracer
+                with span("failing", SCRIPT):
+                    raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert get_tracer() is None
+        assert [event["name"] for event in events_of(json.loads(path.read_text()), "X")] == ["failing"]
+
+
+class TestRunTrace:
+    """Test tracing a run of the execution engine."""
+
+    @patch("ginx.cli.execution.get_scripts")
+    def test_parallel_run(self, mock_get_scripts: MagicMock, tmp_path: Path):
+        """Every phase is traced, with one track per job slot."""
+        mock_get_scripts.return_value = {
+            "lint": {"command": "echo lint", "description": "Lint", "depends": []},
+            "test": {"command": "echo test", "description": "Test", "depends": []},
+            "ci": {"command": "echo ci", "description": "CI", "depends": ["lint", "test"]},
+        }
+        path = tmp_path / "trace.json"
+
+        execute_script_logic("ci", {}, "", True, False, False, jobs=2, trace=str(path))
+
+        trace = json.loads(path.read_text())
+        spans = events_of(trace, "X")
+        assert {(event["cat"], event["name"]) for event in spans} >= {
+            ("config", "load config"),
+            ("plan", "resolve plan"),
+            ("script", "lint"),
+            ("script", "test"),
+            ("script", "ci"),
+            ("script", "run"),
+        }
+        runs = [event for event in spans if event["name"] == "run"]
+        assert sorted(event["args"]["command"] for event in runs) == ["echo ci", "echo lint", "echo test"]
+        assert all(event["args"]["exit_code"] == 0 for event in runs)
+
+        tracks = {event["tid"]: event["args"]["name"] for event in events_of(trace, "M") if event["name"] == "thread_name"}
+        assert {tracks[event["tid"]] for event in spans if event["cat"] == "script"} <= {"ginx-job_0", "ginx-job_1"}
+        assert len([event for event in trace["traceEvents"] if event.get("cat") == "queue"]) == 6
+        assert max(event["args"]["running scripts"] for event in events_of(trace, "C") if "running scripts" in event["args"]) <= 2
@@ -0,0 +1,118 @@
+"""
+Tests for requirements file parsing.
+"""
+
+import os
+from pathlib import Path
+
+from ginx.utils.requirements import parse_requirement, parse_requirements
+
+
+class TestParseRequirement:
+    """Test parsing single PEP 508 requirements."""
+
+    def test_requirement_parts(self):
+        """Names are normalized and specifiers, extras, markers and URLs split out."""
+        assert parse_requirement("requests") == ("requests", "", (), "", "")
+        assert parse_requirement("Foo_Bar[Socks, security] >= 2.0, <3 ; python_version < '3.9'") == (
+            "foo-bar",
+            ">=2.0,<3",
+            ("security", "socks"),
+            'python_version < "3.9"',
+            "",
+        )
+        assert parse_requirement("name (==1.0)") == ("name", "==1.0", (), "", "")
+        assert parse_requirement("pkg @ https://example.com/pkg-1.0.tar.gz ; os_name == 'nt'") == (
+            "pkg",
+            "",
+            (),
+            'os_name == "nt"',
+            "https://example.com/pkg-1.0.tar.gz",
+        )
+
+    def test_invalid_requirements(self):
+        """Malformed requirements are rejected."""
+        for text in ["requests>=>2", "==1.0", "-pkg", "pkg[extra", "pkg 1.0", "pkg; python_version <"]:
+            assert parse_requirement(text) is None, text
+
+
+class TestParseRequirements:
+    """Test parsing requirements files."""
+
+    def test_lines_options_and_hashes(self, tmp_path: Path):
+        """Comments, continuations, options, hashes and editables are handled."""
+        requirements_file = tmp_path / "requirements.txt"
+        requirements_file.write_text(
+            "# Pinned\n"
+            "--index-url https://example.com/simple\n"
+            "click==8.1.7 \\\n"
+            "    --hash=sha256:aaa \\\n"
+            "    --hash=sha256:bbb\n"
+            "rich>=13  # console output\n"
+            "-e git+https://example.com/repo.git#egg=My_Tool\n"
+            "./wheels/local-1.0-py3-none-any.whl\n",
+            encoding="utf-8",
+        )
+
+        parsed = parse_requirements(str(requirements_file))
+
+        assert parsed.errors == []
+        click, rich, tool, wheel = parsed.requirements
+        assert (click.name, click.specifier, click.hashes, click.line) == ("click", "==8.1.7", ("sha256:aaa", "sha256:bbb"), 3)
+        assert (rich.name, rich.specifier, rich.text, rich.line) == ("rich", ">=13", "rich>=13", 6)
+        assert tool.editable and tool.name == "my-tool" and tool.text == "-e git+https://example.com/repo.git#egg=My_Tool"
+        assert wheel.name == "" and wheel.url == "./wheels/local-1.0-py3-none-any.whl"
+
+    def test_includes(self, tmp_path: Path):
+        """-r and -c includes are resolved relative to the including file."""
+        (tmp_path / "reqs").mkdir()
+        (tmp_path / "reqs" / "base.txt").write_text("requests>=2\n-c ../constraints.txt\n", encoding="utf-8")
+        (tmp_path / "constraints.txt").write_text("urllib3<2\n", encoding="utf-8")
+        requirements_file = tmp_path / "requirements.txt"
+        requirements_file.write_text("-r reqs/base.txt\npytest\n", encoding="utf-8")
+
+        parsed = parse_requirements(str(requirements_file))
+
+        assert [(r.name, r.constraint) for r in parsed.requirements] == [("requests", False), ("urllib3", True), ("pytest", False)]
+        assert [Path(path).name for path in parsed.files] == ["requirements.txt", "base.txt", "constraints.txt"]
+
+    def test_file_included_as_requirements_and_constraints(self, tmp_path: Path):
+        """A file read through -r is read again through -c, as constraints."""
+        (tmp_path / "pins.txt").write_text("urllib3<2\n", encoding="utf-8")
+        requirements_file = tmp_path / "requirements.txt"
+        requirements_file.write_text("-r pins.txt\n-c pins.txt\n-r pins.txt\n", encoding="utf-8")
+
+        parsed = parse_requirements(str(requirements_file))
+
+        assert parsed.errors == []
+        assert [(r.name, r.constraint) for r in parsed.requirements] == [("urllib3", False), ("urllib3", True)]
+
+    def test_circular_includes_and_errors(self, tmp_path: Path):
+        """Include cycles and invalid lines are reported with their location."""
+        (tmp_path / "a.txt").write_text("-r b.txt\nflask\n", encoding="utf-8")
+        (tmp_path / "b.txt").write_text("-r a.txt\n-r missing.txt\nnot a requirement\n", encoding="utf-8")
+
+        parsed = parse_requirements(str(tmp_path / "a.txt"))
+
+        assert [r.name for r in parsed.requirements] == ["flask"]
+        b_path = tmp_path / "b.txt"
+        assert parsed.errors[0] == f"{b_path}:1: circular include of a.txt"
+        assert parsed.errors[1] == f"{tmp_path / 'missing.txt'}: file not found"
+        assert parsed.errors[2] == f"{b_path}:3: invalid requirement 'not a requirement'"
+
+    def test_memoized_until_a_file_changes(self, tmp_path: Path):
+        """Results are reused until an included file changes."""
+        (tmp_path / "base.txt").write_text("requests\n", encoding="utf-8")
+        requirements_file = tmp_path / "requirements.txt"
+        requirements_file.write_text("-r base.txt\n", encoding="utf-8")
+
+        first = parse_requirements(str(requirements_file))
+        assert parse_requirements(str(requirements_file)) is first
+
+        (tmp_path / "base.txt").write_text("requests\nrich\n", encoding="utf-8")
+        stat = os.stat(tmp_path / "base.txt")
+        os.utime(tmp_path / "base.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = parse_requirements(str(requirements_file))
+        assert second is not first
+        assert [r.name for r in second.requirements] == ["requests", "rich"]
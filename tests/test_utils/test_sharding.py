@@ -0,0 +1,97 @@
+"""
+Tests for sharding utilities.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from ginx.utils.sharding import (
+    apportion_duration,
+    collect_shard_items,
+    get_shard_variable,
+    load_shard_timings,
+    parse_shard_spec,
+    partition_items,
+    substitute_shard_items,
+)
+
+
+class TestSharding:
+    """Test splitting items into balanced shards."""
+
+    def test_parse_shard_spec(self):
+        """Test parsing K/N specifications."""
+        assert parse_shard_spec("3/8") == (3, 8)
+        assert parse_shard_spec(" 1 / 1 ") == (1, 1)
+
+        for spec in ["0/8", "9/8", "3", "a/b", "1/0"]:
+            with pytest.raises(ValueError):
+                parse_shard_spec(spec)
+
+    def test_partition_balances_durations(self):
+        """Slow items are spread out so bucket totals are close."""
+        items = ["a", "b", "c", "d", "e", "f"]
+        durations = {"a": 8.0, "b": 1.0, "c": 7.0, "d": 2.0, "e": 3.0, "f": 5.0}
+
+        buckets = partition_items(items, 2, durations)
+
+        assert sorted(item for bucket in buckets for item in bucket) == items
+        assert [sum(durations[item] for item in bucket) for bucket in buckets] == [13.0, 13.0]
+        # Original order is kept inside each bucket
+        assert all(bucket == sorted(bucket) for bucket in buckets)
+
+    def test_partition_without_history_is_even_and_deterministic(self):
+        """Unknown items are spread evenly, identically on every call."""
+        items = [f"tests/test_{i}.py" for i in range(10)]
+
+        buckets = partition_items(items, 3)
+
+        assert [len(bucket) for bucket in buckets] == [4, 3, 3]
+        assert partition_items(items, 3) == buckets
+
+    def test_partition_more_buckets_than_items(self):
+        """Extra buckets stay empty."""
+        assert partition_items(["a"], 3) == [["a"], [], []]
+
+    def test_apportion_duration(self):
+        """Measured time is split by the current estimates."""
+        assert apportion_duration(["a", "b"], 4.0) == {"a": 2.0, "b": 2.0}
+        assert apportion_duration(["a", "b"], 4.0, {"a": 3.0, "b": 1.0}) == {"a": 3.0, "b": 1.0}
+
+    def test_shard_variable_and_substitution(self):
+        """Items replace the typed args placeholder, quoted."""
+        command = "pytest ${files:args} -q"
+
+        assert get_shard_variable(command, {}) == "files"
+        assert substitute_shard_items(command, "files", ["a.py", "b c.py"]) == "pytest a.py 'b c.py' -q"
+
+        with pytest.raises(ValueError):
+            get_shard_variable("pytest", {})
+        with pytest.raises(ValueError):
+            get_shard_variable(command, {"variable": "other"})
+
+    def test_collect_items(self, temp_dir: Path):
+        """Items come from globs or a generator command."""
+        (temp_dir / "tests" / "unit").mkdir(parents=True)
+        (temp_dir / "tests" / "test_a.py").touch()
+        (temp_dir / "tests" / "unit" / "test_b.py").touch()
+        (temp_dir / "tests" / "helper.py").touch()
+
+        assert collect_shard_items({"items": ["tests/**/test_*.py"]}, str(temp_dir)) == [
+            "tests/test_a.py",
+            "tests/unit/test_b.py",
+        ]
+        assert collect_shard_items({"command": "printf 'b\\na\\n\\na\\n'"}, str(temp_dir)) == ["a", "b"]
+
+        with pytest.raises(ValueError):
+            collect_shard_items({}, str(temp_dir))
+
+    def test_load_timings(self, temp_dir: Path):
+        """Shared timings are a JSON object of seconds per item."""
+        (temp_dir / "timings.json").write_text('{"tests/test_a.py": 12.5, "tests/test_b.py": 3}')
+        assert load_shard_timings("timings.json", str(temp_dir)) == {"tests/test_a.py": 12.5, "tests/test_b.py": 3.0}
+
+        (temp_dir / "bad.json").write_text('{"tests/test_a.py": "slow"}')
+        with pytest.raises(ValueError):
+            load_shard_timings("bad.json", str(temp_dir))
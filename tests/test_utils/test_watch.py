@@ -0,0 +1,118 @@
+"""
+Tests for file watching utilities.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional, Set
+
+import pytest
+
+from ginx.utils.watch import FileWatcher, InotifyWatcher, PollingWatcher, create_file_watcher, get_watch_roots, wait_for_changes
+
+
+class ScriptedWatcher(FileWatcher):
+    """Returns prepared batches of changes, then nothing."""
+
+    def __init__(self, batches: List[Set[str]]) -> None:
+        super().__init__([])
+        self.batches = batches
+        self.timeouts: List[Optional[float]] = []
+
+    def read_changes(self, timeout: Optional[float] = None) -> Set[str]:
+        self.timeouts.append(timeout)
+        return self.batches.pop(0) if self.batches else set()
+
+
+class TestWatchers:
+    """Test detecting file changes."""
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_reports_changes(self, temp_dir: Path):
+        """Changes in watched trees are reported, including in new directories."""
+        (temp_dir / "src").mkdir()
+        watcher = InotifyWatcher([str(temp_dir)])
+        try:
+            assert watcher.read_changes(0.05) == set()
+
+            (temp_dir / "src" / "app.py").write_text("changed")
+            assert str(temp_dir / "src" / "app.py") in wait_for_changes(watcher, debounce=0.05, timeout=2)
+
+            (temp_dir / "new").mkdir()
+            wait_for_changes(watcher, debounce=0.05, timeout=2)
+            (temp_dir / "new" / "module.py").write_text("x")
+            assert str(temp_dir / "new" / "module.py") in wait_for_changes(watcher, debounce=0.05, timeout=2)
+        finally:
+            watcher.close()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_skips_ignored_directories(self, temp_dir: Path):
+        """Ignored directories such as .git are not reported."""
+        (temp_dir / ".git").mkdir()
+        watcher = InotifyWatcher([str(temp_dir)])
+        try:
+            (temp_dir / ".git" / "index").write_text("x")
+            (temp_dir / "__pycache__").mkdir()
+            changes = wait_for_changes(watcher, debounce=0.05, timeout=0.5)
+            assert not any(".git" in path or "__pycache__" in path for path in changes)
+        finally:
+            watcher.close()
+
+    def test_polling_reports_changes(self, temp_dir: Path):
+        """The polling watcher reports created, modified and deleted files."""
+        existing = temp_dir / "existing.txt"
+        existing.write_text("old")
+        watcher = PollingWatcher([str(temp_dir)], interval=0.01)
+
+        assert watcher.read_changes(0.05) == set()
+
+        existing.write_text("new content")
+        (temp_dir / "created.txt").write_text("x")
+        assert watcher.read_changes(1) == {str(existing), str(temp_dir / "created.txt")}
+
+        existing.unlink()
+        assert watcher.read_changes(1) == {str(existing)}
+
+    def test_create_file_watcher(self, temp_dir: Path):
+        """Polling can be forced, otherwise the best watcher is used."""
+        assert isinstance(create_file_watcher([str(temp_dir)], force_polling=True), PollingWatcher)
+        watcher = create_file_watcher([str(temp_dir)])
+        watcher.close()
+        if sys.platform.startswith("linux"):
+            assert isinstance(watcher, InotifyWatcher)
+
+
+class TestDebounce:
+    """Test grouping bursts of changes."""
+
+    def test_batches_until_quiet(self):
+        """Changes are collected until a debounce period passes without any."""
+        watcher = ScriptedWatcher([{"a"}, {"b"}, {"c"}])
+
+        assert wait_for_changes(watcher, debounce=0.2, timeout=5) == {"a", "b", "c"}
+        assert watcher.timeouts == [5, 0.2, 0.2, 0.2]
+
+    def test_timeout_without_changes(self):
+        """Nothing is returned when no change arrives in time."""
+        watcher = ScriptedWatcher([])
+
+        assert wait_for_changes(watcher, debounce=0.2, timeout=0.1) == set()
+        assert watcher.timeouts == [0.1]
+
+
+class TestWatchRoots:
+    """Test reducing input patterns to watched paths."""
+
+    def test_static_prefixes(self, temp_dir: Path):
+        """Patterns are watched from their static prefix, without nested roots."""
+        (temp_dir / "src" / "pkg").mkdir(parents=True)
+        (temp_dir / "docs").mkdir()
+
+        roots = get_watch_roots(["src/**/*.py", "src/pkg/[ab].py", "docs/*.md"], str(temp_dir))
+        assert roots == [str(temp_dir / "docs"), str(temp_dir / "src")]
+
+    def test_missing_paths_watch_their_parent(self, temp_dir: Path):
+        """Paths that do not exist yet are watched through the nearest existing parent."""
+        (temp_dir / "src").mkdir()
+
+        assert get_watch_roots(["src/*.py", "build/out/*.txt"], str(temp_dir)) == [str(temp_dir)]